@@ -0,0 +1,106 @@
+# benchmark_asset_matrix.py
+#
+# Reports build time and peak memory of the portfolio asset matrix for a
+# synthetic watchlist, comparing concatenate + pivot (AssetMatrixPreparer.prepare)
+# with the preallocated builder (AssetMatrixPreparer.build):
+#
+#   python -m scripts.benchmark_asset_matrix --symbols 500 --years 3 --freq 15min
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.data_preparer.asset_matrix_preparer import (
+    AssetMatrixPreparer,
+)
+from algo_royale.logging.logger_env import ApplicationEnv
+from algo_royale.logging.logger_factory import LoggerFactory
+
+
+def _symbol_frames(symbols: int, years: int, freq: str, seed: int = 0):
+    """One long-form frame per symbol over regular trading hours. Symbols list
+    late and drop a few bars, so the union index has gaps to fill."""
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2021-01-04", periods=252 * years, tz="America/New_York")
+    session = pd.timedelta_range("09:30:00", "15:59:00", freq=freq)
+    timestamps = (days.values[:, None] + session.values[None, :]).ravel()
+    timestamps = pd.DatetimeIndex(timestamps).tz_localize("UTC")
+    frames = []
+    for i in range(symbols):
+        start = rng.integers(0, len(timestamps) // 10)
+        keep = rng.random(len(timestamps) - start) > 0.01
+        ts = timestamps[start:][keep]
+        close = 100 + rng.normal(0, 0.1, len(ts)).cumsum()
+        frame = pd.DataFrame(
+            {
+                "timestamp": ts,
+                "symbol": f"SYM{i:03d}",
+                "open_price": close,
+                "high_price": close + 0.05,
+                "low_price": close - 0.05,
+                "close_price": close,
+            }
+        )
+        frames.append(frame)
+    return frames
+
+
+def _measure(fn):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark asset matrix build time and peak memory"
+    )
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--freq", default="15min", help="Bar frequency")
+    parser.add_argument(
+        "--skip-pivot", action="store_true", help="Only run the builder"
+    )
+    args = parser.parse_args()
+
+    preparer = AssetMatrixPreparer(
+        logger=LoggerFactory(ApplicationEnv.DEV_UNIT).get_base_logger()
+    )
+    frames = _symbol_frames(args.symbols, args.years, args.freq)
+    rows = sum(len(f) for f in frames)
+    input_mb = sum(f.memory_usage(deep=False).sum() for f in frames) / 1e6
+    print(
+        f"{args.symbols} symbols x {args.years} years of {args.freq} bars: "
+        f"{rows:,} rows, {input_mb:,.0f} MB of input frames"
+    )
+
+    runs = [("builder", lambda: preparer.build(frames))]
+    if not args.skip_pivot:
+        runs.insert(
+            0,
+            (
+                "concat+pivot",
+                lambda: preparer.prepare(pd.concat(frames, ignore_index=True)),
+            ),
+        )
+    for name, fn in runs:
+        matrix, elapsed, peak = _measure(fn)
+        matrix_mb = matrix.memory_usage(deep=False).sum() / 1e6
+        print(
+            f"{name:>13}: {elapsed:7.2f}s  peak {peak / 1e6:9,.0f} MB  "
+            f"matrix {matrix.shape} {matrix_mb:,.0f} MB"
+        )
+        del matrix
+
+
+if __name__ == "__main__":
+    main()
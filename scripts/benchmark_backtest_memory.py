@@ -0,0 +1,155 @@
+# benchmark_backtest_memory.py
+#
+# Reports the peak RSS of signal backtests over growing windows: collecting
+# every result page, concatenating each strategy's pages and evaluating them,
+# versus streaming the pages one at a time into the evaluation. Pages are
+# generated on the fly and every run gets a fresh process, so the streamed
+# peak should stay flat as the window grows:
+#
+#   python -m scripts.benchmark_backtest_memory --bars 20000,80000,320000
+#   python -m scripts.benchmark_backtest_memory --strategies 32 --page-bars 5000
+
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.evaluator.backtest.signal_backtest_evaluator import (
+    SignalBacktestEvaluator,
+)
+from algo_royale.backtester.executor.strategy_backtest_executor import (
+    StrategyBacktestExecutor,
+)
+from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.strategy.signal.conditions.momentum_entry import (
+    MomentumEntryCondition,
+)
+from algo_royale.backtester.strategy.signal.conditions.momentum_exit import (
+    MomentumExitCondition,
+)
+from algo_royale.backtester.strategy.signal.momentum_strategy import MomentumStrategy
+from algo_royale.logging.logger_env import ApplicationEnv
+from algo_royale.logging.logger_factory import LoggerFactory
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def _pages(bars: int, page_bars: int, seed: int = 0):
+    async def pages():
+        rng = np.random.default_rng(seed)
+        last_close = 100.0
+        start = pd.Timestamp("2021-01-04 14:30", tz="UTC")
+        for offset in range(0, bars, page_bars):
+            n = min(page_bars, bars - offset)
+            close = last_close + rng.normal(0, 0.1, n).cumsum()
+            last_close = close[-1]
+            yield pd.DataFrame(
+                {
+                    "timestamp": pd.date_range(
+                        start + pd.Timedelta(minutes=offset), periods=n, freq="min"
+                    ),
+                    "open_price": close,
+                    "high_price": close + 0.05,
+                    "low_price": close - 0.05,
+                    "close_price": close,
+                    "volume": 1000,
+                }
+            )
+
+    return pages
+
+
+def _strategies(count: int, logger) -> list[MomentumStrategy]:
+    return [
+        MomentumStrategy(
+            logger=logger,
+            entry_conditions=[MomentumEntryCondition(lookback=5 + i, logger=logger)],
+            exit_conditions=[MomentumExitCondition(lookback=5 + i, logger=logger)],
+        )
+        for i in range(count)
+    ]
+
+
+async def _collect(executor, evaluator, strategies, data) -> list[dict]:
+    results = await executor.async_run_backtest(strategies, data)
+    by_strategy = {}
+    for df in results["SYM"]:
+        by_strategy.setdefault(df["strategy_name"].iloc[0], []).append(df)
+    return [
+        evaluator.evaluate(
+            strategy, pd.concat(by_strategy[strategy.get_hash_id()], ignore_index=True)
+        )
+        for strategy in strategies
+        if strategy.get_hash_id() in by_strategy
+    ]
+
+
+async def _stream(executor, evaluator, strategies, data) -> list[dict]:
+    evaluations = {id(strategy): evaluator.stream(strategy) for strategy in strategies}
+    async for _, strategy, page_df in executor.async_stream_backtest(strategies, data):
+        evaluations[id(strategy)].add_page(page_df)
+    return [evaluation.metrics() for evaluation in evaluations.values()]
+
+
+def _run(mode: str, bars: int, page_bars: int, strategy_count: int) -> tuple:
+    """Runs one backtest in a fresh worker process; returns its peak RSS and time."""
+    logger = LoggerFactory(ApplicationEnv.DEV_UNIT).get_base_logger()
+    with tempfile.TemporaryDirectory() as tmp:
+        executor = StrategyBacktestExecutor(
+            stage_data_manager=StageDataManager(data_dir=Path(tmp), logger=logger),
+            logger=logger,
+        )
+        evaluator = SignalBacktestEvaluator(logger=logger)
+        strategies = _strategies(strategy_count, logger)
+        baseline = _peak_rss_mb()
+        run = _collect if mode == "collect" else _stream
+        started = time.perf_counter()
+        metrics = asyncio.run(
+            run(executor, evaluator, strategies, {"SYM": _pages(bars, page_bars)})
+        )
+        return baseline, _peak_rss_mb(), time.perf_counter() - started, len(metrics)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the peak memory of collected versus streamed backtests"
+    )
+    parser.add_argument("--bars", default="20000,80000,320000")
+    parser.add_argument("--page-bars", type=int, default=10_000)
+    parser.add_argument("--strategies", type=int, default=8)
+    parser.add_argument("--modes", default="collect,stream")
+    args = parser.parse_args()
+
+    print(
+        f"{args.strategies} strategies, {args.page_bars:,}-bar pages; "
+        "peak RSS above the process baseline"
+    )
+    ctx = multiprocessing.get_context("spawn")
+    for bars in (int(b) for b in args.bars.split(",")):
+        line = [f"{bars:>10,} bars"]
+        for mode in args.modes.split(","):
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                baseline, peak, seconds, evaluated = pool.submit(
+                    _run, mode, bars, args.page_bars, args.strategies
+                ).result()
+            line.append(
+                f"{mode} {peak - baseline:8.1f} MB ({peak:7.1f} MB peak) "
+                f"{seconds:6.1f}s, {evaluated} evaluated"
+            )
+        print(" | ".join(line))
+
+
+if __name__ == "__main__":
+    main()
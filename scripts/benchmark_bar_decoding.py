@@ -0,0 +1,114 @@
+# benchmark_bar_decoding.py
+#
+# Reports how fast a stocks/bars payload becomes a staged page: parsing every
+# bar into a Bar via BarsResponse and model_dump-ing it back into a frame,
+# versus decoding the payload straight into columns (BarColumnsResponse), and
+# checks both give identical frames. Pass recorded API responses (one JSON
+# page per file) with --payload, or time a synthetic payload of --bars bars:
+#
+#   python -m scripts.benchmark_bar_decoding --payload pages/aapl_*.json
+#   python -m scripts.benchmark_bar_decoding --bars 1000,10000,100000
+
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.models.alpaca_market_data.alpaca_bar import BarsResponse
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import (
+    BarColumnsResponse,
+)
+
+
+def _synthetic_payload(bars: int, seed: int = 0) -> bytes:
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range("2021-01-04 14:30", periods=bars, freq="min", tz="UTC")
+    close = 100 + rng.normal(0, 0.1, bars).cumsum()
+    rows = [
+        {
+            "t": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "o": round(c + o, 4),
+            "h": round(c + 0.05, 4),
+            "l": round(c - 0.05, 4),
+            "c": round(c, 4),
+            "v": int(v),
+            "n": int(n),
+            "vw": round(c + 0.01, 6),
+        }
+        for ts, c, o, v, n in zip(
+            timestamps,
+            close,
+            rng.normal(0, 0.02, bars),
+            rng.integers(100, 10_000, bars),
+            rng.integers(1, 100, bars),
+        )
+    ]
+    # The old default requested pages newest first
+    return json.dumps({"bars": {"SYM": rows[::-1]}, "next_page_token": None}).encode()
+
+
+def _bar_models(payload: bytes) -> dict[str, pd.DataFrame]:
+    response = BarsResponse.from_raw(json.loads(payload))
+    return {
+        symbol: pd.DataFrame([bar.model_dump() for bar in bars])
+        .iloc[::-1]
+        .reset_index(drop=True)
+        for symbol, bars in response.symbol_bars.items()
+    }
+
+
+def _bar_columns(payload: bytes) -> dict[str, pd.DataFrame]:
+    return BarColumnsResponse.from_raw(json.loads(payload)).symbol_frames
+
+
+def _best_of(repeat: int, fn):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Bar model parsing versus columnar bar decoding"
+    )
+    parser.add_argument(
+        "--payload", nargs="*", default=[], help="Recorded stocks/bars responses"
+    )
+    parser.add_argument("--bars", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    payloads = []
+    for path in args.payload:
+        with open(path, "rb") as f:
+            payloads.append((path, f.read()))
+    if not payloads:
+        payloads = [
+            (f"synthetic {int(n):,} bars", _synthetic_payload(int(n)))
+            for n in args.bars.split(",")
+        ]
+
+    for name, payload in payloads:
+        models, models_seconds = _best_of(args.repeat, lambda: _bar_models(payload))
+        columns, columns_seconds = _best_of(args.repeat, lambda: _bar_columns(payload))
+        for symbol, df in models.items():
+            df["timestamp"] = df["timestamp"].dt.tz_convert("UTC")
+            pd.testing.assert_frame_equal(columns[symbol], df, check_exact=True)
+        rows = sum(len(df) for df in columns.values())
+        print(
+            f"{name}: {rows:,} bars, {len(payload) / 1e6:.1f} MB | "
+            f"Bar models {models_seconds * 1000:8.1f} ms "
+            f"({rows / models_seconds:>10,.0f} bars/s), "
+            f"columns {columns_seconds * 1000:8.1f} ms "
+            f"({rows / columns_seconds:>10,.0f} bars/s), "
+            f"{models_seconds / columns_seconds:4.1f}x, identical"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# benchmark_db_pagination.py
+#
+# Seeds orders and trades into a scratch schema of a local PostgreSQL database
+# and reports query latency against table size: paging by LIMIT/OFFSET on the
+# original indexes versus the keyset-paginated queries with the indexes from
+# migration 201. The scratch schema is dropped afterwards:
+#
+#   python -m scripts.benchmark_db_pagination \
+#       --dsn postgresql://localhost/algo_royale_dev --sizes 10000,100000,1000000
+
+import argparse
+import time
+from datetime import datetime
+from pathlib import Path
+
+import psycopg2
+
+from algo_royale.models.db.db_page_cursor import DBPageCursor
+
+DB_DIR = Path(__file__).resolve().parents[1] / "src" / "algo_royale" / "clients" / "db"
+MIGRATIONS = DB_DIR / "migrations"
+SQL_DIR = DB_DIR / "sql"
+SCHEMA = "pagination_benchmark"
+PAGE = 100
+
+# The queries as they were before keyset pagination
+OFFSET_QUERIES = {
+    "orders by status": (
+        "SELECT * FROM orders WHERE status = ANY(%s) "
+        "ORDER BY created_at DESC LIMIT %s OFFSET %s",
+        lambda depth: (["new"], PAGE, depth),
+    ),
+    "orders by symbol and status": (
+        "SELECT * FROM orders WHERE status = ANY(%s) AND symbol = %s "
+        "ORDER BY created_at DESC LIMIT %s OFFSET %s",
+        lambda depth: (["new"], "S8", PAGE, depth),
+    ),
+    "trades by date range": (
+        "SELECT * FROM trades WHERE executed_at >= %s AND executed_at <= %s "
+        "ORDER BY executed_at LIMIT %s OFFSET %s",
+        lambda depth: (datetime(2020, 1, 1), datetime(2030, 1, 1), PAGE, depth),
+    ),
+    "unsettled trades": (
+        "SELECT * FROM trades WHERE settled = FALSE "
+        "ORDER BY settlement_date DESC LIMIT %s OFFSET %s",
+        lambda depth: (PAGE, depth),
+    ),
+}
+
+KEYSET_QUERIES = {
+    "orders by status": (
+        "orders/fetch_orders_by_status.sql",
+        {"status_list": ["new"]},
+        DBPageCursor.after_order,
+    ),
+    "orders by symbol and status": (
+        "orders/fetch_orders_by_symbol_and_status.sql",
+        {"status_list": ["new"], "symbol": "S8"},
+        DBPageCursor.after_order,
+    ),
+    "trades by date range": (
+        "trades/fetch_trades_by_date_range.sql",
+        {"start_date": datetime(2020, 1, 1), "end_date": datetime(2030, 1, 1)},
+        DBPageCursor.after_executed_trade,
+    ),
+    "unsettled trades": (
+        "trades/fetch_unsettled_trades.sql",
+        {},
+        DBPageCursor.after_unsettled_trade,
+    ),
+}
+
+
+class _Row:
+    """Attribute access to a fetched row for the DBPageCursor constructors."""
+
+    def __init__(self, columns, row):
+        self.__dict__.update(zip(columns, row))
+
+
+def _create(cur, rows: int, indexed: bool):
+    cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+    cur.execute(f"SET search_path TO {SCHEMA}, public;")
+    migrations = ["101_create_orders_table.sql", "102_create_trades_table.sql"]
+    migrations += ["200_create_indexes.sql"]
+    if indexed:
+        migrations += ["201_create_pagination_indexes.sql"]
+    cur.execute((MIGRATIONS / migrations[0]).read_text())
+    cur.execute((MIGRATIONS / migrations[1]).read_text())
+    # Seed before indexing, then index, as a long-lived table would be
+    cur.execute(
+        """
+        INSERT INTO orders (symbol, order_type, status, action, settled, created_at, user_id, account_id)
+        SELECT 'S' || (i %% 50), 'market', (ARRAY['new', 'filled', 'canceled', 'filled'])[1 + i %% 4],
+            'buy', i %% 10 <> 0, TIMESTAMP '2021-01-01' + i * INTERVAL '1 minute', 'u', 'a'
+        FROM generate_series(1, %(rows)s) i;
+        INSERT INTO trades (symbol, action, settled, settlement_date, price, quantity, executed_at, user_id, account_id)
+        SELECT 'S' || (i %% 50), 'buy', i %% 10 <> 0, TIMESTAMP '2021-01-03' + i * INTERVAL '1 minute',
+            100, 1, TIMESTAMP '2021-01-01' + i * INTERVAL '1 minute', 'u', 'a'
+        FROM generate_series(1, %(rows)s) i;
+        """,
+        {"rows": rows},
+    )
+    for migration in migrations[2:]:
+        cur.execute((MIGRATIONS / migration).read_text())
+    cur.execute("ANALYZE orders; ANALYZE trades;")
+
+
+def _timed(cur, sql, params):
+    started = time.perf_counter()
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    return rows, time.perf_counter() - started
+
+
+def _offset_latency(cur, name, depth):
+    sql, params = OFFSET_QUERIES[name]
+    return min(_timed(cur, sql, params(depth))[1] for _ in range(3))
+
+
+def _keyset_latency(cur, name, depth):
+    sql_file, params, cursor_after = KEYSET_QUERIES[name]
+    sql = (SQL_DIR / sql_file).read_text()
+    # Walk to the page at the given depth once, then time fetching it
+    after = None
+    if depth:
+        rows, _ = _timed(cur, sql, {**params, **DBPageCursor.params(None, depth)})
+        if not rows:
+            return float("nan")
+        columns = [column.name for column in cur.description]
+        after = cursor_after(_Row(columns, rows[-1]))
+    page_params = {**params, **DBPageCursor.params(after, PAGE)}
+    return min(_timed(cur, sql, page_params)[1] for _ in range(3))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark OFFSET versus keyset pagination of orders and trades"
+    )
+    parser.add_argument("--dsn", required=True, help="PostgreSQL connection string")
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument(
+        "--depth", type=float, default=0.9, help="Page position as a fraction of rows"
+    )
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn)
+    try:
+        with conn.cursor() as cur:
+            for rows in (int(n) for n in args.sizes.split(",")):
+                # Roughly a quarter of orders are 'new' and a tenth of trades unsettled
+                depths = {
+                    "orders by status": int(rows / 4 * args.depth),
+                    "orders by symbol and status": int(rows / 100 * args.depth),
+                    "trades by date range": int(rows * args.depth),
+                    "unsettled trades": int(rows / 10 * args.depth),
+                }
+                _create(cur, rows, indexed=False)
+                offset = {n: _offset_latency(cur, n, d) for n, d in depths.items()}
+                _create(cur, rows, indexed=True)
+                keyset = {n: _keyset_latency(cur, n, d) for n, d in depths.items()}
+                conn.rollback()
+                print(f"{rows:,} orders and trades, page of {PAGE} at {args.depth:.0%}")
+                for name in OFFSET_QUERIES:
+                    print(
+                        f"  {name:<28} offset {offset[name] * 1000:8.2f} ms, "
+                        f"keyset {keyset[name] * 1000:8.2f} ms"
+                    )
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
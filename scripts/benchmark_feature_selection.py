@@ -0,0 +1,113 @@
+# benchmark_feature_selection.py
+#
+# Reports feature engineering time and peak memory per page of bars with every
+# feature computed versus only the features the given signal combinators read
+# (feature_selection = all / required), and the slowest features skipped:
+#
+#   python -m scripts.benchmark_feature_selection --rows 100000 \
+#       --combinators BollingerBandsStrategyCombinator,VWAPReversionStrategyCombinator
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.feature_engineering.feature_engineering import (
+    feature_engineering,
+)
+from algo_royale.backtester.feature_engineering.feature_requirements import (
+    required_features,
+)
+from algo_royale.backtester.feature_engineering.feature_selection_report import (
+    FeatureSelectionReport,
+)
+from algo_royale.backtester.maps.signal_strategy_combinator_map import (
+    SIGNAL_STRATEGY_COMBINATOR_MAP,
+)
+from algo_royale.logging.logger_env import ApplicationEnv
+from algo_royale.logging.logger_factory import LoggerFactory
+
+
+def _bars(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 0.1, rows).cumsum()
+    return pd.DataFrame(
+        {
+            "symbol": "SYM000",
+            "timestamp": pd.date_range(
+                "2021-01-04 14:30", periods=rows, freq="min", tz="UTC"
+            ),
+            "open_price": close + rng.normal(0, 0.02, rows),
+            "high_price": close + 0.05,
+            "low_price": close - 0.05,
+            "close_price": close,
+            "volume": rng.integers(100, 10_000, rows).astype(float),
+            "num_trades": rng.integers(1, 100, rows),
+            "volume_weighted_price": close,
+        }
+    )
+
+
+def _measure(bars: pd.DataFrame, logger, features):
+    timings: dict[str, float] = {}
+    df = bars.copy()
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    df = feature_engineering(df, logger, features=features, timings=timings)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark computing all features versus the required ones"
+    )
+    parser.add_argument("--rows", type=int, default=100_000, help="Bars per page")
+    parser.add_argument(
+        "--combinators",
+        default="BollingerBandsStrategyCombinator",
+        help="Comma-separated signal combinator class names",
+    )
+    args = parser.parse_args()
+
+    logger = LoggerFactory(ApplicationEnv.DEV_UNIT).get_base_logger()
+    combinators = [
+        SIGNAL_STRATEGY_COMBINATOR_MAP[name]() for name in args.combinators.split(",")
+    ]
+    features = required_features(combinators, logger)
+    report = FeatureSelectionReport.for_features(features)
+    bars = _bars(args.rows)
+
+    full, full_seconds, full_peak, full_timings = _measure(bars, logger, None)
+    selected, seconds, peak, _ = _measure(bars, logger, features)
+
+    print(f"{args.rows:,} rows, combinators: {args.combinators}")
+    print(f"required: {sorted(features) if features is not None else 'all'}")
+    print(f"computed {len(report.computed)} features: {report.computed}")
+    for label, df, elapsed, peak_bytes in (
+        ("all", full, full_seconds, full_peak),
+        ("required", selected, seconds, peak),
+    ):
+        print(
+            f"{label:>8}: {elapsed * 1000:8.1f} ms, peak {peak_bytes / 1e6:8.1f} MB, "
+            f"frame {df.memory_usage(deep=False).sum() / 1e6:8.1f} MB"
+        )
+    print(
+        f"   saved: {(full_seconds - seconds) * 1000:8.1f} ms, "
+        f"peak {(full_peak - peak) / 1e6:8.1f} MB"
+    )
+    slowest = sorted(report.skipped, key=lambda col: full_timings[col], reverse=True)
+    print(
+        "slowest skipped: "
+        + ", ".join(f"{col} {full_timings[col] * 1000:.1f} ms" for col in slowest[:5])
+    )
+
+
+if __name__ == "__main__":
+    main()
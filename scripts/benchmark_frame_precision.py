@@ -0,0 +1,131 @@
+# benchmark_frame_precision.py
+#
+# Reports memory per symbol-year and staged CSV bytes for engineered minute
+# bars in full precision versus compact precision (frame_precision = compact:
+# float32 derived columns, categorical symbol/strategy, epoch-second
+# timestamps on disk), and the largest relative error the compact mode adds:
+#
+#   python -m scripts.benchmark_frame_precision --symbols 4 --days 252
+
+import argparse
+import io
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.feature_engineering.feature_engineering import (
+    panel_feature_engineering,
+)
+from algo_royale.backtester.stage_data.frame_dtypes import (
+    CATEGORICAL_COLUMNS,
+    FULL_PRECISION_COLUMNS,
+    compact_frame,
+    from_stored_frame,
+    memory_per_symbol_year,
+    to_stored_frame,
+)
+from algo_royale.logging.logger_env import ApplicationEnv
+from algo_royale.logging.logger_factory import LoggerFactory
+
+BARS_PER_DAY = 390
+
+
+def _bars(symbol: str, days: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    sessions = pd.bdate_range("2021-01-04", periods=days, tz="UTC")
+    timestamps = (
+        sessions.repeat(BARS_PER_DAY)
+        + pd.Timedelta(hours=14, minutes=30)
+        + pd.to_timedelta(np.tile(np.arange(BARS_PER_DAY), days), unit="min")
+    )
+    rows = len(timestamps)
+    close = 100 + rng.normal(0, 0.05, rows).cumsum()
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "timestamp": timestamps,
+            "open_price": close + rng.normal(0, 0.02, rows),
+            "high_price": close + 0.05,
+            "low_price": close - 0.05,
+            "close_price": close,
+            "volume": rng.integers(100, 10_000, rows).astype(float),
+            "num_trades": rng.integers(1, 100, rows),
+            "volume_weighted_price": close,
+        }
+    )
+
+
+def _csv(df: pd.DataFrame) -> tuple[str, float]:
+    started = time.perf_counter()
+    text = df.to_csv(index=False)
+    return text, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark full versus compact staged frame precision"
+    )
+    parser.add_argument("--symbols", type=int, default=4)
+    parser.add_argument("--days", type=int, default=252, help="Sessions per symbol")
+    args = parser.parse_args()
+
+    logger = LoggerFactory(ApplicationEnv.DEV_UNIT).get_base_logger()
+    warnings.simplefilter("ignore", RuntimeWarning)
+    frames = {
+        f"SYM{i:03d}": _bars(f"SYM{i:03d}", args.days, seed=i)
+        for i in range(args.symbols)
+    }
+    engineered = panel_feature_engineering(frames, logger)
+    full = pd.concat(engineered.values(), ignore_index=True).assign(
+        strategy="BollingerBandsStrategy"
+    )
+    compact = compact_frame(full)
+
+    full_csv, full_write = _csv(full)
+    compact_csv, compact_write = _csv(to_stored_frame(full))
+    started = time.perf_counter()
+    pd.read_csv(io.StringIO(full_csv), parse_dates=["timestamp"])
+    full_read = time.perf_counter() - started
+    started = time.perf_counter()
+    from_stored_frame(
+        pd.read_csv(
+            io.StringIO(compact_csv),
+            dtype={column: "category" for column in CATEGORICAL_COLUMNS},
+        )
+    )
+    compact_read = time.perf_counter() - started
+
+    print(
+        f"{args.symbols} symbols x {args.days} sessions of minute bars, "
+        f"{len(full):,} rows x {len(full.columns)} columns"
+    )
+    for label, df, csv, write, read in (
+        ("full", full, full_csv, full_write, full_read),
+        ("compact", compact, compact_csv, compact_write, compact_read),
+    ):
+        print(
+            f"{label:>8}: {memory_per_symbol_year(df) / 1e6:8.1f} MB per symbol-year, "
+            f"csv {len(csv) / 1e6:8.1f} MB, write {write:6.2f} s, read {read:6.2f} s"
+        )
+
+    derived = [
+        column
+        for column in full.columns
+        if full[column].dtype == np.float64 and column not in FULL_PRECISION_COLUMNS
+    ]
+    exact = full[derived].to_numpy()
+    rounded = compact[derived].to_numpy(np.float64)
+    scale = np.maximum(np.abs(exact), 1e-12)
+    with np.errstate(invalid="ignore"):
+        worst = np.nanmax(np.abs(rounded - exact) / scale, axis=0)
+    column = derived[int(np.nanargmax(worst))]
+    print(
+        f"max relative error of {len(derived)} float32 columns: "
+        f"{np.nanmax(worst):.2e} ({column})"
+    )
+
+
+if __name__ == "__main__":
+    main()
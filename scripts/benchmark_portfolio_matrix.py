@@ -0,0 +1,133 @@
+# benchmark_portfolio_matrix.py
+#
+# Times the per-symbol signal backtests of the portfolio matrix build for a
+# synthetic watchlist at several worker counts:
+#
+#   python -m scripts.benchmark_portfolio_matrix --symbols 120 --workers 1,2,4,8
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.data_preparer.asset_matrix_preparer import (
+    AssetMatrixPreparer,
+)
+from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.executor.strategy_backtest_executor import (
+    StrategyBacktestExecutor,
+)
+from algo_royale.backtester.stage_data.loader.portfolio_matrix_loader import (
+    PortfolioMatrixLoader,
+)
+from algo_royale.backtester.stage_data.loader.stage_data_loader import StageDataLoader
+from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.strategy.signal.momentum_strategy import MomentumStrategy
+from algo_royale.backtester.strategy_factory.signal.signal_strategy_factory import (
+    SignalStrategyFactory,
+)
+from algo_royale.logging.logger_env import ApplicationEnv
+from algo_royale.logging.logger_factory import LoggerFactory
+
+START = datetime(2023, 1, 1)
+END = datetime(2024, 1, 1)
+
+
+class _Watchlist:
+    def __init__(self, symbols):
+        self.symbols = symbols
+
+    def load_watchlist(self):
+        return self.symbols
+
+
+def _write_feature_pages(manager, symbol, rows, pages, seed):
+    rng = np.random.default_rng(seed)
+    symbol_dir = manager.get_directory_path(
+        stage=BacktestStage.FEATURE_ENGINEERING,
+        symbol=symbol,
+        start_date=START,
+        end_date=END,
+    )
+    symbol_dir.mkdir(parents=True, exist_ok=True)
+    close = 100 + rng.normal(0, 1, rows).cumsum()
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(
+                "2023-01-02 14:30", periods=rows, freq="min", tz="UTC"
+            ),
+            "open_price": close,
+            "high_price": close + 0.5,
+            "low_price": close - 0.5,
+            "close_price": close,
+            "volume": 1000,
+        }
+    )
+    for page, chunk in enumerate(np.array_split(df, pages), start=1):
+        chunk.to_csv(symbol_dir / f"None_{symbol}_page{page}.csv", index=False)
+
+
+def _build_loader(root: Path, symbols, workers, logger):
+    manager = StageDataManager(data_dir=root / "data", logger=logger)
+    loader = PortfolioMatrixLoader(
+        strategy_backtest_executor=StrategyBacktestExecutor(
+            stage_data_manager=manager, logger=logger
+        ),
+        asset_matrix_preparer=AssetMatrixPreparer(logger=logger),
+        stage_data_manager=manager,
+        stage_data_loader=StageDataLoader(
+            logger=logger,
+            stage_data_manager=manager,
+            watchlist_repo=_Watchlist(symbols),
+        ),
+        strategy_factory=SignalStrategyFactory(logger=logger, strategy_logger=logger),
+        data_dir=root / "signals",
+        optimization_root=root / "optimization",
+        signal_summary_json_filename="summary_result.json",
+        symbol_signals_filename="symbol_signals.parquet",
+        logger=logger,
+        max_workers=workers,
+    )
+    loader._get_optimized_strategy = lambda symbol: MomentumStrategy(logger=logger)
+    return loader, manager
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the portfolio matrix signal backtests"
+    )
+    parser.add_argument("--symbols", type=int, default=120)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument(
+        "--workers", default=f"1,2,4,{os.cpu_count() or 1}", help="Comma-separated"
+    )
+    args = parser.parse_args()
+
+    logger = LoggerFactory(ApplicationEnv.DEV_UNIT).get_base_logger()
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+    worker_counts = sorted({int(w) for w in args.workers.split(",")})
+    print(f"{args.symbols} symbols x {args.rows} rows, {os.cpu_count()} CPUs")
+    baseline = None
+    for workers in worker_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            loader, manager = _build_loader(Path(tmp), symbols, workers, logger)
+            for seed, symbol in enumerate(symbols):
+                _write_feature_pages(manager, symbol, args.rows, args.pages, seed)
+            started = time.perf_counter()
+            asyncio.run(loader._run_backtest_and_save_signals(symbols, START, END))
+            elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:>3}  {elapsed:8.2f}s  speedup={baseline / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmark_signal_payloads.py
+#
+# Reports the memory and Python objects the live signal -> roster -> order
+# path allocates per bar per symbol: the SignalDataPayload, the roster
+# snapshot published to subscribers and the SignalOrderPayload. Every object
+# built is retained (as a subscriber keeping history would), so the numbers
+# are what each bar adds, not what survives garbage collection:
+#
+#   python -m scripts.benchmark_signal_payloads --symbols 100 --bars 200
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+from algo_royale.application.orders.equity_order_enums import EquityOrderSide
+from algo_royale.application.orders.signal_order_payload import SignalOrderPayload
+from algo_royale.application.signals.signals_data_payload import SignalDataPayload
+from algo_royale.application.signals.stream_signal_roster_object import (
+    StreamSignalRosterObject,
+)
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
+from algo_royale.backtester.column_names.strategy_columns import SignalStrategyColumns
+from algo_royale.logging.logger_env import ApplicationEnv
+from algo_royale.logging.logger_factory import LoggerFactory
+
+
+def _inputs(symbols: list[str], bars: int) -> list[list[tuple[dict, dict]]]:
+    """Signals and price data per bar per symbol. These come from upstream
+    stages, so they are built before measuring."""
+    return [
+        [
+            (
+                {
+                    SignalStrategyColumns.ENTRY_SIGNAL: "buy",
+                    SignalStrategyColumns.EXIT_SIGNAL: "hold",
+                },
+                {
+                    DataIngestColumns.TIMESTAMP: bar,
+                    DataIngestColumns.CLOSE_PRICE: 100.0 + bar,
+                },
+            )
+            for _ in symbols
+        ]
+        for bar in range(bars)
+    ]
+
+
+async def _run(roster_object, symbols, inputs, retained: list):
+    for bar_inputs in inputs:
+        for symbol, (signals, price_data) in zip(symbols, bar_inputs):
+            payload = SignalDataPayload(signals=signals, price_data=price_data)
+            await roster_object.async_set_signal_data_payload(symbol, payload)
+            retained.append(roster_object.get_signal_data_roster())
+            retained.append(
+                SignalOrderPayload(
+                    symbol=symbol,
+                    side=EquityOrderSide.BUY,
+                    weight=0.1,
+                    price_data=price_data,
+                )
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark allocations of the live signal payload path"
+    )
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--bars", type=int, default=200)
+    args = parser.parse_args()
+
+    logger = LoggerFactory(ApplicationEnv.DEV_UNIT).get_base_logger()
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+    inputs = _inputs(symbols, args.bars)
+    roster_object = StreamSignalRosterObject(initial_symbols=symbols, logger=logger)
+    retained: list = []
+
+    gc.collect()
+    gc.disable()
+    objects_before = len(gc.get_objects())
+    tracemalloc.start()
+    asyncio.run(_run(roster_object, symbols, inputs, retained))
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = len(gc.get_objects()) - objects_before
+    gc.enable()
+
+    updates = args.symbols * args.bars
+    print(f"{args.symbols} symbols x {args.bars} bars = {updates:,} updates")
+    print(
+        f"per bar per symbol: {allocated / updates:,.0f} bytes, "
+        f"{objects / updates:,.1f} gc-tracked objects"
+    )
+
+
+if __name__ == "__main__":
+    main()
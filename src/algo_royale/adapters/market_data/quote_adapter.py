@@ -16,6 +16,9 @@ from algo_royale.models.alpaca_market_data.alpaca_bar import (
     BarsResponse,
     LatestBarsResponse,
 )
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import (
+    BarColumnsResponse,
+)
 from algo_royale.models.alpaca_market_data.alpaca_condition_code import ConditionCodeMap
 from algo_royale.models.alpaca_market_data.alpaca_quote import QuotesResponse
 from algo_royale.models.alpaca_market_data.alpaca_snapshot import SnapshotsResponse
@@ -166,6 +169,51 @@ class QuoteAdapter:
             page_token,
         )
 
+    async def fetch_historical_bar_columns(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        currency=SupportedCurrencies.USD,
+        feed: DataFeed = DataFeed.IEX,
+        timeframe: TimeFrame = TimeFrame(1, TimeFrameUnit.Minute),
+        adjustment: Adjustment = Adjustment.RAW,
+        sort_order: Sort = Sort.ASC,
+        page_limit: int = 10000,
+        page_token: Optional[str] = None,
+    ) -> Optional[BarColumnsResponse]:
+        """
+        Fetch historical bar data for the given symbols and date range, decoded
+        straight into columns rather than one Bar per row.
+
+        Parameters:
+            symbols (list[str]): List of stock symbols.
+            start_date (datetime): Start date for the historical bars.
+            end_date (datetime): End date for the historical bars.
+            currency (SupportedCurrencies): The currency in which the data should be returned.
+            feed (DataFeed): Data feed provider.
+            timeframe (TimeFrame): The timeframe for the bars.
+            adjustment (Adjustment): The adjustment for the bars.
+            sort_order (Sort): Sort order for the pages.
+            page_limit (int): Maximum number of records to return.
+            page_token (Optional[str]): Pagination token for fetching next pages of results.
+
+        Returns:
+            Optional[BarColumnsResponse]: Historical bar frames per symbol if successful.
+        """
+        return await self.client.fetch_historical_bar_columns(
+            symbols,
+            start_date,
+            end_date,
+            currency,
+            feed,
+            timeframe,
+            adjustment,
+            sort_order,
+            page_limit,
+            page_token,
+        )
+
     async def fetch_latest_bars(
         self,
         symbols: list[str],
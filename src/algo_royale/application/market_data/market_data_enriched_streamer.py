@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional
 
 import pandas as pd
 
@@ -10,6 +10,7 @@ from algo_royale.application.market_data.queued_async_enriched_data_buffer impor
     QueuedAsyncEnrichedDataBuffer,
 )
 from algo_royale.application.utils.async_pubsub import AsyncPubSub, AsyncSubscriber
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
 from algo_royale.backtester.feature_engineering.feature_engineer import FeatureEngineer
 from algo_royale.logging.loggable import Loggable
@@ -23,8 +24,10 @@ class MarketDataEnrichedStreamer:
         feature_engineer: FeatureEngineer,
         market_data_streamer: MarketDataRawStreamer,
         logger: Loggable,
+        latency_tracker: Optional[LatencyTracker] = None,
     ):
         self.logger = logger
+        self.latency_tracker = latency_tracker
         self.market_data_streamer = market_data_streamer
         # MARKET DATA
         self.market_data_raw_subscriber_map: dict[str, list[AsyncSubscriber]] = {}
@@ -224,6 +227,13 @@ class MarketDataEnrichedStreamer:
                 self.logger.error(f"No enriched data found for {symbol}")
                 return
 
+            if self.latency_tracker:
+                self.latency_tracker.stamp(
+                    symbol,
+                    data.get(DataIngestColumns.TIMESTAMP),
+                    hop="enrichment",
+                    next_timestamp=enriched_data.get(DataIngestColumns.TIMESTAMP),
+                )
             # Publish the enriched data
             await self._async_publish_enriched_data(symbol, enriched_data)
             self.logger.info(f"Enriched data published for {symbol}")
@@ -238,7 +248,10 @@ class MarketDataEnrichedStreamer:
         if symbol not in self.pubsub_enriched_data_map:
             self.pubsub_enriched_data_map.setdefault(
                 symbol,
-                AsyncPubSub(),
+                AsyncPubSub(
+                    stage="market_data_enriched",
+                    latency_tracker=self.latency_tracker,
+                ),
             )
         return self.pubsub_enriched_data_map[symbol]
 
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
 from algo_royale.adapters.market_data.stream_adapter import StreamAdapter
@@ -6,6 +6,7 @@ from algo_royale.application.signals.stream_data_ingest_object import (
     StreamDataIngestObject,
 )
 from algo_royale.application.utils.async_pubsub import AsyncSubscriber
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 from algo_royale.logging.loggable import Loggable
 from algo_royale.models.alpaca_market_data.alpaca_stream_bar import StreamBar
 from algo_royale.models.alpaca_market_data.alpaca_stream_quote import StreamQuote
@@ -26,8 +27,10 @@ class MarketDataRawStreamer:
         data_stream_session_repo: DataStreamSessionRepo,
         logger: Loggable,
         clock_provider: ClockProvider,
+        latency_tracker: Optional[LatencyTracker] = None,
     ):
         self.stream_adapter = stream_adapter
+        self.latency_tracker = latency_tracker
         self.data_stream_session_repo = data_stream_session_repo
         self.stream_data_ingest_object_map: dict[str, StreamDataIngestObject] = {}
         self.upstream_subscriber_map: Dict[str, list[AsyncSubscriber]] = {}
@@ -165,9 +168,7 @@ class MarketDataRawStreamer:
                 self.logger.debug(f"No StreamDataIngestObject for {quote.symbol}")
                 return
 
-            await self.stream_data_ingest_object_map[quote.symbol]._update_with_quote(
-                quote
-            )
+            await self.stream_data_ingest_object_map[quote.symbol].async_update(quote)
             self.logger.debug(f"Updated stream data ingest object for {quote.symbol}")
 
         except Exception as e:
@@ -187,6 +188,8 @@ class MarketDataRawStreamer:
             else:
                 bar = StreamBar.from_raw(raw_bar)
 
+            if self.latency_tracker:
+                self.latency_tracker.start_trace(bar.symbol, bar.closing_epoch)
             self.logger.info(f"Received bar: {bar}")
 
             # Do nothing if there's no StreamDataIngestObject for this symbol
@@ -194,9 +197,7 @@ class MarketDataRawStreamer:
                 self.logger.debug(f"No StreamDataIngestObject for {bar.symbol}")
                 return
 
-            await self.stream_data_ingest_object_map[bar.symbol].async_update_with_bar(
-                bar
-            )
+            await self.stream_data_ingest_object_map[bar.symbol].async_update(bar)
             self.logger.debug(f"Updated stream data ingest object for {bar.symbol}")
         except Exception as e:
             self.logger.error(f"Error processing bar: {e}")
@@ -225,7 +226,7 @@ class MarketDataRawStreamer:
                     f"Creating StreamDataIngestObject for symbol: {symbol}"
                 )
                 self.stream_data_ingest_object_map[symbol] = StreamDataIngestObject(
-                    symbol
+                    symbol, latency_tracker=self.latency_tracker
                 )
             else:
                 self.logger.debug(
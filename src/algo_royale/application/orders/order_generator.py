@@ -1,5 +1,5 @@
 import asyncio
-from typing import Callable
+from typing import Callable, Optional
 
 from algo_royale.application.orders.equity_order_enums import EquityOrderSide
 from algo_royale.application.orders.signal_order_payload import SignalOrderPayload
@@ -9,6 +9,8 @@ from algo_royale.application.strategies.portfolio_strategy_registry import (
     PortfolioStrategyRegistry,
 )
 from algo_royale.application.utils.async_pubsub import AsyncPubSub, AsyncSubscriber
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
 from algo_royale.backtester.column_names.strategy_columns import SignalStrategyColumns
 from algo_royale.backtester.enums.signal_type import SignalType
 from algo_royale.backtester.strategy.portfolio.buffered_components.buffered_portfolio_strategy import (
@@ -25,6 +27,7 @@ class OrderGenerator:
         signal_generator: SignalGenerator,
         portfolio_strategy_registry: PortfolioStrategyRegistry,
         logger: Loggable,
+        latency_tracker: Optional[LatencyTracker] = None,
     ):
         """
         Initialize the OrderGenerator with a trading symbol and an optional logger.
@@ -32,8 +35,10 @@ class OrderGenerator:
         Args:
             signal_generator (SignalGenerator): The signal generator instance.
             logger (Loggable): Logger for logging events and errors.
+            latency_tracker (LatencyTracker): Optional tracker for live path latency.
         """
         self.logger = logger
+        self.latency_tracker = latency_tracker
         # SIGNAL GENERATOR
         self.signal_generator = signal_generator
         # PORTFOLIO STRATEGY REGISTRY
@@ -271,7 +276,9 @@ class OrderGenerator:
         If it does not exist, create a new one.
         """
         if symbol not in self.pubsub_orders_map:
-            self.pubsub_orders_map[symbol] = AsyncPubSub()
+            self.pubsub_orders_map[symbol] = AsyncPubSub(
+                stage="order_generated", latency_tracker=self.latency_tracker
+            )
         return self.pubsub_orders_map[symbol]
 
     async def _async_publish_order_event(self, order_payload: SignalOrderPayload):
@@ -284,8 +291,14 @@ class OrderGenerator:
             if not pubsub:
                 self.logger.error(f"No pubsub found for symbol: {symbol}")
                 return
+            if self.latency_tracker:
+                self.latency_tracker.stamp(
+                    symbol,
+                    order_payload.price_data.get(DataIngestColumns.TIMESTAMP),
+                    hop="order_generation",
+                )
             await pubsub.async_publish(
-                event_type=self.order_event_type, payload=order_payload
+                event_type=self.order_event_type, data=order_payload
             )
             self.logger.info(f"Order event published for {symbol}: {order_payload}")
         except Exception as e:
@@ -1,11 +1,13 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 from algo_royale.application.orders.equity_order_enums import EquityOrderSide
 
 
-class SignalOrderPayload(BaseModel):
+@dataclass(slots=True)
+class SignalOrderPayload:
     """
-    Payload for signal-based order generation.
+    Payload for signal-based order generation. Slotted, as one is built per
+    generated order on the live path.
 
     Attributes:
         symbol (str): The stock symbol for which the order is generated.
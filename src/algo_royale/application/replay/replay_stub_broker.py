@@ -0,0 +1,80 @@
+from typing import Optional
+
+from algo_royale.application.orders.signal_order_payload import SignalOrderPayload
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
+from algo_royale.logging.loggable import Loggable
+
+
+class ReplayStubBroker:
+    """
+    Broker stand-in for replay runs. Generated orders are filled immediately
+    at the bar close and kept in memory instead of reaching the ledger or Alpaca.
+    Filling an order closes its latency trace, like order execution does live.
+
+    Parameters:
+        logger: Loggable instance for logging information and errors.
+        latency_tracker: Optional tracker whose traces are closed on fill.
+    """
+
+    def __init__(
+        self,
+        logger: Loggable,
+        latency_tracker: Optional[LatencyTracker] = None,
+    ):
+        self.logger = logger
+        self.latency_tracker = latency_tracker
+        self.fills: list[dict] = []
+
+    async def async_submit_order(self, order_payload: SignalOrderPayload):
+        """
+        Fill an order event from the OrderGenerator.
+        :param order_payload: The generated order.
+        """
+        filled = False
+        try:
+            price_data = order_payload.price_data or {}
+            timestamp = price_data.get(DataIngestColumns.TIMESTAMP)
+            self.fills.append(
+                {
+                    "symbol": order_payload.symbol,
+                    "side": order_payload.side.value,
+                    "weight": order_payload.weight,
+                    "price": price_data.get(DataIngestColumns.CLOSE_PRICE),
+                    "timestamp": timestamp,
+                }
+            )
+            self.logger.debug(f"Stub fill: {self.fills[-1]}")
+            filled = True
+        except Exception as e:
+            self.logger.error(f"Error filling stub order: {e}")
+        finally:
+            if self.latency_tracker and order_payload is not None:
+                timestamp = (order_payload.price_data or {}).get(
+                    DataIngestColumns.TIMESTAMP
+                )
+                if filled:
+                    self.latency_tracker.stamp(
+                        order_payload.symbol,
+                        timestamp,
+                        hop="order_execution",
+                        final=True,
+                    )
+                else:
+                    self.latency_tracker.discard(
+                        order_payload.symbol, timestamp, reason="order_execution"
+                    )
+
+    def get_summary(self) -> dict:
+        """
+        :return: Fill counts in total, by side and by symbol.
+        """
+        by_side: dict[str, int] = {}
+        by_symbol: dict[str, int] = {}
+        for fill in self.fills:
+            by_side[fill["side"]] = by_side.get(fill["side"], 0) + 1
+            by_symbol[fill["symbol"]] = by_symbol.get(fill["symbol"], 0) + 1
+        return {"orders": len(self.fills), "by_side": by_side, "by_symbol": by_symbol}
+
+    def reset(self):
+        self.fills = []
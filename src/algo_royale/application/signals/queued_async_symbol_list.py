@@ -17,6 +17,10 @@ class QueuedAsyncSymbolList(QueuedAsyncUpdateObject):
         super().__init__(logger=logger)
         self.symbols: set[str] = symbols or set()
 
+    def _update_key(self, symbol: str) -> str:
+        # Each symbol is its own update; adds must not coalesce by type
+        return symbol
+
     def _update(self, symbol: str):
         """
         Update the list of symbols.
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from algo_royale.application.market_data.market_data_enriched_streamer import (
     MarketDataEnrichedStreamer,
@@ -12,6 +12,8 @@ from algo_royale.application.strategies.signal_strategy_registry import (
     SignalStrategyRegistry,
 )
 from algo_royale.application.utils.async_pubsub import AsyncSubscriber
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
 from algo_royale.backtester.strategy.signal.combined_weighted_signal_strategy import (
     CombinedWeightedSignalStrategy,
 )
@@ -26,8 +28,10 @@ class SignalGenerator:
         enriched_data_streamer: MarketDataEnrichedStreamer,
         strategy_registry: SignalStrategyRegistry,
         logger: Loggable,
+        latency_tracker: Optional[LatencyTracker] = None,
     ):
         self.logger = logger
+        self.latency_tracker = latency_tracker
         self.enriched_data_streamer = enriched_data_streamer
         self.strategy_registry = strategy_registry
         # MARKET DATA
@@ -37,7 +41,7 @@ class SignalGenerator:
         # SIGNALS
         self.symbol_signal_lock_map: dict[str, asyncio.Lock] = {}
         self.signal_roster: StreamSignalRosterObject = StreamSignalRosterObject(
-            initial_symbols=[], logger=self.logger
+            initial_symbols=[], logger=self.logger, latency_tracker=latency_tracker
         )
         self.subscribers = []
         self.logger.info("SignalGenerator initialized.")
@@ -230,6 +234,12 @@ class SignalGenerator:
                 return
             else:
                 payload = SignalDataPayload(signals=signals, price_data=enriched_data)
+                if self.latency_tracker:
+                    self.latency_tracker.stamp(
+                        symbol,
+                        enriched_data.get(DataIngestColumns.TIMESTAMP),
+                        hop="signal",
+                    )
                 await self.signal_roster.async_set_signal_data_payload(
                     symbol=symbol, payload=payload
                 )
@@ -286,7 +296,9 @@ class SignalGenerator:
             await self._async_unsubscribe_all_subscribers()
             await self.signal_roster.async_shutdown()
             self.signal_roster = StreamSignalRosterObject(
-                initial_symbols=[], logger=self.logger
+                initial_symbols=[],
+                logger=self.logger,
+                latency_tracker=self.latency_tracker,
             )
             self.symbol_strategy_map.clear()
             await self._async_unsubscribe_from_enriched_data()
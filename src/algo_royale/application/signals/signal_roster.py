@@ -0,0 +1,58 @@
+from collections.abc import Iterator, Mapping
+
+from algo_royale.application.signals.signals_data_payload import SignalDataPayload
+
+
+class SignalRoster(Mapping):
+    """
+    Read-only snapshot of the signal roster: symbol -> SignalDataPayload.
+
+    Array-backed rather than a dict per publish. The symbol order and the
+    symbol -> slot index are shared by every snapshot until the roster gains
+    a symbol, so a snapshot only allocates the tuple of current payloads.
+    Symbols that have not produced a payload yet are left out.
+
+    Parameters:
+        symbols: Symbols in slot order.
+        slots: Symbol -> slot position in `symbols`.
+        payloads: Payload of each slot, or None if the symbol has none yet.
+    """
+
+    __slots__ = ("_symbols", "_slots", "_payloads", "_size")
+
+    def __init__(
+        self,
+        symbols: tuple[str, ...],
+        slots: dict[str, int],
+        payloads: tuple[SignalDataPayload | None, ...],
+    ):
+        self._symbols = symbols
+        self._slots = slots
+        self._payloads = payloads
+        self._size = len(payloads) - payloads.count(None)
+
+    def __getitem__(self, symbol: str) -> SignalDataPayload:
+        slot = self._slots.get(symbol)
+        payload = self._payloads[slot] if slot is not None else None
+        if payload is None:
+            raise KeyError(symbol)
+        return payload
+
+    def __iter__(self) -> Iterator[str]:
+        for symbol, payload in zip(self._symbols, self._payloads):
+            if payload is not None:
+                yield symbol
+
+    def __len__(self) -> int:
+        return self._size
+
+    def items(self):
+        """(symbol, payload) pairs, read straight from the slots."""
+        return [
+            (symbol, payload)
+            for symbol, payload in zip(self._symbols, self._payloads)
+            if payload is not None
+        ]
+
+    def __repr__(self) -> str:
+        return f"SignalRoster({dict(self.items())!r})"
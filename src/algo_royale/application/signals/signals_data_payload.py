@@ -1,9 +1,12 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class SignalDataPayload(BaseModel):
-    """SignalDataPayload is a Pydantic model that represents the payload for signal data.
+@dataclass(slots=True)
+class SignalDataPayload:
+    """SignalDataPayload represents the payload for signal data of one symbol on one bar.
     It includes fields for signals and price data, both of which are dictionaries.
+    It is slotted (no per-instance __dict__) since one is built per symbol per bar.
+    Payloads are not mutated once set on the roster, so subscribers share them.
 
         Attributes:
             signals (dict): A dictionary containing trading signals for various stock symbols.
@@ -23,3 +26,7 @@ class SignalDataPayload(BaseModel):
 
     signals: dict
     price_data: dict
+
+    def copy(self) -> "SignalDataPayload":
+        """Shallow copy; the signal and price dicts are shared."""
+        return SignalDataPayload(signals=self.signals, price_data=self.price_data)
@@ -2,6 +2,7 @@ import asyncio
 from typing import Any, Callable, Optional, Union
 
 from algo_royale.application.utils.async_pubsub import AsyncPubSub, AsyncSubscriber
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 from algo_royale.application.utils.queued_async_update_object import (
     QueuedAsyncUpdateObject,
 )
@@ -18,7 +19,12 @@ class StreamDataIngestObject(QueuedAsyncUpdateObject):
 
     update_type = "UPDATE"
 
-    def __init__(self, symbol: str, logger=None):
+    def __init__(
+        self,
+        symbol: str,
+        logger=None,
+        latency_tracker: Optional[LatencyTracker] = None,
+    ):
         """
         Initialize the StreamDataIngestObject.
         """
@@ -36,7 +42,9 @@ class StreamDataIngestObject(QueuedAsyncUpdateObject):
             DataIngestColumns.NUM_TRADES: None,
             DataIngestColumns.VOLUME_WEIGHTED_PRICE: None,
         }
-        self._pubsub = AsyncPubSub()
+        self._pubsub = AsyncPubSub(
+            stage="market_data_raw", latency_tracker=latency_tracker
+        )
         super().__init__(logger=logger)
 
     def subscribe(
@@ -88,15 +96,15 @@ class StreamDataIngestObject(QueuedAsyncUpdateObject):
         """
         async with self.get_set_lock:
             if isinstance(obj, StreamQuote):
-                self._update_with_quote(obj)
+                await self._update_with_quote(obj)
             elif isinstance(obj, StreamBar):
-                self._update_with_bar(obj)
+                await self._update_with_bar(obj)
             else:
                 raise TypeError(
                     f"[StreamDataIngestObject: {self.symbol}] Unsupported object type: {type(obj)}"
                 )
 
-    def _update_with_quote(self, quote: StreamQuote):
+    async def _update_with_quote(self, quote: StreamQuote):
         """
         Update the data with a new market quote.
         """
@@ -132,7 +140,7 @@ class StreamDataIngestObject(QueuedAsyncUpdateObject):
             self.data[DataIngestColumns.HIGH_PRICE] = new_high_price
             self.data[DataIngestColumns.LOW_PRICE] = new_low_price
             self.data[DataIngestColumns.TIMESTAMP] = quote.timestamp
-            self._pubsub.async_publish(
+            await self._pubsub.async_publish(
                 event_type=self.update_type, data=self.data.copy()
             )
 
@@ -141,7 +149,7 @@ class StreamDataIngestObject(QueuedAsyncUpdateObject):
                 f"[StreamDataIngestObject: {self.symbol}] Error _updating with quote: {e}"
             )
 
-    def _update_with_bar(self, bar: StreamBar):
+    async def _update_with_bar(self, bar: StreamBar):
         """
         Update the data with a new market bar.
         """
@@ -154,11 +162,8 @@ class StreamDataIngestObject(QueuedAsyncUpdateObject):
             self.data[DataIngestColumns.LOW_PRICE] = bar.low_price
             self.data[DataIngestColumns.CLOSE_PRICE] = bar.close_price
             self.data[DataIngestColumns.VOLUME] = bar.volume
-            self.data[DataIngestColumns.NUM_TRADES] = bar.num_trades
-            self.data[DataIngestColumns.VOLUME_WEIGHTED_PRICE] = (
-                bar.volume_weighted_price
-            )
-            self._pubsub.async_publish(
+            self.data[DataIngestColumns.VOLUME_WEIGHTED_PRICE] = bar.vwap
+            await self._pubsub.async_publish(
                 event_type=self.update_type, data=self.data.copy()
             )
         except Exception as e:
@@ -1,120 +1,103 @@
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
-from algo_royale.application.signals.queued_async_data_payload import (
-    QueuedAsyncSignalDataPayload,
-)
-from algo_royale.application.signals.queued_async_symbol_list import (
-    QueuedAsyncSymbolList,
-)
+from algo_royale.application.signals.signal_roster import SignalRoster
 from algo_royale.application.signals.signals_data_payload import SignalDataPayload
 from algo_royale.application.utils.async_pubsub import AsyncPubSub, AsyncSubscriber
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 
 
 class StreamSignalRosterObject:
     """
-    This class manages the roster of signals for a specific symbol.
+    This class manages the roster of signals across symbols.
+
+    The roster is array-backed: each symbol owns a slot in a payload list,
+    and setting a payload overwrites its slot in place. Each update publishes
+    one SignalRoster snapshot shared by all subscribers; payloads are not
+    copied since they are not mutated once set.
     """
 
     update_type = "UPDATE"
 
-    def __init__(self, initial_symbols: list[str], logger=None):
+    def __init__(
+        self,
+        initial_symbols: list[str],
+        logger=None,
+        latency_tracker: Optional[LatencyTracker] = None,
+    ):
         """
         Initialize the StreamSignalRosterObject.
         """
         self.logger = logger
-        self._pubsub = AsyncPubSub()
-        self._queued_symbols_list = QueuedAsyncSymbolList(symbols=initial_symbols)
+        self._pubsub = AsyncPubSub(
+            stage="signal_roster", latency_tracker=latency_tracker
+        )
+        self._symbols: tuple[str, ...] = ()
+        self._slots: dict[str, int] = {}
+        self._payloads: list[SignalDataPayload | None] = []
         self._initialize_signal_data(symbols=initial_symbols)
 
     def _initialize_signal_data(self, symbols: list[str]):
         """
         Initialize the signal data structure for the given symbols.
-        This creates a pubsub queue for each symbol to handle signal updates.
+        This reserves a roster slot for each symbol.
         """
         for symbol in symbols:
-            self._get_signal_payload_queue(symbol)
-
-    def _get_queued_async_signal_data_payload_name(self, symbol: str) -> str:
-        """
-        Get the name of the pubsub queue for a specific symbol.
-        """
-        return f"signal_data_payload_{symbol}"
-
-    def _get_signal_payload_queue(self, symbol: str) -> QueuedAsyncSignalDataPayload:
-        """
-        Get the signal payload queue for a specific symbol.
-        If it doesn't exist, create a new one.
-        """
-        queue_name = self._get_queued_async_signal_data_payload_name(symbol)
-        value = getattr(self, queue_name, None)
-        if not isinstance(value, QueuedAsyncSignalDataPayload):
-            self.logger.warning(
-                f"No queued async signal data payload found for symbol: {symbol}. Creating new one."
-            )
-            setattr(self, queue_name, QueuedAsyncSignalDataPayload(symbol))
-            value = getattr(self, queue_name)
-        return value
+            self._get_slot(symbol)
 
-    async def _async_get_signal_data_payload(self, symbol: str) -> SignalDataPayload:
+    def _get_slot(self, symbol: str) -> int:
         """
-        Get the signal payload for a specific symbol.
+        Get the roster slot for a specific symbol.
+        If it doesn't exist, append a new one. The symbol order and slot index
+        are replaced rather than mutated, so published snapshots keep theirs.
         """
-        queue = self._get_signal_payload_queue(symbol)
-        # Now get the payload
-        return await queue.async_get_payload()
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self._payloads)
+            self._symbols = self._symbols + (symbol,)
+            self._slots = {**self._slots, symbol: slot}
+            self._payloads.append(None)
+        return slot
 
-    async def _async_update_queued_symbols_list(self, symbol: str):
+    def get_signal_data_payload(self, symbol: str) -> SignalDataPayload | None:
         """
-        Update the list of symbols in the queued async symbol list.
+        Get the latest signal payload for a specific symbol.
         """
-        if symbol not in self._queued_symbols_list.symbols:
-            await self._queued_symbols_list.async_update(symbol)
-
-    async def _async_set_signal_data_payload(
-        self, symbol: str, payload: SignalDataPayload
-    ):
-        """
-        Set the signal payload for a specific symbol.
-        """
-        queue = self._get_signal_payload_queue(symbol)
-        # Now set the payload
-        await queue.async_set_payload(payload)
+        slot = self._slots.get(symbol)
+        return self._payloads[slot] if slot is not None else None
 
     async def async_set_signal_data_payload(
         self, symbol: str, payload: SignalDataPayload
     ):
         """Set the signal data payload for a specific symbol.
-        This will update the queued symbols list and the signal data payload.
+        This will update the symbol's roster slot and publish the roster.
         """
-        await self._async_update_queued_symbols_list(symbol)
-        await self._async_set_signal_data_payload(symbol, payload)
+        self._payloads[self._get_slot(symbol)] = payload
         await self._async_publish_roster_update()
 
-    async def _async_get_signal_data_roster(
-        self, symbols: list[str]
-    ) -> dict[str, SignalDataPayload]:
+    def get_signal_data_roster(self) -> SignalRoster:
         """
-        Get the signal data payloads for a list of symbols.
-        Returns a dictionary mapping symbol to SignalDataPayload.
+        Get a snapshot of the current roster of signal data payloads.
         """
-        payloads = {}
-        for symbol in symbols:
-            payload = await self._async_get_signal_data_payload(symbol)
-            payloads[symbol] = payload.copy()
-        return payloads
+        return SignalRoster(
+            symbols=self._symbols,
+            slots=self._slots,
+            payloads=tuple(self._payloads),
+        )
 
     async def _async_publish_roster_update(self):
         """Publish the current roster of signal data payloads.
         This will notify all subscribers of the latest state.
         """
-        symbols = self._queued_symbols_list.symbols
-        roster = await self._async_get_signal_data_roster(symbols=symbols)
-        await self._pubsub.async_publish(self.update_type, roster)
+        if not self._pubsub.has_subscribers(self.update_type):
+            return
+        await self._pubsub.async_publish(
+            self.update_type, self.get_signal_data_roster()
+        )
 
     def subscribe(
         self,
         callback: Callable[
-            [dict[str, SignalDataPayload], type], Any
+            [SignalRoster, type], Any
         ],  # callback receives (data, object_type)
         queue_size: int = 1,
     ) -> AsyncSubscriber:
@@ -4,6 +4,9 @@ from pathlib import Path
 from typing import Dict, Sequence
 
 # (removed unused import 'symbol')
+from algo_royale.application.strategies.strategy_registry_snapshot import (
+    StrategyRegistrySnapshot,
+)
 from algo_royale.backtester.maps.portfolio_strategy_class_map import (
     PORTFOLIO_STRATEGY_CLASS_MAP,
 )
@@ -39,8 +42,9 @@ class PortfolioStrategyRegistry:
         self.viable_strategies_path = Path(viable_strategies_path)
         self.portfolio_strategy_factory = portfolio_strategy_factory
         self.logger = logger
-        # Map of symbol_dir_name -> strategy descriptor dict (persisted as JSON)
+        # Map of symbol_dir_name -> strategy descriptor dict (persisted in the snapshot)
         self.portfolio_strategy_map: dict[str, dict] = {}
+        self.snapshot: StrategyRegistrySnapshot | None = None
         # Lock to protect concurrent access to portfolio_strategy_map and file writes
         self._lock = threading.RLock()
         self.optimization_root_path = Path(optimization_root_path)
@@ -67,7 +71,7 @@ class PortfolioStrategyRegistry:
                 )
                 # Only persist if we actually found a viable best strategy.
                 if best_portfolio_strategy_map:
-                    self._sync_viable_strategy_params()
+                    self._sync_viable_strategy_params(symbol_str)
                 else:
                     self.logger.info(
                         f"No viable portfolio strategies found for {symbol_str}; skipping sync."
@@ -81,46 +85,39 @@ class PortfolioStrategyRegistry:
         return None
 
     def _load_existing_viable_strategy_params(self):
-        """Get existing viable strategy parameters for a given symbol."""
+        """Load the viable portfolio strategies from the registry snapshot."""
         self.logger.info("Retrieving viable strategy parameters...")
         try:
-            if (
-                not self.viable_strategies_path.exists()
-                or self.viable_strategies_path.stat().st_size == 0
-            ):
-                self.logger.info(
-                    f"Viable strategies file {self.viable_strategies_path} does not exist or is empty. Initializing."
+            self.logger.info(
+                f"Loading viable strategies from {self.viable_strategies_path}..."
+            )
+            with self._lock:
+                self.snapshot = StrategyRegistrySnapshot(
+                    path=self.viable_strategies_path, logger=self.logger
                 )
-                with open(self.viable_strategies_path, "w") as f:
-                    json.dump({}, f)
-                self.portfolio_strategy_map = {}
-            with open(self.viable_strategies_path, "r") as f:
-                try:
-                    self.logger.info(
-                        f"Loading viable strategies from {self.viable_strategies_path}..."
-                    )
-                    self.portfolio_strategy_map = json.load(f)
-                except json.JSONDecodeError as e:
-                    self.logger.error(
-                        f"Error decoding JSON from {self.viable_strategies_path}: {e}"
-                    )
-                    self.portfolio_strategy_map = {}
+                self.portfolio_strategy_map = self.snapshot.load()
         except Exception as e:
             self.logger.error(f"Error getting existing strategies: {e}")
+            self.portfolio_strategy_map = {}
 
-    def _sync_viable_strategy_params(self):
-        """Sync the current state with the viable strategies file."""
+    def _sync_viable_strategy_params(self, symbol_str: str | None = None):
+        """
+        Persist the viable portfolio strategies. A single entry is appended to
+        the snapshot; without a key the whole map is rewritten atomically.
+        """
         self.logger.info("Syncing viable portfolio strategy parameters...")
         try:
-            # Write atomically: write to a temp file then replace the target.
-            tmp_path = self.viable_strategies_path.with_suffix(".tmp")
-            # Lock map snapshot during write to ensure consistency
+            if self.snapshot is None:
+                return
+            # Lock the map while persisting to keep the snapshot consistent
             with self._lock:
-                snapshot = dict(self.portfolio_strategy_map)
-            with open(tmp_path, "w") as f:
-                json.dump(snapshot, f, indent=2)
-            # Use Path.replace/rename which is atomic on most OSes
-            tmp_path.replace(self.viable_strategies_path)
+                if symbol_str is not None:
+                    self.snapshot.put(
+                        symbol_str, self.portfolio_strategy_map.get(symbol_str)
+                    )
+                else:
+                    self.snapshot.data = dict(self.portfolio_strategy_map)
+                    self.snapshot.compact()
             self.logger.info(
                 f"Viable portfolio strategies successfully synced to {self.viable_strategies_path}"
             )
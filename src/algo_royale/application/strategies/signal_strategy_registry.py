@@ -1,5 +1,6 @@
 """Manages the collection of available strategies and resolves them per symbol.
-State of symbol-strategy pairs is maintained in the strategy registry.
+State of symbol-strategy pairs is maintained in the strategy registry snapshot,
+loaded once at startup; strategy objects are only built when a symbol first streams.
 Daily or on-demand update reports are generated to track changes in strategy availability and use.
 """
 
@@ -7,6 +8,9 @@ import json
 from pathlib import Path
 from typing import Dict
 
+from algo_royale.application.strategies.strategy_registry_snapshot import (
+    StrategyRegistrySnapshot,
+)
 from algo_royale.backtester.maps.strategy_class_map import SYMBOL_STRATEGY_CLASS_MAP
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
 from algo_royale.backtester.strategy.signal.combined_weighted_signal_strategy import (
@@ -46,6 +50,7 @@ class SignalStrategyRegistry:
         if not (0 <= self.combined_sell_threshold <= 1):
             raise ValueError("combined_sell_threshold must be between 0 and 1")
         self.symbol_strategy_map = {}
+        self.snapshot: StrategyRegistrySnapshot | None = None
         self._load_existing_viable_strategy_params()
 
     def get_combined_weighted_signal_strategy(
@@ -60,7 +65,7 @@ class SignalStrategyRegistry:
                     f"No buffered strategies found for {symbol}. Retrieving existing viable strategies."
                 )
                 viable_symbol_strategy_map = self._update_symbol_strategy_map(symbol)
-                self._sync_viable_strategy_params()
+                self._sync_viable_strategy_params(symbol)
             return self._get_combined_weighted_signal_strategy(
                 viable_symbol_strategy_map
             )
@@ -71,36 +76,31 @@ class SignalStrategyRegistry:
         return None
 
     def _load_existing_viable_strategy_params(self):
-        """Get existing viable strategy parameters for a given symbol."""
+        """Load the viable strategy parameters of every symbol from the registry snapshot."""
         self.logger.info("Retrieving viable strategy parameters...")
         try:
-            if (
-                not self.viable_strategies_path.exists()
-                or self.viable_strategies_path.stat().st_size == 0
-            ):
-                self.logger.info(
-                    f"Viable strategies file {self.viable_strategies_path} does not exist or is empty. Initializing."
-                )
-                with open(self.viable_strategies_path, "w") as f:
-                    json.dump({}, f)
-                self.symbol_strategy_map = {}
-            with open(self.viable_strategies_path, "r") as f:
-                try:
-                    self.symbol_strategy_map = json.load(f)
-                except json.JSONDecodeError as e:
-                    self.logger.error(
-                        f"Error decoding JSON from {self.viable_strategies_path}: {e}"
-                    )
-                    self.symbol_strategy_map = {}
+            self.snapshot = StrategyRegistrySnapshot(
+                path=self.viable_strategies_path, logger=self.logger
+            )
+            self.symbol_strategy_map = self.snapshot.load()
         except Exception as e:
             self.logger.error(f"Error getting existing strategies: {e}")
+            self.symbol_strategy_map = {}
 
-    def _sync_viable_strategy_params(self):
-        """Sync the current state with the viable strategies file."""
+    def _sync_viable_strategy_params(self, symbol: str | None = None):
+        """
+        Persist the viable strategies. A single symbol's entry is appended to the
+        snapshot; without a symbol the whole map is written.
+        """
         self.logger.info("Syncing viable strategy parameters...")
         try:
-            with open(self.viable_strategies_path, "w") as f:
-                json.dump(self.symbol_strategy_map, f, indent=2)
+            if self.snapshot is None:
+                return
+            if symbol is not None:
+                self.snapshot.put(symbol, self.symbol_strategy_map.get(symbol))
+            else:
+                self.snapshot.data = self.symbol_strategy_map
+                self.snapshot.compact()
             self.logger.info(
                 f"Viable strategies successfully synced to {self.viable_strategies_path}"
             )
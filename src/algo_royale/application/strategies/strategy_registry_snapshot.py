@@ -0,0 +1,171 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from algo_royale.logging.loggable import Loggable
+
+
+class StrategyRegistrySnapshot:
+    """
+    Versioned, append-only snapshot of a strategy registry.
+
+    The file is a JSON-lines journal: a header line carrying the format
+    version, then one compact `{"k": key, "v": value}` record per update,
+    the latest record for a key winning. The whole snapshot loads with a
+    single read into a dict for O(1) lookups, and each update appends one
+    line instead of rewriting the file. The journal is compacted (rewritten
+    atomically with one record per key) when superseded records pile up.
+
+    Files in the previous format, a single JSON object of key -> value,
+    are loaded as-is and migrated on load. A journal with a corrupt record
+    is compacted on load so later appends start on a fresh line, and a
+    journal with another version is ignored and replaced on the next update.
+
+    Parameters:
+        path: Snapshot file path.
+        logger: Loggable instance for logging information and errors.
+        compact_ratio: Compact once the journal holds this many records per live key.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | Path, logger: Loggable, compact_ratio: float = 2.0):
+        self.path = Path(path)
+        self.logger = logger
+        self.compact_ratio = compact_ratio
+        self.data: dict[str, Any] = {}
+        self._records = 0
+        self._rewrite_on_put = False
+        self._lock = threading.RLock()
+
+    def load(self) -> dict[str, Any]:
+        """
+        Load the snapshot with one read, migrating a legacy JSON file.
+        :return: The key -> value map.
+        """
+        with self._lock:
+            self.data = {}
+            self._records = 0
+            self._rewrite_on_put = False
+            try:
+                text = self.path.read_text() if self.path.exists() else ""
+            except Exception as e:
+                self.logger.error(f"Error reading registry snapshot {self.path}: {e}")
+                return self.data
+            if not text.strip():
+                self.logger.info(
+                    f"Registry snapshot {self.path} does not exist or is empty. Initializing."
+                )
+                self.compact()
+                return self.data
+
+            first_line, _, rest = text.partition("\n")
+            header = self._parse_header(first_line)
+            if header is None:
+                self._load_legacy(text)
+                return self.data
+            if header.get("version") != self.VERSION:
+                self.logger.warning(
+                    f"Registry snapshot {self.path} has version {header.get('version')}, expected {self.VERSION}. Ignoring."
+                )
+                self._rewrite_on_put = True
+                return self.data
+            corrupt = False
+            for line in rest.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    # A torn final append is dropped; earlier records still apply
+                    self.logger.error(
+                        f"Skipping corrupt record in registry snapshot {self.path}: {e}"
+                    )
+                    corrupt = True
+                    continue
+                self._apply(record["k"], record.get("v"))
+                self._records += 1
+            if corrupt or self._needs_compaction():
+                self.compact()
+            return self.data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def put(self, key: str, value: Any):
+        """
+        Set a key and append the update to the journal.
+        :param key: The registry key (e.g. a symbol).
+        :param value: JSON-serializable value; None removes the key.
+        """
+        with self._lock:
+            self._apply(key, value)
+            try:
+                if self._rewrite_on_put or not self.path.exists():
+                    self.compact()
+                    return
+                with open(self.path, "a") as f:
+                    f.write(self._record_line(key, value))
+                self._records += 1
+                if self._needs_compaction():
+                    self.compact()
+            except Exception as e:
+                self.logger.error(
+                    f"Error appending to registry snapshot {self.path}: {e}"
+                )
+
+    def compact(self):
+        """Rewrite the journal atomically with one record per live key."""
+        with self._lock:
+            try:
+                content = json.dumps({"version": self.VERSION}) + "\n"
+                content += "".join(
+                    self._record_line(key, value) for key, value in self.data.items()
+                )
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                tmp_path.write_text(content)
+                tmp_path.replace(self.path)
+                self._records = len(self.data)
+                self._rewrite_on_put = False
+            except Exception as e:
+                self.logger.error(
+                    f"Error compacting registry snapshot {self.path}: {e}"
+                )
+
+    def _apply(self, key: str, value: Any):
+        if value is None:
+            self.data.pop(key, None)
+        else:
+            self.data[key] = value
+
+    def _load_legacy(self, text: str):
+        try:
+            legacy = json.loads(text)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Error decoding JSON from {self.path}: {e}")
+            return
+        if not isinstance(legacy, dict):
+            self.logger.error(f"Unexpected registry format in {self.path}. Ignoring.")
+            return
+        self.logger.info(f"Migrating registry {self.path} to snapshot format.")
+        self.data = legacy
+        self.compact()
+
+    def _needs_compaction(self) -> bool:
+        return self._records > max(len(self.data), 1) * self.compact_ratio
+
+    @staticmethod
+    def _parse_header(line: str) -> Optional[dict]:
+        try:
+            header = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(header, dict) and set(header) == {"version"}:
+            return header
+        return None
+
+    @staticmethod
+    def _record_line(key: str, value: Any) -> str:
+        return json.dumps({"k": key, "v": value}, separators=(",", ":")) + "\n"
@@ -31,6 +31,21 @@ class SymbolHoldTracker:
         except Exception as e:
             self.logger.error(f"Error setting hold for {symbol}: {e}")
 
+    async def async_set_holds(self, holds: dict[str, SymbolHoldStatus]):
+        """Set the hold status for many symbols with a single roster update."""
+        try:
+            async with self.lock:
+                self.symbol_holds.update(holds)
+                for symbol, status in holds.items():
+                    await self._symbol_hold_pubsub.async_publish(
+                        event_type=self.event_type, data={symbol: status}
+                    )
+                await self._roster_hold_pubsub.async_publish(
+                    event_type=self.event_type, data=self.symbol_holds
+                )
+        except Exception as e:
+            self.logger.error(f"Error setting holds for {list(holds)}: {e}")
+
     async def async_subscribe_to_symbol_holds(
         self,
         callback: Callable[[dict[str, SymbolHoldStatus]], None],
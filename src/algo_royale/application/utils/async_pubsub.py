@@ -1,6 +1,9 @@
 import asyncio
+import time
 from typing import Any, Callable, Dict, List, Optional
 
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+
 
 class AsyncSubscriber:
     def __init__(
@@ -9,17 +12,26 @@ class AsyncSubscriber:
         callback: Callable[[Any], Any],
         filter_fn: Optional[Callable[[Any], bool]] = None,
         queue_size: int = 10,
+        stage: Optional[str] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
     ):
         self.event_type = event_type
         self.callback = callback
         self.filter_fn = filter_fn
+        self.stage = stage or event_type
+        self.latency_tracker = latency_tracker
+        # Items are queued as (enqueued_at, data) so queue wait can be measured
         self.queue = asyncio.Queue(maxsize=queue_size)
         self._task = asyncio.create_task(self._consume())
 
     async def _consume(self):
         try:
             while True:
-                data = await self.queue.get()
+                enqueued_at, data = await self.queue.get()
+                if self.latency_tracker:
+                    self.latency_tracker.record_queue_wait(
+                        self.stage, time.perf_counter() - enqueued_at
+                    )
                 if self.filter_fn is None or self.filter_fn(data):
                     await self.callback(data)
         except asyncio.CancelledError:
@@ -28,15 +40,29 @@ class AsyncSubscriber:
     async def async_send(self, data: Any):
         if self.queue.full():
             self.queue.get_nowait()  # discard oldest item if full
-        await self.queue.put(data)
+            if self.latency_tracker:
+                self.latency_tracker.record_drop(self.stage)
+        await self.queue.put((time.perf_counter(), data))
 
     def cancel(self):
         self._task.cancel()
 
 
 class AsyncPubSub:
-    def __init__(self):
+    """
+    Minimal async publish/subscribe hub.
+    :param stage: Name reported to the latency tracker for queue waits and drops.
+    :param latency_tracker: Optional LatencyTracker for queue instrumentation.
+    """
+
+    def __init__(
+        self,
+        stage: Optional[str] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
+    ):
         self.subscribers: Dict[str, List[AsyncSubscriber]] = {}
+        self.stage = stage
+        self.latency_tracker = latency_tracker
 
     def has_subscribers(self, event_type: str) -> bool:
         """Return True if there are any subscribers for the given event type."""
@@ -49,7 +75,14 @@ class AsyncPubSub:
         filter_fn: Optional[Callable[[Any], bool]] = None,
         queue_size: int = 1,
     ) -> AsyncSubscriber:
-        sub = AsyncSubscriber(event_type, callback, filter_fn, queue_size)
+        sub = AsyncSubscriber(
+            event_type,
+            callback,
+            filter_fn,
+            queue_size,
+            stage=self.stage,
+            latency_tracker=self.latency_tracker,
+        )
         self.subscribers.setdefault(event_type, []).append(sub)
         return sub
 
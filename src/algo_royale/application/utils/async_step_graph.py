@@ -0,0 +1,163 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from algo_royale.logging.loggable import Loggable
+
+
+@dataclass
+class AsyncStep:
+    """
+    A named unit of work in an AsyncStepGraph.
+
+    Attributes:
+        name: Unique step name, used by other steps' `depends_on`.
+        fn: Coroutine function or plain callable taking no arguments. Plain
+            callables run in a worker thread so blocking I/O does not stall the loop.
+        depends_on: Names of the steps that must succeed before this one starts.
+        timeout_seconds: Time budget for the step; falls back to the graph default.
+    """
+
+    name: str
+    fn: Callable[[], Any]
+    depends_on: tuple[str, ...] = ()
+    timeout_seconds: Optional[float] = None
+
+
+class AsyncStepGraph:
+    """
+    Runs a set of steps as a dependency graph: every step starts as soon as
+    its dependencies have succeeded, so independent steps run concurrently.
+    A step that fails or exceeds its time budget causes its dependents to be
+    skipped. The run returns a timing breakdown per step.
+
+    A timed-out thread step cannot be interrupted; the graph stops waiting
+    for it and its thread finishes in the background.
+
+    Parameters:
+        steps: The steps to run.
+        logger: Loggable instance for logging information and errors.
+        default_timeout_seconds: Time budget for steps without their own.
+    """
+
+    OK = "ok"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    SKIPPED = "skipped"
+
+    def __init__(
+        self,
+        steps: list[AsyncStep],
+        logger: Loggable,
+        default_timeout_seconds: Optional[float] = None,
+    ):
+        self.steps = self._sort_steps(steps)
+        self.logger = logger
+        self.default_timeout_seconds = default_timeout_seconds
+
+    async def async_run(self) -> dict:
+        """
+        Run every step.
+        :return: A report with `succeeded`, the wall time, the summed step time
+            and, per step, its status, start offset, duration and error.
+        """
+        started = time.perf_counter()
+        results: dict[str, dict] = {}
+        tasks: dict[str, asyncio.Task] = {}
+        for step in self.steps:
+            dependencies = [tasks[name] for name in step.depends_on]
+            tasks[step.name] = asyncio.create_task(
+                self._async_run_step(step, dependencies, started, results)
+            )
+        await asyncio.gather(*tasks.values())
+
+        report = {
+            "succeeded": all(r["status"] == self.OK for r in results.values()),
+            "wall_time_sec": round(time.perf_counter() - started, 4),
+            "step_time_sec": round(sum(r["duration_sec"] for r in results.values()), 4),
+            "steps": {step.name: results[step.name] for step in self.steps},
+        }
+        return report
+
+    async def _async_run_step(
+        self,
+        step: AsyncStep,
+        dependencies: list[asyncio.Task],
+        started: float,
+        results: dict[str, dict],
+    ) -> str:
+        statuses = await asyncio.gather(*dependencies)
+        step_started = time.perf_counter()
+        result = {
+            "status": self.OK,
+            "start_sec": round(step_started - started, 4),
+            "duration_sec": 0.0,
+            "error": None,
+        }
+        results[step.name] = result
+        if any(status != self.OK for status in statuses):
+            result["status"] = self.SKIPPED
+            self.logger.warning(
+                f"Skipping step {step.name}: a dependency did not succeed."
+            )
+            return result["status"]
+
+        timeout = (
+            step.timeout_seconds
+            if step.timeout_seconds is not None
+            else self.default_timeout_seconds
+        )
+        try:
+            await asyncio.wait_for(self._call(step.fn), timeout=timeout)
+        except asyncio.TimeoutError:
+            result["status"] = self.TIMEOUT
+            result["error"] = f"exceeded {timeout}s"
+            self.logger.error(f"Step {step.name} exceeded its {timeout}s budget.")
+        except Exception as e:
+            result["status"] = self.FAILED
+            result["error"] = str(e)
+            self.logger.error(f"Step {step.name} failed: {e}")
+        result["duration_sec"] = round(time.perf_counter() - step_started, 4)
+        return result["status"]
+
+    @staticmethod
+    async def _call(fn: Callable[[], Any]) -> Any:
+        if inspect.iscoroutinefunction(fn):
+            return await fn()
+        result = await asyncio.to_thread(fn)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    @staticmethod
+    def _sort_steps(steps: list[AsyncStep]) -> list[AsyncStep]:
+        """Order steps so dependencies come first; reject unknown names and cycles."""
+        by_name = {}
+        for step in steps:
+            if step.name in by_name:
+                raise ValueError(f"Duplicate step name: {step.name}")
+            by_name[step.name] = step
+        for step in steps:
+            for name in step.depends_on:
+                if name not in by_name:
+                    raise ValueError(f"Step {step.name} depends on unknown step {name}")
+
+        ordered: list[AsyncStep] = []
+        state: dict[str, str] = {}
+
+        def visit(step: AsyncStep):
+            if state.get(step.name) == "done":
+                return
+            if state.get(step.name) == "visiting":
+                raise ValueError(f"Dependency cycle at step {step.name}")
+            state[step.name] = "visiting"
+            for name in step.depends_on:
+                visit(by_name[name])
+            state[step.name] = "done"
+            ordered.append(step)
+
+        for step in steps:
+            visit(step)
+        return ordered
@@ -0,0 +1,190 @@
+import json
+import time
+from collections import OrderedDict, deque
+from typing import Any, Optional
+
+import numpy as np
+
+from algo_royale.logging.loggable import Loggable
+
+
+class LatencyHistogram:
+    """
+    Bounded latency sample reservoir with running count and max.
+    Percentiles are computed over the most recent `max_samples` samples.
+    """
+
+    def __init__(self, max_samples: int = 10_000):
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def summary(self) -> dict:
+        if not self.samples:
+            return {"count": self.count, "p50_ms": None, "p99_ms": None, "max_ms": None}
+        p50, p99 = np.percentile(np.fromiter(self.samples, dtype=float), [50, 99])
+        return {
+            "count": self.count,
+            "p50_ms": round(p50 * 1000, 3),
+            "p99_ms": round(p99 * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class LatencyTracker:
+    """
+    Traces live events (keyed by symbol and bar timestamp) through the
+    bar -> enrichment -> signal -> order -> execution path.
+
+    A trace is opened when a bar arrives; each later hop stamps it, recording
+    the time since the previous stamp under the hop name and, at the final
+    hop, the time since the bar arrived under "end_to_end". Events that end
+    without an order are discarded instead, so "end_to_end" only covers bars
+    that led to an order. AsyncPubSub queues report queue waits and dropped
+    items through the same tracker.
+
+    Traces are keyed by symbol and bar timestamp. The raw market data queue
+    keeps only the latest update per symbol, so a quote that arrives before a
+    bar reaches enrichment replaces the bar and its trace is never stamped
+    again; such traces stay open until evicted and are reported as
+    "open_traces" rather than in the hop latencies.
+
+    Parameters:
+        logger: Loggable instance used to dump the snapshot.
+        max_samples: Number of recent samples kept per histogram.
+        max_open_traces: Open traces kept before the oldest are evicted.
+    """
+
+    END_TO_END = "end_to_end"
+
+    def __init__(
+        self,
+        logger: Optional[Loggable] = None,
+        max_samples: int = 10_000,
+        max_open_traces: int = 10_000,
+    ):
+        self.logger = logger
+        self.max_samples = max_samples
+        self.max_open_traces = max_open_traces
+        self.hop_latency: dict[str, LatencyHistogram] = {}
+        self.queue_wait: dict[str, LatencyHistogram] = {}
+        self.dropped: dict[str, int] = {}
+        self.discarded: dict[str, int] = {}
+        self._open_traces: OrderedDict[tuple, tuple[float, float]] = OrderedDict()
+
+    def start_trace(self, symbol: Any, timestamp: Any):
+        """
+        Open a trace for an event entering the pipeline.
+        :param symbol: Symbol of the event.
+        :param timestamp: Bar timestamp identifying the event.
+        """
+        now = time.perf_counter()
+        key = (symbol, timestamp)
+        self._open_traces[key] = (now, now)
+        self._open_traces.move_to_end(key)
+        self._evict_old_traces()
+
+    def stamp(
+        self,
+        symbol: Any,
+        timestamp: Any,
+        hop: str,
+        final: bool = False,
+        next_timestamp: Any = None,
+    ):
+        """
+        Stamp an event at a pipeline hop. Events without an open trace are ignored.
+        :param symbol: Symbol of the event.
+        :param timestamp: Bar timestamp identifying the event.
+        :param hop: Name of the hop being stamped.
+        :param final: True for the last hop; closes the trace.
+        :param next_timestamp: Timestamp later hops will see, if this hop changes it.
+        """
+        try:
+            key = (symbol, timestamp)
+            trace = self._open_traces.get(key)
+            if trace is None:
+                return
+            now = time.perf_counter()
+            started, previous = trace
+            self.record_latency(hop, now - previous)
+            if final:
+                self.record_latency(self.END_TO_END, now - started)
+                self._open_traces.pop(key, None)
+            elif next_timestamp is not None and next_timestamp != timestamp:
+                self._open_traces.pop(key, None)
+                self._open_traces[(symbol, next_timestamp)] = (started, now)
+            else:
+                self._open_traces[key] = (started, now)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error stamping trace {hop} for {symbol}: {e}")
+
+    def discard(self, symbol: Any, timestamp: Any, reason: str):
+        """
+        Close a trace without recording its final hop or end-to-end latency.
+        :param symbol: Symbol of the event.
+        :param timestamp: Bar timestamp identifying the event.
+        :param reason: Why the event ended early, counted in the snapshot.
+        """
+        if self._open_traces.pop((symbol, timestamp), None) is not None:
+            self.discarded[reason] = self.discarded.get(reason, 0) + 1
+
+    def record_latency(self, stage: str, seconds: float):
+        """Record a hop latency sample."""
+        self._histogram(self.hop_latency, stage).record(seconds)
+
+    def record_queue_wait(self, stage: str, seconds: float):
+        """Record how long an item waited in a stage's queue."""
+        self._histogram(self.queue_wait, stage).record(seconds)
+
+    def record_drop(self, stage: str, count: int = 1):
+        """Record items dropped from a stage's queue."""
+        self.dropped[stage] = self.dropped.get(stage, 0) + count
+
+    def snapshot(self) -> dict:
+        """Return the current latency, queue-wait and drop statistics."""
+        return {
+            "hop_latency": {
+                stage: histogram.summary()
+                for stage, histogram in self.hop_latency.items()
+            },
+            "queue_wait": {
+                stage: histogram.summary()
+                for stage, histogram in self.queue_wait.items()
+            },
+            "dropped": dict(self.dropped),
+            "discarded": dict(self.discarded),
+            "open_traces": len(self._open_traces),
+        }
+
+    def log_snapshot(self):
+        """Dump the snapshot to the logger (used on shutdown)."""
+        if self.logger:
+            self.logger.info(f"Live latency snapshot: {json.dumps(self.snapshot())}")
+
+    def reset(self):
+        self.hop_latency.clear()
+        self.queue_wait.clear()
+        self.dropped.clear()
+        self.discarded.clear()
+        self._open_traces.clear()
+
+    def _histogram(
+        self, histograms: dict[str, LatencyHistogram], stage: str
+    ) -> LatencyHistogram:
+        histogram = histograms.get(stage)
+        if histogram is None:
+            histogram = LatencyHistogram(max_samples=self.max_samples)
+            histograms[stage] = histogram
+        return histogram
+
+    def _evict_old_traces(self):
+        while len(self._open_traces) > self.max_open_traces:
+            self._open_traces.popitem(last=False)
@@ -1,18 +1,31 @@
 import asyncio
+import inspect
 from abc import ABC, abstractmethod
+from typing import Any, Hashable
 
 
 class QueuedAsyncUpdateObject(ABC):
     """
     Async object that queues updates and processes only the latest per type,
     with support for type hierarchy (priority).
+
+    Pending updates are kept in arrival order: an update whose key is already
+    pending replaces it and moves to the back, so draining never sorts.
+    An update equal to the last one applied for its key is suppressed, so
+    subclasses only run (and notify downstream) on actual state changes.
+    Coalesced and suppressed updates are counted, see `get_update_counters`.
     """
 
     def __init__(self, logger=None):
         self.update_lock = asyncio.Lock()
-        self.pending_updates = {}  # type -> (timestamp, object)
+        self.pending_updates: dict[Hashable, Any] = {}  # key -> object
         self.logger = logger
-        self.type_hierarchy = self._type_hierarchy()
+        type_hierarchy = self._type_hierarchy()
+        self.type_hierarchy = type_hierarchy if isinstance(type_hierarchy, dict) else {}
+        self._last_applied: dict[Hashable, Any] = {}
+        self.applied_updates = 0
+        self.coalesced_updates = 0
+        self.suppressed_updates = 0
 
     @abstractmethod
     def _type_hierarchy(self):
@@ -21,41 +34,84 @@ class QueuedAsyncUpdateObject(ABC):
         """
         return {}
 
+    def _update_key(self, obj) -> Hashable:
+        """
+        Key under which pending updates coalesce; the latest update per key wins.
+        Defaults to the object's type.
+        """
+        return type(obj)
+
+    def _has_changed(self, previous, obj) -> bool:
+        """
+        Whether `obj` differs from the last update applied under its key.
+        Objects that cannot be compared to a single bool (e.g. pandas objects)
+        always count as changed. An object mutated in place and re-sent
+        compares equal to itself; subclasses sending such objects override this.
+        """
+        if previous is obj:
+            return False
+        try:
+            return bool(previous != obj)
+        except Exception:
+            return True
+
     async def async_update(self, obj):
         """
-        Queue an update object by its type.
+        Queue an update object by its key.
         If a higher-priority type comes in, remove lower-priority pending updates.
         """
         try:
-            obj_type = type(obj)
-            now = asyncio.get_event_loop().time()
-            self.pending_updates[obj_type] = (now, obj)
+            key = self._update_key(obj)
+            if key in self.pending_updates:
+                # Re-insert so the update moves to the back of the arrival order
+                del self.pending_updates[key]
+                self.coalesced_updates += 1
+            self.pending_updates[key] = obj
             # Remove lower-priority types if hierarchy is set
             if self.type_hierarchy:
-                obj_priority = self.type_hierarchy.get(obj_type, 0)
+                obj_priority = self.type_hierarchy.get(type(obj), 0)
                 to_remove = [
-                    t
-                    for t, _ in self.pending_updates.items()
-                    if self.type_hierarchy.get(t, 0) < obj_priority
+                    k
+                    for k, pending in self.pending_updates.items()
+                    if self.type_hierarchy.get(type(pending), 0) < obj_priority
                 ]
-                for t in to_remove:
-                    del self.pending_updates[t]
+                for k in to_remove:
+                    del self.pending_updates[k]
+                self.coalesced_updates += len(to_remove)
             if not self.update_lock.locked():
                 async with self.update_lock:
-                    # Process all pending updates in order of priority (highest first)
+                    # Process pending updates in arrival order; updates queued
+                    # while one is applied are picked up by the same loop
                     while self.pending_updates:
-                        # Sort timestamp
-                        sorted_updates = sorted(
-                            self.pending_updates.items(),
-                            key=lambda x: x[1][0],  # sort by timestamp only
-                        )
-                        for t, (timestamp, obj) in sorted_updates:
-                            await self._update(obj)
-                            del self.pending_updates[t]
+                        key = next(iter(self.pending_updates))
+                        pending = self.pending_updates.pop(key)
+                        await self._apply(key, pending)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"[{self.__class__.__name__}] Error updating: {e}")
 
+    async def _apply(self, key: Hashable, obj):
+        if key in self._last_applied and not self._has_changed(
+            self._last_applied[key], obj
+        ):
+            self.suppressed_updates += 1
+            return
+        result = self._update(obj)
+        if inspect.isawaitable(result):
+            await result
+        self._last_applied[key] = obj
+        self.applied_updates += 1
+
+    def get_update_counters(self) -> dict[str, int]:
+        """
+        :return: Counts of applied, coalesced and suppressed updates.
+        """
+        return {
+            "applied": self.applied_updates,
+            "coalesced": self.coalesced_updates,
+            "suppressed": self.suppressed_updates,
+        }
+
     @abstractmethod
     async def _update(self, obj):
         """
@@ -1,10 +1,14 @@
-from typing import Optional
+from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
 from algo_royale.backtester.column_names.feature_engineering_columns import (
     FeatureEngineeringColumns,
 )
+from algo_royale.backtester.enums.asset_matrix_fill_policy import (
+    AssetMatrixFillPolicy,
+)
 from algo_royale.logging.loggable import Loggable
 
 """
@@ -14,12 +18,25 @@ AssetMatrixPreparer: Utility for preparing feature-engineered data in the asset-
     - Multi-symbol: index is timestamp, columns are asset symbols, values are features (e.g., returns, signals)
     - Single-symbol: returns the DataFrame as-is, with a single column
 - Handles missing data and provides logging for shape/column issues
+- `build` assembles the matrix from per-symbol frames without concatenating or pivoting them
 """
 
+PRICE_COLUMNS = {
+    FeatureEngineeringColumns.CLOSE_PRICE,
+    FeatureEngineeringColumns.OPEN_PRICE,
+    FeatureEngineeringColumns.HIGH_PRICE,
+    FeatureEngineeringColumns.LOW_PRICE,
+}
+
 
 class AssetMatrixPreparer:
-    def __init__(self, logger: Loggable):
+    def __init__(
+        self,
+        logger: Loggable,
+        fill_policy: AssetMatrixFillPolicy = AssetMatrixFillPolicy.NONE,
+    ):
         self.logger = logger
+        self.fill_policy = AssetMatrixFillPolicy(fill_policy)
 
     def prepare(
         self,
@@ -51,17 +68,7 @@ class AssetMatrixPreparer:
             )
         else:
             # Only use price columns by default
-            price_cols = [
-                c
-                for c in df.columns
-                if c.lower()
-                in {
-                    FeatureEngineeringColumns.CLOSE_PRICE,
-                    FeatureEngineeringColumns.OPEN_PRICE,
-                    FeatureEngineeringColumns.HIGH_PRICE,
-                    FeatureEngineeringColumns.LOW_PRICE,
-                }
-            ]
+            price_cols = [c for c in df.columns if c.lower() in PRICE_COLUMNS]
             if not price_cols:
                 self.logger.warning(
                     "No price columns found in DataFrame for asset matrix. Columns: %s",
@@ -82,3 +89,111 @@ class AssetMatrixPreparer:
             f"Asset-matrix shape: {pivot_df.shape}, columns: {pivot_df.columns}"
         )
         return pivot_df
+
+    def build(
+        self,
+        frames: Iterable[pd.DataFrame],
+        symbol_col: str = "symbol",
+        value_col: Optional[str] = None,
+        timestamp_col: str = "timestamp",
+        fill_policy: Optional[AssetMatrixFillPolicy] = None,
+        dtype=np.float64,
+    ) -> pd.DataFrame:
+        """
+        Builds the asset matrix straight from long-form frames, one or more per symbol.
+        The matrix is preallocated over the union of all timestamps and each
+        symbol's values are written into their columns, so the frames are never
+        concatenated or pivoted. The result has the same layout as `prepare`,
+        with float values.
+        Args:
+            frames: Long-form DataFrames, each holding the symbol_col column
+            symbol_col: Name of the column containing asset symbols
+            value_col: Name of the column to place in the matrix (if None, uses only price columns)
+            timestamp_col: Name of the column containing timestamps
+            fill_policy: How to fill timestamps a symbol has no row for (defaults to the preparer's)
+            dtype: Float dtype of the matrix
+        Returns:
+            pd.DataFrame: Asset-matrix DataFrame (index: timestamp, columns: symbols)
+        """
+        fill_policy = AssetMatrixFillPolicy(fill_policy or self.fill_policy)
+        parts = []
+        for frame in frames:
+            if frame is None or frame.empty:
+                continue
+            if frame[symbol_col].nunique() == 1:
+                parts.append((frame[symbol_col].iloc[0], frame))
+            else:
+                parts.extend(frame.groupby(symbol_col, sort=False))
+        if not parts:
+            self.logger.warning("No data to build the asset matrix from.")
+            return pd.DataFrame()
+
+        if value_col:
+            value_cols = [value_col]
+        else:
+            value_cols = []
+            for _, frame in parts:
+                for c in frame.columns:
+                    if c.lower() in PRICE_COLUMNS and c not in value_cols:
+                        value_cols.append(c)
+            if not value_cols:
+                self.logger.warning(
+                    "No price columns found in frames for asset matrix. Columns: %s",
+                    parts[0][1].columns,
+                )
+                return pd.DataFrame()
+
+        symbols = sorted({symbol for symbol, _ in parts})
+        symbol_pos = {symbol: i for i, symbol in enumerate(symbols)}
+        timestamps = [pd.Index(frame[timestamp_col]) for _, frame in parts]
+        index = timestamps[0].append(timestamps[1:]).unique().sort_values()
+        index.name = timestamp_col
+
+        # Column-major, so each column is contiguous for the writes and fills
+        # and the DataFrame wraps the array without copying it
+        n_symbols = len(symbols)
+        matrix = np.full(
+            (len(index), len(value_cols) * n_symbols), np.nan, dtype=dtype, order="F"
+        )
+        for (symbol, frame), frame_timestamps in zip(parts, timestamps):
+            if not frame_timestamps.is_unique:
+                raise ValueError(f"Duplicate timestamps for symbol {symbol}")
+            rows = index.get_indexer(frame_timestamps)
+            for j, col in enumerate(value_cols):
+                if col in frame.columns:
+                    matrix[rows, j * n_symbols + symbol_pos[symbol]] = frame[
+                        col
+                    ].to_numpy(dtype=dtype, na_value=np.nan)
+        self._fill(matrix, fill_policy)
+
+        if len(value_cols) == 1:
+            columns = pd.Index(symbols, name=symbol_col)
+        else:
+            columns = pd.MultiIndex.from_product(
+                [value_cols, symbols], names=[None, symbol_col]
+            )
+        matrix_df = pd.DataFrame(matrix, index=index, columns=columns, copy=False)
+        self.logger.info(
+            f"Asset-matrix shape: {matrix_df.shape}, fill policy: {fill_policy.value}"
+        )
+        return matrix_df
+
+    def _fill(self, matrix: np.ndarray, fill_policy: AssetMatrixFillPolicy):
+        """Fills gaps in place, one column at a time to bound the extra memory."""
+        if fill_policy == AssetMatrixFillPolicy.NONE:
+            return
+        for c in range(matrix.shape[1]):
+            column = matrix[:, c]
+            if fill_policy == AssetMatrixFillPolicy.ZERO:
+                column[np.isnan(column)] = 0.0
+                continue
+            self._ffill(column)
+            if fill_policy == AssetMatrixFillPolicy.FFILL_BFILL:
+                self._ffill(column[::-1])
+
+    @staticmethod
+    def _ffill(column: np.ndarray):
+        """Forward fills a 1-D array in place; leading NaNs are left as-is."""
+        positions = np.where(np.isnan(column), 0, np.arange(len(column)))
+        np.maximum.accumulate(positions, out=positions)
+        column[:] = column[positions]
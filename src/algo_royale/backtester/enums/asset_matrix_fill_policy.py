@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class AssetMatrixFillPolicy(str, Enum):
+    """How the asset-matrix builder fills timestamps a symbol has no row for.
+    - NONE: Leave gaps as NaN (same as pivoting the long-form frame)
+    - FFILL: Carry each symbol's last value forward; leading gaps stay NaN
+    - FFILL_BFILL: Forward fill, then back fill leading gaps
+    - ZERO: Fill gaps with 0
+    """
+
+    NONE = "none"
+    FFILL = "ffill"
+    FFILL_BFILL = "ffill_bfill"
+    ZERO = "zero"
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class FeatureSelection(str, Enum):
+    """Which engineered features the feature engineering stage computes.
+    - ALL: Every feature column
+    - REQUIRED: Only the columns the configured signal combinators' conditions
+      and stateful logic read, plus the features those are derived from
+    """
+
+    ALL = "all"
+    REQUIRED = "required"
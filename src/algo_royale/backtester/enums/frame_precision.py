@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class FramePrecision(str, Enum):
+    """How staged frames are stored and held in memory.
+    - FULL: float64 and object columns, ISO timestamps on disk
+    - COMPACT: float32 derived columns (ingested prices and volume stay
+      float64), categorical symbol/strategy columns and epoch-second
+      timestamps on disk
+    """
+
+    FULL = "full"
+    COMPACT = "compact"
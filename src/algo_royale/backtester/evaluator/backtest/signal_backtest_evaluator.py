@@ -13,6 +13,13 @@ class SignalBacktestEvaluator(BacktestEvaluator):
     def __init__(self, logger: Loggable):
         super().__init__(logger)
 
+    def stream(self, strategy) -> "SignalEvaluationStream":
+        """
+        Evaluate a strategy over data that arrives page by page; see
+        SignalEvaluationStream.
+        """
+        return SignalEvaluationStream(evaluator=self, strategy=strategy)
+
     def _evaluate_signals(self, signals_df: pd.DataFrame) -> dict:
         try:
             self.logger.debug(
@@ -170,3 +177,102 @@ class SignalBacktestEvaluator(BacktestEvaluator):
         except Exception as e:
             self.logger.error(f"Max drawdown calculation failed: {e}")
             return 0.0
+
+
+class SignalEvaluationStream:
+    """
+    Evaluates a strategy page by page with the same trade rules and metrics
+    as SignalBacktestEvaluator.evaluate over the concatenated pages, keeping
+    only running totals: an open trade carries over to the next page and no
+    page or trade list is retained, so memory does not grow with the window.
+
+    Parameters:
+        evaluator: The evaluator whose validation and logger are used.
+        strategy: The strategy whose signals are evaluated.
+    """
+
+    def __init__(self, evaluator: SignalBacktestEvaluator, strategy):
+        self.evaluator = evaluator
+        self.strategy = strategy
+        self.pages = 0
+        self.in_trade = False
+        self.entry_price = None
+        self.cumulative_return = 0.0
+        self.trades = 0
+        self.wins = 0
+        self.nonzero = 0
+        # Welford running mean and sum of squared deviations of trade returns
+        self.mean_return = 0.0
+        self.m2 = 0.0
+        self.peak = None
+        self.max_drawdown = 0.0
+
+    def add_page(self, df: pd.DataFrame) -> None:
+        """
+        Generate the strategy's signals for a page and fold its trades into
+        the running totals. The page is handed over: the strategy may modify it.
+        """
+        if df is None or df.empty:
+            return
+        self.add_signals(self.strategy.generate_signals(df))
+
+    def add_signals(self, signals_df: pd.DataFrame) -> None:
+        """Fold a page of already generated signals into the running totals."""
+        self.evaluator._validate_dataframe(signals_df)
+        self.pages += 1
+        prices = signals_df[SignalStrategyColumns.CLOSE_PRICE].to_numpy(
+            dtype=np.float64
+        )
+        entries = signals_df[SignalStrategyColumns.ENTRY_SIGNAL].to_numpy()
+        exits = signals_df[SignalStrategyColumns.EXIT_SIGNAL].to_numpy()
+        valid = np.isfinite(prices) & (prices > 0) & (prices <= 1e6)
+        # Only rows that can open or close a trade matter to the simulation
+        rows = np.flatnonzero(
+            valid
+            & ((entries == SignalType.BUY.value) | (exits == SignalType.SELL.value))
+        )
+        for i in rows:
+            price = prices[i]
+            if entries[i] == SignalType.BUY.value and not self.in_trade:
+                self.entry_price = price
+                self.in_trade = True
+            elif exits[i] == SignalType.SELL.value and self.in_trade:
+                self._close_trade((price - self.entry_price) / self.entry_price)
+
+    def _close_trade(self, pnl: float) -> None:
+        self.in_trade = False
+        self.entry_price = None
+        self.trades += 1
+        self.wins += pnl > 0
+        self.nonzero += pnl != 0
+        delta = pnl - self.mean_return
+        self.mean_return += delta / self.trades
+        self.m2 += delta * (pnl - self.mean_return)
+        self.cumulative_return += pnl
+        self.peak = (
+            self.cumulative_return
+            if self.peak is None
+            else max(self.peak, self.cumulative_return)
+        )
+        self.max_drawdown = max(self.max_drawdown, self.peak - self.cumulative_return)
+
+    def metrics(self) -> dict:
+        """The metrics of the pages so far, as SignalBacktestEvaluator reports them."""
+        if not self.trades:
+            return {
+                "total_return": 0.0,
+                "sharpe_ratio": 0.0,
+                "win_rate": 0.0,
+                "max_drawdown": 0.0,
+            }
+        sharpe = 0.0
+        if self.trades >= 2:
+            std = np.sqrt(self.m2 / (self.trades - 1))
+            if not np.isclose(std, 0):
+                sharpe = self.mean_return / std
+        return {
+            "total_return": float(self.cumulative_return),
+            "sharpe_ratio": float(sharpe),
+            "win_rate": float(self.wins / self.nonzero) if self.nonzero else 0.0,
+            "max_drawdown": float(self.max_drawdown),
+        }
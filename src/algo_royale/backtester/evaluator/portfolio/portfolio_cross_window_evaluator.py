@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from typing import List, Optional
 
 import numpy as np
 
@@ -24,19 +25,28 @@ class PortfolioCrossWindowEvaluator:
     def run(
         self,
         strategy_dir: Path,
+        window_files: Optional[List[Path]] = None,
     ):
+        """
+        Aggregate the strategy's window results. window_files are the window
+        result files when the caller has already listed them (e.g. from a
+        ResultFileIndex); otherwise the window directories are listed here.
+        """
         window_results = []
         # First, iterate over window-level directories
         if not strategy_dir.is_dir():
             self.logger.error(f"Strategy directory does not exist: {strategy_dir}")
             return None
-        for window_dir in sorted(strategy_dir.iterdir()):
-            if not window_dir.is_dir():
-                continue
+        if window_files is None:
+            window_files = [
+                window_dir / self.window_json_filename
+                for window_dir in sorted(strategy_dir.iterdir())
+                if window_dir.is_dir()
+            ]
+        for opt_path in window_files:
             self.logger.debug(
-                f"Processing window directory: {window_dir} | {self.window_json_filename}"
+                f"Processing window directory: {opt_path.parent} | {self.window_json_filename}"
             )
-            opt_path = window_dir / self.window_json_filename
             if not opt_path.exists():
                 self.logger.warning(f"No optimization result found: {opt_path}")
                 continue
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from algo_royale.backtester.evaluator.portfolio.portfolio_cross_strategy_summary import (
@@ -6,12 +8,20 @@ from algo_royale.backtester.evaluator.portfolio.portfolio_cross_strategy_summary
 from algo_royale.backtester.evaluator.portfolio.portfolio_cross_window_evaluator import (
     PortfolioCrossWindowEvaluator,
 )
+from algo_royale.backtester.evaluator.result_file_index import (
+    EvaluationRunStats,
+    ResultFileIndex,
+)
 from algo_royale.logging.loggable import Loggable
 
 
 class PortfolioEvaluationCoordinator:
     """
     Orchestrates cross-window and cross-strategy evaluation for all portfolio strategies.
+    Strategies are found from one index of the window result files; those whose
+    window results are unchanged since their last evaluation are not re-read,
+    and the others are evaluated on up to `max_workers` threads
+    (0 or less uses the CPU count).
     """
 
     def __init__(
@@ -21,6 +31,7 @@ class PortfolioEvaluationCoordinator:
         cross_strategy_summary: PortfolioCrossStrategySummary,
         optimization_root: str,
         viability_threshold: float = 0.75,
+        max_workers: int = 1,
     ):
         self.cross_window_evaluator = cross_window_evaluator
         self.cross_strategy_summary = cross_strategy_summary
@@ -29,24 +40,76 @@ class PortfolioEvaluationCoordinator:
             self.optimization_root.mkdir(parents=True, exist_ok=True)
         self.viability_threshold = viability_threshold
         self.logger = logger
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.last_run_stats = EvaluationRunStats()
 
-    def run(self):
+    def run(self) -> EvaluationRunStats:
         self.logger.info("Starting portfolio evaluation...")
-        # 1. For each strategy, aggregate all window results into evaluation_result.json
-        for symbol_dir in sorted(self.optimization_root.iterdir()):
-            if not symbol_dir.is_dir():
+        stats = EvaluationRunStats()
+        index = ResultFileIndex(
+            self.optimization_root, self.cross_window_evaluator.window_json_filename
+        )
+        state = index.load_state()
+        new_state = {}
+        pending = []
+        symbol_dirs = {}
+        for strategy_dir, files in index.scan().items():
+            # Window results sit directly in the window directories
+            window_files = [f for f in files if f.path.parent.parent == strategy_dir]
+            stats.files_indexed += len(window_files)
+            key = index.key(strategy_dir)
+            signature = index.signature(window_files)
+            symbol_dirs.setdefault(strategy_dir.parent, False)
+            if (
+                window_files
+                and state.get(key) == signature
+                and (
+                    strategy_dir / self.cross_window_evaluator.output_filename
+                ).is_file()
+            ):
+                stats.strategies_skipped += 1
+                stats.files_skipped += len(window_files)
+                new_state[key] = signature
                 continue
-            self.logger.debug(f"Processing symbol directory: {symbol_dir}")
-            # Now, iterate over strategy-level directories within each symbol directory
-            for strategy_dir in sorted(symbol_dir.iterdir()):
-                if not strategy_dir.is_dir():
-                    continue
-                self.logger.info(
-                    f"Aggregating windows for strategy: {strategy_dir.name}"
-                )
-                self.cross_window_evaluator.run(strategy_dir=strategy_dir)
-
-            # 2. Aggregate all strategy evaluation_result.json into summary_result.json
-            self.logger.info("Aggregating strategy evaluations into summary...")
+            symbol_dirs[strategy_dir.parent] = True
+            pending.append((strategy_dir, window_files, key, signature))
+
+        # 1. For each changed strategy, aggregate all window results into evaluation_result.json
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(pending)))
+        ) as pool:
+            evaluations = pool.map(
+                lambda item: self._evaluate_strategy(item[0], item[1]), pending
+            )
+            for (_, window_files, key, signature), evaluation in zip(
+                pending, evaluations
+            ):
+                stats.strategies_evaluated += 1
+                stats.files_read += len(window_files)
+                if evaluation is not None:
+                    new_state[key] = signature
+
+        # 2. Aggregate all strategy evaluation_result.json into summary_result.json
+        for symbol_dir, changed in sorted(symbol_dirs.items()):
+            if (
+                not changed
+                and (symbol_dir / self.cross_strategy_summary.output_filename).is_file()
+            ):
+                continue
+            self.logger.info(
+                f"Aggregating strategy evaluations into summary for {symbol_dir.name}..."
+            )
             self.cross_strategy_summary.run(symbol_dir=symbol_dir)
-            self.logger.info("Portfolio evaluation completed successfully.")
+        index.save_state(new_state)
+        self.last_run_stats = stats
+        self.logger.info(
+            f"Portfolio evaluation completed successfully: {stats.summary()}"
+        )
+        return stats
+
+    def _evaluate_strategy(self, strategy_dir: Path, window_files: list):
+        self.logger.info(f"Aggregating windows for strategy: {strategy_dir.name}")
+        return self.cross_window_evaluator.run(
+            strategy_dir=strategy_dir,
+            window_files=[f.path for f in window_files],
+        )
@@ -0,0 +1,117 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+from algo_royale.backtester.stage_data.stage_fingerprint import fingerprint
+
+# Kept at the optimization root, next to the symbol directories
+INDEX_STATE_FILENAME = "evaluation_index.json"
+
+
+@dataclass(frozen=True)
+class ResultFile:
+    """A result file and the stat fields that tell whether it changed."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class EvaluationRunStats:
+    """Counters for one evaluation run."""
+
+    files_indexed: int = 0
+    files_read: int = 0
+    files_skipped: int = 0
+    files_failed: int = 0
+    strategies_evaluated: int = 0
+    strategies_skipped: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def summary(self) -> str:
+        return (
+            f"{self.strategies_evaluated} strategies evaluated, "
+            f"{self.strategies_skipped} unchanged; {self.files_indexed} result files "
+            f"indexed, {self.files_read} read, {self.files_skipped} skipped, "
+            f"{self.files_failed} failed"
+        )
+
+
+class ResultFileIndex:
+    """
+    Index of the result files under an optimization root laid out as
+    symbol/strategy/..., built in one walk of the tree. Each strategy
+    directory gets a signature of its files' paths, sizes and modification
+    times; the signatures of the last evaluation are kept in a state file so
+    unchanged directories are not re-read.
+
+    Parameters:
+        root: The optimization root.
+        result_filename: Name of the result files to index.
+        state_filename: Name of the state file at the root.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        result_filename: str,
+        state_filename: str = INDEX_STATE_FILENAME,
+    ):
+        self.root = Path(root)
+        self.result_filename = result_filename
+        self.state_path = self.root / state_filename
+
+    def scan(self) -> Dict[Path, List[ResultFile]]:
+        """
+        Every symbol/strategy directory mapped to the result files below it,
+        sorted by path. Strategy directories without result files map to an
+        empty list.
+        """
+        index: Dict[Path, List[ResultFile]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames.sort()
+            rel_parts = Path(dirpath).relative_to(self.root).parts
+            if len(rel_parts) < 2:
+                continue
+            strategy_dir = self.root.joinpath(*rel_parts[:2])
+            files = index.setdefault(strategy_dir, [])
+            if self.result_filename in filenames:
+                path = Path(dirpath) / self.result_filename
+                stat = path.stat()
+                files.append(ResultFile(path, stat.st_size, stat.st_mtime_ns))
+        for files in index.values():
+            files.sort(key=lambda f: f.path)
+        return index
+
+    def signature(self, files: List[ResultFile], *params) -> str:
+        """Signature of a strategy directory's result files and evaluation params."""
+        return fingerprint(
+            [
+                (f.path.relative_to(self.root).as_posix(), f.size, f.mtime_ns)
+                for f in files
+            ],
+            *params,
+        )
+
+    def key(self, strategy_dir: Path) -> str:
+        return strategy_dir.relative_to(self.root).as_posix()
+
+    def load_state(self) -> Dict[str, str]:
+        """Signatures of the strategy directories at their last evaluation."""
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def save_state(self, state: Dict[str, str]):
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
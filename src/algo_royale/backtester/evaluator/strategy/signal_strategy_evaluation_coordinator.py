@@ -1,9 +1,15 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 
+from algo_royale.backtester.evaluator.result_file_index import (
+    EvaluationRunStats,
+    ResultFileIndex,
+)
 from algo_royale.backtester.evaluator.strategy.strategy_evaluation_type import (
     StrategyEvaluationType,
 )
@@ -24,6 +30,7 @@ class SignalStrategyEvaluationCoordinator:
         evaluation_type (WalkForwardEvaluationType): Type of evaluation to perform (test, optimization, or both).
         optimization_json_filename (str): Name of the optimization result JSON file.
         evaluation_json_filename (str): Name of the evaluation report JSON file.
+        max_workers (int): Strategy directories evaluated at once; 0 or less uses the CPU count.
     """
 
     def __init__(
@@ -33,6 +40,7 @@ class SignalStrategyEvaluationCoordinator:
         evaluation_type: StrategyEvaluationType,
         optimization_json_filename: str,
         evaluation_json_filename: str,
+        max_workers: int = 1,
     ):
         """
         Args:
@@ -40,6 +48,7 @@ class SignalStrategyEvaluationCoordinator:
             evaluation_type: Type of evaluation to perform (test, optimization, or both).
             optimization_result_json_filename: Name of the optimization result JSON file.
             evaluation_json_filename: Name of the evaluation report JSON file.
+            max_workers: Strategy directories evaluated at once; 0 or less uses the CPU count.
         """
         self.opt_root_path = Path(optimization_root)
         if not self.opt_root_path.is_dir():
@@ -50,53 +59,94 @@ class SignalStrategyEvaluationCoordinator:
         self.opt_result_json_filename = optimization_json_filename
         self.eval_json_filename = evaluation_json_filename
         self.logger = logger
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.last_run_stats = EvaluationRunStats()
 
-    def run(self):
+    def run(self) -> EvaluationRunStats:
+        """
+        Evaluate every symbol/strategy directory from one index of the result
+        files. Directories whose result files are unchanged since their last
+        evaluation keep their report; the others are evaluated on up to
+        `max_workers` threads.
+        """
         self.logger.info("Starting strategy evaluation...")
+        stats = EvaluationRunStats()
         try:
-            # Loop over each symbol directory
-            for symbol_dir in self.opt_root_path.iterdir():
-                try:
-                    self.logger.info(f"Evaluating symbol directory: {symbol_dir}")
-                    if not symbol_dir.is_dir():
-                        continue
-                    self.logger.info(f"Processing symbol: {symbol_dir.name}")
-                    # Loop over each strategy directory within the symbol
-                    for strategy_dir in symbol_dir.iterdir():
-                        try:
-                            self.logger.debug(
-                                f"Checking strategy directory: {strategy_dir}"
-                            )
-                            if not strategy_dir.is_dir():
-                                continue
-                            self.logger.info(
-                                f"Processing strategy: {strategy_dir.name}"
-                            )
-                            self._evaluate_strategy_dir(strategy_dir)
-                        except Exception as e:
-                            self.logger.error(
-                                f"Error processing strategy directory {strategy_dir}: {e}"
-                            )
-                            continue
-                except Exception as e:
-                    self.logger.error(
-                        f"Error processing symbol directory {symbol_dir}: {e}"
-                    )
+            index = ResultFileIndex(self.opt_root_path, self.opt_result_json_filename)
+            state = index.load_state()
+            new_state = {}
+            pending = []
+            for strategy_dir, files in index.scan().items():
+                stats.files_indexed += len(files)
+                key = index.key(strategy_dir)
+                signature = index.signature(files, str(self.evaluation_type))
+                if (
+                    files
+                    and state.get(key) == signature
+                    and (strategy_dir / self.eval_json_filename).is_file()
+                ):
+                    self.logger.debug(f"Strategy directory unchanged: {strategy_dir}")
+                    stats.strategies_skipped += 1
+                    stats.files_skipped += len(files)
+                    new_state[key] = signature
                     continue
+                pending.append((strategy_dir, [f.path for f in files], key, signature))
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_workers, len(pending)))
+            ) as pool:
+                outcomes = pool.map(
+                    lambda item: self._evaluate_strategy_dir_safely(*item[:2]), pending
+                )
+                for (_, _, key, signature), (written, read, failed) in zip(
+                    pending, outcomes
+                ):
+                    stats.strategies_evaluated += 1
+                    stats.files_read += read
+                    stats.files_failed += failed
+                    if written:
+                        new_state[key] = signature
+            index.save_state(new_state)
         except Exception as e:
             self.logger.error(f"Error during strategy evaluation: {e}")
             raise e
+        self.last_run_stats = stats
+        self.logger.info(f"Strategy evaluation finished: {stats.summary()}")
+        return stats
+
+    def _evaluate_strategy_dir_safely(
+        self, strategy_dir: Path, optimization_files: List[Path]
+    ) -> Tuple[bool, int, int]:
+        try:
+            self.logger.info(f"Processing strategy: {strategy_dir}")
+            return self._evaluate_strategy_dir(strategy_dir, optimization_files)
+        except Exception as e:
+            self.logger.error(
+                f"Error processing strategy directory {strategy_dir}: {e}"
+            )
+            return False, 0, len(optimization_files)
 
-    def _evaluate_strategy_dir(self, strategy_dir: Path):
-        optimization_files = list(strategy_dir.rglob(self.opt_result_json_filename))
+    def _evaluate_strategy_dir(
+        self, strategy_dir: Path, optimization_files: Optional[List[Path]] = None
+    ) -> Tuple[bool, int, int]:
+        """
+        Aggregate a strategy directory's optimization results into its report.
+        :return: Whether a report was written, and the files read and failed.
+        """
+        if optimization_files is None:
+            optimization_files = sorted(
+                strategy_dir.rglob(self.opt_result_json_filename)
+            )
         if not optimization_files:
             self.logger.info(
                 f"No optimization result files found in {strategy_dir}. Skipping evaluation."
             )
-            return
+            return False, 0, 0
         self.logger.info(
             f"Found {len(optimization_files)} optimization result files in {strategy_dir}."
         )
+        files_read = 0
+        files_failed = 0
 
         all_metrics = []
         window_params = []
@@ -113,6 +163,7 @@ class SignalStrategyEvaluationCoordinator:
                 evaluator = StrategyEvaluator(
                     logger=self.logger, metric_type=self.evaluation_type
                 )
+                files_read += 1
                 evaluator.load_data(results_path=opt_json_path)
                 all_metrics.extend(evaluator.metrics)
                 for window, data in evaluator.results.items():
@@ -120,13 +171,14 @@ class SignalStrategyEvaluationCoordinator:
                     if best_params:
                         window_params.append(json.dumps(best_params, sort_keys=True))
             except Exception as e:
+                files_failed += 1
                 self.logger.error(
                     f"Error evaluating {opt_json_path}: {e}. Skipping this file."
                 )
 
         if not all_metrics:
             self.logger.warning("No metrics found in any optimization result files.")
-            return
+            return False, files_read, files_failed
 
         keys = [k for k in all_metrics[0] if k not in ("window", "type")]
         summary = {}
@@ -192,6 +244,7 @@ class SignalStrategyEvaluationCoordinator:
         with open(eval_path, "w") as f:
             json.dump(report, f, indent=2)
         self.logger.info(f"Aggregated evaluation report written to {eval_path}.")
+        return True, files_read, files_failed
 
     def _find_optimization_result_files(self) -> List[Path]:
         """Recursively find all optimization_result.json files under the root."""
@@ -1,5 +1,5 @@
 import asyncio
-from typing import AsyncIterator, Callable, Dict
+from typing import AsyncIterator, Callable, Dict, Tuple
 
 import pandas as pd
 
@@ -31,13 +31,29 @@ class StrategyBacktestExecutor:
         """
         Run backtest for the given strategies and data.
         Includes robust exception handling and validation.
+        Collects every result page; use async_stream_backtest to consume them
+        as they are produced instead.
         """
         # Ensure results are initialized for all symbols
         results = {symbol: [] for symbol in data.keys()}
+        async for symbol, _, result_df in self.async_stream_backtest(strategies, data):
+            results[symbol].append(result_df)
+        return results
 
+    async def async_stream_backtest(
+        self,
+        strategies: list[BaseSignalStrategy],
+        data: Dict[str, Callable[[], AsyncIterator[pd.DataFrame]]],
+    ) -> AsyncIterator[Tuple[str, BaseSignalStrategy, pd.DataFrame]]:
+        """
+        Run backtest for the given strategies and data, yielding a
+        (symbol, strategy, result page) tuple as soon as each page is
+        processed. Nothing is kept between pages, so memory stays bounded by
+        one input page and its results whatever the window length.
+        """
         if not data:
             self.logger.error("No data available - check your data paths and files")
-            return results
+            return
 
         try:
             self.logger.info("Starting async backtest for strategies: %s", strategies)
@@ -49,48 +65,38 @@ class StrategyBacktestExecutor:
 
                 async for page_df in async_df_iterator:
                     page_count += 1
+                    pending = []
                     for strategy in strategies:
                         strategy_name = strategy.get_hash_id()
                         pair_key = f"{symbol}_{strategy_name}"
+                        if not self._should_skip_pair(pair_key, strategy_name, symbol):
+                            pending.append(strategy)
+                    if not pending:
                         self.logger.debug(
-                            f"Processing page {page_count} for {symbol}-{strategy_name}"
+                            f"Skipping page {page_count} for {symbol} as all strategies are already processed"
                         )
-                        if self._should_skip_pair(pair_key, strategy_name, symbol):
-                            self.logger.debug(
-                                f"Skipping {symbol}-{strategy_name} as already processed"
-                            )
-                            continue
+                        continue
 
-                        try:
-                            # Explicitly handle extreme values
-                            self.logger.debug(
-                                f"Page {page_count} before filtering: shape={page_df.shape}, columns={list(page_df.columns)}, head={page_df.head(2)}"
-                            )
-                            page_df = self._filter_extreme_values(page_df)
-                            self.logger.debug(
-                                f"Page {page_count} after filtering: shape={page_df.shape}, columns={list(page_df.columns)}, head={page_df.head(2)}"
-                            )
-
-                            # Ensure valid pages are processed
-                            if page_df.empty:
-                                self.logger.debug(
-                                    f"Page {page_count} for {symbol}-{strategy_name} is empty after filtering extreme values. Skipping."
-                                )
-                                continue
+                    # Explicitly handle extreme values, once for all strategies
+                    page_df = self.filter_extreme_values(page_df)
+                    if page_df.empty:
+                        self.logger.debug(
+                            f"Page {page_count} for {symbol} is empty after filtering extreme values. Skipping."
+                        )
+                        continue
 
+                    for strategy in pending:
+                        strategy_name = strategy.get_hash_id()
+                        self.logger.debug(
+                            f"Processing page {page_count} for {symbol}-{strategy_name}"
+                        )
+                        try:
                             result_df = await self._process_single_page(
                                 symbol=symbol,
                                 strategy=strategy,
                                 page_df=page_df,
                                 page_num=page_count,
                             )
-                            # Ensure valid pages are appended correctly
-                            if result_df is not None:
-                                results[symbol].append(result_df)
-                            else:
-                                self.logger.warning(
-                                    f"Page {page_count} for {symbol}-{strategy_name} resulted in None. Skipping."
-                                )
                         except ValueError as ve:
                             self.logger.warning(
                                 f"Validation error on page {page_count} for {symbol}-{strategy_name}: {str(ve)}"
@@ -102,8 +108,13 @@ class StrategyBacktestExecutor:
                                 exc_info=True,
                             )
                             continue
-
-            return results
+                        # Ensure valid pages are yielded
+                        if result_df is None:
+                            self.logger.warning(
+                                f"Page {page_count} for {symbol}-{strategy_name} resulted in None. Skipping."
+                            )
+                            continue
+                        yield symbol, strategy, result_df
         except asyncio.CancelledError:
             self.logger.warning("Backtest cancelled")
             raise
@@ -118,7 +129,7 @@ class StrategyBacktestExecutor:
         page_df: pd.DataFrame,
         page_num: int,
     ) -> pd.DataFrame:
-        """Process a single page of data with proper signal handling"""
+        """Process a single page of data, already filtered of extreme values, with proper signal handling"""
         strategy_name = strategy.get_hash_id()
         self.logger.debug(
             f"Processing page {page_num} for symbol: {symbol} with strategy: {strategy_name}"
@@ -137,25 +148,7 @@ class StrategyBacktestExecutor:
             )
 
         try:
-            # Filter extreme values
-            page_df = self._filter_extreme_values(page_df)
-            self.logger.debug(
-                f"Page {page_num} for {symbol}-{strategy_name} after filtering extreme values: shape={page_df.shape}, columns={list(page_df.columns)}, head={page_df.head(2)}"
-            )
-            # Ensure valid pages are processed and appended
-            if page_df.empty:
-                self.logger.warning(
-                    f"Page {page_num} for {symbol}-{strategy_name} is empty after filtering. Skipping."
-                )
-                return pd.DataFrame(
-                    columns=[
-                        SignalStrategyExecutorColumns.ENTRY_SIGNAL,
-                        SignalStrategyExecutorColumns.EXIT_SIGNAL,
-                        SignalStrategyExecutorColumns.STRATEGY_NAME,
-                        SignalStrategyExecutorColumns.SYMBOL,
-                    ]
-                )
-
+            # Extreme values were filtered out by the caller
             # Generate and validate signals
             try:
                 self.logger.debug(
@@ -177,8 +170,9 @@ class StrategyBacktestExecutor:
                 )
                 return None
 
-            # Create result DataFrame
-            result_df = signals_df.copy()
+            # The strategy worked on its own copy of the page, so its output
+            # can carry the result columns without another copy
+            result_df = signals_df
             result_df[SignalStrategyExecutorColumns.STRATEGY_NAME] = strategy_name
             result_df[SignalStrategyExecutorColumns.SYMBOL] = symbol
 
@@ -250,7 +244,7 @@ class StrategyBacktestExecutor:
                 f"Strategy {strategy_name} returned extreme signal values (> 1e6). These will be skipped."
             )
 
-    def _filter_extreme_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def filter_extreme_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Filter out rows with extreme values in the DataFrame. Now also logs and skips suspiciously large/small values.
         """
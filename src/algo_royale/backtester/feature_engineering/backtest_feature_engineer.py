@@ -1,8 +1,20 @@
-from typing import AsyncGenerator, AsyncIterator, Callable
+import time
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
 
 import pandas as pd
 
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.feature_engineering.feature_selection_report import (
+    FeatureSelectionReport,
+)
 from algo_royale.logging.loggable import Loggable
 from algo_royale.logging.logger_factory import mockLogger
 
@@ -13,10 +25,31 @@ class BacktestFeatureEngineer:
         feature_engineering_func: Callable[[pd.DataFrame], pd.DataFrame],
         logger: Loggable,
         max_lookback: int,
+        features: Optional[Iterable[str]] = None,
+        panel_feature_engineering_func: Optional[
+            Callable[[Dict[str, pd.DataFrame]], Dict[str, pd.DataFrame]]
+        ] = None,
     ):
+        """
+        Args:
+            feature_engineering_func: Function adding feature columns to a page.
+            logger: Loggable instance.
+            max_lookback: Rows carried over between pages for rolling windows.
+            features: Features to compute (with their dependencies); None computes all.
+            panel_feature_engineering_func: Function engineering pages of several
+                symbols in one call, used by engineer_panel_features.
+        """
         self.feature_engineering_func = feature_engineering_func
         self.logger = logger
         self.max_lookback = max_lookback  # Set this to the max window/lag you use
+        self.features = None if features is None else set(features)
+        self.panel_feature_engineering_func = panel_feature_engineering_func
+        self.report = FeatureSelectionReport.for_features(self.features)
+
+    def start_report(self) -> FeatureSelectionReport:
+        """Start a new report of computed and skipped features for a run."""
+        self.report = FeatureSelectionReport.for_features(self.features)
+        return self.report
 
     async def engineer_features(
         self, df_iter: AsyncIterator[pd.DataFrame], symbol: str
@@ -40,39 +73,151 @@ class BacktestFeatureEngineer:
                 self.logger.info(
                     f"Feature engineering input columns: {df.columns}, shape: {df.shape}"
                 )
-                engineered_df: pd.DataFrame = self.feature_engineering_func(
-                    df=df, logger=self.logger
+                started = time.perf_counter()
+                engineered_df = self._call_func(df)
+                seconds = time.perf_counter() - started
+                output_df = self._output_page(
+                    symbol=symbol,
+                    engineered_df=engineered_df,
+                    has_buffer=buffer is not None and not buffer.empty,
+                    seconds=seconds,
                 )
-                # Validate the output DataFrame
-                if not self._validate_output(engineered_df):
+                if output_df is None:
+                    continue
+                yield output_df
+
+                # Update buffer to last N rows of the *input* DataFrame
+                buffer = df.iloc[-self.max_lookback :].copy()
+            except Exception as e:
+                self.logger.error(f"Feature engineering failed for {symbol}: {e}")
+
+    async def engineer_panel_features(
+        self, df_iters: Dict[str, AsyncIterator[pd.DataFrame]]
+    ) -> Dict[str, List[pd.DataFrame]]:
+        """
+        Engineer several symbols' pages with the panel function: the next page
+        of every symbol is engineered in one vectorized call. Symbols are aligned
+        by row position, so their pages need not cover the same dates.
+
+        Returns:
+            Dict[str, List[pd.DataFrame]]: Per symbol, the pages engineer_features
+            would yield for it.
+        """
+        pages: Dict[str, List[pd.DataFrame]] = {symbol: [] for symbol in df_iters}
+        buffers: Dict[str, pd.DataFrame] = {}
+        active = dict(df_iters)
+        while active:
+            frames = {}
+            for symbol, df_iter in list(active.items()):
+                try:
+                    df = await anext(df_iter)
+                except StopAsyncIteration:
+                    del active[symbol]
+                    continue
+                except Exception as e:
+                    self.logger.error(f"Loading page failed for {symbol}: {e}")
+                    del active[symbol]
+                    continue
+                if not self._validate_input(df):
                     self.logger.error(
-                        f"Output DataFrame for {symbol} is invalid after feature engineering."
+                        f"Input DataFrame for {symbol} is invalid. Skipping feature engineering."
                     )
                     continue
-                # Only yield the rows corresponding to the current page
-                # (i.e., drop the buffer rows)
+                buffer = buffers.get(symbol)
                 if buffer is not None and not buffer.empty:
-                    output_df = engineered_df.iloc[self.max_lookback :]
-                else:
-                    output_df = engineered_df
+                    df = pd.concat([buffer, df], ignore_index=True)
+                frames[symbol] = df
+            if not frames:
+                continue
 
-                self.logger.info(
-                    f"Feature engineering output columns: {engineered_df.columns}, shape: {engineered_df.shape}"
+            started = time.perf_counter()
+            try:
+                engineered = self._call_panel_func(frames)
+            except Exception as e:
+                # One bad page must not drop the others: fall back to per symbol
+                self.logger.warning(
+                    f"Panel feature engineering failed ({e}); engineering {len(frames)} symbols one by one."
                 )
-                self.logger.debug(
-                    f"Yielding engineered DataFrame for {symbol} with shape: {output_df.shape}"
+                engineered = {}
+                for symbol, df in frames.items():
+                    try:
+                        engineered[symbol] = self._call_func(df.copy())
+                    except Exception as symbol_error:
+                        self.logger.error(
+                            f"Feature engineering failed for {symbol}: {symbol_error}"
+                        )
+            # The panel pass is shared, so its time is split evenly across symbols
+            seconds = (time.perf_counter() - started) / len(frames)
+
+            for symbol, engineered_df in engineered.items():
+                buffer = buffers.get(symbol)
+                output_df = self._output_page(
+                    symbol=symbol,
+                    engineered_df=engineered_df,
+                    has_buffer=buffer is not None and not buffer.empty,
+                    seconds=seconds,
                 )
-                if output_df.empty:
-                    self.logger.warning(
-                        f"Engineered DataFrame for {symbol} is empty after feature engineering."
-                    )
+                if output_df is None:
                     continue
-                yield output_df
+                pages[symbol].append(output_df)
+                buffers[symbol] = frames[symbol].iloc[-self.max_lookback :].copy()
+        return pages
 
-                # Update buffer to last N rows of the *input* DataFrame
-                buffer = df.iloc[-self.max_lookback :].copy()
-            except Exception as e:
-                self.logger.error(f"Feature engineering failed for {symbol}: {e}")
+    def _call_func(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.features is None:
+            return self.feature_engineering_func(df=df, logger=self.logger)
+        return self.feature_engineering_func(
+            df=df, logger=self.logger, features=self.features
+        )
+
+    def _call_panel_func(
+        self, frames: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        if self.panel_feature_engineering_func is None:
+            raise ValueError("No panel feature engineering function configured.")
+        if self.features is None:
+            return self.panel_feature_engineering_func(
+                frames=frames, logger=self.logger
+            )
+        return self.panel_feature_engineering_func(
+            frames=frames, logger=self.logger, features=self.features
+        )
+
+    def _output_page(
+        self,
+        symbol: str,
+        engineered_df: pd.DataFrame,
+        has_buffer: bool,
+        seconds: float,
+    ) -> Optional[pd.DataFrame]:
+        """Validate an engineered page and drop the rows carried over from the
+        previous page. Returns None if there is nothing to yield."""
+        # Validate the output DataFrame
+        if not self._validate_output(engineered_df):
+            self.logger.error(
+                f"Output DataFrame for {symbol} is invalid after feature engineering."
+            )
+            return None
+        # Only yield the rows corresponding to the current page
+        # (i.e., drop the buffer rows)
+        if has_buffer:
+            output_df = engineered_df.iloc[self.max_lookback :]
+        else:
+            output_df = engineered_df
+
+        self.logger.info(
+            f"Feature engineering output columns: {engineered_df.columns}, shape: {engineered_df.shape}"
+        )
+        self.logger.debug(
+            f"Yielding engineered DataFrame for {symbol} with shape: {output_df.shape}"
+        )
+        if output_df.empty:
+            self.logger.warning(
+                f"Engineered DataFrame for {symbol} is empty after feature engineering."
+            )
+            return None
+        self.report.record(symbol, rows=len(output_df), seconds=seconds)
+        return output_df
 
     def _validate_input(self, df: pd.DataFrame) -> bool:
         """
@@ -103,7 +248,12 @@ class BacktestFeatureEngineer:
         Validate the DataFrame to ensure it has the expected output columns.
         This method can be customized based on the specific requirements of your feature engineering function.
         """
-        required_output_columns = BacktestStage.FEATURE_ENGINEERING.output_columns
+        if self.features is None:
+            required_output_columns = BacktestStage.FEATURE_ENGINEERING.output_columns
+        else:
+            required_output_columns = (
+                BacktestStage.FEATURE_ENGINEERING.input_columns + self.report.computed
+            )
         self.logger.debug(
             f"Validating output DataFrame columns: {df.columns}, expected: {required_output_columns}"
         )
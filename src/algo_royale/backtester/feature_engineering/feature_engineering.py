@@ -1,201 +1,325 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
 import numpy as np
 import pandas as pd
 from algo_royale.logging.loggable import Loggable
 
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
 from algo_royale.backtester.column_names.feature_engineering_columns import (
     FeatureEngineeringColumns,
 )
 
 
-def feature_engineering(df: pd.DataFrame, logger: Loggable) -> pd.DataFrame:
-    try:
-        logger.info(f"Input DataFrame shape: {df.shape}, columns: {list(df.columns)}")
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    An engineered column, how it is computed and the engineered columns it
+    reads. Ingested columns are always present, so only engineered
+    dependencies are listed. `panel` features only use elementwise, rolling
+    and exponential operations, so they also compute on a row x symbol
+    matrix (see panel_feature_engineering).
+    """
 
-        # Price returns
-        df[FeatureEngineeringColumns.PCT_RETURN] = df[
-            FeatureEngineeringColumns.CLOSE_PRICE
-        ].pct_change()
-        df[FeatureEngineeringColumns.LOG_RETURN] = np.log(
-            df[FeatureEngineeringColumns.CLOSE_PRICE]
-        ).diff()
-
-        # Moving averages (loop for brevity)
-        for window in [10, 20, 50, 100, 150, 200]:
-            df[getattr(FeatureEngineeringColumns, f"SMA_{window}")] = (
-                df[FeatureEngineeringColumns.CLOSE_PRICE].rolling(window=window).mean()
-            )
-        for window in [9, 10, 12, 20, 26, 50, 100, 150, 200]:
-            df[getattr(FeatureEngineeringColumns, f"EMA_{window}")] = (
-                df[FeatureEngineeringColumns.CLOSE_PRICE]
-                .ewm(span=window, adjust=False)
-                .mean()
-            )
+    column: str
+    compute: Callable[[pd.DataFrame], pd.Series]
+    depends_on: tuple[str, ...] = ()
+    panel: bool = True
 
-        # MACD
-        df[FeatureEngineeringColumns.MACD] = (
-            df[FeatureEngineeringColumns.CLOSE_PRICE].ewm(span=12, adjust=False).mean()
-            - df[FeatureEngineeringColumns.CLOSE_PRICE]
-            .ewm(span=26, adjust=False)
-            .mean()
-        )
-        df[FeatureEngineeringColumns.MACD_SIGNAL] = (
-            df[FeatureEngineeringColumns.MACD].ewm(span=9, adjust=False).mean()
-        )
-        # RSI
-        df[FeatureEngineeringColumns.RSI] = calculate_rsi(
-            df[FeatureEngineeringColumns.CLOSE_PRICE]
-        )
 
-        # Volatility
-        for window in [10, 20, 50]:
-            df[getattr(FeatureEngineeringColumns, f"VOLATILITY_{window}")] = (
-                df[FeatureEngineeringColumns.PCT_RETURN].rolling(window=window).std()
-            )
-        df[FeatureEngineeringColumns.HIST_VOLATILITY_20] = df[
-            FeatureEngineeringColumns.PCT_RETURN
-        ].rolling(window=20).std() * np.sqrt(252)
+def _max(a, b):
+    """Elementwise max of two Series or frames, skipping NaN like max(axis=1)."""
+    return a.where((a >= b) | b.isna(), b)
 
-        # ATR
-        df[FeatureEngineeringColumns.ATR_14] = calculate_atr(df, window=14)
 
-        # Range and candle features
-        df[FeatureEngineeringColumns.RANGE] = (
-            df[FeatureEngineeringColumns.HIGH_PRICE]
-            - df[FeatureEngineeringColumns.LOW_PRICE]
-        )
-        df[FeatureEngineeringColumns.BODY] = abs(
-            df[FeatureEngineeringColumns.CLOSE_PRICE]
-            - df[FeatureEngineeringColumns.OPEN_PRICE]
-        )
-        df[FeatureEngineeringColumns.UPPER_WICK] = df[
-            FeatureEngineeringColumns.HIGH_PRICE
-        ] - df[
-            [
-                FeatureEngineeringColumns.OPEN_PRICE,
-                FeatureEngineeringColumns.CLOSE_PRICE,
-            ]
-        ].max(axis=1)
-        df[FeatureEngineeringColumns.LOWER_WICK] = (
-            df[
-                [
-                    FeatureEngineeringColumns.OPEN_PRICE,
-                    FeatureEngineeringColumns.CLOSE_PRICE,
-                ]
-            ].min(axis=1)
-            - df[FeatureEngineeringColumns.LOW_PRICE]
-        )
+def _min(a, b):
+    """Elementwise min of two Series or frames, skipping NaN like min(axis=1)."""
+    return a.where((a <= b) | b.isna(), b)
 
-        # Volume features
-        for window in [10, 20, 50, 100, 200]:
-            df[getattr(FeatureEngineeringColumns, f"VOL_MA_{window}")] = (
-                df[FeatureEngineeringColumns.VOLUME].rolling(window=window).mean()
-            )
-        df[FeatureEngineeringColumns.VOL_CHANGE] = df[
-            FeatureEngineeringColumns.VOLUME
-        ].pct_change()
 
-        # VWAP rolling
-        df[FeatureEngineeringColumns.VWAP_10] = (
-            df[FeatureEngineeringColumns.VOLUME_WEIGHTED_PRICE]
-            * df[FeatureEngineeringColumns.VOLUME]
-        ).rolling(10).sum() / df[FeatureEngineeringColumns.VOLUME].rolling(10).sum()
-        df[FeatureEngineeringColumns.VWAP_20] = (
-            df[FeatureEngineeringColumns.VOLUME_WEIGHTED_PRICE]
-            * df[FeatureEngineeringColumns.VOLUME]
-        ).rolling(20).sum() / df[FeatureEngineeringColumns.VOLUME].rolling(20).sum()
-        df[FeatureEngineeringColumns.VWAP_50] = (
-            df[FeatureEngineeringColumns.VOLUME_WEIGHTED_PRICE]
-            * df[FeatureEngineeringColumns.VOLUME]
-        ).rolling(50).sum() / df[FeatureEngineeringColumns.VOLUME].rolling(50).sum()
-        df[FeatureEngineeringColumns.VWAP_100] = (
-            df[FeatureEngineeringColumns.VOLUME_WEIGHTED_PRICE]
-            * df[FeatureEngineeringColumns.VOLUME]
-        ).rolling(100).sum() / df[FeatureEngineeringColumns.VOLUME].rolling(100).sum()
-        df[FeatureEngineeringColumns.VWAP_150] = (
-            df[FeatureEngineeringColumns.VOLUME_WEIGHTED_PRICE]
-            * df[FeatureEngineeringColumns.VOLUME]
-        ).rolling(150).sum() / df[FeatureEngineeringColumns.VOLUME].rolling(150).sum()
-        df[FeatureEngineeringColumns.VWAP_200] = (
+def _close(df: pd.DataFrame) -> pd.Series:
+    return df[FeatureEngineeringColumns.CLOSE_PRICE]
+
+
+def _sma(window: int) -> Callable[[pd.DataFrame], pd.Series]:
+    return lambda df: _close(df).rolling(window=window).mean()
+
+
+def _ema(window: int) -> Callable[[pd.DataFrame], pd.Series]:
+    return lambda df: _close(df).ewm(span=window, adjust=False).mean()
+
+
+def _volatility(window: int) -> Callable[[pd.DataFrame], pd.Series]:
+    return (
+        lambda df: df[FeatureEngineeringColumns.PCT_RETURN].rolling(window=window).std()
+    )
+
+
+def _vol_ma(window: int) -> Callable[[pd.DataFrame], pd.Series]:
+    return lambda df: df[FeatureEngineeringColumns.VOLUME].rolling(window=window).mean()
+
+
+def _vwap(window: int) -> Callable[[pd.DataFrame], pd.Series]:
+    return (
+        lambda df: (
             df[FeatureEngineeringColumns.VOLUME_WEIGHTED_PRICE]
             * df[FeatureEngineeringColumns.VOLUME]
-        ).rolling(200).sum() / df[FeatureEngineeringColumns.VOLUME].rolling(200).sum()
+        )
+        .rolling(window)
+        .sum()
+        / df[FeatureEngineeringColumns.VOLUME].rolling(window).sum()
+    )
 
-        # Time features
-        df[FeatureEngineeringColumns.HOUR] = df[
-            FeatureEngineeringColumns.TIMESTAMP
-        ].dt.hour
-        df[FeatureEngineeringColumns.DAY_OF_WEEK] = df[
-            FeatureEngineeringColumns.TIMESTAMP
-        ].dt.dayofweek
 
-        # ADX
-        df[FeatureEngineeringColumns.ADX] = calculate_adx(df, window=14)
+def _macd(df: pd.DataFrame) -> pd.Series:
+    return (
+        _close(df).ewm(span=12, adjust=False).mean()
+        - _close(df).ewm(span=26, adjust=False).mean()
+    )
 
-        # Momentum, ROC
-        df[FeatureEngineeringColumns.MOMENTUM_10] = df[
-            FeatureEngineeringColumns.CLOSE_PRICE
-        ] - df[FeatureEngineeringColumns.CLOSE_PRICE].shift(10)
-        df[FeatureEngineeringColumns.ROC_10] = (
-            df[FeatureEngineeringColumns.CLOSE_PRICE]
-            - df[FeatureEngineeringColumns.CLOSE_PRICE].shift(10)
-        ) / df[FeatureEngineeringColumns.CLOSE_PRICE].shift(10)
 
-        # Stochastic K/D
-        low_14 = df[FeatureEngineeringColumns.LOW_PRICE].rolling(window=14).min()
-        high_14 = df[FeatureEngineeringColumns.HIGH_PRICE].rolling(window=14).max()
-        df[FeatureEngineeringColumns.STOCHASTIC_K] = (
-            (df[FeatureEngineeringColumns.CLOSE_PRICE] - low_14)
-            / (high_14 - low_14)
-            * 100
-        )
-        df[FeatureEngineeringColumns.STOCHASTIC_D] = (
-            df[FeatureEngineeringColumns.STOCHASTIC_K].rolling(window=3).mean()
-        )
+def _upper_wick(df: pd.DataFrame) -> pd.Series:
+    return df[FeatureEngineeringColumns.HIGH_PRICE] - _max(
+        df[FeatureEngineeringColumns.OPEN_PRICE], _close(df)
+    )
 
-        # Bollinger Bands
-        ma20 = df[FeatureEngineeringColumns.CLOSE_PRICE].rolling(window=20).mean()
-        std20 = df[FeatureEngineeringColumns.CLOSE_PRICE].rolling(window=20).std()
-        df[FeatureEngineeringColumns.BOLLINGER_UPPER] = ma20 + 2 * std20
-        df[FeatureEngineeringColumns.BOLLINGER_LOWER] = ma20 - 2 * std20
-        df[FeatureEngineeringColumns.BOLLINGER_WIDTH] = (
-            df[FeatureEngineeringColumns.BOLLINGER_UPPER]
-            - df[FeatureEngineeringColumns.BOLLINGER_LOWER]
-        ) / ma20
 
-        # GAP, High/Low Ratio
-        df[FeatureEngineeringColumns.GAP] = (
-            df[FeatureEngineeringColumns.CLOSE_PRICE]
-            - df[FeatureEngineeringColumns.OPEN_PRICE]
-        ) / df[FeatureEngineeringColumns.OPEN_PRICE]
-        df[FeatureEngineeringColumns.HIGH_LOW_RATIO] = (
-            df[FeatureEngineeringColumns.HIGH_PRICE]
-            / df[FeatureEngineeringColumns.LOW_PRICE]
-        ).replace([np.inf, -np.inf], np.nan)
-
-        # OBV
-        df[FeatureEngineeringColumns.OBV] = (
-            (
-                df[FeatureEngineeringColumns.VOLUME]
-                * np.sign(df[FeatureEngineeringColumns.CLOSE_PRICE].diff())
+def _lower_wick(df: pd.DataFrame) -> pd.Series:
+    return (
+        _min(df[FeatureEngineeringColumns.OPEN_PRICE], _close(df))
+        - df[FeatureEngineeringColumns.LOW_PRICE]
+    )
+
+
+def _stochastic_k(df: pd.DataFrame) -> pd.Series:
+    low_14 = df[FeatureEngineeringColumns.LOW_PRICE].rolling(window=14).min()
+    high_14 = df[FeatureEngineeringColumns.HIGH_PRICE].rolling(window=14).max()
+    return (_close(df) - low_14) / (high_14 - low_14) * 100
+
+
+def _bollinger_band(sign: int) -> Callable[[pd.DataFrame], pd.Series]:
+    return lambda df: (
+        _close(df).rolling(window=20).mean()
+        + sign * 2 * _close(df).rolling(window=20).std()
+    )
+
+
+def _bollinger_width(df: pd.DataFrame) -> pd.Series:
+    return (
+        df[FeatureEngineeringColumns.BOLLINGER_UPPER]
+        - df[FeatureEngineeringColumns.BOLLINGER_LOWER]
+    ) / _close(df).rolling(window=20).mean()
+
+
+def _obv(df: pd.DataFrame) -> pd.Series:
+    return (
+        (df[FeatureEngineeringColumns.VOLUME] * np.sign(_close(df).diff()))
+        .fillna(0)
+        .cumsum()
+    )
+
+
+def _adl(df: pd.DataFrame) -> pd.Series:
+    return (
+        (
+            df[FeatureEngineeringColumns.VOLUME]
+            * (_close(df) - df[FeatureEngineeringColumns.LOW_PRICE])
+            / (
+                df[FeatureEngineeringColumns.HIGH_PRICE]
+                - df[FeatureEngineeringColumns.LOW_PRICE]
             )
-            .fillna(0)
-            .cumsum()
+        ).fillna(0)
+    ).cumsum()
+
+
+def _window_specs(
+    prefix: str, windows: list[int], compute, depends_on: tuple[str, ...] = ()
+) -> list[FeatureSpec]:
+    return [
+        FeatureSpec(
+            getattr(FeatureEngineeringColumns, f"{prefix}_{window}"),
+            compute(window),
+            depends_on,
         )
+        for window in windows
+    ]
+
 
-        # ADL
-        df[FeatureEngineeringColumns.ADL] = (
+# Every engineered column, in the order feature_engineering adds them
+FEATURE_SPECS: dict[str, FeatureSpec] = {
+    spec.column: spec
+    for spec in [
+        # Price returns
+        FeatureSpec(
+            FeatureEngineeringColumns.PCT_RETURN, lambda df: _close(df).pct_change()
+        ),
+        FeatureSpec(
+            FeatureEngineeringColumns.LOG_RETURN, lambda df: np.log(_close(df)).diff()
+        ),
+        # Moving averages
+        *_window_specs("SMA", [10, 20, 50, 100, 150, 200], _sma),
+        *_window_specs("EMA", [9, 10, 12, 20, 26, 50, 100, 150, 200], _ema),
+        # MACD
+        FeatureSpec(FeatureEngineeringColumns.MACD, _macd),
+        FeatureSpec(
+            FeatureEngineeringColumns.MACD_SIGNAL,
+            lambda df: df[FeatureEngineeringColumns.MACD]
+            .ewm(span=9, adjust=False)
+            .mean(),
+            (FeatureEngineeringColumns.MACD,),
+        ),
+        # RSI
+        FeatureSpec(
+            FeatureEngineeringColumns.RSI, lambda df: calculate_rsi(_close(df))
+        ),
+        # Volatility
+        *_window_specs(
+            "VOLATILITY",
+            [10, 20, 50],
+            _volatility,
+            (FeatureEngineeringColumns.PCT_RETURN,),
+        ),
+        FeatureSpec(
+            FeatureEngineeringColumns.HIST_VOLATILITY_20,
+            lambda df: df[FeatureEngineeringColumns.PCT_RETURN].rolling(window=20).std()
+            * np.sqrt(252),
+            (FeatureEngineeringColumns.PCT_RETURN,),
+        ),
+        # ATR
+        FeatureSpec(
+            FeatureEngineeringColumns.ATR_14, lambda df: calculate_atr(df, window=14)
+        ),
+        # Range and candle features
+        FeatureSpec(
+            FeatureEngineeringColumns.RANGE,
+            lambda df: df[FeatureEngineeringColumns.HIGH_PRICE]
+            - df[FeatureEngineeringColumns.LOW_PRICE],
+        ),
+        FeatureSpec(
+            FeatureEngineeringColumns.BODY,
+            lambda df: abs(_close(df) - df[FeatureEngineeringColumns.OPEN_PRICE]),
+        ),
+        FeatureSpec(FeatureEngineeringColumns.UPPER_WICK, _upper_wick),
+        FeatureSpec(FeatureEngineeringColumns.LOWER_WICK, _lower_wick),
+        # Volume features
+        *_window_specs("VOL_MA", [10, 20, 50, 100, 200], _vol_ma),
+        FeatureSpec(
+            FeatureEngineeringColumns.VOL_CHANGE,
+            lambda df: df[FeatureEngineeringColumns.VOLUME].pct_change(),
+        ),
+        # VWAP rolling
+        *_window_specs("VWAP", [10, 20, 50, 100, 150, 200], _vwap),
+        # Time features
+        FeatureSpec(
+            FeatureEngineeringColumns.HOUR,
+            lambda df: df[FeatureEngineeringColumns.TIMESTAMP].dt.hour,
+            panel=False,
+        ),
+        FeatureSpec(
+            FeatureEngineeringColumns.DAY_OF_WEEK,
+            lambda df: df[FeatureEngineeringColumns.TIMESTAMP].dt.dayofweek,
+            panel=False,
+        ),
+        # ADX
+        FeatureSpec(
+            FeatureEngineeringColumns.ADX, lambda df: calculate_adx(df, window=14)
+        ),
+        # Momentum, ROC
+        FeatureSpec(
+            FeatureEngineeringColumns.MOMENTUM_10,
+            lambda df: _close(df) - _close(df).shift(10),
+        ),
+        FeatureSpec(
+            FeatureEngineeringColumns.ROC_10,
+            lambda df: (_close(df) - _close(df).shift(10)) / _close(df).shift(10),
+        ),
+        # Stochastic K/D
+        FeatureSpec(FeatureEngineeringColumns.STOCHASTIC_K, _stochastic_k),
+        FeatureSpec(
+            FeatureEngineeringColumns.STOCHASTIC_D,
+            lambda df: df[FeatureEngineeringColumns.STOCHASTIC_K]
+            .rolling(window=3)
+            .mean(),
+            (FeatureEngineeringColumns.STOCHASTIC_K,),
+        ),
+        # Bollinger Bands
+        FeatureSpec(FeatureEngineeringColumns.BOLLINGER_UPPER, _bollinger_band(1)),
+        FeatureSpec(FeatureEngineeringColumns.BOLLINGER_LOWER, _bollinger_band(-1)),
+        FeatureSpec(
+            FeatureEngineeringColumns.BOLLINGER_WIDTH,
+            _bollinger_width,
             (
-                df[FeatureEngineeringColumns.VOLUME]
-                * (
-                    df[FeatureEngineeringColumns.CLOSE_PRICE]
-                    - df[FeatureEngineeringColumns.LOW_PRICE]
-                )
-                / (
-                    df[FeatureEngineeringColumns.HIGH_PRICE]
-                    - df[FeatureEngineeringColumns.LOW_PRICE]
+                FeatureEngineeringColumns.BOLLINGER_UPPER,
+                FeatureEngineeringColumns.BOLLINGER_LOWER,
+            ),
+        ),
+        # GAP, High/Low Ratio
+        FeatureSpec(
+            FeatureEngineeringColumns.GAP,
+            lambda df: (_close(df) - df[FeatureEngineeringColumns.OPEN_PRICE])
+            / df[FeatureEngineeringColumns.OPEN_PRICE],
+        ),
+        FeatureSpec(
+            FeatureEngineeringColumns.HIGH_LOW_RATIO,
+            lambda df: (
+                df[FeatureEngineeringColumns.HIGH_PRICE]
+                / df[FeatureEngineeringColumns.LOW_PRICE]
+            ).replace([np.inf, -np.inf], np.nan),
+        ),
+        # OBV, ADL
+        FeatureSpec(FeatureEngineeringColumns.OBV, _obv),
+        FeatureSpec(FeatureEngineeringColumns.ADL, _adl),
+    ]
+}
+
+
+def resolve_features(features: Optional[Iterable[str]] = None) -> list[str]:
+    """
+    Engineered columns to compute for the requested features: the features
+    themselves plus the engineered columns they depend on, in computation
+    order. None requests every feature; names that are not engineered
+    columns (e.g. ingested price columns) are ignored.
+    """
+    if features is None:
+        return list(FEATURE_SPECS)
+    selected = set()
+    pending = [str(feature) for feature in features if feature in FEATURE_SPECS]
+    while pending:
+        column = pending.pop()
+        if column in selected:
+            continue
+        selected.add(column)
+        pending.extend(FEATURE_SPECS[column].depends_on)
+    return [column for column in FEATURE_SPECS if column in selected]
+
+
+def feature_engineering(
+    df: pd.DataFrame,
+    logger: Loggable,
+    features: Optional[Iterable[str]] = None,
+    timings: Optional[dict[str, float]] = None,
+) -> pd.DataFrame:
+    """
+    Add engineered feature columns to an ingested bars DataFrame.
+
+    Args:
+        df: Ingested bars; modified in place and returned.
+        logger: Loggable instance.
+        features: Features to compute, with their dependencies. None computes all.
+        timings: If given, seconds spent per feature are added to it.
+    """
+    try:
+        logger.info(f"Input DataFrame shape: {df.shape}, columns: {list(df.columns)}")
+
+        columns = resolve_features(features)
+        for column in columns:
+            started = time.perf_counter()
+            df[column] = FEATURE_SPECS[column].compute(df)
+            if timings is not None:
+                timings[column] = (
+                    timings.get(column, 0.0) + time.perf_counter() - started
                 )
-            ).fillna(0)
-        ).cumsum()
 
         # Ensure timestamp is datetime
         df[FeatureEngineeringColumns.TIMESTAMP] = pd.to_datetime(
@@ -205,13 +329,11 @@ def feature_engineering(df: pd.DataFrame, logger: Loggable) -> pd.DataFrame:
         logger.info(f"DataFrame shape before dropna: {df.shape}")
         logger.info(f"DataFrame columns after feature engineering: {list(df.columns)}")
 
-        # Validation: ensure all features in FeatureEngineeringColumns are present
+        # Validation: ensure the ingested and selected features are present
         missing = [
-            getattr(FeatureEngineeringColumns, attr)
-            for attr in dir(FeatureEngineeringColumns)
-            if not attr.startswith("__")
-            and not callable(getattr(FeatureEngineeringColumns, attr))
-            and getattr(FeatureEngineeringColumns, attr) not in df.columns
+            column
+            for column in DataIngestColumns.get_all_column_values() + columns
+            if column not in df.columns
         ]
         if missing:
             logger.error(f"Missing features after engineering: {missing}")
@@ -224,6 +346,105 @@ def feature_engineering(df: pd.DataFrame, logger: Loggable) -> pd.DataFrame:
         raise ValueError(f"Feature engineering failed: {e}") from e
 
 
+class _Panel(dict):
+    """
+    Ingested columns as row x symbol matrices, built on first access.
+    Symbol j's i-th bar is at row i, column j; shorter symbols are NaN-padded
+    at the end, so padding never enters a window ending on a real bar.
+    """
+
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        super().__init__()
+        self.frames = frames
+        self.n_rows = max((len(frame) for frame in frames.values()), default=0)
+
+    def __missing__(self, column: str) -> pd.DataFrame:
+        values = np.full((self.n_rows, len(self.frames)), np.nan)
+        for j, frame in enumerate(self.frames.values()):
+            values[: len(frame), j] = frame[column].to_numpy(dtype=np.float64)
+        matrix = pd.DataFrame(values, columns=list(self.frames))
+        self[column] = matrix
+        return matrix
+
+
+def panel_feature_engineering(
+    frames: dict[str, pd.DataFrame],
+    logger: Loggable,
+    features: Optional[Iterable[str]] = None,
+    timings: Optional[dict[str, float]] = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Engineer features for several symbols at once: each panel feature is one
+    vectorized pass over a row x symbol matrix instead of one pass per symbol.
+    Results are identical to feature_engineering on each frame.
+
+    Args:
+        frames: Ingested bars per symbol.
+        logger: Loggable instance.
+        features: Features to compute, with their dependencies. None computes all.
+        timings: If given, seconds spent per feature are added to it.
+
+    Returns:
+        dict[str, pd.DataFrame]: Engineered frames per symbol.
+    """
+    try:
+        columns = resolve_features(features)
+        panel = _Panel(frames)
+        for column in columns:
+            spec = FEATURE_SPECS[column]
+            if not spec.panel:
+                continue
+            started = time.perf_counter()
+            panel[column] = spec.compute(panel)
+            if timings is not None:
+                timings[column] = (
+                    timings.get(column, 0.0) + time.perf_counter() - started
+                )
+
+        # rows x symbols x features, so each symbol's features are one 2-D slice
+        panel_columns = [column for column in columns if FEATURE_SPECS[column].panel]
+        stacked = np.stack(
+            [panel[column].to_numpy() for column in panel_columns], axis=-1
+        ).reshape(panel.n_rows, len(frames), len(panel_columns))
+
+        engineered = {}
+        for j, (symbol, frame) in enumerate(frames.items()):
+            features_df = pd.DataFrame(
+                stacked[: len(frame), j, :], index=frame.index, columns=panel_columns
+            )
+            for column in columns:
+                if not FEATURE_SPECS[column].panel:
+                    features_df[column] = FEATURE_SPECS[column].compute(frame)
+            df = pd.concat(
+                [
+                    frame.drop(columns=[c for c in columns if c in frame.columns]),
+                    features_df[columns],
+                ],
+                axis=1,
+            )
+            df[FeatureEngineeringColumns.TIMESTAMP] = pd.to_datetime(
+                df[FeatureEngineeringColumns.TIMESTAMP]
+            )
+            missing = [
+                column
+                for column in DataIngestColumns.get_all_column_values() + columns
+                if column not in df.columns
+            ]
+            if missing:
+                logger.error(f"Missing features after engineering {symbol}: {missing}")
+                raise ValueError(f"Missing features after engineering: {missing}")
+            engineered[symbol] = df
+
+        logger.info(
+            f"Panel feature engineering complete for {len(frames)} symbols, "
+            f"{panel.n_rows} rows"
+        )
+        return engineered
+    except Exception as e:
+        logger.error(f"Panel feature engineering failed: {e}")
+        raise ValueError(f"Panel feature engineering failed: {e}") from e
+
+
 def calculate_rsi(series, window=14):
     delta = series.diff()
     gain = delta.clip(lower=0)
@@ -238,9 +459,9 @@ def calculate_atr(df, window=14):
     high = df[FeatureEngineeringColumns.HIGH_PRICE]
     low = df[FeatureEngineeringColumns.LOW_PRICE]
     close = df[FeatureEngineeringColumns.CLOSE_PRICE]
-    tr = pd.concat(
-        [high - low, (high - close.shift()).abs(), (low - close.shift()).abs()], axis=1
-    ).max(axis=1)
+    tr = _max(
+        _max(high - low, (high - close.shift()).abs()), (low - close.shift()).abs()
+    )
     return tr.rolling(window=window, min_periods=window).mean()
 
 
@@ -255,7 +476,7 @@ def calculate_adx(df, window=14):
     tr1 = high - low
     tr2 = (high - close.shift()).abs()
     tr3 = (low - close.shift()).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    tr = _max(_max(tr1, tr2), tr3)
     atr = tr.rolling(window=window, min_periods=window).mean()
     plus_di = 100 * (plus_dm.rolling(window=window, min_periods=window).mean() / atr)
     minus_di = 100 * (minus_dm.rolling(window=window, min_periods=window).mean() / atr)
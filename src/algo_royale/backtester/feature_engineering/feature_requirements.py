@@ -0,0 +1,48 @@
+from typing import Iterable, Optional
+
+from algo_royale.backtester.strategy_combinator.signal.base_signal_strategy_combinator import (
+    SignalStrategyCombinator,
+)
+from algo_royale.logging.loggable import Loggable
+
+CONDITION_TYPE_ATTRIBUTES = (
+    "filter_condition_types",
+    "entry_condition_types",
+    "trend_condition_types",
+    "exit_condition_types",
+    "stateful_logic_types",
+)
+
+
+def required_features(
+    combinators: Iterable[SignalStrategyCombinator], logger: Loggable
+) -> Optional[set[str]]:
+    """
+    Columns read by every condition and stateful logic instance the
+    combinators can build, across their whole parameter grids.
+
+    Returns None if any condition type cannot be enumerated, since the
+    columns it reads are then unknown and every feature must be computed.
+    """
+    columns = set()
+    for combinator in combinators:
+        for attribute in CONDITION_TYPE_ATTRIBUTES:
+            for condition_type in getattr(combinator, attribute, None) or []:
+                if condition_type is None:
+                    continue
+                try:
+                    # Some all_possible_conditions require logger, some don't
+                    try:
+                        conditions = condition_type.all_possible_conditions(logger)
+                    except TypeError:
+                        conditions = condition_type.all_possible_conditions()
+                    for condition in conditions:
+                        columns.update(str(col) for col in condition.required_columns)
+                except Exception as e:
+                    logger.warning(
+                        f"Cannot determine columns read by {condition_type.__name__} "
+                        f"({e}); computing all features."
+                    )
+                    return None
+    logger.info(f"Features required by the configured combinators: {sorted(columns)}")
+    return columns
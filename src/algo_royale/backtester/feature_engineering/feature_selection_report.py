@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from algo_royale.backtester.feature_engineering.feature_engineering import (
+    FEATURE_SPECS,
+    resolve_features,
+)
+
+# Engineered columns are float64
+FEATURE_BYTES_PER_ROW = 8
+
+
+@dataclass
+class FeatureSelectionReport:
+    """
+    What a feature engineering run computed and skipped.
+    Skipped memory is what the skipped columns would have taken in the
+    engineered frames; time saved is not observable without computing them
+    (see scripts/benchmark_feature_selection.py).
+    """
+
+    computed: list[str]
+    skipped: list[str]
+    rows: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+    seconds_by_symbol: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def for_features(
+        cls, features: Optional[Iterable[str]] = None
+    ) -> "FeatureSelectionReport":
+        computed = resolve_features(features)
+        return cls(
+            computed=computed,
+            skipped=[column for column in FEATURE_SPECS if column not in computed],
+        )
+
+    def record(self, symbol: str, rows: int, seconds: float):
+        self.rows += rows
+        self.pages += 1
+        self.seconds += seconds
+        self.seconds_by_symbol[symbol] = (
+            self.seconds_by_symbol.get(symbol, 0.0) + seconds
+        )
+
+    @property
+    def skipped_bytes(self) -> int:
+        return self.rows * len(self.skipped) * FEATURE_BYTES_PER_ROW
+
+    def summary(self) -> str:
+        return (
+            f"computed {len(self.computed)}/{len(FEATURE_SPECS)} features for "
+            f"{self.rows:,} rows ({self.pages} pages, {len(self.seconds_by_symbol)} symbols) "
+            f"in {self.seconds:.2f}s; skipped {len(self.skipped)} features, "
+            f"{self.skipped_bytes / 1e6:,.1f} MB not materialized: {self.skipped}"
+        )
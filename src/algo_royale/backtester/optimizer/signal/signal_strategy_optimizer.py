@@ -3,7 +3,7 @@ import inspect
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Callable, Dict, Type
+from typing import Any, Callable, Dict, Optional, Sequence, Type
 
 import optuna
 import pandas as pd
@@ -43,6 +43,11 @@ class SignalStrategyOptimizer(ABC):
 
 
 class SignalStrategyOptimizerImpl(SignalStrategyOptimizer):
+    # Trials scored before pruning starts; studies of at most this many
+    # trials cannot prune, so they skip the lower-fidelity rungs
+    PRUNER_STARTUP_TRIALS = 5
+    PRUNERS = ("median", "successive_halving", "hyperband")
+
     def __init__(
         self,
         strategy_class: Type,
@@ -52,6 +57,9 @@ class SignalStrategyOptimizerImpl(SignalStrategyOptimizer):
         strategy_logger: Loggable,
         metric_name: str = "total_return",
         direction: str = "maximize",
+        pruner: Optional[str] = None,
+        fidelity_fractions: Sequence[float] = (0.25, 0.5),
+        seed: Optional[int] = None,
     ):
         """
         :param strategy_class: The strategy class to instantiate.
@@ -61,6 +69,13 @@ class SignalStrategyOptimizerImpl(SignalStrategyOptimizer):
         :param logger: Optional logger for debugging.
         :param metric_name: What metric to optimize.
         :param direction: 'maximize' or 'minimize'.
+        :param pruner: None, "median", "successive_halving" or "hyperband". When set,
+                       each trial is first scored on growing prefixes of the window
+                       (fidelity_fractions) and losing trials are stopped early.
+                       Studies of PRUNER_STARTUP_TRIALS trials or fewer run
+                       without pruning.
+        :param fidelity_fractions: Window fractions scored before the full window.
+        :param seed: Optional sampler seed for reproducible studies.
         """
         self.strategy_class = strategy_class
         self.condition_types = condition_types
@@ -69,6 +84,9 @@ class SignalStrategyOptimizerImpl(SignalStrategyOptimizer):
         self.direction = direction
         self.logger = logger
         self.strategy_logger = strategy_logger
+        self.pruner = pruner
+        self.fidelity_fractions = fidelity_fractions
+        self.seed = seed
 
     def optimize(
         self,
@@ -94,149 +112,61 @@ class SignalStrategyOptimizerImpl(SignalStrategyOptimizer):
             f"Starting optimization for {symbol} with {self.strategy_class.__name__}"
         )
         self.logger.debug(f"DataFrame lines: {len(df)}")
-        study = optuna.create_study(direction=self.direction)
+        rungs = self._fidelity_rungs(n_trials)
+        study = optuna.create_study(
+            direction=self.direction,
+            sampler=(
+                optuna.samplers.TPESampler(seed=self.seed)
+                if self.seed is not None
+                else None
+            ),
+            pruner=self._create_pruner(rungs),
+        )
         start_time = time.time()
 
         def objective(trial, logger=self.logger):
-            entry_conds = [
-                cond_cls.optuna_suggest(
-                    logger=self.strategy_logger,
-                    trial=trial,
-                    prefix=f"{symbol}_entry_{cond_cls.__name__}_",
-                )
-                for i, cond_cls in enumerate(self.condition_types.get("entry", []))
-            ]
-            trend_conds = [
-                cond_cls.optuna_suggest(
-                    logger=self.strategy_logger,
-                    trial=trial,
-                    prefix=f"{symbol}_trend_{cond_cls.__name__}_",
-                )
-                for i, cond_cls in enumerate(self.condition_types.get("trend", []))
-            ]
-            exit_conds = [
-                cond_cls.optuna_suggest(
-                    logger=self.strategy_logger,
-                    trial=trial,
-                    prefix=f"{symbol}_exit_{cond_cls.__name__}_",
-                )
-                for i, cond_cls in enumerate(self.condition_types.get("exit", []))
-            ]
-            filter_conds = [
-                cond_cls.optuna_suggest(
-                    logger=self.strategy_logger,
-                    trial=trial,
-                    prefix=f"{symbol}_filter_{cond_cls.__name__}_",
-                )
-                for i, cond_cls in enumerate(self.condition_types.get("filter", []))
-            ]
-            state_logic = self.condition_types.get("stateful_logic")
-            # Defensive: If state_logic is a class, instantiate it
-            if isinstance(state_logic, type):
-                # Defensive: If it's the base class, log error and skip
-                if state_logic.__name__ == "StatefulLogic":
-                    self.logger.error(
-                        f"[FATAL] Base StatefulLogic class was provided as stateful_logic for symbol {symbol}. This is not allowed. Skipping this candidate."
-                    )
-                    state_logic = None
-                else:
-                    try:
-                        state_logic = state_logic(logger=self.strategy_logger)
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to instantiate stateful_logic class {state_logic}: {e}"
-                        )
-                        state_logic = None
-            # If it's an instance, optionally call optuna_suggest if available
-            if isinstance(state_logic, StatefulLogic):
-                # Defensive: If it's the base class, log error and skip
-                if type(state_logic).__name__ == "StatefulLogic":
-                    self.logger.error(
-                        f"[FATAL] Base StatefulLogic instance was provided as stateful_logic for symbol {symbol}. This is not allowed. Skipping this candidate."
-                    )
-                    state_logic = None
-                elif hasattr(state_logic, "optuna_suggest") and callable(
-                    getattr(state_logic, "optuna_suggest", None)
-                ):
-                    try:
-                        state_logic = state_logic.optuna_suggest(
-                            logger=self.strategy_logger,
-                            trial=trial,
-                            prefix=f"{symbol}_logic_{type(state_logic).__name__}_",
-                        )
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to call optuna_suggest on stateful_logic: {e}"
-                        )
-                        state_logic = None
-
-            # Build full candidate kwargs
-            init_kwargs = {
-                "entry_conditions": entry_conds,
-                "trend_conditions": trend_conds,
-                "exit_conditions": exit_conds,
-                "filter_conditions": filter_conds,
-                "stateful_logic": state_logic,
-            }
-
-            # Only keep those that the strategy class actually accepts
-            valid_params = set(
-                inspect.signature(self.strategy_class.__init__).parameters
-            )
-            strategy_kwargs = {
-                k: v for k, v in init_kwargs.items() if k in valid_params
-            }
-
-            strategy = self.strategy_class(
-                logger=self.strategy_logger, **strategy_kwargs
-            )
-            logger.debug(
-                f"[{symbol}] Strategy class: {self.strategy_class.__name__} | Params: {strategy_kwargs}"
-            )
-            # coro = self.run_async(self.backtest_fn(strategy, df))
-            result = self.run_async(self.backtest_fn(strategy, df))
-            logger.debug(
-                f"[{symbol}] Strategy params: {strategy_kwargs} | Backtest result: {result}"
-            )
+            trial_start = time.perf_counter()
             try:
-                score = result[self.metric_name]
-            except Exception as e:
-                logger.error(
-                    f"[{symbol}] Error extracting metric '{self.metric_name}' from backtest result: {e} | Result: {result}"
-                )
-                return float("-inf") if self.direction == "maximize" else float("inf")
-
-            # Validate the result dictionary
-            if not isinstance(result, dict):
-                logger.error(
-                    f"[{symbol}] Backtest result is not a dictionary: {result}"
-                )
-                return float("-inf") if self.direction == "maximize" else float("inf")
-
-            required_metrics = [
-                "total_return",
-                "sharpe_ratio",
-                "win_rate",
-                "max_drawdown",
-            ]
-            missing_metrics = [m for m in required_metrics if m not in result]
-            if missing_metrics:
-                logger.error(
-                    f"[{symbol}] Missing required metrics {missing_metrics} in backtest result: {result}"
-                )
-                return float("-inf") if self.direction == "maximize" else float("inf")
-
-            # Store the full result in the trial for later retrieval
-            trial.set_user_attr("full_result", result)
-            if logger:
-                logger.debug(f"[{symbol}] Trial result: {score}")
-            return score
+                # Lower-fidelity rungs: score growing prefixes of the window so
+                # the pruner can stop losing candidates before the full pass
+                for step, fraction in enumerate(rungs[:-1]):
+                    rung_df = df.iloc[: max(1, int(len(df) * fraction))]
+                    strategy = self._build_strategy(trial, symbol, logger)
+                    rung_result = self.run_async(self.backtest_fn(strategy, rung_df))
+                    rung_score = self._score_result(symbol, rung_result, logger)
+                    if rung_score is None:
+                        rung_score = self._worst_score()
+                    trial.report(rung_score, step)
+                    if trial.should_prune():
+                        logger.debug(
+                            f"[{symbol}] Trial {trial.number} pruned at {fraction:.0%} of the window (score {rung_score})"
+                        )
+                        raise optuna.TrialPruned()
+
+                full_start = time.perf_counter()
+                strategy = self._build_strategy(trial, symbol, logger)
+                result = self.run_async(self.backtest_fn(strategy, df))
+                trial.set_user_attr("full_window_sec", time.perf_counter() - full_start)
+                logger.debug(f"[{symbol}] Backtest result: {result}")
+                score = self._score_result(symbol, result, logger)
+                if score is None:
+                    return self._worst_score()
+
+                # Store the full result in the trial for later retrieval
+                trial.set_user_attr("full_result", result)
+                if logger:
+                    logger.debug(f"[{symbol}] Trial result: {score}")
+                return score
+            finally:
+                trial.set_user_attr("trial_sec", time.perf_counter() - trial_start)
 
         study.optimize(objective, n_trials=n_trials)
 
         duration = round(time.time() - start_time, 2)
+        pruning_meta = self._pruning_meta(study, rungs)
         self.logger.info(
-            f"Optimization completed for {symbol} in {duration} seconds over {n_trials} trials"
+            f"Optimization completed for {symbol} in {duration} seconds over {n_trials} trials "
+            f"({pruning_meta['n_pruned']} pruned, ~{pruning_meta['wall_time_saved_sec']}s saved)"
         )
         results = {
             "strategy": self.strategy_class.__name__,
@@ -247,12 +177,197 @@ class SignalStrategyOptimizerImpl(SignalStrategyOptimizer):
                 "n_trials": n_trials,
                 "symbol": symbol,
                 "direction": self.direction,
+                **pruning_meta,
             },
             "metrics": study.best_trial.user_attrs.get("full_result"),
         }
         self.logger.debug(f"Optimization results: {results}")
         return results
 
+    def _build_strategy(self, trial, symbol: str, logger: Loggable):
+        """Instantiate the candidate strategy for a trial's suggested parameters."""
+        entry_conds = [
+            cond_cls.optuna_suggest(
+                logger=self.strategy_logger,
+                trial=trial,
+                prefix=f"{symbol}_entry_{cond_cls.__name__}_",
+            )
+            for i, cond_cls in enumerate(self.condition_types.get("entry", []))
+        ]
+        trend_conds = [
+            cond_cls.optuna_suggest(
+                logger=self.strategy_logger,
+                trial=trial,
+                prefix=f"{symbol}_trend_{cond_cls.__name__}_",
+            )
+            for i, cond_cls in enumerate(self.condition_types.get("trend", []))
+        ]
+        exit_conds = [
+            cond_cls.optuna_suggest(
+                logger=self.strategy_logger,
+                trial=trial,
+                prefix=f"{symbol}_exit_{cond_cls.__name__}_",
+            )
+            for i, cond_cls in enumerate(self.condition_types.get("exit", []))
+        ]
+        filter_conds = [
+            cond_cls.optuna_suggest(
+                logger=self.strategy_logger,
+                trial=trial,
+                prefix=f"{symbol}_filter_{cond_cls.__name__}_",
+            )
+            for i, cond_cls in enumerate(self.condition_types.get("filter", []))
+        ]
+        state_logic = self.condition_types.get("stateful_logic")
+        # Defensive: If state_logic is a class, instantiate it
+        if isinstance(state_logic, type):
+            # Defensive: If it's the base class, log error and skip
+            if state_logic.__name__ == "StatefulLogic":
+                self.logger.error(
+                    f"[FATAL] Base StatefulLogic class was provided as stateful_logic for symbol {symbol}. This is not allowed. Skipping this candidate."
+                )
+                state_logic = None
+            else:
+                try:
+                    state_logic = state_logic(logger=self.strategy_logger)
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to instantiate stateful_logic class {state_logic}: {e}"
+                    )
+                    state_logic = None
+        # If it's an instance, optionally call optuna_suggest if available
+        if isinstance(state_logic, StatefulLogic):
+            # Defensive: If it's the base class, log error and skip
+            if type(state_logic).__name__ == "StatefulLogic":
+                self.logger.error(
+                    f"[FATAL] Base StatefulLogic instance was provided as stateful_logic for symbol {symbol}. This is not allowed. Skipping this candidate."
+                )
+                state_logic = None
+            elif hasattr(state_logic, "optuna_suggest") and callable(
+                getattr(state_logic, "optuna_suggest", None)
+            ):
+                try:
+                    state_logic = state_logic.optuna_suggest(
+                        logger=self.strategy_logger,
+                        trial=trial,
+                        prefix=f"{symbol}_logic_{type(state_logic).__name__}_",
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to call optuna_suggest on stateful_logic: {e}"
+                    )
+                    state_logic = None
+
+        # Build full candidate kwargs
+        init_kwargs = {
+            "entry_conditions": entry_conds,
+            "trend_conditions": trend_conds,
+            "exit_conditions": exit_conds,
+            "filter_conditions": filter_conds,
+            "stateful_logic": state_logic,
+        }
+
+        # Only keep those that the strategy class actually accepts
+        valid_params = set(inspect.signature(self.strategy_class.__init__).parameters)
+        strategy_kwargs = {k: v for k, v in init_kwargs.items() if k in valid_params}
+
+        strategy = self.strategy_class(logger=self.strategy_logger, **strategy_kwargs)
+        logger.debug(
+            f"[{symbol}] Strategy class: {self.strategy_class.__name__} | Params: {strategy_kwargs}"
+        )
+        return strategy
+
+    def _score_result(
+        self, symbol: str, result: Any, logger: Loggable
+    ) -> Optional[float]:
+        """Extract the optimized metric, or None if the result is invalid."""
+        try:
+            score = result[self.metric_name]
+        except Exception as e:
+            logger.error(
+                f"[{symbol}] Error extracting metric '{self.metric_name}' from backtest result: {e} | Result: {result}"
+            )
+            return None
+
+        # Validate the result dictionary
+        if not isinstance(result, dict):
+            logger.error(f"[{symbol}] Backtest result is not a dictionary: {result}")
+            return None
+
+        required_metrics = [
+            "total_return",
+            "sharpe_ratio",
+            "win_rate",
+            "max_drawdown",
+        ]
+        missing_metrics = [m for m in required_metrics if m not in result]
+        if missing_metrics:
+            logger.error(
+                f"[{symbol}] Missing required metrics {missing_metrics} in backtest result: {result}"
+            )
+            return None
+        return score
+
+    def _worst_score(self) -> float:
+        return float("-inf") if self.direction == "maximize" else float("inf")
+
+    def _fidelity_rungs(self, n_trials: int) -> tuple[float, ...]:
+        """
+        Window fractions each trial is scored on; the full window only when not
+        pruning, or when the study is too short for the pruner to ever prune.
+        """
+        if not self._is_pruning() or n_trials <= self.PRUNER_STARTUP_TRIALS:
+            return (1.0,)
+        rungs = sorted({float(f) for f in self.fidelity_fractions if 0 < f < 1})
+        return tuple(rungs) + (1.0,)
+
+    def _is_pruning(self) -> bool:
+        return bool(self.pruner) and self.pruner != "none"
+
+    def _create_pruner(self, rungs: tuple[float, ...]) -> optuna.pruners.BasePruner:
+        if self._is_pruning() and self.pruner not in self.PRUNERS:
+            raise ValueError(f"Unknown optimization pruner: {self.pruner}")
+        if len(rungs) < 2:
+            return optuna.pruners.NopPruner()
+        if self.pruner == "median":
+            return optuna.pruners.MedianPruner(
+                n_startup_trials=self.PRUNER_STARTUP_TRIALS, n_warmup_steps=0
+            )
+        if self.pruner == "successive_halving":
+            return optuna.pruners.SuccessiveHalvingPruner()
+        return optuna.pruners.HyperbandPruner(min_resource=1, max_resource=len(rungs))
+
+    def _pruning_meta(
+        self, study: optuna.Study, rungs: tuple[float, ...]
+    ) -> Dict[str, Any]:
+        """
+        Summarize pruning for the study report. Time saved is estimated against
+        running every trial once on the full window.
+        """
+        states = optuna.trial.TrialState
+        complete = study.get_trials(deepcopy=False, states=(states.COMPLETE,))
+        pruned = study.get_trials(deepcopy=False, states=(states.PRUNED,))
+        trial_sec = sum(
+            t.user_attrs.get("trial_sec", 0.0) for t in study.get_trials(deepcopy=False)
+        )
+        full_runs = [
+            t.user_attrs["full_window_sec"]
+            for t in complete
+            if "full_window_sec" in t.user_attrs
+        ]
+        saved = None
+        if full_runs:
+            full_window_sec = sum(full_runs) / len(full_runs)
+            saved = round(full_window_sec * len(study.trials) - trial_sec, 2)
+        return {
+            "pruner": self.pruner if len(rungs) > 1 else None,
+            "fidelity_fractions": list(rungs),
+            "n_complete": len(complete),
+            "n_pruned": len(pruned),
+            "trial_time_sec": round(trial_sec, 2),
+            "wall_time_saved_sec": saved,
+        }
+
     def _strip_prefixes(self, params: dict) -> dict:
         grouped = {
             "entry_conditions": {},
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Any, Callable, Dict, Type
+from typing import Any, Callable, Dict, Optional, Sequence, Type
 
 import pandas as pd
 
@@ -42,13 +42,26 @@ class SignalStrategyOptimizerFactoryImpl(SignalStrategyOptimizerFactory):
     This is used to create mock optimizers for testing purposes.
     """
 
-    def __init__(self, logger: Loggable, strategy_logger: Loggable):
+    def __init__(
+        self,
+        logger: Loggable,
+        strategy_logger: Loggable,
+        pruner: Optional[str] = None,
+        fidelity_fractions: Sequence[float] = (0.25, 0.5),
+        seed: Optional[int] = None,
+    ):
         """
         Initialize the factory with a logger.
         :param logger: Loggable instance for logging.
+        :param pruner: Optuna pruner used by created optimizers (None disables pruning).
+        :param fidelity_fractions: Window fractions scored before the full window.
+        :param seed: Optional sampler seed for reproducible studies.
         """
         self.logger = logger
         self.strategy_logger = strategy_logger
+        self.pruner = pruner
+        self.fidelity_fractions = fidelity_fractions
+        self.seed = seed
 
     def create(
         self,
@@ -75,6 +88,9 @@ class SignalStrategyOptimizerFactoryImpl(SignalStrategyOptimizerFactory):
             strategy_logger=self.strategy_logger,
             metric_name=metric_name,
             direction=direction,
+            pruner=self.pruner,
+            fidelity_fractions=self.fidelity_fractions,
+            seed=self.seed,
         )
 
 
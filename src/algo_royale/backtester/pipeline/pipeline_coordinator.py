@@ -1,4 +1,6 @@
 import asyncio
+from pathlib import Path
+from typing import Optional
 
 from algo_royale.backtester.evaluator.portfolio.portfolio_evaluation_coordinator import (
     PortfolioEvaluationCoordinator,
@@ -9,6 +11,8 @@ from algo_royale.backtester.evaluator.strategy.signal_strategy_evaluation_coordi
 from algo_royale.backtester.evaluator.symbol.symbol_evaluation_coordinator import (
     SymbolEvaluationCoordinator,
 )
+from algo_royale.backtester.profiling.stage_profiler import StageProfiler
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
 from algo_royale.backtester.walkforward.walk_forward_coordinator import (
     WalkForwardCoordinator,
 )
@@ -26,6 +30,8 @@ class PipelineCoordinator:
         strategy_evaluation_coordinator (StrategyEvaluationCoordinator): Coordinator for strategy performance evaluation.
         symbol_evaluation_coordinator (SymbolEvaluationCoordinator): Coordinator for symbol performance evaluation.
         logger (Logger): Logger instance for logging messages and errors.
+        stage_profiler (StageProfiler): Profiler shared by the pipeline stages.
+        profile_report_path (Path): Directory (or .json file) for the stage profile report written after each run.
     """
 
     def __init__(
@@ -36,8 +42,12 @@ class PipelineCoordinator:
         symbol_evaluation_coordinator: SymbolEvaluationCoordinator,
         portfolio_evaluation_coordinator: PortfolioEvaluationCoordinator,
         logger: Loggable,
+        stage_profiler: Optional[StageProfiler] = None,
+        profile_report_path: Optional[Path] = None,
     ):
         self.logger = logger
+        self.stage_profiler = stage_profiler or StageProfiler(logger=logger)
+        self.profile_report_path = profile_report_path
         self.strategy_walk_forward_coordinator = (
             signal_strategy_walk_forward_coordinator
         )
@@ -47,10 +57,12 @@ class PipelineCoordinator:
         self.portfolio_evaluation_coordinator = portfolio_evaluation_coordinator
 
     async def run_async(self):
+        self.stage_profiler.reset()
         try:
             self.logger.info("Starting Backtest Pipeline...")
             # Run the pipeline stages in sequence
-            pipeline_result = await self.run_pipeline()
+            with self.stage_profiler.span("pipeline"):
+                pipeline_result = await self.run_pipeline()
             if pipeline_result is False:
                 self.logger.error("Backtest pipeline failed in run_pipeline.")
                 return False
@@ -59,21 +71,36 @@ class PipelineCoordinator:
         except Exception as e:
             self.logger.error(f"Backtest failed: {e}")
             return False
+        finally:
+            if self.profile_report_path:
+                self.stage_profiler.write_report(self.profile_report_path)
 
     async def run_pipeline(
         self,
     ):
         try:
             self.logger.info("Running pipeline stages...")
-            await self.strategy_walk_forward_coordinator.run_async()
-            self.strategy_evaluation_coordinator.run()
-            self.symbol_evaluation_coordinator.run()
-            await self.portfolio_walk_forward_coordinator.run_async()
-            self.portfolio_evaluation_coordinator.run()
+            with self.stage_profiler.span("signal_walk_forward"):
+                await self.strategy_walk_forward_coordinator.run_async()
+            with self.stage_profiler.span("signal_strategy_evaluation"):
+                self.strategy_evaluation_coordinator.run()
+            with self.stage_profiler.span("symbol_evaluation"):
+                self.symbol_evaluation_coordinator.run()
+            with self.stage_profiler.span("portfolio_walk_forward"):
+                await self.portfolio_walk_forward_coordinator.run_async()
+            with self.stage_profiler.span("portfolio_evaluation"):
+                self.portfolio_evaluation_coordinator.run()
             self.logger.info("Pipeline stages completed successfully.")
         except Exception as e:
             self.logger.error(f"Pipeline failed: {e}")
             return False
 
+    def plan_rebuild(self) -> RebuildPlan:
+        """
+        Dry run of the signal walk-forward stages, which fingerprint their
+        inputs. The evaluations and portfolio stages always rerun.
+        """
+        return self.strategy_walk_forward_coordinator.plan_rebuild()
+
     def run(self):
         return asyncio.run(self.run_async())
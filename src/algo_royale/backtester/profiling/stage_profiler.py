@@ -0,0 +1,285 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+import psutil
+
+from algo_royale.logging.loggable import Loggable
+
+
+@dataclass
+class StageSpan:
+    """A single timed span of backtest work (pipeline stage, window or symbol).
+    Counters (rows, files) are inclusive of any child spans.
+    peak_rss_bytes is the highest resident memory sampled while the span was
+    open, not the process lifetime peak. cpu_time_sec is process CPU time over
+    the span, so spans running concurrently each count the others' CPU too.
+    """
+
+    name: str
+    stage: Optional[str] = None
+    symbol: Optional[str] = None
+    window: Optional[str] = None
+    parent: Optional[str] = None
+    status: str = "ok"
+    started_at: Optional[str] = None
+    wall_time_sec: float = 0.0
+    cpu_time_sec: float = 0.0
+    rss_start_bytes: int = 0
+    rss_end_bytes: int = 0
+    peak_rss_bytes: int = 0
+    rows: int = 0
+    files_read: int = 0
+    files_written: int = 0
+    rows_read: int = 0
+    rows_written: int = 0
+    _parent_span: Optional["StageSpan"] = field(default=None, repr=False)
+
+    @property
+    def label(self) -> str:
+        parts = [self.name, self.stage, self.window, self.symbol]
+        return "/".join(part for part in parts if part)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("_parent_span", None)
+        return data
+
+
+_current_span: ContextVar[Optional[StageSpan]] = ContextVar(
+    "algo_royale_current_stage_span", default=None
+)
+
+
+class StageProfiler:
+    """Collects per-stage, per-window and per-symbol spans for a backtest run.
+    Each span records wall time, CPU time, resident memory, rows processed and
+    files read/written. Spans nest through a context variable, so concurrent
+    tasks keep their own span stack and counters roll up to the enclosing span.
+    Parameters:
+        logger: Loggable instance for logging information and errors.
+        enabled: When False, spans are no-ops and nothing is recorded.
+        rss_sample_interval_sec: How often a background thread samples resident
+            memory for the peak of the open spans; None samples only at span
+            start and end.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[Loggable] = None,
+        enabled: bool = True,
+        rss_sample_interval_sec: Optional[float] = 0.05,
+    ):
+        self.logger = logger
+        self.enabled = enabled
+        self.rss_sample_interval_sec = rss_sample_interval_sec
+        self._process = psutil.Process()
+        self.spans: list[StageSpan] = []
+        self._open_spans: dict[int, StageSpan] = {}
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        stage: Optional[str] = None,
+        symbol: Optional[str] = None,
+        window: Optional[str] = None,
+    ) -> Iterator[Optional[StageSpan]]:
+        """Time the enclosed block as a span.
+        :param name: Span name, e.g. "walk_forward_window" or "write_symbol".
+        :param stage: Backtest stage the span belongs to.
+        :param symbol: Symbol the span is processing, if any.
+        :param window: Walk-forward window id, if any.
+        :return: The active StageSpan (None when profiling is disabled).
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        span = StageSpan(
+            name=name,
+            stage=stage if stage is not None else getattr(parent, "stage", None),
+            symbol=symbol if symbol is not None else getattr(parent, "symbol", None),
+            window=window if window is not None else getattr(parent, "window", None),
+            parent=parent.label if parent else None,
+            started_at=datetime.now().isoformat(),
+            rss_start_bytes=self._rss_bytes(),
+            _parent_span=parent,
+        )
+        span.peak_rss_bytes = span.rss_start_bytes
+        self._track(span)
+        token = _current_span.set(span)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield span
+        except BaseException:
+            span.status = "error"
+            raise
+        finally:
+            span.wall_time_sec = round(time.perf_counter() - wall_start, 4)
+            span.cpu_time_sec = round(time.process_time() - cpu_start, 4)
+            self._untrack(span)
+            span.rss_end_bytes = self._rss_bytes()
+            span.peak_rss_bytes = max(span.peak_rss_bytes, span.rss_end_bytes)
+            _current_span.reset(token)
+            if parent is not None:
+                parent.rows += span.rows
+                parent.files_read += span.files_read
+                parent.files_written += span.files_written
+                parent.rows_read += span.rows_read
+                parent.rows_written += span.rows_written
+            self.spans.append(span)
+
+    def add_rows(self, count: int):
+        """Add processed rows to the active span."""
+        span = _current_span.get()
+        if span is not None:
+            span.rows += int(count)
+
+    def add_files_read(self, count: int = 1, rows: int = 0):
+        """Record files (and the rows they contained) read by the active span."""
+        span = _current_span.get()
+        if span is not None:
+            span.files_read += int(count)
+            span.rows_read += int(rows)
+
+    def add_files_written(self, count: int = 1, rows: int = 0):
+        """Record files (and the rows they contained) written by the active span."""
+        span = _current_span.get()
+        if span is not None:
+            span.files_written += int(count)
+            span.rows_written += int(rows)
+
+    def add_spans(self, spans: list[dict]):
+        """Record spans profiled in another process (as StageSpan.to_dict()).
+        Their top-level spans become children of the active span, and their
+        counters roll up to it.
+        """
+        if not self.enabled:
+            return
+        parent = _current_span.get()
+        for data in spans:
+            span = StageSpan(**data)
+            if span.parent is None and parent is not None:
+                span.parent = parent.label
+                parent.rows += span.rows
+                parent.files_read += span.files_read
+                parent.files_written += span.files_written
+                parent.rows_read += span.rows_read
+                parent.rows_written += span.rows_written
+            self.spans.append(span)
+
+    def summary(self) -> dict:
+        """Aggregate spans by name and stage.
+        :return: Mapping of "name/stage" to summed timings, counters and peak RSS.
+        """
+        summary = {}
+        for span in self.spans:
+            key = "/".join(part for part in (span.name, span.stage) if part)
+            entry = summary.setdefault(
+                key,
+                {
+                    "count": 0,
+                    "errors": 0,
+                    "wall_time_sec": 0.0,
+                    "cpu_time_sec": 0.0,
+                    "peak_rss_bytes": 0,
+                    "rows": 0,
+                    "files_read": 0,
+                    "files_written": 0,
+                    "rows_read": 0,
+                    "rows_written": 0,
+                },
+            )
+            entry["count"] += 1
+            entry["errors"] += int(span.status != "ok")
+            entry["wall_time_sec"] = round(
+                entry["wall_time_sec"] + span.wall_time_sec, 4
+            )
+            entry["cpu_time_sec"] = round(entry["cpu_time_sec"] + span.cpu_time_sec, 4)
+            entry["peak_rss_bytes"] = max(entry["peak_rss_bytes"], span.peak_rss_bytes)
+            entry["rows"] += span.rows
+            entry["files_read"] += span.files_read
+            entry["files_written"] += span.files_written
+            entry["rows_read"] += span.rows_read
+            entry["rows_written"] += span.rows_written
+        return summary
+
+    def report(self) -> dict:
+        """Build the machine-readable report for the spans recorded so far."""
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "pid": self._process.pid,
+            "summary": self.summary(),
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+    def write_report(self, path: Path | str) -> Optional[Path]:
+        """Write the report as JSON.
+        :param path: Target file, or a directory in which a timestamped file is created.
+        :return: The path written, or None if profiling is disabled or writing failed.
+        """
+        if not self.enabled:
+            return None
+        try:
+            path = Path(path)
+            if path.suffix != ".json":
+                path = path / f"stage_profile_{datetime.now():%Y%m%d_%H%M%S}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(self.report(), f, indent=2, default=str)
+            if self.logger:
+                self.logger.info(f"Stage profile report written to {path}")
+            return path
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Failed to write stage profile report: {e}")
+            return None
+
+    def reset(self):
+        """Drop all recorded spans."""
+        self.spans = []
+
+    def _rss_bytes(self) -> int:
+        try:
+            return self._process.memory_info().rss
+        except Exception:
+            return 0
+
+    def _track(self, span: StageSpan):
+        """Include an opened span in the RSS sampling, starting the sampler if idle."""
+        if self.rss_sample_interval_sec is None:
+            return
+        with self._lock:
+            self._open_spans[id(span)] = span
+            if self._sampler is None:
+                self._sampler = threading.Thread(
+                    target=self._sample_rss, name="stage-profiler-rss", daemon=True
+                )
+                self._sampler.start()
+
+    def _untrack(self, span: StageSpan):
+        with self._lock:
+            self._open_spans.pop(id(span), None)
+
+    def _sample_rss(self):
+        """Raise the peak of every open span to the current RSS until none is open."""
+        while True:
+            time.sleep(self.rss_sample_interval_sec)
+            rss = self._rss_bytes()
+            with self._lock:
+                if not self._open_spans:
+                    self._sampler = None
+                    return
+                for span in self._open_spans.values():
+                    span.peak_rss_bytes = max(span.peak_rss_bytes, rss)
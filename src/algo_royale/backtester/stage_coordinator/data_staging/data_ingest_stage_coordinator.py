@@ -2,18 +2,24 @@ from datetime import datetime
 from typing import AsyncIterator, Callable, Dict, Optional
 
 import pandas as pd
-from alpaca.common.enums import SupportedCurrencies
+from alpaca.common.enums import Sort, SupportedCurrencies
 
 from algo_royale.adapters.market_data.quote_adapter import QuoteAdapter
 from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
 from algo_royale.backtester.stage_coordinator.stage_coordinator import StageCoordinator
 from algo_royale.backtester.stage_data.loader.stage_data_loader import StageDataLoader
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.stage_data.stage_fingerprint import (
+    code_version,
+    fingerprint,
+)
 from algo_royale.backtester.stage_data.writer.symbol_strategy_data_writer import (
     SymbolStrategyDataWriter,
 )
 from algo_royale.logging.loggable import Loggable
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import invalid_bar_mask
 from algo_royale.models.alpaca_market_data.enums import DataFeed
 from algo_royale.repo.watchlist_repo import WatchlistRepo
 
@@ -150,24 +156,25 @@ class DataIngestStageCoordinator(StageCoordinator):
         try:
             while True:
                 page_count += 1
-                response = await self.quote_adapter.fetch_historical_bars(
+                # Pages come oldest first, so they are written in time order
+                response = await self.quote_adapter.fetch_historical_bar_columns(
                     symbols=[symbol],
                     start_date=self.start_date,
                     end_date=self.end_date,
                     currency=SupportedCurrencies.USD,
                     feed=DataFeed.IEX,
+                    sort_order=Sort.ASC,
                     page_token=page_token,
                 )
 
-                if not response or not response.symbol_bars.get(symbol):
+                df = response.symbol_frames.get(symbol) if response else None
+                if df is None or df.empty:
                     if page_count == 1:
                         self.logger.warning(f"No data returned for {symbol}")
                     break
 
-                bars = response.symbol_bars[symbol]
-                df = pd.DataFrame([bar.model_dump() for bar in bars])
                 df[DataIngestColumns.SYMBOL] = symbol
-                df = df.iloc[::-1].reset_index(drop=True)  # Reverse rows
+                df = self._drop_invalid_bars(symbol, df)
                 total_rows += len(df)
 
                 # Validate the data before yielding
@@ -199,16 +206,74 @@ class DataIngestStageCoordinator(StageCoordinator):
             await self.quote_adapter.client.aclose()
             self.logger.info(f"Closed connection for {symbol}")
 
+    def stage_fingerprint(
+        self, symbol: str, start_date: datetime, end_date: datetime
+    ) -> str:
+        """
+        Fingerprint of what a symbol's ingested data depends on: the request,
+        the code decoding and validating the bars and the precision the pages
+        are stored in.
+        """
+        return fingerprint(
+            self.stage.name,
+            symbol,
+            self.data_manager.get_window_id(start_date=start_date, end_date=end_date),
+            DataFeed.IEX,
+            code_version(invalid_bar_mask),
+            self.data_writer.precision,
+        )
+
+    def plan_rebuild(
+        self, start_date: datetime, end_date: datetime, plan: RebuildPlan
+    ) -> RebuildPlan:
+        """Add the watchlist symbols' ingest outputs for the dates to a dry-run plan."""
+        window_id = self.data_manager.get_window_id(
+            start_date=start_date, end_date=end_date
+        )
+        for symbol in self.watchlist_repo.load_watchlist() or []:
+            marker = self.data_manager.read_symbol_stage_marker(
+                stage=self.stage,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            plan.add(
+                stage=self.stage,
+                window_id=window_id,
+                symbol=symbol,
+                fingerprint=self.stage_fingerprint(symbol, start_date, end_date),
+                stored_fingerprint=(
+                    None if marker is None else marker.get("fingerprint", "")
+                ),
+                last_duration_sec=(marker or {}).get("duration_sec"),
+            )
+        return plan
+
     def _does_symbol_data_exist(self, symbol: str) -> bool:
         """
-        Check if data exists for a specific symbol.
+        Check if data exists for a specific symbol, ingested for the same
+        request by the current decoding code.
         """
         return self.data_manager.is_symbol_stage_done(
             stage=self.stage,
             symbol=symbol,
             start_date=self.start_date,
             end_date=self.end_date,
+            fingerprint=self.stage_fingerprint(symbol, self.start_date, self.end_date),
+        )
+
+    def _drop_invalid_bars(self, symbol: str, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop bars with missing or repeated timestamps, bad prices or negative
+        counts from a page.
+        """
+        invalid = invalid_bar_mask(data)
+        if not invalid.any():
+            return data
+        self.logger.warning(
+            f"Dropping {int(invalid.sum())} invalid bars of {len(data)} for {symbol}."
         )
+        return data[~invalid].reset_index(drop=True)
 
     def _validate_symbol_data(self, symbol: str, data: pd.DataFrame) -> bool:
         """
@@ -238,4 +303,8 @@ class DataIngestStageCoordinator(StageCoordinator):
             symbol_strategy_data_factory=processed_data,
             start_date=self.start_date,
             end_date=self.end_date,
+            fingerprints={
+                symbol: self.stage_fingerprint(symbol, self.start_date, self.end_date)
+                for symbol in processed_data
+            },
         )
@@ -11,7 +11,12 @@ from algo_royale.backtester.stage_coordinator.stage_coordinator import StageCoor
 from algo_royale.backtester.stage_data.loader.symbol_strategy_data_loader import (
     SymbolStrategyDataLoader,
 )
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.stage_data.stage_fingerprint import (
+    code_version,
+    fingerprint,
+)
 from algo_royale.backtester.stage_data.writer.symbol_strategy_data_writer import (
     SymbolStrategyDataWriter,
 )
@@ -30,6 +35,9 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
         stage_data_manager: StageDataManager instance for managing stage data.
         logger: Loggable instance for logging information and errors.
         feature_engineer: FeatureEngineer instance for engineering features.
+        panel_symbols: Symbols engineered together in one vectorized pass per page
+            (0 or 1 engineers each symbol on its own). A batch's engineered
+            pages for the whole window are held in memory until written.
     """
 
     def __init__(
@@ -39,6 +47,7 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
         data_manager: StageDataManager,
         logger: Loggable,
         feature_engineer: BacktestFeatureEngineer,
+        panel_symbols: int = 0,
     ):
         self.stage = BacktestStage.FEATURE_ENGINEERING
         self.data_loader = data_loader
@@ -46,6 +55,7 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
         self.stage_data_manager = data_manager
         self.logger = logger
         self.feature_engineer = feature_engineer
+        self.panel_symbols = panel_symbols
 
     async def run(
         self,
@@ -66,7 +76,7 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
             f"Starting stage: {self.stage} | start_date: {start_date} | end_date: {end_date}"
         )
         if not self.stage.input_stage:
-            """ If no incoming stage is defined, skip loading data """
+            """If no incoming stage is defined, skip loading data"""
             self.logger.error(f"Stage {self.stage} has no incoming stage defined.")
             raise ValueError(
                 f"Stage {self.stage} has no incoming stage defined. Cannot proceed with data loading."
@@ -84,6 +94,7 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
 
         # Process the prepared data
         self.logger.info(f"stage:{self.stage} starting data processing.")
+        report = self.feature_engineer.start_report()
         processed_data = await self._process(data)
 
         if not processed_data:
@@ -96,6 +107,8 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
             stage=self.stage,
             processed_data=processed_data,
         )
+        # Pages are engineered lazily while writing, so the report is complete here
+        self.logger.info(f"stage:{self.stage} features: {report.summary()}")
         self.logger.info(f"stage:{self.stage} completed and files saved.")
         return True
 
@@ -143,28 +156,159 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
     async def _engineer(
         self, ingest_data: Dict[str, Callable[[], AsyncIterator[pd.DataFrame]]]
     ) -> Dict[str, Callable[[], AsyncIterator[pd.DataFrame]]]:
+        if self.panel_symbols > 1:
+            return self._engineer_panels(ingest_data)
         engineered = {}
         for symbol, df_iter_factory in ingest_data.items():
 
             def factory(symbol=symbol, df_iter_factory=df_iter_factory):
-                self.logger.info(
-                    f"Calling factory for {symbol}, df_iter_factory={df_iter_factory}"
-                )
-                result = df_iter_factory()
-                self.logger.info(
-                    f"Result from df_iter_factory for {symbol}: {type(result)}"
+                return self.feature_engineer.engineer_features(
+                    self._ingest_iter(symbol, df_iter_factory), symbol
                 )
-                if not hasattr(result, "__aiter__"):
-                    self.logger.error(
-                        f"df_iter_factory for {symbol} did not return an async iterator. Got: {type(result)} Value: {result}"
-                    )
-                    raise TypeError(f"Expected async iterator, got {type(result)}")
-                return self.feature_engineer.engineer_features(result, symbol)
 
             engineered[symbol] = factory
 
         return engineered
 
+    def _engineer_panels(
+        self, ingest_data: Dict[str, Callable[[], AsyncIterator[pd.DataFrame]]]
+    ) -> Dict[str, Callable[[], AsyncIterator[pd.DataFrame]]]:
+        """
+        Engineer symbols in batches of `panel_symbols`. A batch is engineered
+        when the writer asks for its first symbol and its pages are held until
+        each symbol is written. The writer asks in symbol order, so the pages of
+        symbols it skipped are dropped once a later symbol is asked for, and at
+        most one batch is in memory.
+        """
+        symbols = list(ingest_data)
+        batches = [
+            symbols[i : i + self.panel_symbols]
+            for i in range(0, len(symbols), self.panel_symbols)
+        ]
+        engineered_batches: set[int] = set()
+        pages: Dict[str, list[pd.DataFrame]] = {}
+
+        async def engineer_batch(batch_index: int):
+            df_iters = {}
+            for symbol in batches[batch_index]:
+                try:
+                    df_iters[symbol] = self._ingest_iter(symbol, ingest_data[symbol])
+                except Exception as e:
+                    self.logger.error(f"Loading data failed for {symbol}: {e}")
+            engineered_pages = await self.feature_engineer.engineer_panel_features(
+                df_iters
+            )
+            pages.clear()
+            pages.update(engineered_pages)
+            engineered_batches.add(batch_index)
+
+        engineered = {}
+        for batch_index, batch in enumerate(batches):
+            for position, symbol in enumerate(batch):
+
+                async def factory(
+                    symbol=symbol, batch_index=batch_index, position=position
+                ):
+                    if batch_index not in engineered_batches:
+                        await engineer_batch(batch_index)
+                    for skipped in batches[batch_index][:position]:
+                        pages.pop(skipped, None)
+                    for page in pages.pop(symbol, []):
+                        yield page
+
+                engineered[symbol] = factory
+
+        return engineered
+
+    def _ingest_iter(
+        self,
+        symbol: str,
+        df_iter_factory: Callable[[], AsyncIterator[pd.DataFrame]],
+    ) -> AsyncIterator[pd.DataFrame]:
+        self.logger.info(
+            f"Calling factory for {symbol}, df_iter_factory={df_iter_factory}"
+        )
+        result = df_iter_factory()
+        self.logger.info(f"Result from df_iter_factory for {symbol}: {type(result)}")
+        if not hasattr(result, "__aiter__"):
+            self.logger.error(
+                f"df_iter_factory for {symbol} did not return an async iterator. Got: {type(result)} Value: {result}"
+            )
+            raise TypeError(f"Expected async iterator, got {type(result)}")
+        return result
+
+    def stage_fingerprint(
+        self, symbol: str, start_date: datetime, end_date: datetime
+    ) -> Optional[str]:
+        """
+        Fingerprint of what a symbol's features depend on: the content of its
+        ingested data, the selected features and lookback, the feature code
+        and the precision the pages are stored in. None if the symbol has no
+        ingested data for the dates.
+        """
+        ingest_hash = self.stage_data_manager.hash_stage_data(
+            stage=self.stage.input_stage,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if ingest_hash is None:
+            return None
+        features = self.feature_engineer.features
+        return fingerprint(
+            self.stage.name,
+            symbol,
+            self.stage_data_manager.get_window_id(
+                start_date=start_date, end_date=end_date
+            ),
+            ingest_hash,
+            "all" if features is None else sorted(features),
+            self.feature_engineer.max_lookback,
+            code_version(
+                self.feature_engineer.feature_engineering_func,
+                type(self.feature_engineer),
+            ),
+            self.data_writer.precision,
+        )
+
+    def plan_rebuild(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        plan: RebuildPlan,
+    ) -> RebuildPlan:
+        """
+        Add the symbols' feature outputs for the dates to a dry-run plan. A
+        symbol whose ingest is rebuilt in the plan is rebuilt here too.
+        """
+        window_id = self.stage_data_manager.get_window_id(
+            start_date=start_date, end_date=end_date
+        )
+        for symbol in symbols:
+            marker = self.stage_data_manager.read_symbol_stage_marker(
+                stage=self.stage,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            upstream = plan.will_rebuild(self.stage.input_stage, window_id, symbol)
+            plan.add(
+                stage=self.stage,
+                window_id=window_id,
+                symbol=symbol,
+                fingerprint=(
+                    None
+                    if upstream
+                    else self.stage_fingerprint(symbol, start_date, end_date)
+                ),
+                stored_fingerprint=(
+                    None if marker is None else marker.get("fingerprint", "")
+                ),
+                last_duration_sec=(marker or {}).get("duration_sec"),
+            )
+        return plan
+
     async def _write(
         self,
         stage: BacktestStage,
@@ -178,4 +322,8 @@ class FeatureEngineeringStageCoordinator(StageCoordinator):
             symbol_strategy_data_factory=processed_data,
             start_date=self.start_date,
             end_date=self.end_date,
+            fingerprints={
+                symbol: self.stage_fingerprint(symbol, self.start_date, self.end_date)
+                for symbol in processed_data
+            },
         )
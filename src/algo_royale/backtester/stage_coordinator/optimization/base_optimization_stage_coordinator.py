@@ -163,6 +163,27 @@ class BaseOptimizationStageCoordinator(StageCoordinator):
                 return {}
         return opt_results
 
+    def _read_optimization_results(
+        self, strategy_name: str, symbol: str, start_date: datetime, end_date: datetime
+    ) -> Dict[str, dict]:
+        """Read optimization results without creating the file, as a dry run must."""
+        json_path = (
+            self.stage_data_manager.get_directory_path(
+                base_dir=self.optimization_root,
+                strategy_name=strategy_name,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            / self.optimization_json_filename
+        )
+        try:
+            with open(json_path, "r") as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return results if isinstance(results, dict) else {}
+
     def _get_optimization_result_path(
         self,
         strategy_name: str,
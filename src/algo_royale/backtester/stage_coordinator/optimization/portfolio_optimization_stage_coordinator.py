@@ -30,6 +30,7 @@ from algo_royale.backtester.strategy_factory.portfolio.portfolio_strategy_combin
     PortfolioStrategyCombinatorFactory,
 )
 from algo_royale.logging.loggable import Loggable
+from algo_royale.utils.path_lock import path_lock
 
 
 class PortfolioOptimizationStageCoordinator(BaseOptimizationStageCoordinator):
@@ -341,34 +342,36 @@ class PortfolioOptimizationStageCoordinator(BaseOptimizationStageCoordinator):
                 }
             }
 
-            # Get existing results for the symbol and strategy
-            existing_optimization_json = self.get_existing_optimization_results(
+            out_path = self._get_output_path(
                 strategy_name=strategy_name,
                 symbols=symbols,
                 start_date=start_date,
                 end_date=end_date,
             )
-            if existing_optimization_json is None:
-                self.logger.warning(
-                    f"No existing optimization results for {strategy_name} {symbols} {self.window_id}"
+            # Walk-forward windows run concurrently and may share this file
+            with path_lock(out_path):
+                # Get existing results for the symbol and strategy
+                existing_optimization_json = self.get_existing_optimization_results(
+                    strategy_name=strategy_name,
+                    symbols=symbols,
+                    start_date=start_date,
+                    end_date=end_date,
                 )
-                existing_optimization_json = {}
+                if existing_optimization_json is None:
+                    self.logger.warning(
+                        f"No existing optimization results for {strategy_name} {symbols} {self.window_id}"
+                    )
+                    existing_optimization_json = {}
 
-            updated_optimization_json = self._deep_merge(
-                existing_optimization_json, optimization_json
-            )
-            # Save optimization metrics to optimization_result.json under window_id
-            out_path = self._get_output_path(
-                strategy_name=strategy_name,
-                symbols=symbols,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            self.logger.info(
-                f"Saving portfolio optimization summary for PORTFOLIO {strategy_name} {self._get_symbols_dir_name(symbols)} to {out_path}"
-            )
-            with open(out_path, "w") as f:
-                json.dump(updated_optimization_json, f, indent=2, default=str)
+                updated_optimization_json = self._deep_merge(
+                    existing_optimization_json, optimization_json
+                )
+                # Save optimization metrics to optimization_result.json under window_id
+                self.logger.info(
+                    f"Saving portfolio optimization summary for PORTFOLIO {strategy_name} {self._get_symbols_dir_name(symbols)} to {out_path}"
+                )
+                with open(out_path, "w") as f:
+                    json.dump(updated_optimization_json, f, indent=2, default=str)
 
             # Update the results dictionary to match the validator's requirements
             collective_results[strategy_name] = updated_optimization_json
@@ -1,10 +1,12 @@
 import json
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, AsyncIterator, Callable, Dict, Optional
 
 import pandas as pd
 
+from algo_royale.backtester.column_names.strategy_columns import SignalStrategyColumns
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
 from algo_royale.backtester.evaluator.backtest.signal_backtest_evaluator import (
     SignalBacktestEvaluator,
@@ -21,17 +23,30 @@ from algo_royale.backtester.stage_coordinator.optimization.base_optimization_sta
 from algo_royale.backtester.stage_data.loader.symbol_strategy_data_loader import (
     SymbolStrategyDataLoader,
 )
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.stage_data.stage_fingerprint import (
+    code_version,
+    fingerprint,
+)
 from algo_royale.backtester.stage_data_validation.signal_strategy_optimization_result_validator import (
     signal_strategy_optimization_validator,
 )
 from algo_royale.backtester.strategy.signal.base_signal_strategy import (
     BaseSignalStrategy,
 )
+from algo_royale.backtester.strategy_combinator.signal.base_signal_strategy_combinator import (
+    SignalStrategyCombinator,
+)
+from algo_royale.backtester.strategy_combinator.signal.combination_signal_matrix import (
+    CombinationSignalMatrix,
+    ConditionCombination,
+)
 from algo_royale.backtester.strategy_factory.signal.signal_strategy_combinator_factory import (
     SignalStrategyCombinatorFactory,
 )
 from algo_royale.logging.loggable import Loggable
+from algo_royale.utils.path_lock import path_lock
 
 
 class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinator):
@@ -109,6 +124,12 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
                 )
                 continue
             train_df = pd.concat(dfs, ignore_index=True)
+            data_hash = self.stage_data_manager.hash_stage_data(
+                stage=self.stage.input_stage,
+                symbol=symbol,
+                start_date=self.start_date,
+                end_date=self.end_date,
+            )
 
             for (
                 strategy_combinator
@@ -116,12 +137,19 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
                 try:
                     strategy_class = strategy_combinator.strategy_class
                     strategy_name = strategy_class.__name__
+                    strategy_fingerprint = self.stage_fingerprint(
+                        symbol=symbol,
+                        strategy_combinator=strategy_combinator,
+                        data_hash=data_hash,
+                        window_id=self.window_id,
+                    )
 
                     if self._has_optimization_run(
                         symbol=symbol,
                         strategy_name=strategy_name,
                         start_date=self.start_date,
                         end_date=self.end_date,
+                        fingerprint=strategy_fingerprint,
                     ):
                         self.logger.info(
                             f"Skipping optimization for {symbol} {strategy_name} as it has already been run."
@@ -140,12 +168,17 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
                         results = results | skip_result_json
                         continue
 
-                    # Run optimization
+                    # Run optimization. The trials share signal matrices of the
+                    # train frame (and the prefixes pruning scores), so each
+                    # distinct condition is applied to a frame once per study
+                    signal_matrices: Dict[int, CombinationSignalMatrix] = {}
                     optimizer = self.signal_strategy_optimizer_factory.create(
                         strategy_class=strategy_class,
                         condition_types=strategy_combinator.get_condition_types(),
-                        backtest_fn=lambda strat, df_: self._backtest_and_evaluate(
-                            symbol, strat, df_
+                        backtest_fn=partial(
+                            self._backtest_and_evaluate,
+                            symbol,
+                            signal_matrices=signal_matrices,
                         ),
                     )
                     optimization_result = optimizer.optimize(
@@ -178,6 +211,7 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
                         strategy_name=strategy_name,
                         optimization_result=optimization_result,
                         collective_results=results,
+                        fingerprint=strategy_fingerprint,
                     )
                 except Exception as e:
                     self.logger.error(
@@ -187,10 +221,103 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
 
         return results
 
+    def stage_fingerprint(
+        self,
+        symbol: str,
+        strategy_combinator: SignalStrategyCombinator,
+        data_hash: Optional[str],
+        window_id: str,
+    ) -> Optional[str]:
+        """
+        Fingerprint of what a strategy's optimization depends on: the content
+        of the symbol's features, the strategy and its conditions (and so its
+        parameter space), the trial budget and the backtest code. None if the
+        symbol has no staged features to hash.
+        """
+        if data_hash is None:
+            return None
+        return fingerprint(
+            self.stage.name,
+            symbol,
+            window_id,
+            data_hash,
+            strategy_combinator.strategy_class.__name__,
+            self.optimization_n_trials,
+            strategy_combinator.code_version(),
+            code_version(type(self.executor), type(self.evaluator)),
+        )
+
+    def plan_rebuild(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        plan: RebuildPlan,
+    ) -> RebuildPlan:
+        """
+        Add each symbol's strategy optimizations for the dates to a dry-run
+        plan. A symbol whose features are rebuilt in the plan is reoptimized.
+        """
+        window_id = self.stage_data_manager.get_window_id(
+            start_date=start_date, end_date=end_date
+        )
+        for symbol in symbols:
+            upstream = plan.will_rebuild(self.stage.input_stage, window_id, symbol)
+            data_hash = (
+                None
+                if upstream
+                else self.stage_data_manager.hash_stage_data(
+                    stage=self.stage.input_stage,
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+            )
+            for (
+                strategy_combinator
+            ) in self.strategy_combinator_factory.all_combinators():
+                strategy_name = strategy_combinator.strategy_class.__name__
+                optimization = (
+                    self._read_optimization_results(
+                        strategy_name=strategy_name,
+                        symbol=symbol,
+                        start_date=start_date,
+                        end_date=end_date,
+                    )
+                    .get(window_id, {})
+                    .get("optimization")
+                )
+                meta = (optimization or {}).get("meta", {})
+                plan.add(
+                    stage=self.stage,
+                    window_id=window_id,
+                    symbol=symbol,
+                    strategy=strategy_name,
+                    fingerprint=self.stage_fingerprint(
+                        symbol=symbol,
+                        strategy_combinator=strategy_combinator,
+                        data_hash=data_hash,
+                        window_id=window_id,
+                    ),
+                    stored_fingerprint=(
+                        None if not optimization else meta.get("fingerprint", "")
+                    ),
+                    last_duration_sec=meta.get("run_time_sec"),
+                )
+        return plan
+
     def _has_optimization_run(
-        self, symbol: str, strategy_name: str, start_date: datetime, end_date: datetime
+        self,
+        symbol: str,
+        strategy_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        fingerprint: Optional[str] = None,
     ) -> bool:
-        """Check if optimization has already been run for the current stage, for the specific symbol, strategy, and window."""
+        """
+        Check if optimization has already been run for the current stage, for the specific symbol, strategy, and window.
+        With a fingerprint, the run must also have been made from the same inputs.
+        """
         try:
             existing_optimization_json = self.get_existing_optimization_results(
                 strategy_name=strategy_name,
@@ -230,6 +357,11 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
                     f"Optimization symbol mismatch for window {self.window_id}: expected {symbol}, found {meta.get('symbol')}"
                 )
                 return False
+            if fingerprint is not None and meta.get("fingerprint") != fingerprint:
+                self.logger.info(
+                    f"Optimization inputs changed for {symbol} {strategy_name} in window {self.window_id}: fingerprint {meta.get('fingerprint')} -> {fingerprint}"
+                )
+                return False
             # Validate the structure of the optimization data
             if not self.stage.output_validation_fn(
                 existing_optimization_json, self.logger
@@ -267,22 +399,63 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
         symbol: str,
         strategy: BaseSignalStrategy,
         df: pd.DataFrame,
+        signal_matrices: Optional[Dict[int, CombinationSignalMatrix]] = None,
     ):
+        if signal_matrices is not None and self._composes_conditions(strategy):
+            return self._evaluate_from_matrix(strategy, df, signal_matrices)
+
         # We wrap df into an async factory as your executor expects
         async def data_factory():
             yield df
 
-        raw_results = await self.executor.async_run_backtest(
+        # Evaluate each result page as it is produced instead of collecting
+        # and concatenating them
+        evaluation = self.evaluator.stream(strategy)
+        async for _, _, page_df in self.executor.async_stream_backtest(
             [strategy], {symbol: data_factory}
+        ):
+            evaluation.add_page(page_df)
+        self.logger.debug(f"Backtest result pages evaluated: {evaluation.pages}")
+        if not evaluation.pages:
+            return {}
+        return evaluation.metrics()
+
+    @staticmethod
+    def _composes_conditions(strategy: BaseSignalStrategy) -> bool:
+        """Whether the strategy's signals are its conditions' as composed by the base class."""
+        return (
+            isinstance(strategy, BaseSignalStrategy)
+            and type(strategy).generate_signals is BaseSignalStrategy.generate_signals
         )
-        self.logger.debug(f"Raw backtest results: line count: {len(raw_results)}")
-        dfs = raw_results.get(symbol, [])
-        if not dfs:
+
+    def _evaluate_from_matrix(
+        self,
+        strategy: BaseSignalStrategy,
+        df: pd.DataFrame,
+        signal_matrices: Dict[int, CombinationSignalMatrix],
+    ) -> dict:
+        """
+        Evaluate a trial's strategy from the signal matrix of its frame, built
+        on first use from the rows the executor would backtest. The strategy's
+        conditions are looked up by id, so only those no earlier trial used
+        are applied; the metrics are those of backtesting the strategy.
+        """
+        matrix = signal_matrices.get(len(df))
+        if matrix is None:
+            matrix = CombinationSignalMatrix(
+                self.executor.filter_extreme_values(df), logger=self.logger
+            )
+            signal_matrices[len(df)] = matrix
+        if matrix.frame.empty:
             return {}
-        self.logger.debug(f"Backtest result DataFrames: {len(dfs)}")
-        full_df = pd.concat(dfs, ignore_index=True)
-        metrics = self.evaluator.evaluate(strategy, full_df)
-        return metrics
+        k = matrix.row(ConditionCombination.from_strategy(strategy))
+        evaluation = self.evaluator.stream(strategy)
+        evaluation.add_signals(
+            matrix.signals_frame(
+                k, [SignalStrategyColumns.TIMESTAMP, SignalStrategyColumns.CLOSE_PRICE]
+            )
+        )
+        return evaluation.metrics()
 
     def _validate_optimization_results(
         self, results: Dict[str, Dict[str, dict]]
@@ -310,6 +483,7 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
         strategy_name: str,
         optimization_result: Dict[str, Any],
         collective_results: Dict[str, Dict[str, dict]],
+        fingerprint: Optional[str] = None,
     ) -> Dict[str, Dict[str, dict]]:
         try:
             optimization_json = {
@@ -326,6 +500,7 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
                             "multi_objective": optimization_result.get(
                                 "multi_objective", False
                             ),
+                            "fingerprint": fingerprint,
                         },
                         "metrics": optimization_result.get("metrics", {}),
                     },
@@ -337,35 +512,37 @@ class SignalStrategyOptimizationStageCoordinator(BaseOptimizationStageCoordinato
                 }
             }
 
-            # Get existing results for the symbol and strategy
-            existing_optimization_json = self.get_existing_optimization_results(
-                strategy_name=strategy_name,
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            if existing_optimization_json is None:
-                self.logger.warning(
-                    f"No existing optimization results for {symbol} {strategy_name} {self.window_id}"
-                )
-                existing_optimization_json = {}
-
-            updated_optimization_json = self._deep_merge(
-                existing_optimization_json, optimization_json
-            )
-            # Save optimization metrics to optimization_result.json under window_id
             out_path = self._get_output_path(
                 strategy_name,
                 symbol,
                 start_date,
                 end_date,
             )
-            self.logger.info(
-                f"Saving optimization results for {symbol} {strategy_name} to {out_path} results: {updated_optimization_json}"
-            )
-            # Write the updated results to the file
-            with open(out_path, "w") as f:
-                json.dump(updated_optimization_json, f, indent=2, default=str)
+            # Walk-forward windows run concurrently and may share this file
+            with path_lock(out_path):
+                # Get existing results for the symbol and strategy
+                existing_optimization_json = self.get_existing_optimization_results(
+                    strategy_name=strategy_name,
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                if existing_optimization_json is None:
+                    self.logger.warning(
+                        f"No existing optimization results for {symbol} {strategy_name} {self.window_id}"
+                    )
+                    existing_optimization_json = {}
+
+                updated_optimization_json = self._deep_merge(
+                    existing_optimization_json, optimization_json
+                )
+                # Save optimization metrics to optimization_result.json under window_id
+                self.logger.info(
+                    f"Saving optimization results for {symbol} {strategy_name} to {out_path} results: {updated_optimization_json}"
+                )
+                # Write the updated results to the file
+                with open(out_path, "w") as f:
+                    json.dump(updated_optimization_json, f, indent=2, default=str)
 
             # Update the results dictionary to match the validator's requirements
             collective_results.setdefault(symbol, {})[strategy_name] = optimization_json
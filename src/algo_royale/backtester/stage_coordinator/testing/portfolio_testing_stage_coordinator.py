@@ -30,6 +30,7 @@ from algo_royale.backtester.strategy_factory.portfolio.portfolio_strategy_combin
     PortfolioStrategyCombinatorFactory,
 )
 from algo_royale.logging.loggable import Loggable
+from algo_royale.utils.path_lock import path_lock
 
 
 class PortfolioTestingStageCoordinator(BaseTestingStageCoordinator):
@@ -383,14 +384,6 @@ class PortfolioTestingStageCoordinator(BaseTestingStageCoordinator):
                 }
             }
 
-            updated_optimization_json = self._deep_merge(
-                test_optimization_json, optimization_result
-            )
-
-            self.logger.debug(
-                f"Optimization result after update: {updated_optimization_json}"
-            )
-
             # Save the updated optimization results to the file
             test_opt_results_path = self._get_optimization_result_path(
                 strategy_name=strategy_name,
@@ -398,11 +391,30 @@ class PortfolioTestingStageCoordinator(BaseTestingStageCoordinator):
                 start_date=self.test_start_date,
                 end_date=self.test_end_date,
             )
-            self.logger.info(
-                f"Saving test results for {strategy_name} to {test_opt_results_path}"
-            )
-            with open(test_opt_results_path, "w") as f:
-                json.dump(updated_optimization_json, f, indent=2, default=str)
+            # Walk-forward windows run concurrently and the next window optimizes
+            # into this file, so re-read it under the lock before merging
+            with path_lock(test_opt_results_path):
+                optimization_result = (
+                    self._get_optimization_results(
+                        strategy_name=strategy_name,
+                        symbol=self._get_symbols_dir_name(symbols),
+                        start_date=self.test_start_date,
+                        end_date=self.test_end_date,
+                    )
+                    or optimization_result
+                )
+                updated_optimization_json = self._deep_merge(
+                    test_optimization_json, optimization_result
+                )
+
+                self.logger.debug(
+                    f"Optimization result after update: {updated_optimization_json}"
+                )
+                self.logger.info(
+                    f"Saving test results for {strategy_name} to {test_opt_results_path}"
+                )
+                with open(test_opt_results_path, "w") as f:
+                    json.dump(updated_optimization_json, f, indent=2, default=str)
 
             collective_results[strategy_name] = updated_optimization_json
         except Exception as e:
@@ -1,5 +1,6 @@
 import inspect
 import json
+import time
 from datetime import datetime
 from typing import Any, AsyncIterator, Callable, Dict, Optional
 
@@ -18,7 +19,15 @@ from algo_royale.backtester.stage_coordinator.testing.base_testing_stage_coordin
 from algo_royale.backtester.stage_data.loader.symbol_strategy_data_loader import (
     SymbolStrategyDataLoader,
 )
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.stage_data.stage_fingerprint import (
+    code_version,
+    fingerprint,
+)
+from algo_royale.backtester.strategy_combinator.signal.base_signal_strategy_combinator import (
+    SignalStrategyCombinator,
+)
 from algo_royale.backtester.strategy_factory.signal.signal_strategy_combinator_factory import (
     SignalStrategyCombinatorFactory,
 )
@@ -26,6 +35,7 @@ from algo_royale.backtester.strategy_factory.signal.signal_strategy_factory impo
     SignalStrategyFactory,
 )
 from algo_royale.logging.loggable import Loggable
+from algo_royale.utils.path_lock import path_lock
 
 
 class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
@@ -156,17 +166,38 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                 continue
             test_df = pd.concat(dfs, ignore_index=True)
             self.logger.debug(f"Test DataFrame for {symbol}: {test_df}")
+            data_hash = self.stage_data_manager.hash_stage_data(
+                stage=self.stage.input_stage,
+                symbol=symbol,
+                start_date=self.test_start_date,
+                end_date=self.test_end_date,
+            )
             for (
                 strategy_combinator
             ) in self.strategy_combinator_factory.all_combinators():
                 strategy_class = strategy_combinator.strategy_class
                 strategy_name = strategy_class.__name__
+                test_fingerprint = self.stage_fingerprint(
+                    symbol=symbol,
+                    strategy_combinator=strategy_combinator,
+                    data_hash=data_hash,
+                    train_optimization=self._read_optimization_results(
+                        strategy_name=strategy_name,
+                        symbol=symbol,
+                        start_date=self.train_start_date,
+                        end_date=self.train_end_date,
+                    )
+                    .get(self.train_window_id, {})
+                    .get("optimization"),
+                    test_window_id=self.test_window_id,
+                )
 
                 if self._has_optimization_run(
                     symbol=symbol,
                     strategy_name=strategy_name,
                     start_date=self.test_start_date,
                     end_date=self.test_end_date,
+                    fingerprint=test_fingerprint,
                 ):
                     self.logger.info(
                         f"Skipping optimization for {symbol} {strategy_name} as it has already been run."
@@ -199,6 +230,7 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                         f"No optimized parameters found for {symbol} {strategy_name} {self.train_window_id}"
                     )
                     continue
+                started = time.perf_counter()
                 strategy = self.strategy_factory.build_strategy(
                     strategy_class, optimized_params
                 )
@@ -206,19 +238,18 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                 async def data_factory():
                     yield test_df
 
-                raw_results = await self.executor.async_run_backtest(
+                # Evaluate each result page as it is produced
+                evaluation = self.evaluator.stream(strategy)
+                async for _, _, page_df in self.executor.async_stream_backtest(
                     [strategy], {symbol: data_factory}
-                )
-                self.logger.debug(f"Raw results for {symbol}: {raw_results}")
-                dfs = raw_results.get(symbol, [])
-                if not dfs:
+                ):
+                    evaluation.add_page(page_df)
+                if not evaluation.pages:
                     self.logger.warning(
                         f"No test results for {symbol} {strategy_name} {self.test_window_id}"
                     )
                     continue
-                full_df = pd.concat(dfs, ignore_index=True)
-                self.logger.debug(f"Full DataFrame for {symbol}: {full_df}")
-                metrics = self.evaluator.evaluate(strategy, full_df)
+                metrics = evaluation.metrics()
 
                 required_metrics = [
                     "total_return",
@@ -228,6 +259,7 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                 ]
                 metrics = {k: metrics.get(k, 0.0) for k in required_metrics}
                 self.logger.debug(f"Metrics for {strategy_name}: {metrics}")
+                duration_sec = round(time.perf_counter() - started, 4)
 
                 test_opt_results = self._get_test_optimization_results(
                     strategy_name,
@@ -253,6 +285,8 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                     metrics=metrics,
                     optimization_result=test_opt_results,
                     collective_results=results,
+                    fingerprint=test_fingerprint,
+                    duration_sec=duration_sec,
                 )
 
                 self.logger.debug(
@@ -290,10 +324,132 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
             )
             return None
 
+    def stage_fingerprint(
+        self,
+        symbol: str,
+        strategy_combinator: SignalStrategyCombinator,
+        data_hash: Optional[str],
+        train_optimization: Optional[Dict[str, Any]],
+        test_window_id: str,
+    ) -> Optional[str]:
+        """
+        Fingerprint of what a strategy's test depends on: the content of the
+        symbol's test window features, the train window optimization it takes
+        its parameters from and the backtest code. None if either input is
+        missing.
+        """
+        if data_hash is None or not train_optimization:
+            return None
+        return fingerprint(
+            self.stage.name,
+            symbol,
+            test_window_id,
+            data_hash,
+            train_optimization.get("meta", {}).get("fingerprint"),
+            train_optimization.get("best_params"),
+            strategy_combinator.code_version(),
+            code_version(
+                type(self.executor), type(self.evaluator), type(self.strategy_factory)
+            ),
+        )
+
+    def plan_rebuild(
+        self,
+        symbols: list[str],
+        train_start_date: datetime,
+        train_end_date: datetime,
+        test_start_date: datetime,
+        test_end_date: datetime,
+        plan: RebuildPlan,
+    ) -> RebuildPlan:
+        """
+        Add each symbol's strategy tests for the window to a dry-run plan. A
+        test whose features or train optimization are rebuilt in the plan is
+        rerun.
+        """
+        train_window_id = self.stage_data_manager.get_window_id(
+            start_date=train_start_date, end_date=train_end_date
+        )
+        test_window_id = self.stage_data_manager.get_window_id(
+            start_date=test_start_date, end_date=test_end_date
+        )
+        for symbol in symbols:
+            upstream = plan.will_rebuild(self.stage.input_stage, test_window_id, symbol)
+            data_hash = (
+                None
+                if upstream
+                else self.stage_data_manager.hash_stage_data(
+                    stage=self.stage.input_stage,
+                    symbol=symbol,
+                    start_date=test_start_date,
+                    end_date=test_end_date,
+                )
+            )
+            for (
+                strategy_combinator
+            ) in self.strategy_combinator_factory.all_combinators():
+                strategy_name = strategy_combinator.strategy_class.__name__
+                train_optimization = (
+                    None
+                    if plan.will_rebuild(
+                        BacktestStage.STRATEGY_OPTIMIZATION,
+                        train_window_id,
+                        symbol,
+                        strategy_name,
+                    )
+                    else self._read_optimization_results(
+                        strategy_name=strategy_name,
+                        symbol=symbol,
+                        start_date=train_start_date,
+                        end_date=train_end_date,
+                    )
+                    .get(train_window_id, {})
+                    .get("optimization")
+                )
+                test_section = (
+                    self._read_optimization_results(
+                        strategy_name=strategy_name,
+                        symbol=symbol,
+                        start_date=test_start_date,
+                        end_date=test_end_date,
+                    )
+                    .get(test_window_id, {})
+                    .get("test")
+                    or {}
+                )
+                plan.add(
+                    stage=self.stage,
+                    window_id=test_window_id,
+                    symbol=symbol,
+                    strategy=strategy_name,
+                    fingerprint=self.stage_fingerprint(
+                        symbol=symbol,
+                        strategy_combinator=strategy_combinator,
+                        data_hash=data_hash,
+                        train_optimization=train_optimization,
+                        test_window_id=test_window_id,
+                    ),
+                    stored_fingerprint=(
+                        test_section.get("fingerprint", "")
+                        if test_section.get("metrics")
+                        else None
+                    ),
+                    last_duration_sec=test_section.get("duration_sec"),
+                )
+        return plan
+
     def _has_optimization_run(
-        self, symbol: str, strategy_name: str, start_date: datetime, end_date: datetime
+        self,
+        symbol: str,
+        strategy_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        fingerprint: Optional[str] = None,
     ) -> bool:
-        """Check if test has already been run for the current stage and test window."""
+        """
+        Check if test has already been run for the current stage and test window.
+        With a fingerprint, the test must also have been run from the same inputs.
+        """
         try:
             existing_optimization_json = self.get_existing_optimization_results(
                 strategy_name=strategy_name,
@@ -315,6 +471,14 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                     f"No test metrics for window {self.test_window_id} for {symbol} {strategy_name}"
                 )
                 return False
+            if (
+                fingerprint is not None
+                and test_section.get("fingerprint") != fingerprint
+            ):
+                self.logger.info(
+                    f"Test inputs changed for {symbol} {strategy_name} in window {self.test_window_id}: fingerprint {test_section.get('fingerprint')} -> {fingerprint}"
+                )
+                return False
             # Validate the structure of the test data
             if not self.stage.output_validation_fn(test_data, self.logger):
                 self.logger.info(
@@ -434,6 +598,8 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
         metrics: Dict[str, float],
         optimization_result: Dict[str, Any],
         collective_results: Dict[str, Dict[str, dict]],
+        fingerprint: Optional[str] = None,
+        duration_sec: Optional[float] = None,
     ) -> Dict[str, Dict[str, dict]]:
         try:
             self.logger.debug(
@@ -458,6 +624,8 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                 self.test_window_id: {
                     "test": {
                         "metrics": metrics,
+                        "fingerprint": fingerprint,
+                        "duration_sec": duration_sec,
                     },
                     "window": {
                         "start_date": self.test_start_date.strftime("%Y-%m-%d"),
@@ -467,14 +635,6 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                 }
             }
 
-            updated_optimization_json = self._deep_merge(
-                test_optimization_json, optimization_result
-            )
-
-            self.logger.debug(
-                f"Optimization result after update: {updated_optimization_json}"
-            )
-
             # Save the updated optimization results to the file
             test_opt_results_path = self._get_optimization_result_path(
                 strategy_name=strategy_name,
@@ -482,11 +642,31 @@ class SignalStrategyTestingStageCoordinator(BaseTestingStageCoordinator):
                 start_date=self.test_start_date,
                 end_date=self.test_end_date,
             )
-            self.logger.info(
-                f"Saving test results for {strategy_name} and symbol {symbol} to {test_opt_results_path}"
-            )
-            with open(test_opt_results_path, "w") as f:
-                json.dump(updated_optimization_json, f, indent=2, default=str)
+            # Walk-forward windows run concurrently and the next window optimizes
+            # into this file, so re-read it under the lock before merging
+            with path_lock(test_opt_results_path):
+                optimization_result = (
+                    self._get_optimization_results(
+                        strategy_name=strategy_name,
+                        symbol=symbol,
+                        start_date=self.test_start_date,
+                        end_date=self.test_end_date,
+                    )
+                    or optimization_result
+                )
+                # A rerun's metrics replace the stale ones
+                updated_optimization_json = self._deep_merge(
+                    optimization_result, test_optimization_json
+                )
+
+                self.logger.debug(
+                    f"Optimization result after update: {updated_optimization_json}"
+                )
+                self.logger.info(
+                    f"Saving test results for {strategy_name} and symbol {symbol} to {test_opt_results_path}"
+                )
+                with open(test_opt_results_path, "w") as f:
+                    json.dump(updated_optimization_json, f, indent=2, default=str)
 
             # Update the results dictionary
             collective_results.setdefault(symbol, {}).setdefault(
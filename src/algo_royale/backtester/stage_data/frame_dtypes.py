@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
+from algo_royale.backtester.enums.frame_precision import FramePrecision
+
+TIMESTAMP_COLUMN = str(DataIngestColumns.TIMESTAMP)
+# Repeated labels, one or a few values per frame
+CATEGORICAL_COLUMNS = (str(DataIngestColumns.SYMBOL), "strategy")
+# Ingested prices and volume keep float64 so fills and P&L are unchanged
+FULL_PRECISION_COLUMNS = frozenset(DataIngestColumns.get_all_column_values())
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derived float64 columns as float32 and label columns as categoricals.
+    Ingested columns, integers and other object columns are left as they are.
+    """
+    dtypes = {}
+    for column, dtype in df.dtypes.items():
+        if column in CATEGORICAL_COLUMNS:
+            if not isinstance(dtype, pd.CategoricalDtype):
+                dtypes[column] = "category"
+        elif dtype == np.float64 and column not in FULL_PRECISION_COLUMNS:
+            dtypes[column] = np.float32
+    return df.astype(dtypes) if dtypes else df
+
+
+def to_stored_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact frame for writing: tz-aware timestamps on whole seconds are
+    stored as epoch seconds (10 characters instead of 25 per row).
+    """
+    df = compact_frame(df)
+    timestamps = df.get(TIMESTAMP_COLUMN)
+    if timestamps is not None and pd.api.types.is_datetime64tz_dtype(timestamps):
+        nanoseconds = pd.DatetimeIndex(timestamps).asi8
+        if timestamps.notna().all() and not (nanoseconds % 1_000_000_000).any():
+            df = df.assign(**{TIMESTAMP_COLUMN: nanoseconds // 1_000_000_000})
+    return df
+
+
+def restore_timestamps(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Epoch-second timestamps read from a compact page as UTC datetimes. Also
+    handles digit strings, which is what parse_dates leaves them as.
+    """
+    timestamps = df.get(TIMESTAMP_COLUMN)
+    if timestamps is None:
+        return df
+    if timestamps.dtype == object:
+        if not timestamps.astype(str).str.fullmatch(r"\d+").all():
+            return df
+        timestamps = timestamps.astype(np.int64)
+    if pd.api.types.is_integer_dtype(timestamps):
+        df[TIMESTAMP_COLUMN] = pd.to_datetime(timestamps, unit="s", utc=True)
+    return df
+
+
+def from_stored_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Compact in-memory frame from a page read without parsing dates."""
+    df = restore_timestamps(df)
+    timestamps = df.get(TIMESTAMP_COLUMN)
+    if timestamps is not None and timestamps.dtype == object:
+        df[TIMESTAMP_COLUMN] = pd.to_datetime(timestamps)
+    return compact_frame(df)
+
+
+def read_stored_page(page_path: Path, precision: FramePrecision) -> pd.DataFrame:
+    """Read a page; compact precision keeps derived columns float32 and
+    labels categorical. Pages written in either precision are readable."""
+    if FramePrecision(precision) == FramePrecision.COMPACT:
+        df = pd.read_csv(
+            page_path, dtype={column: "category" for column in CATEGORICAL_COLUMNS}
+        )
+        return from_stored_frame(df)
+    return restore_timestamps(pd.read_csv(page_path, parse_dates=[TIMESTAMP_COLUMN]))
+
+
+def memory_per_symbol_year(df: pd.DataFrame) -> float:
+    """
+    Bytes of memory per symbol per year of bars, from the frame's memory
+    usage (strings included) and the time span each symbol covers.
+    """
+    if df.empty or TIMESTAMP_COLUMN not in df.columns:
+        return float("nan")
+    if str(DataIngestColumns.SYMBOL) in df.columns:
+        spans = df.groupby(str(DataIngestColumns.SYMBOL), observed=True)[
+            TIMESTAMP_COLUMN
+        ].agg(lambda ts: (ts.max() - ts.min()).total_seconds())
+        symbol_years = spans.sum() / SECONDS_PER_YEAR
+    else:
+        timestamps = df[TIMESTAMP_COLUMN]
+        symbol_years = (
+            timestamps.max() - timestamps.min()
+        ).total_seconds() / SECONDS_PER_YEAR
+    if symbol_years <= 0:
+        return float("nan")
+    return df.memory_usage(deep=True).sum() / symbol_years
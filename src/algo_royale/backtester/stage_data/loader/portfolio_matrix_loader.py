@@ -1,14 +1,15 @@
+import asyncio
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import pandas as pd
 
-from algo_royale.backtester.column_names.strategy_columns import (
-    SignalStrategyColumns,
-    SignalStrategyExecutorColumns,
-)
+from algo_royale.backtester.column_names.strategy_columns import SignalStrategyColumns
 from algo_royale.backtester.data_preparer.asset_matrix_preparer import (
     AssetMatrixPreparer,
 )
@@ -18,6 +19,11 @@ from algo_royale.backtester.executor.strategy_backtest_executor import (
     StrategyBacktestExecutor,
 )
 from algo_royale.backtester.maps.strategy_class_map import SYMBOL_STRATEGY_CLASS_MAP
+from algo_royale.backtester.stage_data.loader.signal_backtest_worker import (
+    collect_signal_columns,
+    run_symbol_signal_backtest,
+    select_signal_columns,
+)
 from algo_royale.backtester.stage_data.loader.stage_data_loader import StageDataLoader
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
 from algo_royale.backtester.strategy.signal.base_signal_strategy import (
@@ -42,6 +48,7 @@ class PortfolioMatrixLoader:
         signal_summary_json_filename: str,
         symbol_signals_filename: str,
         logger: Loggable,
+        max_workers: int = 1,
     ):
         self.asset_matrix_preparer = asset_matrix_preparer
         self.stage_data_manager = stage_data_manager
@@ -57,12 +64,15 @@ class PortfolioMatrixLoader:
         self.executor = strategy_backtest_executor
         self.logger = logger
         self.stage = BacktestStage.PORTFOLIO_MATRIX_LOADER
+        # Processes for the per-symbol signal backtests; 0 or less uses the CPU count
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
 
     async def get_portfolio_matrix(
         self, symbols: List[str], start_date: datetime, end_date: datetime
     ) -> Optional[pd.DataFrame]:
         """
-        Oversees the workflow: runs backtest and save signals, then compiles and returns the asset-matrix DataFrame."""
+        Oversees the workflow: runs backtest and save signals, then compiles and returns the asset-matrix DataFrame.
+        """
         await self._run_backtest_and_save_signals(symbols, start_date, end_date)
         return await self._compile_portfolio_matrix(
             symbols,
@@ -81,52 +91,127 @@ class PortfolioMatrixLoader:
         """
         Runs backtest for each symbol in the watchlist with the specified strategy,
         checking if the backtest has already been run for the current stage.
-        For each symbol, if the backtest has not been run, it will run the backtest and save the results."""
-        import asyncio
-
+        For each symbol, if the backtest has not been run, it will run the backtest and save the results.
+        The backtests are CPU-bound, so with more than one worker they run in a process pool.
+        """
         try:
             self.logger.info(
                 f"[PortfolioMatrixLoader] Running backtest for symbols: {symbols} | {start_date} to {end_date}"
             )
-            tasks = []
+            strategies = {}
             for symbol in symbols:
-
-                async def process_symbol(symbol=symbol):
-                    try:
+                try:
+                    self.logger.info(
+                        f"[PortfolioMatrixLoader] Checking backtest file for {symbol} | {start_date} to {end_date}"
+                    )
+                    if self._has_backtest_run(
+                        symbol=symbol, start_date=start_date, end_date=end_date
+                    ):
                         self.logger.info(
-                            f"[PortfolioMatrixLoader] Checking backtest file for {symbol} | {start_date} to {end_date}"
+                            f"[PortfolioMatrixLoader] Optimized strategy signals already exist for {symbol}, skipping backtest."
                         )
-                        if not self._has_backtest_run(
-                            symbol=symbol, start_date=start_date, end_date=end_date
-                        ):
-                            self.logger.info(
-                                f"[PortfolioMatrixLoader] No optimized strategy signals for {symbol}, running backtest..."
-                            )
-                            strategy_instance = self._get_optimized_strategy(symbol)
-                            if not strategy_instance:
-                                self.logger.warning(
-                                    f"[PortfolioMatrixLoader] No viable strategy found for {symbol}, skipping backtest."
-                                )
-                                return
-                            await self._run_and_save_symbol_data(
-                                symbol, strategy_instance, start_date, end_date
-                            )
-                        else:
-                            self.logger.info(
-                                f"[PortfolioMatrixLoader] Optimized strategy signals already exist for {symbol}, skipping backtest."
-                            )
-                    except Exception as e:
-                        self.logger.error(
-                            f"[PortfolioMatrixLoader] Error running backtest for {symbol}: {e}"
+                        continue
+                    self.logger.info(
+                        f"[PortfolioMatrixLoader] No optimized strategy signals for {symbol}, running backtest..."
+                    )
+                    strategy_instance = self._get_optimized_strategy(symbol)
+                    if not strategy_instance:
+                        self.logger.warning(
+                            f"[PortfolioMatrixLoader] No viable strategy found for {symbol}, skipping backtest."
                         )
+                        continue
+                    strategies[symbol] = strategy_instance
+                except Exception as e:
+                    self.logger.error(
+                        f"[PortfolioMatrixLoader] Error running backtest for {symbol}: {e}"
+                    )
 
-                tasks.append(process_symbol())
-            await asyncio.gather(*tasks)
+            if self.max_workers > 1 and len(strategies) > 1:
+                await self._run_backtests_in_process_pool(
+                    strategies, start_date, end_date
+                )
+                return
+            await asyncio.gather(
+                *(
+                    self._run_and_save_symbol_data(
+                        symbol, strategy, start_date, end_date
+                    )
+                    for symbol, strategy in strategies.items()
+                )
+            )
         except Exception as e:
             self.logger.error(
                 f"[PortfolioMatrixLoader] Failed to run backtest for symbols: {symbols} | {e}"
             )
 
+    async def _run_backtests_in_process_pool(
+        self,
+        strategies: Dict[str, BaseSignalStrategy],
+        start_date: datetime,
+        end_date: datetime,
+    ):
+        """
+        Runs the symbol backtests on a process pool. Workers read the feature
+        pages themselves and return compact arrays; a symbol whose worker fails
+        is rerun in this process.
+        """
+        loop = asyncio.get_running_loop()
+        # Spawned workers do not inherit locks held by other threads of this process
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(strategies)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+
+            async def process_symbol(symbol: str, strategy: BaseSignalStrategy):
+                try:
+                    page_paths = self.stage_data_loader.get_stage_page_paths(
+                        symbol=symbol,
+                        stage=self.stage.input_stage,
+                        start_date=start_date,
+                        end_date=end_date,
+                        reverse_pages=True,
+                    )
+                    if not page_paths:
+                        self.logger.warning(
+                            f"[PortfolioMatrixLoader] No feature data found for {symbol} in range {start_date} to {end_date}, skipping backtest."
+                        )
+                        return
+                    signals = await loop.run_in_executor(
+                        pool,
+                        run_symbol_signal_backtest,
+                        self.executor,
+                        strategy,
+                        symbol,
+                        page_paths,
+                        self.stage_data_loader.precision,
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"[PortfolioMatrixLoader] Worker backtest failed for {symbol}, running it in process: {e}"
+                    )
+                    await self._run_and_save_symbol_data(
+                        symbol, strategy, start_date, end_date
+                    )
+                    return
+                self.logger.info(
+                    f"[PortfolioMatrixLoader] Backtest completed for {symbol} with strategy {strategy.__class__.__name__}."
+                )
+                if signals is None:
+                    self.logger.warning(
+                        f"[PortfolioMatrixLoader] Backtest returned empty DataFrame for {symbol}."
+                    )
+                    return
+                self._save_symbol_signals(
+                    symbol, signals.to_frame(), start_date, end_date
+                )
+
+            await asyncio.gather(
+                *(
+                    process_symbol(symbol, strategy)
+                    for symbol, strategy in strategies.items()
+                )
+            )
+
     def _has_backtest_run(
         self, symbol: str, start_date: datetime, end_date: datetime
     ) -> bool:
@@ -168,8 +253,6 @@ class PortfolioMatrixLoader:
         Note:
             For large symbol lists, this step is parallelized using asyncio for I/O bound operations.
         """
-        import asyncio
-
         try:
 
             async def load_symbol(symbol):
@@ -204,9 +287,9 @@ class PortfolioMatrixLoader:
             self.logger.info(
                 f"[PortfolioMatrixLoader] Compiling portfolio matrix for {len(dfs)} symbols."
             )
-            all_df = pd.concat(dfs, axis=0, ignore_index=True)
-            matrix = self.asset_matrix_preparer.prepare(
-                all_df,
+            # Build straight from the per-symbol frames; no concatenated copy
+            matrix = self.asset_matrix_preparer.build(
+                dfs,
                 symbol_col=symbol_col,
                 timestamp_col=timestamp_col,
             )
@@ -242,65 +325,21 @@ class PortfolioMatrixLoader:
                     f"[PortfolioMatrixLoader] No feature data found for {symbol} in range {start_date} to {end_date}, skipping backtest."
                 )
                 return None
-            # Run the backtest
-            result: Dict[
-                str, list[pd.DataFrame]
-            ] = await self.executor.async_run_backtest(
-                [strategy], {symbol: feature_data_loader}
+            # Run the backtest, keeping only the downstream columns of each page
+            df = await collect_signal_columns(
+                self.executor, strategy, symbol, feature_data_loader
             )
             self.logger.info(
                 f"[PortfolioMatrixLoader] Backtest completed for {symbol} with strategy {strategy.__class__.__name__}."
             )
-            if not result or not result.get(symbol):
+            if df is None:
                 self.logger.warning(
                     f"[PortfolioMatrixLoader] Backtest returned empty DataFrame for {symbol}."
                 )
-
-            # Save the DataFrame to a Parquet file
-            dfs = result.get(symbol, [])
-            if not dfs:
-                self.logger.warning(
-                    f"[PortfolioMatrixLoader] Backtest returned empty DataFrame for {symbol}."
-                )
-                return
-            if not isinstance(dfs, list):
-                self.logger.error(
-                    f"[PortfolioMatrixLoader] Backtest result for {symbol} is not a list of DataFrames: {dfs}"
-                )
                 return
 
-            df = pd.concat(dfs, axis=0, ignore_index=True)
-            if df.empty:
-                self.logger.warning(
-                    f"[PortfolioMatrixLoader] Backtest returned empty DataFrame for {symbol}."
-                )
-                return
-
-            # Filter columns to only those needed downstream
-            downstream_cols = [
-                SignalStrategyExecutorColumns.ENTRY_SIGNAL,
-                SignalStrategyExecutorColumns.EXIT_SIGNAL,
-                SignalStrategyExecutorColumns.SYMBOL,
-                SignalStrategyExecutorColumns.TIMESTAMP,
-                SignalStrategyExecutorColumns.OPEN_PRICE,
-                SignalStrategyExecutorColumns.HIGH_PRICE,
-                SignalStrategyExecutorColumns.LOW_PRICE,
-                SignalStrategyExecutorColumns.CLOSE_PRICE,
-            ]
-            # Only keep columns that exist in df
-            filtered_cols = [col for col in downstream_cols if col in df.columns]
-            df = df[filtered_cols]
-
-            file_path = self._get_signal_file_path(symbol, start_date, end_date)
-            df.to_parquet(file_path)
-
-            self.stage_data_manager.mark_symbol_stage(
-                stage=self.stage,
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                statusExtension=DataExtension.DONE,
-            )
+            # Save the DataFrame to a Parquet file
+            self._save_symbol_signals(symbol, df, start_date, end_date)
             return
         except Exception as e:
             self.logger.error(
@@ -308,6 +347,28 @@ class PortfolioMatrixLoader:
             )
             return None
 
+    def _save_symbol_signals(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime,
+    ):
+        """Saves the downstream columns of a symbol's backtest and marks the symbol done."""
+        # Filter columns to only those needed downstream
+        df = select_signal_columns(df)
+
+        file_path = self._get_signal_file_path(symbol, start_date, end_date)
+        df.to_parquet(file_path)
+
+        self.stage_data_manager.mark_symbol_stage(
+            stage=self.stage,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            statusExtension=DataExtension.DONE,
+        )
+
     def _get_signal_file_path(
         self, symbol: str, start_date: datetime, end_date: datetime
     ) -> Path:
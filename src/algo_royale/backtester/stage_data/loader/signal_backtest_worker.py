@@ -0,0 +1,129 @@
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.column_names.strategy_columns import (
+    SignalStrategyExecutorColumns,
+)
+from algo_royale.backtester.enums.frame_precision import FramePrecision
+from algo_royale.backtester.executor.strategy_backtest_executor import (
+    StrategyBacktestExecutor,
+)
+from algo_royale.backtester.stage_data.frame_dtypes import read_stored_page
+from algo_royale.backtester.strategy.signal.base_signal_strategy import (
+    BaseSignalStrategy,
+)
+
+# Columns of a symbol's signal backtest needed to build the portfolio matrix
+SIGNAL_MATRIX_COLUMNS = [
+    SignalStrategyExecutorColumns.ENTRY_SIGNAL,
+    SignalStrategyExecutorColumns.EXIT_SIGNAL,
+    SignalStrategyExecutorColumns.SYMBOL,
+    SignalStrategyExecutorColumns.TIMESTAMP,
+    SignalStrategyExecutorColumns.OPEN_PRICE,
+    SignalStrategyExecutorColumns.HIGH_PRICE,
+    SignalStrategyExecutorColumns.LOW_PRICE,
+    SignalStrategyExecutorColumns.CLOSE_PRICE,
+]
+
+
+@dataclass
+class SymbolSignalArrays:
+    """
+    A symbol's signal backtest as plain numpy arrays, so it crosses a process
+    boundary as raw buffers instead of a pickled DataFrame.
+
+    Attributes:
+        symbol: The symbol; its column is restored from this rather than shipped.
+        columns: Column name -> values, in column order.
+        timezones: Timezone of each tz-aware datetime column, stored as UTC values.
+    """
+
+    symbol: str
+    columns: dict[str, np.ndarray]
+    timezones: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_frame(cls, symbol: str, df: pd.DataFrame) -> "SymbolSignalArrays":
+        columns = {}
+        timezones = {}
+        for col in df.columns:
+            if col == SignalStrategyExecutorColumns.SYMBOL:
+                continue
+            series = df[col]
+            if isinstance(series.dtype, pd.DatetimeTZDtype):
+                timezones[col] = str(series.dt.tz)
+                series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+            columns[col] = series.to_numpy()
+        return cls(symbol=symbol, columns=columns, timezones=timezones)
+
+    def to_frame(self) -> pd.DataFrame:
+        df = pd.DataFrame(self.columns, copy=False)
+        for col, tz in self.timezones.items():
+            df[col] = df[col].dt.tz_localize("UTC").dt.tz_convert(tz)
+        df[SignalStrategyExecutorColumns.SYMBOL] = self.symbol
+        return df[[col for col in SIGNAL_MATRIX_COLUMNS if col in df.columns]]
+
+
+def select_signal_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep only the signal backtest columns used downstream."""
+    return df[[col for col in SIGNAL_MATRIX_COLUMNS if col in df.columns]]
+
+
+def run_symbol_signal_backtest(
+    executor: StrategyBacktestExecutor,
+    strategy: BaseSignalStrategy,
+    symbol: str,
+    page_paths: list[Path],
+    precision: FramePrecision = FramePrecision.FULL,
+) -> Optional[SymbolSignalArrays]:
+    """
+    Run a symbol's signal backtest over its feature pages. Meant to run in a
+    worker process: it reads the pages itself and returns compact arrays.
+    :param executor: The signal backtest executor.
+    :param strategy: The symbol's optimized strategy.
+    :param symbol: The symbol.
+    :param page_paths: Feature data pages, in streaming order.
+    :param precision: Precision the pages are read in, as by the stage data loader.
+    :return: The backtest signals, or None if the backtest produced nothing.
+    """
+
+    async def pages():
+        for path in page_paths:
+            df = read_stored_page(path, precision)
+            if not df.empty:
+                yield df
+
+    df = asyncio.run(collect_signal_columns(executor, strategy, symbol, pages))
+    if df is None:
+        return None
+    return SymbolSignalArrays.from_frame(symbol, df)
+
+
+async def collect_signal_columns(
+    executor: StrategyBacktestExecutor,
+    strategy: BaseSignalStrategy,
+    symbol: str,
+    pages: Callable[[], AsyncIterator[pd.DataFrame]],
+) -> Optional[pd.DataFrame]:
+    """
+    Run a symbol's signal backtest, keeping only the downstream columns of
+    each result page as it is produced, so the feature columns of the whole
+    window are never held at once.
+    :return: The backtest signals, or None if the backtest produced nothing.
+    """
+    dfs = []
+    async for _, _, page_df in executor.async_stream_backtest(
+        [strategy], {symbol: pages}
+    ):
+        dfs.append(select_signal_columns(page_df))
+    if not dfs:
+        return None
+    df = pd.concat(dfs, axis=0, ignore_index=True)
+    if df.empty:
+        return None
+    return df
@@ -8,6 +8,9 @@ import pandas as pd
 
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
 from algo_royale.backtester.enums.data_extension import DataExtension
+from algo_royale.backtester.enums.frame_precision import FramePrecision
+from algo_royale.backtester.profiling.stage_profiler import StageProfiler
+from algo_royale.backtester.stage_data.frame_dtypes import read_stored_page
 from algo_royale.backtester.stage_data.stage_data_manager import (
     StageDataManager,
 )
@@ -21,10 +24,14 @@ class StageDataLoader:
         logger: Loggable,
         stage_data_manager: StageDataManager,
         watchlist_repo: WatchlistRepo,
+        stage_profiler: Optional[StageProfiler] = None,
+        precision: FramePrecision = FramePrecision.FULL,
     ):
         try:
             self.watchlist_repo = watchlist_repo
+            self.precision = FramePrecision(precision)
             self.stage_data_manager = stage_data_manager
+            self.stage_profiler = stage_profiler or StageProfiler(logger=logger)
 
             # Initialize logger
             self.logger = logger
@@ -295,20 +302,34 @@ class StageDataLoader:
             end_date=end_date,
         )
 
-    def _has_existing_data(self, symbol_dir: Path) -> bool:
-        """Check if valid data exists for a symbol"""
-        if not symbol_dir.exists():
-            return False
-        return any(symbol_dir.iterdir())
-
-    async def _stream_existing_data_async(
+    def get_stage_page_paths(
         self,
+        symbol: str,
         stage: BacktestStage,
-        strategy_name: str,
-        symbol_dir: Path,
-        reverse_pages: bool = False,
-    ) -> AsyncIterator[pd.DataFrame]:
-        """Async generator to stream existing data pages for a symbol"""
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        strategy_name: Optional[str] = None,
+        reverse_pages: bool = True,
+    ) -> list[Path]:
+        """
+        Paths of the data pages for a symbol, in the order `load_stage_data`
+        streams them. Lets work that runs outside this process read the pages itself.
+        """
+        symbol_dir = self._get_stage_symbol_dir(
+            stage=stage,
+            strategy_name=strategy_name,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if not self._has_existing_data(symbol_dir):
+            return []
+        return self._sorted_pages(symbol_dir, reverse_pages=reverse_pages)
+
+    def _sorted_pages(
+        self, symbol_dir: Path, reverse_pages: bool = False
+    ) -> list[Path]:
+        """Data pages in a symbol directory, ordered by page and chunk number."""
 
         def extract_page_chunk(filename):
             # Example: None_GOOG_page1_chunk2 or None_GOOG_page1
@@ -319,7 +340,7 @@ class StageDataLoader:
                 return (page, chunk)
             return (float("inf"), float("inf"))  # Put unparseable files at the end
 
-        pages = sorted(
+        return sorted(
             [
                 f
                 for f in symbol_dir.glob("*.csv")
@@ -331,15 +352,33 @@ class StageDataLoader:
             reverse=reverse_pages,  # <-- This is the key line!
         )
 
+    def _has_existing_data(self, symbol_dir: Path) -> bool:
+        """Check if valid data exists for a symbol"""
+        if not symbol_dir.exists():
+            return False
+        return any(symbol_dir.iterdir())
+
+    def _read_page(self, page_path: Path) -> pd.DataFrame:
+        return read_stored_page(page_path, self.precision)
+
+    async def _stream_existing_data_async(
+        self,
+        stage: BacktestStage,
+        strategy_name: str,
+        symbol_dir: Path,
+        reverse_pages: bool = False,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Async generator to stream existing data pages for a symbol"""
+        pages = self._sorted_pages(symbol_dir, reverse_pages=reverse_pages)
+
         self.logger.debug(f"Found {len(pages)} data pages in {symbol_dir}")
 
         for page_path in pages:
             try:
                 self.logger.debug(f"Yielding {page_path}")
-                df = await asyncio.to_thread(
-                    pd.read_csv, page_path, parse_dates=["timestamp"]
-                )
+                df = await asyncio.to_thread(self._read_page, page_path)
                 self.logger.debug(f"Loaded {len(df)} rows from {page_path}")
+                self.stage_profiler.add_files_read(1, rows=len(df))
                 if df.empty:
                     self.logger.warning(f"Empty DataFrame for {page_path}, skipping.")
                     continue
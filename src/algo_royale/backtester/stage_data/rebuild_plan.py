@@ -0,0 +1,133 @@
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from algo_royale.backtester.enums.backtest_stage import BacktestStage
+
+
+@dataclass
+class RebuildItem:
+    """One stage output and whether a run would rebuild or reuse it."""
+
+    stage: str
+    window_id: str
+    symbol: str
+    strategy: Optional[str]
+    fingerprint: Optional[str]
+    reason: str
+    last_duration_sec: Optional[float] = None
+    estimated_sec: Optional[float] = None
+
+    @property
+    def rebuild(self) -> bool:
+        return self.reason != RebuildPlan.REUSE
+
+
+@dataclass
+class RebuildPlan:
+    """
+    Dry run of the backtest stages: which outputs are rebuilt because their
+    input fingerprint is missing or changed, and what that is estimated to
+    cost. An output whose inputs are rebuilt first has no fingerprint yet and
+    is rebuilt too. Estimates use the output's last run time, falling back to
+    the stage's average over the outputs that recorded one.
+    """
+
+    REUSE = "reuse"
+    MISSING = "missing"
+    CHANGED = "changed"
+    UPSTREAM = "upstream rebuilt"
+
+    items: list[RebuildItem] = field(default_factory=list)
+
+    def add(
+        self,
+        stage: BacktestStage,
+        window_id: str,
+        symbol: str,
+        fingerprint: Optional[str],
+        stored_fingerprint: Optional[str],
+        strategy: Optional[str] = None,
+        last_duration_sec: Optional[float] = None,
+    ) -> RebuildItem:
+        """
+        Record an output. stored_fingerprint is None when there is no output
+        yet; a fingerprint of None means an input is still to be rebuilt.
+        """
+        if fingerprint is None:
+            reason = self.UPSTREAM
+        elif stored_fingerprint is None:
+            reason = self.MISSING
+        elif stored_fingerprint != fingerprint:
+            reason = self.CHANGED
+        else:
+            reason = self.REUSE
+        item = RebuildItem(
+            stage=stage.name,
+            window_id=window_id,
+            symbol=symbol,
+            strategy=strategy,
+            fingerprint=fingerprint,
+            reason=reason,
+            last_duration_sec=last_duration_sec,
+        )
+        self.items.append(item)
+        return item
+
+    def will_rebuild(
+        self,
+        stage: BacktestStage,
+        window_id: str,
+        symbol: str,
+        strategy: Optional[str] = None,
+    ) -> bool:
+        """Whether the plan rebuilds an output (or any strategy's, if strategy is None)."""
+        return any(
+            item.rebuild
+            and item.stage == stage.name
+            and item.window_id == window_id
+            and item.symbol == symbol
+            and (strategy is None or item.strategy == strategy)
+            for item in self.items
+        )
+
+    @property
+    def rebuilds(self) -> list[RebuildItem]:
+        return [item for item in self.items if item.rebuild]
+
+    def estimate(self) -> Optional[float]:
+        """Fill in estimated_sec for the rebuilt outputs; returns the total, or
+        None if no stage with rebuilt outputs has recorded a run time."""
+        durations: dict[str, list[float]] = {}
+        for item in self.items:
+            if item.last_duration_sec is not None:
+                durations.setdefault(item.stage, []).append(item.last_duration_sec)
+        total = None
+        for item in self.rebuilds:
+            if item.last_duration_sec is not None:
+                item.estimated_sec = item.last_duration_sec
+            elif durations.get(item.stage):
+                known = durations[item.stage]
+                item.estimated_sec = sum(known) / len(known)
+            if item.estimated_sec is not None:
+                total = (total or 0.0) + item.estimated_sec
+        return total
+
+    def to_rows(self) -> list[dict]:
+        self.estimate()
+        return [asdict(item) | {"rebuild": item.rebuild} for item in self.items]
+
+    def summary(self) -> str:
+        total = self.estimate()
+        by_stage: dict[str, list[int]] = {}
+        for item in self.items:
+            counts = by_stage.setdefault(item.stage, [0, 0])
+            counts[0 if item.rebuild else 1] += 1
+        stages = ", ".join(
+            f"{stage} {rebuild} rebuilt/{reuse} reused"
+            for stage, (rebuild, reuse) in by_stage.items()
+        )
+        cost = "unknown" if total is None else f"~{total:,.0f}s"
+        return (
+            f"{len(self.rebuilds)} of {len(self.items)} stage outputs to rebuild "
+            f"(estimated {cost}): {stages or 'nothing staged'}"
+        )
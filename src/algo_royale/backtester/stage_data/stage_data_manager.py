@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 from datetime import datetime
@@ -6,6 +7,7 @@ from typing import Any, Optional
 
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
 from algo_royale.backtester.enums.data_extension import DataExtension
+from algo_royale.backtester.stage_data.stage_fingerprint import hash_files
 from algo_royale.logging.loggable import Loggable
 
 
@@ -109,7 +111,12 @@ class StageDataManager:
         strategy_name: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        fingerprint: Optional[str] = None,
     ) -> bool:
+        """
+        Whether the stage is marked done for the symbol. With a fingerprint,
+        it only counts as done if it was marked with that same fingerprint.
+        """
         done_file = (
             self.get_directory_path(
                 stage=stage,
@@ -124,7 +131,69 @@ class StageDataManager:
         self.logger.debug(
             f"Checked if symbol stage done file exists ({done_file}): {exists}"
         )
-        return exists
+        if not exists or fingerprint is None:
+            return exists
+        marker = self._read_marker(done_file)
+        return marker.get("fingerprint") == fingerprint
+
+    def read_symbol_stage_marker(
+        self,
+        stage: BacktestStage,
+        symbol: str,
+        strategy_name: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Optional[dict]:
+        """
+        The fingerprint and duration_sec the stage was marked done with for the
+        symbol: None if it is not done, empty if it was marked without them.
+        """
+        done_file = (
+            self.get_directory_path(
+                stage=stage,
+                strategy_name=strategy_name,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            / f"{stage.name}.{DataExtension.DONE.value}.csv"
+        )
+        if not done_file.exists():
+            return None
+        return self._read_marker(done_file)
+
+    def _read_marker(self, marker_file: Path) -> dict:
+        try:
+            marker = json.loads(marker_file.read_text() or "{}")
+        except (OSError, ValueError):
+            self.logger.warning(f"Unreadable marker file: {marker_file}")
+            return {}
+        return marker if isinstance(marker, dict) else {}
+
+    def hash_stage_data(
+        self,
+        stage: BacktestStage,
+        symbol: str,
+        strategy_name: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Optional[str]:
+        """Content hash of a symbol's staged data pages, or None if it has none."""
+        dir_path = self.get_directory_path(
+            stage=stage,
+            strategy_name=strategy_name,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if not dir_path.is_dir():
+            return None
+        pages = [
+            f
+            for f in dir_path.glob("*.csv")
+            if not any(f.name.endswith(f".{ext.value}.csv") for ext in DataExtension)
+        ]
+        return hash_files(pages) if pages else None
 
     def mark_stage(self, stage: BacktestStage, statusExtension: DataExtension) -> None:
         stage_path = self.get_stage_path(stage)
@@ -146,7 +215,14 @@ class StageDataManager:
         strategy_name: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        fingerprint: Optional[str] = None,
+        duration_sec: Optional[float] = None,
     ) -> None:
+        """
+        Mark the stage's status for the symbol. A fingerprint of the stage's
+        inputs (and how long the stage took) is kept in the marker so later
+        runs can tell whether the output is still current.
+        """
         stage_path = self.get_directory_path(
             stage=stage,
             strategy_name=strategy_name,
@@ -161,7 +237,12 @@ class StageDataManager:
                 marker_file.unlink()
                 self.logger.info(f"Removed old symbol marker file: {marker_file}")
         status_file = stage_path / f"{stage.name}.{statusExtension.value}.csv"
-        status_file.touch()
+        if fingerprint is None:
+            status_file.touch()
+        else:
+            status_file.write_text(
+                json.dumps({"fingerprint": fingerprint, "duration_sec": duration_sec})
+            )
         self.logger.info(f"Created new symbol marker file: {status_file}")
 
     def file_exists(
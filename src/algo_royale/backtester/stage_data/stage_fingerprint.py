@@ -0,0 +1,61 @@
+import hashlib
+import inspect
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+# Hex digits kept from each digest; enough to tell stage inputs apart
+FINGERPRINT_LENGTH = 16
+_CHUNK_BYTES = 1 << 20
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Fingerprint of a stage's inputs. Parts are hashed as canonical JSON, so
+    dict order does not matter and dates, enums and paths hash by their str.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def hash_files(paths: Iterable[Path]) -> str:
+    """Content hash of data files, independent of the order they are given in."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(p) for p in paths):
+        digest.update(path.name.encode())
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHUNK_BYTES):
+                digest.update(chunk)
+    return digest.hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def code_version(*objects: Any) -> str:
+    """
+    Hash of the source code behind the given classes and functions. A class
+    hashes with its algo_royale base classes, so editing a base condition
+    changes every condition built on it; a function hashes its whole module,
+    so the helpers it calls are covered too.
+    """
+    sources = []
+    for obj in objects:
+        if obj is None:
+            continue
+        if inspect.isclass(obj):
+            members = [
+                cls for cls in obj.__mro__ if cls.__module__.startswith("algo_royale")
+            ]
+        else:
+            obj = getattr(obj, "func", obj)  # functools.partial
+            members = [sys.modules.get(getattr(obj, "__module__", None)) or obj]
+        sources.extend(_source(member) for member in members)
+    return fingerprint(*sources)
+
+
+@lru_cache(maxsize=None)
+def _source(obj: Any) -> str:
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return getattr(obj, "__qualname__", type(obj).__qualname__)
@@ -4,6 +4,9 @@ from typing import AsyncIterator, Optional
 import pandas as pd
 
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.enums.frame_precision import FramePrecision
+from algo_royale.backtester.profiling.stage_profiler import StageProfiler
+from algo_royale.backtester.stage_data.frame_dtypes import to_stored_frame
 from algo_royale.backtester.stage_data.stage_data_manager import (
     StageDataManager,
 )
@@ -21,13 +24,19 @@ class StageDataWriter:
         logger: Loggable,
         stage_data_manager: StageDataManager,
         max_rows_per_file: int = 1_000_000,
+        stage_profiler: Optional[StageProfiler] = None,
+        precision: FramePrecision = FramePrecision.FULL,
     ):
         """
         Initialize the results saver with directory from config.
+        With FramePrecision.COMPACT, pages are written with float32 derived
+        columns and epoch-second timestamps.
         """
         self.stage_data_manager = stage_data_manager
         self.max_rows_per_file = max_rows_per_file
+        self.precision = FramePrecision(precision)
         self.logger = logger
+        self.stage_profiler = stage_profiler or StageProfiler(logger=logger)
 
     async def async_write_data_batches(
         self,
@@ -84,6 +93,8 @@ class StageDataWriter:
             results_df = results_df.assign(strategy=strategy_name)
         if "symbol" not in results_df.columns:
             results_df = results_df.assign(symbol=symbol)
+        if self.precision == FramePrecision.COMPACT:
+            results_df = to_stored_frame(results_df)
 
         total_rows = len(results_df)
         num_parts = ceil(total_rows / self.max_rows_per_file)
@@ -104,6 +115,7 @@ class StageDataWriter:
 
             try:
                 chunk_df.to_csv(filepath, index=False)
+                self.stage_profiler.add_files_written(1, rows=len(chunk_df))
                 self.logger.info(
                     f"Saved page{page_idx} chunk{chunk_idx + 1}/{num_parts} to {filepath}"
                 )
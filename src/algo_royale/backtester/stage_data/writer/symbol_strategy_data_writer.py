@@ -1,10 +1,13 @@
+import time
 from datetime import datetime
-from typing import AsyncIterator, Callable, Dict
+from typing import AsyncIterator, Callable, Dict, Optional
 
 import pandas as pd
 
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
 from algo_royale.backtester.enums.data_extension import DataExtension
+from algo_royale.backtester.enums.frame_precision import FramePrecision
+from algo_royale.backtester.profiling.stage_profiler import StageProfiler
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
 from algo_royale.backtester.stage_data.writer.stage_data_writer import StageDataWriter
 from algo_royale.logging.loggable import Loggable
@@ -18,6 +21,7 @@ class SymbolStrategyDataWriter:
         stage_data_manager: StageDataManager instance for managing stage data.
         data_writer: StageDataWriter instance for writing data to disk.
         logger: Loggable instance for logging information and errors.
+        stage_profiler: StageProfiler recording per-symbol write spans.
     """
 
     def __init__(
@@ -25,10 +29,17 @@ class SymbolStrategyDataWriter:
         stage_data_manager: StageDataManager,
         data_writer: StageDataWriter,
         logger: Loggable,
+        stage_profiler: Optional[StageProfiler] = None,
     ):
         self.stage_data_manager = stage_data_manager
         self.data_writer = data_writer
         self.logger = logger
+        self.stage_profiler = stage_profiler or StageProfiler(logger=logger)
+
+    @property
+    def precision(self) -> FramePrecision:
+        """Precision the stage's pages are written in."""
+        return self.data_writer.precision
 
     async def async_write_symbol_strategy_data_factory(
         self,
@@ -38,18 +49,29 @@ class SymbolStrategyDataWriter:
         ],
         start_date: datetime,
         end_date: datetime,
+        fingerprints: Optional[Dict[str, str]] = None,
     ):
-        """Write processed data to disk."""
+        """
+        Write processed data to disk. With fingerprints (symbol -> fingerprint
+        of the stage's inputs for it), a symbol already marked done with the
+        same fingerprint is skipped without calling its factories, and written
+        symbols are marked with theirs.
+        """
         self.logger.info(f"Writing data for stage: {stage}")
+        fingerprints = fingerprints or {}
         try:
             for symbol, strategy_factories in symbol_strategy_data_factory.items():
-                await self._write_symbol_data(
-                    stage=stage,
-                    symbol=symbol,
-                    start_date=start_date,
-                    end_date=end_date,
-                    strategy_factories=strategy_factories,
-                )
+                with self.stage_profiler.span(
+                    "write_symbol", stage=stage.name, symbol=symbol
+                ):
+                    await self._write_symbol_data(
+                        stage=stage,
+                        symbol=symbol,
+                        start_date=start_date,
+                        end_date=end_date,
+                        strategy_factories=strategy_factories,
+                        fingerprint=fingerprints.get(symbol),
+                    )
         except Exception as e:
             self._handle_global_write_error(stage=stage, e=e)
             return False
@@ -61,6 +83,7 @@ class SymbolStrategyDataWriter:
         start_date: datetime,
         end_date: datetime,
         strategy_factories: Dict[str, Callable[[], AsyncIterator[pd.DataFrame]]],
+        fingerprint: Optional[str] = None,
     ):
         """Write data for a specific symbol."""
         try:
@@ -73,6 +96,7 @@ class SymbolStrategyDataWriter:
                     start_date=start_date,
                     end_date=end_date,
                     df_iter_factory=df_iter_factory,
+                    fingerprint=fingerprint,
                 )
         except Exception as e:
             self._handle_symbol_write_error(stage=stage, symbol=symbol, e=e)
@@ -85,10 +109,24 @@ class SymbolStrategyDataWriter:
         start_date: datetime,
         end_date: datetime,
         df_iter_factory: Callable[[], AsyncIterator[pd.DataFrame]],
+        fingerprint: Optional[str] = None,
     ):
         """Write data for a specific strategy."""
         try:
-            if self.stage_data_manager.is_symbol_stage_done(
+            if fingerprint is not None:
+                if self.stage_data_manager.is_symbol_stage_done(
+                    stage=stage,
+                    strategy_name=strategy_name,
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    fingerprint=fingerprint,
+                ):
+                    self.logger.info(
+                        f"Skipping {symbol} for stage:{stage} | strategy:{strategy_name} for {start_date} to {end_date} (inputs unchanged, fingerprint {fingerprint})"
+                    )
+                    return
+            elif self.stage_data_manager.is_symbol_stage_done(
                 stage=stage, strategy_name=strategy_name, symbol=symbol
             ):
                 self.logger.info(
@@ -103,6 +141,7 @@ class SymbolStrategyDataWriter:
                 start_date=start_date,
                 end_date=end_date,
             )
+            started = time.perf_counter()
             gen = df_iter_factory()
             if not hasattr(gen, "__aiter__"):
                 raise TypeError(f"Expected async iterator, got {type(gen)}")
@@ -122,6 +161,8 @@ class SymbolStrategyDataWriter:
                 statusExtension=DataExtension.DONE,
                 start_date=start_date,
                 end_date=end_date,
+                fingerprint=fingerprint,
+                duration_sec=round(time.perf_counter() - started, 4),
             )
         except Exception as e:
             self._handle_strategy_write_error(
@@ -29,12 +29,23 @@ class SymbolStrategyManager:
         self.stage_data_manager = stage_data_manager
         self.symbol_strategy_evaluation_filename = symbol_strategy_evaluation_filename
         self.logger = logger
+        # symbol -> (evaluation file mtime, (strategy class, params) or None if not viable)
+        self._descriptor_cache: dict[str, tuple[float, Optional[tuple]]] = {}
 
     def get_optimized_strategy(self, symbol: str) -> Optional[Any]:
         """
         Uses stage_data_manager to resolve the symbol directory, loads evaluation_result.json, checks viability, and returns an initialized strategy instance or None.
+        The resolved strategy class and params are cached per symbol until the evaluation file changes.
         Logs key events if logger is provided.
         """
+        descriptor = self._get_strategy_descriptor(symbol)
+        if descriptor is None:
+            return None
+        strat_class, params = descriptor
+        return SignalStrategyFactory.build_strategy(strat_class, params)
+
+    def _get_strategy_descriptor(self, symbol: str) -> Optional[tuple]:
+        """Resolve the strategy class and params for a symbol, reusing the cached result."""
         symbol_dir = self.stage_data_manager.get_directory_path(
             base_dir=self.data_dir, symbol=symbol
         )
@@ -45,6 +56,17 @@ class SymbolStrategyManager:
                     f"Evaluation file not found for symbol: {symbol} at {eval_file}"
                 )
             return None
+        mtime = eval_file.stat().st_mtime
+        cached = self._descriptor_cache.get(symbol)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        descriptor = self._load_strategy_descriptor(symbol, eval_file)
+        self._descriptor_cache[symbol] = (mtime, descriptor)
+        return descriptor
+
+    def _load_strategy_descriptor(
+        self, symbol: str, eval_file: Path
+    ) -> Optional[tuple]:
         try:
             with open(eval_file, "r") as f:
                 data = json.load(f)
@@ -84,6 +106,6 @@ class SymbolStrategyManager:
             return None
         if self.logger:
             self.logger.debug(
-                f"Instantiating strategy '{strat_name}' for symbol {symbol} with params: {params} using StrategyFactory.build_strategy"
+                f"Resolved strategy '{strat_name}' for symbol {symbol} with params: {params}"
             )
-        return SignalStrategyFactory.build_strategy(strat_class, params)
+        return strat_class, params
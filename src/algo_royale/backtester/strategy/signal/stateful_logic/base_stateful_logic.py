@@ -1,11 +1,27 @@
 import itertools
 from typing import Optional
 
+import numpy as np
+import pandas as pd
 from optuna import Trial
 
+from algo_royale.backtester.enums.signal_type import SignalType
 from algo_royale.logging.loggable import Loggable
 
 
+def unique_mask_rows(masks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The distinct rows of a (combinations, rows) boolean mask matrix and, for
+    each combination, the index of its row among them.
+    """
+    if len(masks) <= 1:
+        return masks, np.zeros(len(masks), dtype=np.intp)
+    _, index, inverse = np.unique(
+        np.packbits(masks, axis=1), axis=0, return_index=True, return_inverse=True
+    )
+    return masks[index], inverse.reshape(-1)
+
+
 class StatefulLogic:
     """Base class for stateful logic in strategies.
     This class defines the interface for stateful logic components that can be used
@@ -49,6 +65,62 @@ class StatefulLogic:
         """
         raise NotImplementedError("Implement in subclass")
 
+    def apply_batch(
+        self,
+        df: pd.DataFrame,
+        entry_signals: np.ndarray,
+        exit_signals: np.ndarray,
+        trend_masks: np.ndarray,
+        filter_masks: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Run the logic over df for several signal combinations at once.
+        Args:
+            df: DataFrame
+            entry_signals: (combinations, rows) array of entry signals
+            exit_signals: (combinations, rows) array of exit signals
+            trend_masks: (combinations, rows) boolean trend masks
+            filter_masks: (combinations, rows) boolean filter masks
+        Returns:
+            (entry_signals, exit_signals): the updated signal arrays
+        The default calls the logic row by row for each combination, as
+        BaseSignalStrategy.generate_signals does; subclasses override it with
+        a pass that advances every combination's state together.
+        """
+        entry_out = entry_signals.copy()
+        exit_out = exit_signals.copy()
+        for k in range(len(entry_signals)):
+            trend_mask = pd.Series(trend_masks[k], index=df.index)
+            filter_mask = pd.Series(filter_masks[k], index=df.index)
+            state = {}
+            for i in range(len(df)):
+                entry_out[k, i], exit_out[k, i], state = self(
+                    i=i,
+                    df=df,
+                    entry_signal=entry_signals[k, i],
+                    exit_signal=exit_signals[k, i],
+                    state=state,
+                    trend_mask=trend_mask,
+                    filter_mask=filter_mask,
+                )
+        return entry_out, exit_out
+
+    def _has_required_columns(self, df: pd.DataFrame) -> bool:
+        return all(col in df.columns for col in self.required_columns)
+
+    @staticmethod
+    def _mark_transitions(
+        entry_signals: np.ndarray,
+        exit_signals: np.ndarray,
+        enters: np.ndarray,
+        exits: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Set BUY where a position was entered and SELL where one was exited."""
+        return (
+            np.where(enters, SignalType.BUY.value, entry_signals),
+            np.where(exits, SignalType.SELL.value, exit_signals),
+        )
+
     @property
     def required_columns(self):
         """Override in subclasses to add additional required columns."""
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from optuna import Trial
 
@@ -7,6 +8,7 @@ from algo_royale.backtester.column_names.strategy_columns import SignalStrategyC
 from algo_royale.backtester.enums.signal_type import SignalType
 from algo_royale.backtester.strategy.signal.stateful_logic.base_stateful_logic import (
     StatefulLogic,
+    unique_mask_rows,
 )
 from algo_royale.logging.loggable import Loggable
 
@@ -98,6 +100,52 @@ class MACDTrailingStatefulLogic(StatefulLogic):
 
         return new_entry_signal, new_exit_signal, state
 
+    def apply_batch(
+        self,
+        df: pd.DataFrame,
+        entry_signals: np.ndarray,
+        exit_signals: np.ndarray,
+        trend_masks: np.ndarray,
+        filter_masks: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The MACD is computed once, and as entries and exits depend only on
+        the trend mask, each distinct trend mask is simulated once, all of
+        them together."""
+        if not self._has_required_columns(df):
+            return entry_signals, exit_signals
+        masks, inverse = unique_mask_rows(trend_masks)
+        close = df[self.close_col]
+        exp1 = close.ewm(span=self.fast, adjust=False).mean()
+        exp2 = close.ewm(span=self.slow, adjust=False).mean()
+        macd = exp1 - exp2
+        signal_line = macd.ewm(span=self.signal, adjust=False).mean()
+        macd_prev = macd.shift(1).to_numpy(dtype=np.float64)
+        signal_prev = signal_line.shift(1).to_numpy(dtype=np.float64)
+        macd = macd.to_numpy(dtype=np.float64)
+        signal_line = signal_line.to_numpy(dtype=np.float64)
+        prices = close.to_numpy(dtype=np.float64)
+        masks_by_row = np.ascontiguousarray(masks.T)
+        enters = np.zeros_like(masks_by_row)
+        exits = np.zeros_like(masks_by_row)
+        in_position = np.zeros(len(masks), dtype=bool)
+        trailing_stop = np.full(len(masks), np.nan)
+        for i, price in enumerate(prices):
+            # Skip if not enough data
+            if np.isnan(macd[i]) or np.isnan(signal_line[i]):
+                continue
+            crossed_up = macd_prev[i] < signal_prev[i] and macd[i] > signal_line[i]
+            crossed_down = macd_prev[i] > signal_prev[i] and macd[i] < signal_line[i]
+            held = in_position
+            stop = price * (1 - self.stop_pct)
+            trailing_stop = np.where(held & (stop > trailing_stop), stop, trailing_stop)
+            exits[i] = held & (crossed_down | (price < trailing_stop))
+            enters[i] = ~held & crossed_up & masks_by_row[i]
+            in_position = (held & ~exits[i]) | enters[i]
+            trailing_stop = np.where(enters[i], stop, trailing_stop)
+        return self._mark_transitions(
+            entry_signals, exit_signals, enters.T[inverse], exits.T[inverse]
+        )
+
     @property
     def required_columns(self):
         """
@@ -1,11 +1,14 @@
 from typing import Optional
 
+import numpy as np
+import pandas as pd
 from optuna import Trial
 
 from algo_royale.backtester.column_names.strategy_columns import SignalStrategyColumns
 from algo_royale.backtester.enums.signal_type import SignalType
 from algo_royale.backtester.strategy.signal.stateful_logic.base_stateful_logic import (
     StatefulLogic,
+    unique_mask_rows,
 )
 from algo_royale.logging.loggable import Loggable
 
@@ -91,6 +94,53 @@ class MeanReversionStatefulLogic(StatefulLogic):
 
         return new_entry_signal, new_exit_signal, state
 
+    def apply_batch(
+        self,
+        df: pd.DataFrame,
+        entry_signals: np.ndarray,
+        exit_signals: np.ndarray,
+        trend_masks: np.ndarray,
+        filter_masks: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Entries and exits depend only on the trend mask, so each distinct
+        trend mask is simulated once, all of them together."""
+        if not self._has_required_columns(df):
+            return entry_signals, exit_signals
+        masks, inverse = unique_mask_rows(trend_masks)
+        close = df[self.close_col]
+        ma = close.rolling(window=self.window, min_periods=1).mean()
+        deviations = ((close - ma) / ma).to_numpy(dtype=np.float64)
+        prices = close.to_numpy(dtype=np.float64)
+        masks_by_row = np.ascontiguousarray(masks.T)
+        enters = np.zeros_like(masks_by_row)
+        exits = np.zeros_like(masks_by_row)
+        in_position = np.zeros(len(masks), dtype=bool)
+        entry_price = np.full(len(masks), np.nan)
+        trailing_stop = np.full(len(masks), np.nan)
+        last_exit_idx = np.full(len(masks), -self.reentry_cooldown)
+        for i, (price, deviation) in enumerate(zip(prices, deviations)):
+            held = in_position
+            stop = price * (1 - self.stop_pct)
+            trailing_stop = np.where(held & (stop > trailing_stop), stop, trailing_stop)
+            exits[i] = held & (
+                (deviation > self.threshold)
+                | (price < trailing_stop)
+                | (price >= entry_price * (1 + self.profit_target_pct))
+            )
+            enters[i] = (
+                ~held
+                & ((i - last_exit_idx) > self.reentry_cooldown)
+                & (deviation < -self.threshold)
+                & masks_by_row[i]
+            )
+            last_exit_idx = np.where(exits[i], i, last_exit_idx)
+            in_position = (held & ~exits[i]) | enters[i]
+            entry_price = np.where(enters[i], price, entry_price)
+            trailing_stop = np.where(enters[i], stop, trailing_stop)
+        return self._mark_transitions(
+            entry_signals, exit_signals, enters.T[inverse], exits.T[inverse]
+        )
+
     @property
     def required_columns(self):
         """Override to specify required columns for mean reversion logic."""
@@ -1,11 +1,14 @@
 from typing import Optional
 
+import numpy as np
+import pandas as pd
 from optuna import Trial
 
 from algo_royale.backtester.column_names.strategy_columns import SignalStrategyColumns
 from algo_royale.backtester.enums.signal_type import SignalType
 from algo_royale.backtester.strategy.signal.stateful_logic.base_stateful_logic import (
     StatefulLogic,
+    unique_mask_rows,
 )
 from algo_royale.logging.loggable import Loggable
 
@@ -56,6 +59,38 @@ class TrailingStopStatefulLogic(StatefulLogic):
 
         return new_entry_signal, new_exit_signal, state
 
+    def apply_batch(
+        self,
+        df: pd.DataFrame,
+        entry_signals: np.ndarray,
+        exit_signals: np.ndarray,
+        trend_masks: np.ndarray,
+        filter_masks: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Entries and stops depend only on the masks, so each distinct
+        trend & filter mask is simulated once, all of them together."""
+        if not self._has_required_columns(df):
+            return entry_signals, exit_signals
+        masks, inverse = unique_mask_rows(trend_masks & filter_masks)
+        prices = df[self.close_col].to_numpy(dtype=np.float64)
+        masks_by_row = np.ascontiguousarray(masks.T)
+        enters = np.zeros_like(masks_by_row)
+        exits = np.zeros_like(masks_by_row)
+        in_position = np.zeros(len(masks), dtype=bool)
+        trailing_high = np.full(len(masks), np.nan)
+        for i, price in enumerate(prices):
+            held = in_position
+            trailing_high = np.where(
+                held & (price > trailing_high), price, trailing_high
+            )
+            exits[i] = held & (price < trailing_high * (1 - self.stop_pct))
+            enters[i] = ~held & masks_by_row[i]
+            in_position = (held & ~exits[i]) | enters[i]
+            trailing_high = np.where(enters[i], price, trailing_high)
+        return self._mark_transitions(
+            entry_signals, exit_signals, enters.T[inverse], exits.T[inverse]
+        )
+
     @property
     def required_columns(self):
         return [self.close_col]
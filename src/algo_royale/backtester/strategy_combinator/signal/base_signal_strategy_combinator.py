@@ -1,8 +1,35 @@
-from typing import Type
+from itertools import product
+from typing import Iterator, Optional, Type
 
+import pandas as pd
+
+from algo_royale.backtester.stage_data.stage_fingerprint import code_version
 from algo_royale.backtester.strategy.signal.base_signal_strategy import (
     BaseSignalStrategy,
 )
+from algo_royale.backtester.strategy_combinator.signal.combination_signal_matrix import (
+    CombinationSignalMatrix,
+    ConditionCombination,
+)
+
+
+def _condition_options(types, logger, max_count, allow_empty):
+    conds = []
+    for t in types:
+        if hasattr(t, "all_possible_conditions"):
+            try:
+                # Some all_possible_conditions require logger, some don't
+                try:
+                    c = t.all_possible_conditions(logger)
+                except TypeError:
+                    c = t.all_possible_conditions()
+                conds.extend(c)
+            except Exception:
+                continue
+    conds = conds[:max_count]
+    if allow_empty:
+        conds = conds + [None]
+    return conds
 
 
 class SignalStrategyCombinator:
@@ -24,37 +51,19 @@ class SignalStrategyCombinator:
         exit_types = getattr(cls, "exit_condition_types", [None])
         stateful_types = getattr(cls, "stateful_logic_types", [None])
 
-        def get_conditions(types, logger, max_count, allow_empty):
-            conds = []
-            for t in types:
-                if hasattr(t, "all_possible_conditions"):
-                    try:
-                        # Some all_possible_conditions require logger, some don't
-                        try:
-                            c = t.all_possible_conditions(logger)
-                        except TypeError:
-                            c = t.all_possible_conditions()
-                        conds.extend(c)
-                    except Exception:
-                        continue
-            conds = conds[:max_count]
-            if allow_empty:
-                conds = conds + [None]
-            return conds
-
-        filter_conds = get_conditions(
+        filter_conds = _condition_options(
             filter_types, logger, max_filter, getattr(cls, "allow_empty_filter", False)
         )
-        entry_conds = get_conditions(
+        entry_conds = _condition_options(
             entry_types, logger, max_entry, getattr(cls, "allow_empty_entry", False)
         )
-        trend_conds = get_conditions(
+        trend_conds = _condition_options(
             trend_types, logger, max_trend, getattr(cls, "allow_empty_trend", False)
         )
-        exit_conds = get_conditions(
+        exit_conds = _condition_options(
             exit_types, logger, max_exit, getattr(cls, "allow_empty_exit", False)
         )
-        stateful_conds = get_conditions(
+        stateful_conds = _condition_options(
             stateful_types,
             logger,
             max_stateful_logic,
@@ -63,8 +72,6 @@ class SignalStrategyCombinator:
         if not stateful_conds:
             stateful_conds = [None]
 
-        from itertools import product
-
         strategy_class = getattr(cls, "strategy_class", None)
         for f, e, t, x, s in product(
             filter_conds, entry_conds, trend_conds, exit_conds, stateful_conds
@@ -115,7 +122,90 @@ class SignalStrategyCombinator:
             "entry": self.entry_condition_types or [],
             "trend": self.trend_condition_types or [],
             "exit": self.exit_condition_types or [],
-            "stateful_logic": self.stateful_logic_types[0]
-            if self.stateful_logic_types
-            else None,
+            "stateful_logic": (
+                self.stateful_logic_types[0] if self.stateful_logic_types else None
+            ),
         }
+
+    def condition_combinations(
+        self,
+        logger,
+        max_filter: Optional[int] = None,
+        max_entry: Optional[int] = None,
+        max_trend: Optional[int] = None,
+        max_exit: Optional[int] = None,
+        max_stateful_logic: Optional[int] = None,
+    ) -> Iterator[ConditionCombination]:
+        """
+        The cartesian product of this combinator's possible filter, trend,
+        entry and exit conditions and stateful logic, taking at most max_* of
+        each kind (all of them by default). A kind without condition types is
+        left empty.
+        """
+
+        def options(types, max_count, allow_empty):
+            conds = _condition_options(types or [], logger, max_count, allow_empty)
+            return conds or [None]
+
+        filter_conds = options(
+            self.filter_condition_types,
+            max_filter,
+            getattr(self, "allow_empty_filter", False),
+        )
+        trend_conds = options(
+            self.trend_condition_types,
+            max_trend,
+            getattr(self, "allow_empty_trend", False),
+        )
+        entry_conds = options(
+            self.entry_condition_types,
+            max_entry,
+            getattr(self, "allow_empty_entry", False),
+        )
+        exit_conds = options(
+            self.exit_condition_types,
+            max_exit,
+            getattr(self, "allow_empty_exit", False),
+        )
+        stateful_conds = options(
+            self.stateful_logic_types,
+            max_stateful_logic,
+            getattr(self, "allow_empty_stateful_logic", False),
+        )
+        for f, t, e, x, s in product(
+            filter_conds, trend_conds, entry_conds, exit_conds, stateful_conds
+        ):
+            yield ConditionCombination(
+                filter_conditions=(f,) if f is not None else (),
+                trend_conditions=(t,) if t is not None else (),
+                entry_conditions=(e,) if e is not None else (),
+                exit_conditions=(x,) if x is not None else (),
+                stateful_logic=s,
+            )
+
+    def combination_signals(
+        self, df: pd.DataFrame, logger, **max_counts
+    ) -> CombinationSignalMatrix:
+        """
+        Signals of every condition combination over df, evaluating each
+        distinct condition once instead of running generate_signals per
+        combination. max_counts are passed to condition_combinations.
+        """
+        return CombinationSignalMatrix(
+            df, self.condition_combinations(logger, **max_counts), logger=logger
+        )
+
+    def code_version(self) -> str:
+        """Hash of the source of the combinator, its strategy and condition classes."""
+        condition_types = [
+            condition_type
+            for types in (
+                self.filter_condition_types,
+                self.entry_condition_types,
+                self.trend_condition_types,
+                self.exit_condition_types,
+                self.stateful_logic_types,
+            )
+            for condition_type in types or []
+        ]
+        return code_version(type(self), self.strategy_class, *condition_types)
@@ -0,0 +1,346 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.column_names.strategy_columns import SignalStrategyColumns
+from algo_royale.backtester.enums.signal_type import SignalType
+from algo_royale.backtester.evaluator.backtest.signal_backtest_evaluator import (
+    SignalBacktestEvaluator,
+)
+from algo_royale.backtester.strategy.signal.base_signal_strategy import (
+    BaseSignalStrategy,
+)
+from algo_royale.logging.loggable import Loggable
+
+# Signal values are stored as int8 codes into this table, HOLD being 0
+SIGNAL_VALUES = [SignalType.HOLD.value] + [
+    signal.value for signal in SignalType if signal is not SignalType.HOLD
+]
+HOLD = 0
+BUY = SIGNAL_VALUES.index(SignalType.BUY.value)
+SELL = SIGNAL_VALUES.index(SignalType.SELL.value)
+
+# Combinations handed to a stateful logic's batched pass at a time, bounding
+# the signal arrays it works on
+STATEFUL_BATCH_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ConditionCombination:
+    """The conditions of one signal strategy; any of them may be empty."""
+
+    filter_conditions: tuple = ()
+    trend_conditions: tuple = ()
+    entry_conditions: tuple = ()
+    exit_conditions: tuple = ()
+    stateful_logic: Optional[object] = None
+
+    @classmethod
+    def from_strategy(cls, strategy: BaseSignalStrategy) -> "ConditionCombination":
+        return cls(
+            filter_conditions=tuple(strategy.filter_conditions),
+            trend_conditions=tuple(strategy.trend_conditions),
+            entry_conditions=tuple(strategy.entry_conditions),
+            exit_conditions=tuple(strategy.exit_conditions),
+            stateful_logic=strategy.stateful_logic,
+        )
+
+    @property
+    def conditions(self) -> tuple:
+        return (
+            self.filter_conditions
+            + self.trend_conditions
+            + self.entry_conditions
+            + self.exit_conditions
+        )
+
+    @property
+    def required_columns(self) -> set:
+        required = set()
+        for func in self.conditions + (
+            (self.stateful_logic,) if self.stateful_logic is not None else ()
+        ):
+            if hasattr(func, "required_columns"):
+                required.update(func.required_columns)
+        return required
+
+    def get_id(self) -> str:
+        def ids(conditions):
+            return [c.get_id() if hasattr(c, "get_id") else repr(c) for c in conditions]
+
+        stateful = self.stateful_logic
+        params = {
+            "entry_conditions": ids(self.entry_conditions),
+            "exit_conditions": ids(self.exit_conditions),
+            "trend_conditions": ids(self.trend_conditions),
+            "filter_conditions": ids(self.filter_conditions),
+            "stateful_logic": ids([stateful])[0] if stateful is not None else None,
+        }
+        param_str = ",".join(f"{k}={repr(v)}" for k, v in sorted(params.items()))
+        return f"{self.__class__.__name__}({param_str})"
+
+
+class CombinationSignalMatrix:
+    """
+    Entry and exit signals of many condition combinations over one frame,
+    matching what BaseSignalStrategy.generate_signals gives for each of them.
+    Every distinct condition (by get_id) is applied to the frame once; each
+    combination's signals are then composed from those results with array
+    operations, and each stateful logic runs one batched pass over all the
+    combinations that use it. Signals are kept as int8 codes into
+    SIGNAL_VALUES, one row per combination.
+
+    Combinations can also be added one at a time, as an optimizer's trials
+    suggest them: row() looks a combination up by its id and adds it if new,
+    applying only the conditions no earlier combination used.
+
+    Parameters:
+        df: The feature frame.
+        combinations: The condition combinations to evaluate.
+        logger: Loggable instance for logging information and errors.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        combinations: Iterable[ConditionCombination] = (),
+        logger: Optional[Loggable] = None,
+    ):
+        self.logger = logger
+        self.combinations: list[ConditionCombination] = []
+        self.index = df.index
+        self.frame = df.copy()
+        self.conditions_applied = 0
+        self._coerced: set = set()
+        self._outputs: dict[str, Optional[pd.Series]] = {}
+        self._signal_codes: dict[tuple, np.ndarray] = {}
+        # Combined filter and trend masks are shared by combinations
+        self._masks: dict[tuple, np.ndarray] = {}
+        self._mask_keys: list[Optional[tuple]] = []
+        self._rows: dict[str, int] = {}
+        combinations = list(combinations)
+        self._entry = np.zeros((len(combinations), len(df)), dtype=np.int8)
+        self._exit = np.zeros((len(combinations), len(df)), dtype=np.int8)
+        self._valid = np.zeros(len(combinations), dtype=bool)
+        self.add(combinations)
+
+    def __len__(self) -> int:
+        return len(self.combinations)
+
+    @property
+    def entry_signals(self) -> np.ndarray:
+        return self._entry[: len(self.combinations)]
+
+    @property
+    def exit_signals(self) -> np.ndarray:
+        return self._exit[: len(self.combinations)]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Combinations missing a column or whose conditions failed stay HOLD."""
+        return self._valid[: len(self.combinations)]
+
+    def row(self, combination: ConditionCombination) -> int:
+        """A combination's row, adding it to the matrix if it is new."""
+        return self.add([combination])[0]
+
+    def add(self, combinations: Iterable[ConditionCombination]) -> list[int]:
+        """
+        Rows of the combinations, looked up by get_id. Combinations not in the
+        matrix yet are added and their signals computed.
+        """
+        rows, added = [], []
+        for combination in combinations:
+            key = combination.get_id()
+            if key not in self._rows:
+                self._rows[key] = len(self.combinations)
+                self.combinations.append(combination)
+                self._mask_keys.append(None)
+                added.append(self._rows[key])
+            rows.append(self._rows[key])
+        if added:
+            self._reserve(len(self.combinations))
+            self._coerce_required_columns(added)
+            for k in added:
+                self._compose(k)
+            self._apply_stateful_logic(added)
+        return rows
+
+    def _reserve(self, count: int):
+        """Grow the signal arrays to hold count combinations, doubling capacity."""
+        capacity = len(self._valid)
+        if count <= capacity:
+            return
+        capacity = max(count, 2 * capacity)
+        rows = len(self.index)
+        entry = np.zeros((capacity, rows), dtype=np.int8)
+        exit_ = np.zeros((capacity, rows), dtype=np.int8)
+        valid = np.zeros(capacity, dtype=bool)
+        used = len(self._valid)
+        entry[:used], exit_[:used], valid[:used] = self._entry, self._exit, self._valid
+        self._entry, self._exit, self._valid = entry, exit_, valid
+
+    def _compose(self, k: int):
+        """Compose a combination's signals from the shared condition results."""
+        combination = self.combinations[k]
+        if not combination.required_columns <= set(self.frame.columns):
+            return
+        try:
+            filter_key = self._mask(combination.filter_conditions)
+            trend_key = self._mask(combination.trend_conditions)
+            entry = self._signal(combination.entry_conditions, BUY)
+            exit_ = self._signal(combination.exit_conditions, SELL)
+        except _ConditionFailed:
+            return
+        # Only allow entry signals where both filter and trend masks are True
+        self._entry[k] = np.where(
+            self._masks[filter_key] & self._masks[trend_key], entry, HOLD
+        )
+        self._exit[k] = exit_
+        self._valid[k] = True
+        self._mask_keys[k] = (filter_key, trend_key)
+
+    def _coerce_required_columns(self, rows: list[int]):
+        """Make the required columns numeric once, as generate_signals does per strategy."""
+        columns = set()
+        for k in rows:
+            columns |= self.combinations[k].required_columns
+        for col in columns - self._coerced:
+            if col in self.frame.columns:
+                self.frame[col] = pd.to_numeric(self.frame[col], errors="coerce")
+        self._coerced |= columns
+
+    @staticmethod
+    def _key(condition) -> str:
+        return condition.get_id() if hasattr(condition, "get_id") else repr(condition)
+
+    def _apply(self, condition) -> pd.Series:
+        """A condition's output, computed on first use."""
+        key = self._key(condition)
+        if key not in self._outputs:
+            try:
+                self._outputs[key] = condition.apply(self.frame)
+                self.conditions_applied += 1
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error applying condition {key}: {e}")
+                self._outputs[key] = None
+        if self._outputs[key] is None:
+            raise _ConditionFailed(key)
+        return self._outputs[key]
+
+    def _mask(self, conditions: tuple) -> tuple:
+        """Key of the conditions' combined mask, computing the mask on first use."""
+        key = tuple(self._key(condition) for condition in conditions)
+        if key not in self._masks:
+            mask = pd.Series(True, index=self.index)
+            for condition in conditions:
+                mask &= self._apply(condition)
+            self._masks[key] = mask.to_numpy(dtype=bool)
+        return key
+
+    def _signal(self, conditions: tuple, signal: int) -> np.ndarray:
+        """Later conditions' non-HOLD signals override earlier ones."""
+        codes = None
+        for condition in conditions:
+            condition_codes = self._codes(condition, signal)
+            codes = (
+                condition_codes
+                if codes is None
+                else np.where(condition_codes != HOLD, condition_codes, codes)
+            )
+        if codes is None:
+            return np.full(len(self.index), HOLD, dtype=np.int8)
+        return codes
+
+    def _codes(self, condition, signal: int) -> np.ndarray:
+        """A condition's output as signal codes; True maps to the given signal."""
+        key = (self._key(condition), signal)
+        if key not in self._signal_codes:
+            output = self._apply(condition)
+            if output.dtype == bool:
+                codes = np.where(output.to_numpy(), signal, HOLD).astype(np.int8)
+            else:
+                codes = self._encode(output.to_numpy())
+            self._signal_codes[key] = codes
+        return self._signal_codes[key]
+
+    @staticmethod
+    def _encode(values: np.ndarray) -> np.ndarray:
+        codes = np.full(values.shape, HOLD, dtype=np.int8)
+        for code, value in enumerate(SIGNAL_VALUES):
+            if code != HOLD:
+                codes[values == value] = code
+        return codes
+
+    def _apply_stateful_logic(self, rows: list[int]):
+        groups: dict[str, list[int]] = {}
+        logics = {}
+        for k in rows:
+            logic = self.combinations[k].stateful_logic
+            if logic is None or not self.valid[k]:
+                continue
+            key = logic.get_id()
+            groups.setdefault(key, []).append(k)
+            logics[key] = logic
+        values = np.array(SIGNAL_VALUES, dtype=object)
+        for key, members in groups.items():
+            for start in range(0, len(members), STATEFUL_BATCH_SIZE):
+                batch = members[start : start + STATEFUL_BATCH_SIZE]
+                filter_masks = np.array(
+                    [self._masks[self._mask_keys[k][0]] for k in batch]
+                )
+                trend_masks = np.array(
+                    [self._masks[self._mask_keys[k][1]] for k in batch]
+                )
+                try:
+                    entry, exit_ = logics[key].apply_batch(
+                        df=self.frame,
+                        entry_signals=values[self.entry_signals[batch]],
+                        exit_signals=values[self.exit_signals[batch]],
+                        trend_masks=trend_masks,
+                        filter_masks=filter_masks,
+                    )
+                    self.entry_signals[batch] = self._encode(entry)
+                    self.exit_signals[batch] = self._encode(exit_)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"Error applying stateful logic {key}: {e}")
+                    self.entry_signals[batch] = HOLD
+                    self.exit_signals[batch] = HOLD
+                    self.valid[batch] = False
+
+    def signals(self, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """A combination's entry and exit signals as SignalType values."""
+        values = np.array(SIGNAL_VALUES, dtype=object)
+        return values[self.entry_signals[k]], values[self.exit_signals[k]]
+
+    def signals_frame(self, k: int, columns: Optional[list] = None) -> pd.DataFrame:
+        """
+        The frame generate_signals would return for a combination: the
+        (coerced) feature columns, or just the given ones, with its signals.
+        """
+        frame = self.frame if columns is None else self.frame[columns]
+        entry, exit_ = self.signals(k)
+        return frame.assign(
+            **{
+                SignalStrategyColumns.ENTRY_SIGNAL: entry,
+                SignalStrategyColumns.EXIT_SIGNAL: exit_,
+            }
+        )
+
+    def evaluate(self, evaluator: SignalBacktestEvaluator) -> list[dict]:
+        """Backtest metrics of every combination, in order."""
+        columns = [SignalStrategyColumns.TIMESTAMP, SignalStrategyColumns.CLOSE_PRICE]
+        metrics = []
+        for k in range(len(self.combinations)):
+            evaluation = evaluator.stream(strategy=None)
+            evaluation.add_signals(self.signals_frame(k, columns))
+            metrics.append(evaluation.metrics())
+        return metrics
+
+
+class _ConditionFailed(Exception):
+    pass
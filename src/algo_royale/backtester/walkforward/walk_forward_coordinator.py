@@ -1,11 +1,16 @@
 import asyncio
+import copy
+import multiprocessing
 import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Optional
 
 from matplotlib.dates import relativedelta
 
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.profiling.stage_profiler import StageProfiler
 from algo_royale.backtester.stage_coordinator.data_staging.data_ingest_stage_coordinator import (
     DataIngestStageCoordinator,
 )
@@ -19,7 +24,12 @@ from algo_royale.backtester.stage_coordinator.testing.base_testing_stage_coordin
     BaseTestingStageCoordinator,
 )
 from algo_royale.backtester.stage_data.loader.stage_data_loader import StageDataLoader
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
 from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.walkforward.walk_forward_window_worker import (
+    init_window_worker,
+    run_window_in_worker,
+)
 from algo_royale.logging.loggable import Loggable
 from algo_royale.services.clock_service import ClockService
 
@@ -28,6 +38,38 @@ if TYPE_CHECKING:
 
 
 class WalkForwardCoordinator:
+    """
+    Runs the backtest pipeline over rolling train/test windows.
+
+    Parameters:
+        stage_data_manager: Manager for stage data paths.
+        stage_data_loader: Loader for staged data and the watchlist.
+        data_ingest_stage_coordinator: Coordinator for the data ingest stage.
+        feature_engineering_stage_coordinator: Coordinator for feature engineering.
+        optimization_stage_coordinator: Coordinator optimizing a train window.
+        testing_stage_coordinator: Coordinator testing a window's best params.
+        logger: Loggable instance for logging information and errors.
+        clock_service: Clock giving the end date of the latest window.
+        walk_forward_n_trials: Number of windows.
+        walk_forward_window_size: Years in each train and test window.
+        stage_profiler: Optional profiler for window and stage spans.
+        max_workers: Windows optimized and tested at once; 0 or less uses the
+            CPU count.
+        window_worker_builder: Picklable callable building this coordinator
+            anew from the application config. Parallel windows need it: each
+            worker process builds its own coordinator with it.
+
+    Parallel windows run in a spawned process pool, so Python-bound
+    optimization scales with the cores. Each worker builds its own
+    containers and stage coordinators once; a window crosses
+    the process boundary as its dates and comes back as its result and
+    profile spans, while the stage data itself stays on disk.
+    """
+
+    OK = "ok"
+    FAILED = "failed"
+    ERROR = "error"
+
     def __init__(
         self,
         stage_data_manager: StageDataManager,
@@ -40,6 +82,9 @@ class WalkForwardCoordinator:
         clock_service: ClockService,
         walk_forward_n_trials: int = 5,
         walk_forward_window_size: int = 1,
+        stage_profiler: Optional[StageProfiler] = None,
+        max_workers: int = 1,
+        window_worker_builder: Optional[Callable[[], "WalkForwardCoordinator"]] = None,
     ):
         self.stage_data_loader = stage_data_loader
         self.stage_data_manager = stage_data_manager
@@ -53,6 +98,10 @@ class WalkForwardCoordinator:
         self.walk_forward_n_trials = walk_forward_n_trials
         self.walk_forward_window_size = walk_forward_window_size
         self.clock_service = clock_service
+        self.stage_profiler = stage_profiler or StageProfiler(logger=logger)
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.window_worker_builder = window_worker_builder
+        self.window_results: list[dict] = []
 
     async def run_async(self):
         try:
@@ -97,151 +146,303 @@ class WalkForwardCoordinator:
         window_size: int,
         end_date: datetime | None = None,
     ):
+        """
+        Run every walk-forward window. The data for all windows is staged
+        first, each distinct date range once, then the windows are optimized
+        and tested on up to `max_workers` workers. `window_results` holds one
+        result per window in window order; a failing window does not stop the others.
+        """
         try:
             if end_date is None:
                 end_date = self.clock_service.now()
             # Go back n_trials + 1 years for the initial train window
-            for window in self.walk_forward_windows(
+            windows = self.walk_forward_windows(
                 end_date=end_date, n_trials=n_trials, window_size=window_size
-            ):
-                try:
-                    train_start = window["train_start"]
-                    train_end = window["train_end"]
-                    test_start = window["test_start"]
-                    test_end = window["test_end"]
-
-                    # Optionally: log or print the window
-                    self.logger.info(
-                        f"Train {train_start.date()} to {train_end.date()}, "
-                        f"Test {test_start.date()} to {test_end.date()}"
-                    )
-                    # Run the pipeline for this window
-                    window_result = await self._run_window(
-                        train_start=train_start,
-                        train_end=train_end,
-                        test_start=test_start,
-                        test_end=test_end,
-                    )
-                    if not window_result:
-                        self.logger.error(
-                            f"Walk-forward failed: "
-                            f"Train {train_start.date()} to {train_end.date()}, "
-                            f"Test {test_start.date()} to {test_end.date()}"
-                        )
-                        continue  # Skip to the next window
-                    self.logger.info("Walk-forward completed successfully")
-                except Exception as e:
-                    self.logger.error(
-                        f"Walk-forward failed for window {train_start.date()} to {train_end.date()}: {e}"
-                    )
-                    continue
+            )
+            staged = await self._stage_windows(windows)
+            self.window_results = await self._run_windows(windows, staged)
+            failed = [r for r in self.window_results if r["status"] != self.OK]
+            self.logger.info(
+                f"Walk-forward windows finished: {len(windows) - len(failed)} succeeded, {len(failed)} failed"
+            )
             return True
         except Exception as e:
             self.logger.error(f"Walk-forward failed: {e}")
             return False
 
-    async def _run_window(self, train_start, train_end, test_start, test_end):
-        """Run the pipeline for a single walk-forward window."""
-        self.logger.info(
-            f"Walk-forward: Train: {train_start.date()} to {train_end.date()} | Test: {test_start.date()} to {test_end.date()}"
+    def plan_rebuild(self, end_date: datetime | None = None) -> RebuildPlan:
+        """
+        Dry run of run_walk_forward: which stage outputs would be rebuilt and
+        which reused, in the order the run builds them, without running any
+        stage. Only stages that fingerprint their inputs are planned.
+        """
+        if end_date is None:
+            end_date = self.clock_service.now()
+        windows = self.walk_forward_windows(
+            end_date=end_date,
+            n_trials=self.walk_forward_n_trials,
+            window_size=self.walk_forward_window_size,
         )
-        # Data ingest for train window
-        self.logger.info(
-            f"Running data ingest for train window: {train_start.date()} to {train_end.date()}"
+        symbols = list(self.stage_data_loader.get_watchlist() or [])
+        plan = RebuildPlan()
+        planned_ranges = set()
+        for window in windows:
+            for date_range in (
+                (window["train_start"], window["train_end"]),
+                (window["test_start"], window["test_end"]),
+            ):
+                if date_range in planned_ranges:
+                    continue
+                planned_ranges.add(date_range)
+                self.data_ingest_stage_coordinator.plan_rebuild(*date_range, plan)
+                self.feature_engineering_stage_coordinator.plan_rebuild(
+                    symbols, *date_range, plan
+                )
+        plan_optimization = getattr(
+            self.optimization_stage_coordinator, "plan_rebuild", None
         )
-        ingest_success = await self.data_ingest_stage_coordinator.run(
-            start_date=train_start, end_date=train_end
+        plan_testing = getattr(self.testing_stage_coordinator, "plan_rebuild", None)
+        for window in windows:
+            if plan_optimization:
+                plan_optimization(
+                    symbols, window["train_start"], window["train_end"], plan
+                )
+            if plan_testing:
+                plan_testing(
+                    symbols,
+                    window["train_start"],
+                    window["train_end"],
+                    window["test_start"],
+                    window["test_end"],
+                    plan,
+                )
+        return plan
+
+    async def _stage_windows(self, windows: list[dict]) -> dict[tuple, bool]:
+        """
+        Ingest and feature-engineer the data of every window on the event loop.
+        Consecutive windows share ranges (one window's test range is a later
+        window's train range), so each distinct range is staged once.
+        :return: Whether each (start, end) range was staged successfully.
+        """
+        staged: dict[tuple, bool] = {}
+        for window in windows:
+            for start_key, end_key in (
+                ("train_start", "train_end"),
+                ("test_start", "test_end"),
+            ):
+                date_range = (window[start_key], window[end_key])
+                if date_range in staged:
+                    continue
+                try:
+                    staged[date_range] = await self._stage_range(*date_range)
+                except Exception as e:
+                    self.logger.error(
+                        f"Data staging failed for {date_range[0].date()} to {date_range[1].date()}: {e}"
+                    )
+                    staged[date_range] = False
+        return staged
+
+    async def _stage_range(self, start_date: datetime, end_date: datetime) -> bool:
+        """Run data ingest and feature engineering for one date range."""
+        self.logger.info(
+            f"Running data ingest for window: {start_date.date()} to {end_date.date()}"
         )
+        with self._stage_span(self.data_ingest_stage_coordinator, start_date, end_date):
+            ingest_success = await self.data_ingest_stage_coordinator.run(
+                start_date=start_date, end_date=end_date
+            )
         if not ingest_success:
             self.logger.error(
-                f"Data ingest stage failed for train window: {train_start.date()} to {train_end.date()}"
+                f"Data ingest stage failed for window: {start_date.date()} to {end_date.date()}"
             )
-            # If ingest fails, skip the rest of the pipeline
             return False
-        # Check if data has been ingested for the test window
-        if not self.has_ingested_data(train_start, train_end):
+        if not self.has_ingested_data(start_date, end_date):
             self.logger.error(
-                f"Data not ingested for train window: {train_start.date()} to {train_end.date()}"
+                f"Data not ingested for window: {start_date.date()} to {end_date.date()}"
             )
             return False
 
-        # Feature engineering for train window
         self.logger.info(
-            f"Running feature engineering for train window: {train_start.date()} to {train_end.date()}"
-        )
-        fe_success = await self.feature_engineering_stage_coordinator.run(
-            start_date=train_start, end_date=train_end
+            f"Running feature engineering for window: {start_date.date()} to {end_date.date()}"
         )
+        with self._stage_span(
+            self.feature_engineering_stage_coordinator, start_date, end_date
+        ):
+            fe_success = await self.feature_engineering_stage_coordinator.run(
+                start_date=start_date, end_date=end_date
+            )
         if not fe_success:
             self.logger.error("Feature engineering stage failed")
             return False
+        return True
 
-        # Optimize on train window
-        self.logger.info(
-            f"Running optimization for train window: {train_start.date()} to {train_end.date()}"
-        )
-        optimization_success = await self.optimization_stage_coordinator.run(
-            start_date=train_start, end_date=train_end
-        )
-        self.logger.debug(
-            f"Optimization results for window {train_start.date()} to {train_end.date()}: {optimization_success}"
-        )
-        if not optimization_success:
-            self.logger.error("Optimization stage failed")
-            return False
-
-        # Data ingest for test window
-        self.logger.info(
-            f"Running data ingest for test window: {test_start.date()} to {test_end.date()}"
-        )
-        ingest_success = await self.data_ingest_stage_coordinator.run(
-            start_date=test_start, end_date=test_end
-        )
-        if not ingest_success:
-            self.logger.error(
-                f"Data ingest stage failed for test window: {test_start.date()} to {test_end.date()}"
+    async def _run_windows(
+        self, windows: list[dict], staged: dict[tuple, bool]
+    ) -> list[dict]:
+        """
+        Run the windows, on a spawned process pool when more than one worker
+        is allowed and a worker builder is set, else one after the other here.
+        :return: One result per window, in window order.
+        """
+        workers = min(self.max_workers, len(windows))
+        if workers <= 1 or self.window_worker_builder is None:
+            if workers > 1:
+                self.logger.warning(
+                    "No window worker builder set, running walk-forward windows one at a time"
+                )
+            return [await self._run_window_worker(window, staged) for window in windows]
+        # Spawned workers do not inherit locks held by other threads of this process
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_window_worker,
+            initargs=(self.window_worker_builder,),
+        ) as pool:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._run_window_worker(window, staged, pool)
+                        for window in windows
+                    )
+                )
             )
-            return False
 
-        # Check if data has been ingested for the test window
-        if not self.has_ingested_data(test_start, test_end):
+    async def _run_window_worker(
+        self,
+        window: dict,
+        staged: dict[tuple, bool],
+        pool: Optional[Executor] = None,
+    ) -> dict:
+        """
+        Run one window, in this process or on a worker of the pool. A worker
+        is sent only the window dates and whether its ranges were staged.
+        :return: The window result: its dates, status, error and duration.
+        """
+        result = {
+            "window_id": self._window_id(window["train_start"], window["test_end"]),
+            **window,
+            "status": self.OK,
+            "error": None,
+            "duration_sec": 0.0,
+        }
+        started = time.perf_counter()
+        try:
+            if pool is None:
+                window_result = await self._run_window(window, staged)
+            else:
+                window_staged = {
+                    date_range: staged.get(date_range, False)
+                    for date_range in (
+                        (window["train_start"], window["train_end"]),
+                        (window["test_start"], window["test_end"]),
+                    )
+                }
+                window_result, spans = await asyncio.get_running_loop().run_in_executor(
+                    pool, run_window_in_worker, window, window_staged
+                )
+                self.stage_profiler.add_spans(spans)
+            if not window_result:
+                result["status"] = self.FAILED
+                self.logger.error(
+                    f"Walk-forward failed: "
+                    f"Train {window['train_start'].date()} to {window['train_end'].date()}, "
+                    f"Test {window['test_start'].date()} to {window['test_end'].date()}"
+                )
+        except Exception as e:
+            result["status"] = self.ERROR
+            result["error"] = str(e)
             self.logger.error(
-                f"Data not ingested for test window: {test_start.date()} to {test_end.date()}"
+                f"Walk-forward failed for window {window['train_start'].date()} to {window['train_end'].date()}: {e}"
             )
-            return False
+        result["duration_sec"] = round(time.perf_counter() - started, 4)
+        return result
 
-        # Feature engineering for test window
+    async def _run_window(self, window: dict, staged: dict[tuple, bool]) -> bool:
+        """
+        Optimize and test a single walk-forward window on its staged data.
+        The stage coordinators keep the window they are running on the
+        instance, so each window runs on its own shallow copies.
+        """
+        train_start = window["train_start"]
+        train_end = window["train_end"]
+        test_start = window["test_start"]
+        test_end = window["test_end"]
         self.logger.info(
-            f"Running feature engineering for test window: {test_start.date()} to {test_end.date()}"
-        )
-        fe_success = await self.feature_engineering_stage_coordinator.run(
-            start_date=test_start, end_date=test_end
+            f"Walk-forward: Train: {train_start.date()} to {train_end.date()} | Test: {test_start.date()} to {test_end.date()}"
         )
-        if not fe_success:
-            self.logger.error("Feature engineering stage failed")
-            return False
+        with self.stage_profiler.span(
+            "walk_forward_window",
+            window=self._window_id(train_start, test_end),
+        ):
+            if not staged.get((train_start, train_end)):
+                self.logger.error(
+                    f"Data not staged for train window: {train_start.date()} to {train_end.date()}"
+                )
+                return False
 
-        # Test on test window using best params from train_results
-        self.logger.info(
-            f"Running backtest for test window: {test_start.date()} to {test_end.date()}"
-        )
-        testing_results = await self.testing_stage_coordinator.run(
-            train_start_date=train_start,
-            train_end_date=train_end,
-            test_start_date=test_start,
-            test_end_date=test_end,
-        )
-        self.logger.debug(
-            f"Testing results for window {train_start.date()} to {train_end.date()}: {testing_results}"
-        )
-        if not testing_results:
-            self.logger.error(
-                f"Testing stage failed for test window: {test_start.date()} to {test_end.date()}: testing_results is empty"
+            # Optimize on train window
+            self.logger.info(
+                f"Running optimization for train window: {train_start.date()} to {train_end.date()}"
             )
-            return False
+            optimization_stage_coordinator = copy.copy(
+                self.optimization_stage_coordinator
+            )
+            with self._stage_span(
+                optimization_stage_coordinator, train_start, train_end
+            ):
+                optimization_success = await optimization_stage_coordinator.run(
+                    start_date=train_start, end_date=train_end
+                )
+            self.logger.debug(
+                f"Optimization results for window {train_start.date()} to {train_end.date()}: {optimization_success}"
+            )
+            if not optimization_success:
+                self.logger.error("Optimization stage failed")
+                return False
+
+            if not staged.get((test_start, test_end)):
+                self.logger.error(
+                    f"Data not staged for test window: {test_start.date()} to {test_end.date()}"
+                )
+                return False
+
+            # Test on test window using best params from train_results
+            self.logger.info(
+                f"Running backtest for test window: {test_start.date()} to {test_end.date()}"
+            )
+            testing_stage_coordinator = copy.copy(self.testing_stage_coordinator)
+            with self._stage_span(testing_stage_coordinator, test_start, test_end):
+                testing_results = await testing_stage_coordinator.run(
+                    train_start_date=train_start,
+                    train_end_date=train_end,
+                    test_start_date=test_start,
+                    test_end_date=test_end,
+                )
+            self.logger.debug(
+                f"Testing results for window {train_start.date()} to {train_end.date()}: {testing_results}"
+            )
+            if not testing_results:
+                self.logger.error(
+                    f"Testing stage failed for test window: {test_start.date()} to {test_end.date()}: testing_results is empty"
+                )
+                return False
 
         return True
 
+    def _window_id(self, start_date: datetime, end_date: datetime) -> str:
+        """Window id in the same format as StageDataManager.get_window_id."""
+        return f"{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}"
+
+    def _stage_span(self, stage_coordinator, start_date: datetime, end_date: datetime):
+        """Profiling span for a stage coordinator run over the given dates."""
+        stage = getattr(stage_coordinator, "stage", None)
+        return self.stage_profiler.span(
+            "stage",
+            stage=stage.name if isinstance(stage, BacktestStage) else None,
+            window=self._window_id(start_date, end_date),
+        )
+
     def has_ingested_data(self, start_date, end_date):
         """
         Returns True if any symbol has a non-empty data file for the given stage and window.
@@ -0,0 +1,37 @@
+import asyncio
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from algo_royale.backtester.walkforward.walk_forward_coordinator import (
+        WalkForwardCoordinator,
+    )
+
+# The worker process's own coordinator, built once by init_window_worker
+_coordinator: Optional["WalkForwardCoordinator"] = None
+
+
+def init_window_worker(build_coordinator: Callable[[], "WalkForwardCoordinator"]):
+    """
+    Process pool initializer: build the worker's walk-forward coordinator,
+    with its own containers, stage coordinators and loggers.
+    :param build_coordinator: Picklable callable building the coordinator.
+    """
+    global _coordinator
+    _coordinator = build_coordinator()
+
+
+def run_window_in_worker(window: dict, staged: dict[tuple, bool]) -> tuple[bool, list]:
+    """
+    Optimize and test one walk-forward window in a worker process. Only the
+    window dates go in and only the result and profile spans come back; the
+    stage coordinators read and write the staged data on disk themselves.
+    :param window: The window's train and test dates.
+    :param staged: Whether each of the window's date ranges was staged.
+    :return: Whether the window succeeded, and its profile spans as dicts.
+    """
+    if _coordinator is None:
+        raise RuntimeError("Walk-forward window worker is not initialized.")
+    stage_profiler = _coordinator.stage_profiler
+    stage_profiler.reset()
+    result = asyncio.run(_coordinator._run_window(window, staged))
+    return result, [span.to_dict() for span in stage_profiler.spans]
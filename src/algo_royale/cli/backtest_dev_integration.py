@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import os
 
@@ -14,7 +15,17 @@ async def async_cli(coordinator: PipelineCoordinator):
     exit(0 if success else 1)
 
 
-def cli():
+def print_rebuild_plan(coordinator: PipelineCoordinator):
+    """Print which stage outputs a run would rebuild, without running it"""
+    plan = coordinator.plan_rebuild()
+    for row in plan.to_rows():
+        if row["rebuild"]:
+            keys = ["stage", "window_id", "symbol", "strategy", "reason"]
+            print(" ".join(str(row[key]) for key in keys if row[key]))
+    print(plan.summary())
+
+
+def cli(dry_run: bool = False):
     """Synchronous CLI wrapper"""
     from algo_royale.di.application_container import ApplicationContainer
 
@@ -29,16 +40,28 @@ def cli():
         coordinator = (
             application_container.backtest_pipeline_container.pipeline_coordinator
         )
-        asyncio.run(async_cli(coordinator))
+        if dry_run:
+            print_rebuild_plan(coordinator)
+        else:
+            asyncio.run(async_cli(coordinator))
     finally:
         if hasattr(application_container, "async_close"):
             asyncio.run(application_container.async_close())
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Run the backtest pipeline in the dev integration environment."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the stage outputs a run would rebuild and their estimated cost.",
+    )
+    args = parser.parse_args()
     with SingleInstanceLock(LOCK_FILE):
         try:
-            cli()
+            cli(dry_run=args.dry_run)
         except KeyboardInterrupt:
             pass  # Graceful exit on Ctrl+C
 
@@ -0,0 +1,48 @@
+import asyncio
+import os
+
+from algo_royale.di.trading.replay_container import ReplayContainer
+from algo_royale.logging.logger_env import ApplicationEnv
+from algo_royale.utils.single_instance_lock import SingleInstanceLock
+
+LOCK_FILE = os.path.join(os.path.dirname(__file__), "replay_dev_integration.lock")
+
+
+async def async_cli(replay_container: ReplayContainer):
+    """Async command line interface entry point"""
+    report = await replay_container.live_replay_harness.async_run(
+        start_date=replay_container.replay_start_date,
+        end_date=replay_container.replay_end_date,
+    )
+    exit(0 if report else 1)
+
+
+def cli():
+    """Synchronous CLI wrapper"""
+    from algo_royale.di.application_container import ApplicationContainer
+
+    application_container = ApplicationContainer(
+        environment=ApplicationEnv.DEV_INTEGRATION
+    )
+    try:
+        # Initialize and run DB migrations
+        db_container = application_container.repo_container.db_container
+        db_container.setup_environment()
+
+        replay_container = application_container.trading_container.replay_container
+        asyncio.run(async_cli(replay_container))
+    finally:
+        if hasattr(application_container, "async_close"):
+            asyncio.run(application_container.async_close())
+
+
+def main():
+    with SingleInstanceLock(LOCK_FILE):
+        try:
+            cli()
+        except KeyboardInterrupt:
+            pass  # Graceful exit on Ctrl+C
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,9 @@ from algo_royale.models.alpaca_market_data.alpaca_bar import (
     BarsResponse,
     LatestBarsResponse,
 )
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import (
+    BarColumnsResponse,
+)
 from algo_royale.models.alpaca_market_data.alpaca_condition_code import ConditionCodeMap
 from algo_royale.models.alpaca_market_data.alpaca_quote import QuotesResponse
 from algo_royale.models.alpaca_market_data.alpaca_snapshot import SnapshotsResponse
@@ -161,7 +164,68 @@ class AlpacaStockClient(AlpacaBaseClient):
         page_token: Optional[str] = None,
     ) -> Optional[BarsResponse]:
         """Fetch historical auction data from Alpaca."""
+        params = self._historical_bars_params(
+            symbols,
+            start_date,
+            end_date,
+            currency,
+            feed,
+            timeframe,
+            adjustment,
+            sort_order,
+            page_limit,
+            page_token,
+        )
+
+        response = await self.get(endpoint="stocks/bars", params=params)
+
+        return BarsResponse.from_raw(response)
+
+    async def fetch_historical_bar_columns(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        currency=SupportedCurrencies.USD,
+        feed: DataFeed = DataFeed.IEX,
+        timeframe: TimeFrame = TimeFrame(1, TimeFrameUnit.Minute),
+        adjustment: Adjustment = Adjustment.RAW,
+        sort_order: Sort = Sort.ASC,
+        page_limit: int = 10000,
+        page_token: Optional[str] = None,
+    ) -> Optional[BarColumnsResponse]:
+        """Fetch historical bars from Alpaca, decoded into columns per symbol
+        instead of one Bar per row."""
+        params = self._historical_bars_params(
+            symbols,
+            start_date,
+            end_date,
+            currency,
+            feed,
+            timeframe,
+            adjustment,
+            sort_order,
+            page_limit,
+            page_token,
+        )
+
+        response = await self.get(endpoint="stocks/bars", params=params)
 
+        return BarColumnsResponse.from_raw(response)
+
+    def _historical_bars_params(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        currency,
+        feed: DataFeed,
+        timeframe: TimeFrame,
+        adjustment: Adjustment,
+        sort_order: Sort,
+        page_limit: int,
+        page_token: Optional[str],
+    ) -> dict:
         if not isinstance(symbols, list):
             symbols = [symbols]
         if not isinstance(start_date, datetime):
@@ -170,7 +234,7 @@ class AlpacaStockClient(AlpacaBaseClient):
             raise ValueError("end_date must be a datetime object")
         start_str = start_date.strftime("%Y-%m-%d")
         end_str = end_date.strftime("%Y-%m-%d")
-        params = {
+        return {
             "symbols": ",".join(symbols),
             "start": start_str,
             "end": end_str,
@@ -179,15 +243,11 @@ class AlpacaStockClient(AlpacaBaseClient):
             "timeframe": timeframe,
             "adjustment": adjustment,
             "sort": sort_order,
-            "limit": min(page_limit, 1000),
+            "limit": min(page_limit, 10000),
             "page_token": page_token,
             "asof": None,
         }
 
-        response = await self.get(endpoint="stocks/bars", params=params)
-
-        return BarsResponse.from_raw(response)
-
     async def fetch_latest_bars(
         self,
         symbols: list[str],
@@ -2,6 +2,9 @@ from uuid import UUID
 
 from algo_royale.clients.db.dao.base_dao import BaseDAO
 from algo_royale.models.db.db_order import DBOrder
+from algo_royale.models.db.db_order_fill_summary import DBOrderFillSummary
+from algo_royale.models.db.db_order_status_summary import DBOrderStatusSummary
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 
 
 class OrderDAO(BaseDAO):
@@ -36,16 +39,22 @@ class OrderDAO(BaseDAO):
         return [DBOrder.from_tuple(row) for row in rows]
 
     def fetch_orders_by_status(
-        self, status_list: list[str], limit: int = 100, offset: int = 0
+        self,
+        status_list: list[str],
+        limit: int = 100,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         """
-        Fetch orders by their status.
+        Fetch a page of orders by their status, newest first.
         :param status_list: List of statuses to filter orders by.
         :param limit: The maximum number of orders to fetch.
-        :param offset: The offset for pagination.
+        :param after: DBPageCursor.after_order of the previous page's last order.
         :return: List of orders with the specified status.
         """
-        rows = self.fetch("fetch_orders_by_status.sql", (status_list, limit, offset))
+        rows = self.fetch(
+            "fetch_orders_by_status.sql",
+            {"status_list": status_list, **DBPageCursor.params(after, limit)},
+        )
         return [DBOrder.from_tuple(row) for row in rows]
 
     def fetch_all_orders_by_symbol_and_status(
@@ -63,22 +72,63 @@ class OrderDAO(BaseDAO):
         return [DBOrder.from_tuple(row) for row in rows]
 
     def fetch_orders_by_symbol_and_status(
-        self, symbol: str, status_list: list[str], limit: int = 100, offset: int = 0
+        self,
+        symbol: str,
+        status_list: list[str],
+        limit: int = 100,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         """
-        Fetch orders by symbol and status.
+        Fetch a page of orders by symbol and status, newest first.
         :param symbol: The stock symbol of the orders to fetch.
         :param status_list: List of statuses to filter orders by.
         :param limit: The maximum number of orders to fetch.
-        :param offset: The offset for pagination.
+        :param after: DBPageCursor.after_order of the previous page's last order.
         :return: List of orders matching the specified symbol and status.
         """
         rows = self.fetch(
             "fetch_orders_by_symbol_and_status.sql",
-            (status_list, symbol, limit, offset),
+            {
+                "status_list": status_list,
+                "symbol": symbol,
+                **DBPageCursor.params(after, limit),
+            },
         )
         return [DBOrder.from_tuple(row) for row in rows]
 
+    def fetch_order_status_summary_by_symbols(
+        self, symbols: list[str], status_list: list[str], user_id: str, account_id: str
+    ) -> list[DBOrderStatusSummary]:
+        """
+        Fetch the grouped order state for a set of symbols in a single query.
+        :param symbols: The stock symbols to summarize.
+        :param status_list: List of statuses to filter orders by.
+        :param user_id: The ID of the user who owns the orders.
+        :param account_id: The ID of the account associated with the orders.
+        :return: One summary per symbol and status with matching orders.
+        """
+        rows = self.fetch(
+            "fetch_order_status_summary_by_symbols.sql",
+            (symbols, status_list, user_id, account_id),
+        )
+        return [DBOrderStatusSummary.from_tuple(row) for row in rows]
+
+    def fetch_order_fill_summary_by_status(
+        self, status_list: list[str], user_id: str, account_id: str
+    ) -> list[DBOrderFillSummary]:
+        """
+        Fetch orders by status with the cumulative fills of their trades in a single query.
+        :param status_list: List of statuses to filter orders by.
+        :param user_id: The ID of the user who owns the orders.
+        :param account_id: The ID of the account associated with the orders.
+        :return: One fill summary per matching order.
+        """
+        rows = self.fetch(
+            "fetch_order_fill_summary_by_status.sql",
+            (status_list, user_id, account_id),
+        )
+        return [DBOrderFillSummary.from_tuple(row) for row in rows]
+
     def fetch_unsettled_orders(self) -> list[DBOrder]:
         """
         Fetch all unsettled orders.
@@ -1,11 +1,16 @@
 # src/algo_royale/clients/db/dao/trade_dao.py
+import csv
+import io
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
 import psycopg2
+from psycopg2.extras import execute_values
 
 from algo_royale.clients.db.dao.base_dao import BaseDAO
 from algo_royale.logging.loggable import Loggable
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.models.db.db_position import DBPosition
 from algo_royale.models.db.db_trade import DBTrade
 
@@ -20,30 +25,68 @@ class TradeDAO(BaseDAO):
         super().__init__(connection=connection, sql_dir=sql_dir, logger=logger)
 
     def fetch_unsettled_trades(
-        self, limit: int = 100, offset: int = 0
+        self, limit: int = 100, after: DBPageCursor | None = None
     ) -> list[DBTrade]:
-        """Fetch all unsettled trades with pagination."""
-        rows = self.fetch("fetch_unsettled_trades.sql", (limit, offset))
+        """Fetch a page of unsettled trades, latest settlement date first.
+        :param limit: The maximum number of trades to fetch.
+        :param after: DBPageCursor.after_unsettled_trade of the previous page's last trade.
+        """
+        rows = self.fetch(
+            "fetch_unsettled_trades.sql", DBPageCursor.params(after, limit)
+        )
         return [DBTrade.from_tuple(row) for row in rows]
 
     def fetch_open_positions(self, user_id: str, account_id: str) -> list[DBPosition]:
-        """Fetch all open positions.
+        """Fetch all open positions from the positions projection.
         :return: List of open positions.
         """
         rows = self.fetch("fetch_open_positions.sql", (user_id, account_id))
         return [DBPosition.from_tuple(row) for row in rows]
 
+    def verify_positions(
+        self, user_id: str, account_id: str
+    ) -> list[tuple[str, Decimal | None, Decimal | None]]:
+        """Compare the positions projection with a full aggregation of the trades.
+        :param user_id: The ID of the user owning the positions.
+        :param account_id: The ID of the account owning the positions.
+        :return: (symbol, expected, projected) for every symbol that differs;
+            a missing position is None.
+        """
+        return self.fetch(
+            "verify_positions.sql",
+            {"user_id": user_id, "account_id": account_id},
+            log_name="verify_positions",
+        )
+
+    def rebuild_positions(self, user_id: str, account_id: str) -> int:
+        """Rebuild the positions projection from the full trade history.
+        :param user_id: The ID of the user owning the positions.
+        :param account_id: The ID of the account owning the positions.
+        :return: The number of open positions after the rebuild.
+        """
+        return self.update(
+            "rebuild_positions.sql",
+            {"user_id": user_id, "account_id": account_id},
+            log_name="rebuild_positions",
+        )
+
     def fetch_trades_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
-        limit: str = 100,
-        offset: str = 0,
+        limit: int = 100,
+        after: DBPageCursor | None = None,
     ) -> list[DBTrade]:
-        """Fetch trades within a specific date range."""
+        """Fetch a page of trades within a specific date range by execution time.
+        :param after: DBPageCursor.after_executed_trade of the previous page's last trade.
+        """
         rows = self.fetch(
             "fetch_trades_by_date_range.sql",
-            (start_date, end_date, limit, offset),
+            {
+                "start_date": start_date,
+                "end_date": end_date,
+                **DBPageCursor.params(after, limit),
+            },
         )
         return [DBTrade.from_tuple(row) for row in rows]
 
@@ -101,6 +144,49 @@ class TradeDAO(BaseDAO):
             return None
         return returned_id
 
+    def insert_trades(
+        self, trades: list[DBTrade], user_id: str, account_id: str
+    ) -> int:
+        """Insert a batch of trade records in a single statement and transaction.
+        :param trades: The trades to insert.
+        :param user_id: The ID of the user who made the trades.
+        :param account_id: The ID of the account associated with the trades.
+        :return: The number of inserted trade records.
+        """
+        if not trades:
+            return 0
+        rows = [
+            (
+                trade.external_id,
+                trade.symbol,
+                trade.action,
+                trade.settlement_date,
+                trade.price,
+                trade.quantity,
+                trade.executed_at,
+                str(trade.order_id),
+                user_id,
+                account_id,
+            )
+            for trade in trades
+        ]
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    self._load_sql("insert_trades.sql"),
+                    rows,
+                    template="(%s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s, CURRENT_TIMESTAMP, %s, %s)",
+                    page_size=len(rows),
+                )
+                inserted_count = cur.rowcount
+            self.conn.commit()
+            return inserted_count
+        except Exception as e:
+            self.logger.error(f"[insert_trades] Batch insert failed: {e}")
+            self.conn.rollback()
+            raise
+
     def update_settled_trades(self, settlement_datetime: datetime) -> int:
         """Update all settled trades in the database.
         :return: The number of updated trade records, or -1 if the update failed.
@@ -113,6 +199,70 @@ class TradeDAO(BaseDAO):
             return -1
         return update_count
 
+    def reconcile_trades(
+        self,
+        trades: list[DBTrade],
+        start_date: datetime,
+        end_date: datetime,
+        user_id: str,
+        account_id: str,
+    ) -> tuple[int, int]:
+        """Reconcile local trades against broker fills in a single transaction.
+        The fills are staged into a temporary table with COPY, then local trades
+        that are duplicated or missing from the fills are deleted and fills with
+        no local match are inserted, both with set-based SQL.
+        :param trades: The broker fills for the reconciliation window.
+        :param start_date: The start of the reconciliation window.
+        :param end_date: The end of the reconciliation window.
+        :param user_id: The ID of the user owning the trades.
+        :param account_id: The ID of the account owning the trades.
+        :return: A tuple of (deleted count, inserted count).
+        """
+        params = {
+            "user_id": user_id,
+            "account_id": account_id,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(self._load_sql("create_trade_reconcile_stage.sql"))
+                cur.copy_expert(
+                    self._load_sql("copy_trade_reconcile_stage.sql"),
+                    self._trades_to_csv(trades),
+                )
+                cur.execute(self._load_sql("delete_unreconciled_trades.sql"), params)
+                deleted_count = cur.rowcount
+                cur.execute(self._load_sql("insert_reconciled_trades.sql"), params)
+                inserted_count = cur.rowcount
+            self.conn.commit()
+            return deleted_count, inserted_count
+        except Exception as e:
+            self.logger.error(f"[reconcile_trades] Reconciliation failed: {e}")
+            self.conn.rollback()
+            raise
+
+    def _trades_to_csv(self, trades: list[DBTrade]) -> io.StringIO:
+        """Serialize trades into a CSV buffer matching the reconcile stage columns."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for trade in trades:
+            writer.writerow(
+                [
+                    trade.external_id,
+                    trade.symbol,
+                    trade.action,
+                    trade.settled,
+                    trade.settlement_date,
+                    trade.price,
+                    trade.quantity,
+                    trade.executed_at,
+                    trade.order_id,
+                ]
+            )
+        buffer.seek(0)
+        return buffer
+
     def delete_trade(self, trade_id: UUID) -> int:
         """Delete a trade record by its ID.
         :param trade_id: The ID of the trade to delete.
@@ -0,0 +1,17 @@
+-- db\migrations\201_create_pagination_indexes.sql
+
+-- Indexes matching the keyset-paginated and filtered order and trade queries
+-- fetch_orders_by_status: status filter, newest first
+CREATE INDEX idx_orders_status_created ON orders (status, created_at DESC, id DESC);
+-- fetch_orders_by_symbol_and_status: symbol filter, newest first
+CREATE INDEX idx_orders_symbol_created ON orders (symbol, created_at DESC, id DESC);
+-- fetch_unsettled_orders
+CREATE INDEX idx_orders_unsettled ON orders (created_at) WHERE settled = FALSE;
+-- fetch_trades_by_date_range: execution time range in order
+CREATE INDEX idx_trades_executed ON trades (executed_at, id);
+-- fetch_unsettled_trades: settlement date, newest first
+CREATE INDEX idx_trades_unsettled ON trades (COALESCE(settlement_date, 'infinity'::timestamp) DESC, id DESC) WHERE settled = FALSE;
+-- update_settled_trades: due unsettled trades
+CREATE INDEX idx_trades_unsettled_due ON trades (settlement_date) WHERE settled = FALSE;
+-- fetch_trades_by_order_id and the order fill summary join
+CREATE INDEX idx_trades_order_id ON trades (order_id);
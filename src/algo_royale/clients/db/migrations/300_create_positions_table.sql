@@ -0,0 +1,78 @@
+-- db\migrations\300_create_positions_table.sql
+
+-- Net position per user, account and symbol, kept in step with trades by the
+-- triggers below so open positions are read without aggregating trade history.
+-- Rows are removed when a position closes.
+CREATE TABLE
+    positions (
+        user_id TEXT NOT NULL,
+        account_id TEXT NOT NULL,
+        symbol TEXT NOT NULL,
+        net_position NUMERIC(20, 10) NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (user_id, account_id, symbol)
+    );
+
+-- Signed quantity a trade adds to its position
+CREATE FUNCTION trade_position_delta(action TEXT, quantity NUMERIC) RETURNS NUMERIC AS $$
+    SELECT CASE
+        WHEN action = 'buy' THEN COALESCE(quantity, 0)
+        WHEN action = 'sell' THEN -COALESCE(quantity, 0)
+        ELSE 0
+    END
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Applies the net change of a statement's inserted, updated or deleted trades,
+-- in the same transaction as the statement
+CREATE FUNCTION apply_trade_positions() RETURNS TRIGGER AS $$
+DECLARE
+    deltas TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        deltas := 'SELECT user_id, account_id, symbol, trade_position_delta(action, quantity) AS delta FROM new_trades';
+    ELSIF TG_OP = 'DELETE' THEN
+        deltas := 'SELECT user_id, account_id, symbol, -trade_position_delta(action, quantity) AS delta FROM old_trades';
+    ELSE
+        deltas := 'SELECT user_id, account_id, symbol, trade_position_delta(action, quantity) AS delta FROM new_trades'
+            || ' UNION ALL SELECT user_id, account_id, symbol, -trade_position_delta(action, quantity) FROM old_trades';
+    END IF;
+
+    EXECUTE format(
+        'INSERT INTO positions (user_id, account_id, symbol, net_position)
+        SELECT user_id, account_id, symbol, SUM(delta)
+        FROM (%s) deltas
+        WHERE user_id IS NOT NULL AND account_id IS NOT NULL
+        GROUP BY user_id, account_id, symbol
+        HAVING SUM(delta) <> 0
+        ON CONFLICT (user_id, account_id, symbol) DO UPDATE
+        SET net_position = positions.net_position + EXCLUDED.net_position,
+            updated_at = CURRENT_TIMESTAMP',
+        deltas
+    );
+    DELETE FROM positions WHERE net_position = 0;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trades_insert_positions
+AFTER INSERT ON trades
+REFERENCING NEW TABLE AS new_trades
+FOR EACH STATEMENT EXECUTE FUNCTION apply_trade_positions();
+
+CREATE TRIGGER trades_update_positions
+AFTER UPDATE ON trades
+REFERENCING OLD TABLE AS old_trades NEW TABLE AS new_trades
+FOR EACH STATEMENT EXECUTE FUNCTION apply_trade_positions();
+
+CREATE TRIGGER trades_delete_positions
+AFTER DELETE ON trades
+REFERENCING OLD TABLE AS old_trades
+FOR EACH STATEMENT EXECUTE FUNCTION apply_trade_positions();
+
+-- Backfill from the existing trade history
+INSERT INTO positions (user_id, account_id, symbol, net_position)
+SELECT user_id, account_id, symbol, SUM(trade_position_delta(action, quantity))
+FROM trades
+WHERE user_id IS NOT NULL AND account_id IS NOT NULL
+GROUP BY user_id, account_id, symbol
+HAVING SUM(trade_position_delta(action, quantity)) <> 0;
@@ -3,6 +3,7 @@
 -- It includes the creation of tables, indexes, and other database objects
 -- This file is for reference only and should not be executed directly
 
+DROP TABLE IF EXISTS positions;
 DROP TABLE IF EXISTS orders;
 DROP TABLE IF EXISTS trades;
 DROP TABLE IF EXISTS enriched_data;
@@ -52,6 +53,18 @@ CREATE TABLE
         account_id TEXT
     );
 
+-- Positions projection, maintained from trades by triggers
+-- (see migrations/300_create_positions_table.sql)
+CREATE TABLE
+    positions (
+        user_id TEXT NOT NULL,
+        account_id TEXT NOT NULL,
+        symbol TEXT NOT NULL,
+        net_position NUMERIC(20, 10) NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (user_id, account_id, symbol)
+    );
+
 -- Enriched Data table
 CREATE TABLE
     enriched_data (
@@ -139,3 +152,10 @@ CREATE TABLE
 -- Indexes for performance
 CREATE INDEX idx_trade_symbol ON trades (symbol);
 CREATE INDEX idx_orders_user_account ON orders (user_id, account_id);
+CREATE INDEX idx_orders_status_created ON orders (status, created_at DESC, id DESC);
+CREATE INDEX idx_orders_symbol_created ON orders (symbol, created_at DESC, id DESC);
+CREATE INDEX idx_orders_unsettled ON orders (created_at) WHERE settled = FALSE;
+CREATE INDEX idx_trades_executed ON trades (executed_at, id);
+CREATE INDEX idx_trades_unsettled ON trades (COALESCE(settlement_date, 'infinity'::timestamp) DESC, id DESC) WHERE settled = FALSE;
+CREATE INDEX idx_trades_unsettled_due ON trades (settlement_date) WHERE settled = FALSE;
+CREATE INDEX idx_trades_order_id ON trades (order_id);
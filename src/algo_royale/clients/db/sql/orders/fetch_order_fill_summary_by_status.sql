@@ -0,0 +1,6 @@
+SELECT o.id, o.symbol, o.action, COALESCE(SUM(t.quantity), 0) AS filled_qty, COALESCE(SUM(t.price * t.quantity), 0) AS filled_notional
+FROM orders o
+LEFT JOIN trades t ON t.order_id = o.id
+WHERE o.status = ANY(%s) AND o.user_id = %s AND o.account_id = %s
+GROUP BY o.id, o.symbol, o.action;
+-- Fetch orders in the given statuses with the cumulative quantity and notional of their trades
@@ -0,0 +1,5 @@
+SELECT symbol, status, BOOL_AND(COALESCE(settled, FALSE)) AS settled, COUNT(*) AS order_count
+FROM orders
+WHERE symbol = ANY(%s) AND status = ANY(%s) AND user_id = %s AND account_id = %s
+GROUP BY symbol, status;
+-- Summarize orders per symbol and status for a set of symbols in a single grouped query
@@ -1,5 +1,15 @@
-SELECT *
-FROM orders
-WHERE status = ANY(%s)
-ORDER BY created_at DESC
-LIMIT %s OFFSET %s;
\ No newline at end of file
+SELECT o.*
+FROM unnest(%(status_list)s::text[]) AS s (status)
+CROSS JOIN LATERAL (
+    SELECT *
+    FROM orders
+    WHERE orders.status = s.status
+    AND (%(after_id)s::uuid IS NULL OR (created_at, id) < (%(after_key)s::timestamp, %(after_id)s::uuid))
+    ORDER BY created_at DESC, id DESC
+    LIMIT %(limit)s
+) o
+ORDER BY o.created_at DESC, o.id DESC
+LIMIT %(limit)s;
+-- Fetch a page of orders by status, newest first. The page starts after the cursor
+-- (created_at, id) of the previous page's last order. Each status is read with an
+-- index seek on idx_orders_status_created and the results merged.
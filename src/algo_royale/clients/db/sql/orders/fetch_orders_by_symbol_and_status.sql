@@ -1,5 +1,7 @@
 SELECT * FROM orders
-WHERE status = ANY(%s) AND symbol = %s
-ORDER BY created_at DESC
-LIMIT %s OFFSET %s;
--- This query retrieves all orders for a specific symbol and status, ordered by creation time in descending
\ No newline at end of file
+WHERE status = ANY(%(status_list)s) AND symbol = %(symbol)s
+AND (%(after_id)s::uuid IS NULL OR (created_at, id) < (%(after_key)s::timestamp, %(after_id)s::uuid))
+ORDER BY created_at DESC, id DESC
+LIMIT %(limit)s;
+-- This query retrieves a page of orders for a specific symbol and status, ordered by creation time in descending
+-- order. The page starts after the cursor (created_at, id) of the previous page's last order.
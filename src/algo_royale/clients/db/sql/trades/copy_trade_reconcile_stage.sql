@@ -0,0 +1,2 @@
+COPY trade_reconcile_stage (external_id, symbol, action, settled, settlement_date, price, quantity, executed_at, order_id)
+FROM STDIN WITH (FORMAT csv)
@@ -0,0 +1,13 @@
+CREATE TEMP TABLE trade_reconcile_stage (
+    external_id TEXT,
+    symbol TEXT,
+    action TEXT,
+    settled BOOLEAN,
+    settlement_date TIMESTAMP,
+    price NUMERIC(20, 10),
+    quantity NUMERIC(20, 10),
+    executed_at TIMESTAMP,
+    order_id UUID
+) ON COMMIT DROP;
+-- Staging table for broker fills during bulk trade reconciliation.
+-- Dropped automatically when the reconciliation transaction commits or rolls back.
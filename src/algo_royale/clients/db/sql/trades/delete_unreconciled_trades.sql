@@ -0,0 +1,40 @@
+WITH window_trades AS (
+    SELECT
+        id,
+        symbol,
+        action,
+        settled,
+        settlement_date,
+        price,
+        quantity,
+        executed_at,
+        order_id,
+        ROW_NUMBER() OVER (
+            PARTITION BY symbol, action, settled, settlement_date, price, quantity, executed_at, order_id
+            ORDER BY created_at, id
+        ) AS key_rank
+    FROM trades
+    WHERE user_id = %(user_id)s
+    AND account_id = %(account_id)s
+    AND executed_at >= %(start_date)s AND executed_at <= %(end_date)s
+)
+DELETE FROM trades t
+USING window_trades w
+WHERE t.id = w.id
+AND (
+    w.key_rank > 1
+    OR NOT EXISTS (
+        SELECT 1
+        FROM trade_reconcile_stage s
+        WHERE s.symbol = w.symbol
+        AND s.action = w.action
+        AND s.settled IS NOT DISTINCT FROM w.settled
+        AND s.settlement_date IS NOT DISTINCT FROM w.settlement_date
+        AND s.price IS NOT DISTINCT FROM w.price
+        AND s.quantity IS NOT DISTINCT FROM w.quantity
+        AND s.executed_at IS NOT DISTINCT FROM w.executed_at
+        AND s.order_id IS NOT DISTINCT FROM w.order_id
+    )
+)
+RETURNING t.id;
+-- Deletes local trades in the reconciliation window that are duplicated or missing from the staged broker fills.
@@ -1,4 +1,7 @@
 SELECT id, user_id, account_id, symbol, action, settled, settlement_date, price, quantity, executed_at, created_at, order_id, updated_at FROM trades
-WHERE executed_at >= %s AND executed_at <= %s
-ORDER BY executed_at
-LIMIT %s OFFSET %s;
+WHERE executed_at >= %(start_date)s AND executed_at <= %(end_date)s
+AND (%(after_id)s::uuid IS NULL OR (executed_at, id) > (%(after_key)s::timestamp, %(after_id)s::uuid))
+ORDER BY executed_at, id
+LIMIT %(limit)s;
+-- Fetch a page of trades in a date range by execution time, starting after the cursor
+-- (executed_at, id) of the previous page's last trade.
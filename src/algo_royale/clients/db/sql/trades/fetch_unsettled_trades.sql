@@ -1,5 +1,12 @@
 -- db\sql\trades\get_unsettled_trades.sql
 
-SELECT id, external_id, user_id, account_id, symbol, action, settled, settlement_date, price, quantity, executed_at, created_at, order_id, updated_at FROM trades WHERE settled = FALSE ORDER BY settlement_date DESC LIMIT %s OFFSET %s;
--- This SQL statement retrieves all unsettled trades from the trades table, ordered by settlement date in descending order,
--- with pagination support using LIMIT and OFFSET.  
\ No newline at end of file
+SELECT id, external_id, user_id, account_id, symbol, action, settled, settlement_date, price, quantity, executed_at, created_at, order_id, updated_at FROM trades
+WHERE settled = FALSE
+AND (
+    %(after_id)s::uuid IS NULL
+    OR (COALESCE(settlement_date, 'infinity'::timestamp), id) < (COALESCE(%(after_key)s::timestamp, 'infinity'::timestamp), %(after_id)s::uuid)
+)
+ORDER BY COALESCE(settlement_date, 'infinity'::timestamp) DESC, id DESC
+LIMIT %(limit)s;
+-- This SQL statement retrieves a page of unsettled trades, ordered by settlement date in descending order
+-- (trades without one first), starting after the cursor (settlement_date, id) of the previous page's last trade.
@@ -0,0 +1,24 @@
+INSERT INTO trades (external_id, symbol, action, settled, settlement_date, price, quantity, executed_at, created_at, order_id, updated_at, user_id, account_id)
+SELECT DISTINCT ON (s.symbol, s.action, s.settled, s.settlement_date, s.price, s.quantity, s.executed_at, s.order_id)
+    s.external_id, s.symbol, s.action, s.settled, s.settlement_date, s.price, s.quantity, s.executed_at,
+    CURRENT_TIMESTAMP, s.order_id, CURRENT_TIMESTAMP, %(user_id)s, %(account_id)s
+FROM trade_reconcile_stage s
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM trades t
+    WHERE t.user_id = %(user_id)s
+    AND t.account_id = %(account_id)s
+    AND t.symbol = s.symbol
+    AND t.action = s.action
+    AND t.settled IS NOT DISTINCT FROM s.settled
+    AND t.settlement_date IS NOT DISTINCT FROM s.settlement_date
+    AND t.price IS NOT DISTINCT FROM s.price
+    AND t.quantity IS NOT DISTINCT FROM s.quantity
+    AND t.executed_at IS NOT DISTINCT FROM s.executed_at
+    AND t.order_id IS NOT DISTINCT FROM s.order_id
+)
+AND (s.order_id IS NULL OR EXISTS (SELECT 1 FROM orders o WHERE o.id = s.order_id))
+ORDER BY s.symbol, s.action, s.settled, s.settlement_date, s.price, s.quantity, s.executed_at, s.order_id, s.external_id
+ON CONFLICT (external_id) DO NOTHING
+RETURNING id;
+-- Inserts staged broker fills that have no matching local trade. Fills whose order is unknown locally are skipped.
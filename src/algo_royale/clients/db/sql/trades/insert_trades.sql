@@ -0,0 +1,4 @@
+INSERT INTO trades (external_id, symbol, action, settlement_date, price, quantity, executed_at, created_at, order_id, updated_at, user_id, account_id)
+VALUES %s
+ON CONFLICT (external_id) DO NOTHING;
+-- Insert a batch of trades; the VALUES rows are expanded by psycopg2.extras.execute_values
@@ -0,0 +1,13 @@
+LOCK TABLE trades IN SHARE MODE;
+DELETE FROM positions
+WHERE user_id = %(user_id)s
+AND account_id = %(account_id)s;
+INSERT INTO positions (user_id, account_id, symbol, net_position)
+SELECT user_id, account_id, symbol, SUM(trade_position_delta(action, quantity))
+FROM trades
+WHERE user_id = %(user_id)s
+AND account_id = %(account_id)s
+GROUP BY user_id, account_id, symbol
+HAVING SUM(trade_position_delta(action, quantity)) <> 0;
+-- Rebuild the positions projection of a user and account from the full trade history.
+-- Trades are locked against writes until the transaction commits so no change is missed.
@@ -0,0 +1,21 @@
+WITH expected AS (
+    SELECT symbol, SUM(trade_position_delta(action, quantity)) AS net_position
+    FROM trades
+    WHERE user_id = %(user_id)s
+    AND account_id = %(account_id)s
+    GROUP BY symbol
+    HAVING SUM(trade_position_delta(action, quantity)) <> 0
+),
+projected AS (
+    SELECT symbol, net_position
+    FROM positions
+    WHERE user_id = %(user_id)s
+    AND account_id = %(account_id)s
+)
+SELECT COALESCE(e.symbol, p.symbol) AS symbol, e.net_position AS expected, p.net_position AS projected
+FROM expected e
+FULL OUTER JOIN projected p ON p.symbol = e.symbol
+WHERE e.net_position IS DISTINCT FROM p.net_position
+ORDER BY 1;
+-- Compare the positions projection with a full aggregation of the trade history.
+-- Returns one row per symbol whose projected net position is wrong or missing.
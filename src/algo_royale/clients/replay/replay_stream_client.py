@@ -0,0 +1,230 @@
+import asyncio
+import time
+from typing import AsyncIterator, Callable, Optional
+
+import pandas as pd
+
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
+from algo_royale.logging.loggable import Loggable
+
+
+class ReplayStreamClient:
+    """
+    Offline stand-in for AlpacaStreamClient that replays recorded bars.
+
+    Recorded data-ingest pages are merged across the streamed symbols in
+    timestamp order and pushed to the registered handlers as raw Alpaca
+    messages, so MarketDataRawStreamer parses them exactly like live traffic.
+
+    Parameters:
+        logger: Loggable instance for logging information and errors.
+        speed: Replay rate as a multiple of real time (e.g. 60 plays a minute
+            of recorded bars per second). 0 replays as fast as possible.
+        emit_quotes: Also emit a quote at each bar close. Stage data only
+            records bars, so these quotes are synthesized from the bar.
+        yield_every: In as-fast-as-possible mode, yield to the event loop
+            after this many events so downstream tasks can drain.
+    """
+
+    def __init__(
+        self,
+        logger: Loggable,
+        speed: float = 1.0,
+        emit_quotes: bool = False,
+        yield_every: int = 1,
+    ):
+        self.logger = logger
+        self.speed = speed
+        self.emit_quotes = emit_quotes
+        self.yield_every = max(1, int(yield_every))
+        # Sets to track what you're subscribed to (mirrors AlpacaStreamClient)
+        self.quote_symbols = set()
+        self.trade_symbols = set()
+        self.bar_symbols = set()
+        self.data_sources: dict[str, Callable[[], AsyncIterator[pd.DataFrame]]] = {}
+        self.on_quote: Optional[Callable] = None
+        self.on_bar: Optional[Callable] = None
+        self.stop_stream = False
+        self._reset_stats()
+
+    @property
+    def client_name(self) -> str:
+        return "ReplayStreamClient"
+
+    def set_data_sources(
+        self, data_sources: dict[str, Callable[[], AsyncIterator[pd.DataFrame]]]
+    ):
+        """
+        Set the recorded data to replay.
+        :param data_sources: Mapping of symbol to a factory of async DataFrame pages,
+            as returned by StageDataLoader.load_all_stage_data.
+        """
+        self.data_sources = data_sources
+
+    async def stream(
+        self,
+        symbols: list[str],
+        on_quote: Optional[Callable] = None,
+        on_trade: Optional[Callable] = None,
+        on_bar: Optional[Callable] = None,
+    ):
+        """
+        Register handlers and symbols. Unlike the live client this returns
+        immediately; events flow once `async_replay` is awaited.
+        """
+        self.on_quote = on_quote
+        self.on_bar = on_bar
+        self.stop_stream = False
+        self.quote_symbols.update(symbols)
+        self.bar_symbols.update(symbols)
+
+    async def add_symbols(self, quotes=[], trades=[], bars=[]):
+        self.quote_symbols.update(quotes)
+        self.trade_symbols.update(trades)
+        self.bar_symbols.update(bars)
+
+    async def remove_symbols(self, quotes=[], trades=[], bars=[]):
+        self.quote_symbols.difference_update(quotes)
+        self.trade_symbols.difference_update(trades)
+        self.bar_symbols.difference_update(bars)
+
+    async def stop(self):
+        self.logger.info("Stopping replay stream...")
+        self.stop_stream = True
+
+    async def async_replay(self) -> dict:
+        """
+        Replay the recorded bars of every streamed symbol.
+        :return: Replay statistics (see `get_stats`).
+        """
+        self._reset_stats()
+        frame = await self._async_load_frame()
+        if frame.empty:
+            self.logger.warning("No recorded bars to replay.")
+            return self.get_stats()
+
+        timestamps = frame[DataIngestColumns.TIMESTAMP]
+        offsets = (timestamps - timestamps.iloc[0]).dt.total_seconds().to_numpy()
+        self.logger.info(
+            f"Replaying {len(frame)} bars for {frame[DataIngestColumns.SYMBOL].nunique()} symbols at speed {self.speed or 'max'}"
+        )
+
+        started = time.perf_counter()
+        for offset, row in zip(
+            offsets, frame.itertuples(index=False, name=None), strict=True
+        ):
+            if self.stop_stream:
+                break
+            if self.speed and self.speed > 0:
+                delay = started + offset / self.speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    self._lag_max = max(self._lag_max, -delay)
+            await self._async_emit(dict(zip(frame.columns, row)))
+            if not self.speed and self._events % self.yield_every == 0:
+                await asyncio.sleep(0)
+        self._wall_time = time.perf_counter() - started
+        stats = self.get_stats()
+        self.logger.info(f"Replay finished: {stats}")
+        return stats
+
+    def get_stats(self) -> dict:
+        """
+        :return: Events sent, wall time, sustained events per second and the
+            largest delay behind schedule (paced replays only).
+        """
+        return {
+            "events": self._events,
+            "bars": self._bars,
+            "quotes": self._quotes,
+            "wall_time_sec": round(self._wall_time, 4),
+            "events_per_sec": (
+                round(self._events / self._wall_time, 2) if self._wall_time else None
+            ),
+            "speed": self.speed,
+            "max_lag_ms": round(self._lag_max * 1000, 3),
+        }
+
+    async def _async_load_frame(self) -> pd.DataFrame:
+        """Load and merge the recorded pages of the streamed symbols by timestamp."""
+        frames = []
+        for symbol in sorted(self.bar_symbols | self.quote_symbols):
+            source = self.data_sources.get(symbol)
+            if source is None:
+                self.logger.warning(f"No recorded data for {symbol}, skipping.")
+                continue
+            async for df in source():
+                if df.empty:
+                    continue
+                df = df.copy()
+                df[DataIngestColumns.SYMBOL] = symbol
+                frames.append(df)
+        if not frames:
+            return pd.DataFrame()
+        frame = pd.concat(frames, ignore_index=True)
+        frame[DataIngestColumns.TIMESTAMP] = pd.to_datetime(
+            frame[DataIngestColumns.TIMESTAMP], utc=True
+        )
+        return frame.sort_values(
+            DataIngestColumns.TIMESTAMP, kind="mergesort"
+        ).reset_index(drop=True)
+
+    async def _async_emit(self, row: dict):
+        symbol = row[DataIngestColumns.SYMBOL]
+        timestamp: pd.Timestamp = row[DataIngestColumns.TIMESTAMP]
+        if self.emit_quotes and self.on_quote and symbol in self.quote_symbols:
+            await self.on_quote(self._to_raw_quote(symbol, timestamp, row))
+            self._quotes += 1
+            self._events += 1
+        if self.on_bar and symbol in self.bar_symbols:
+            await self.on_bar(self._to_raw_bar(symbol, timestamp, row))
+            self._bars += 1
+            self._events += 1
+
+    @staticmethod
+    def _to_raw_bar(symbol: str, timestamp: pd.Timestamp, row: dict) -> dict:
+        """Build a raw bar message in the shape StreamBar.from_raw expects."""
+        epoch_ms = int(timestamp.value // 1_000_000)
+        close = float(row[DataIngestColumns.CLOSE_PRICE])
+        volume = int(row.get(DataIngestColumns.VOLUME) or 0)
+        vwap = row.get(DataIngestColumns.VOLUME_WEIGHTED_PRICE)
+        vwap = close if vwap is None or pd.isna(vwap) else float(vwap)
+        return {
+            "T": symbol,
+            "v": volume,
+            "av": volume,
+            "op": float(row[DataIngestColumns.OPEN_PRICE]),
+            "vw": vwap,
+            "o": float(row[DataIngestColumns.OPEN_PRICE]),
+            "h": float(row[DataIngestColumns.HIGH_PRICE]),
+            "l": float(row[DataIngestColumns.LOW_PRICE]),
+            "c": close,
+            "a": vwap,
+            "s": epoch_ms,
+            "e": epoch_ms,
+        }
+
+    @staticmethod
+    def _to_raw_quote(symbol: str, timestamp: pd.Timestamp, row: dict) -> dict:
+        """Build a raw quote message at the bar close (zero spread)."""
+        close = float(row[DataIngestColumns.CLOSE_PRICE])
+        return {
+            "S": symbol,
+            "t": timestamp.isoformat(),
+            "ax": "R",
+            "ap": close,
+            "as": 1,
+            "bx": "R",
+            "bp": close,
+            "bs": 1,
+            "c": [],
+            "z": "C",
+        }
+
+    def _reset_stats(self):
+        self._events = 0
+        self._bars = 0
+        self._quotes = 0
+        self._wall_time = 0.0
+        self._lag_max = 0.0
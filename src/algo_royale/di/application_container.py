@@ -90,6 +90,7 @@ class ApplicationContainer:
         return FeatureEngineeringContainer(
             config=self.config,
             logger_container=self.logger_container,
+            factory_container=self.factory_container,
         )
 
     @property
@@ -14,6 +14,7 @@ from algo_royale.di.repo.repo_container import RepoContainer
 from algo_royale.di.stage_data_container import StageDataContainer
 from algo_royale.logging.logger_type import LoggerType
 from algo_royale.services.clock_service import ClockService
+from algo_royale.utils.path_utils import get_project_root
 
 
 # Refactored to a regular class
@@ -83,4 +84,7 @@ class BacktestPipelineContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.PIPELINE_COORDINATOR
             ),
+            stage_profiler=self.stage_data_container.stage_profiler,
+            profile_report_path=get_project_root()
+            / self.config["backtester_paths"]["stage_profile_root_path"],
         )
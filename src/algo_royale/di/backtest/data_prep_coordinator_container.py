@@ -50,4 +50,7 @@ class DataPrepCoordinatorContainer:
                 logger_type=LoggerType.BACKTEST_FEATURE_ENGINEERING
             ),
             feature_engineer=self.feature_engineering_container.backtest_feature_engineer,
+            panel_symbols=int(
+                self.config["backtester_signal"].get("feature_panel_symbols", 0)
+            ),
         )
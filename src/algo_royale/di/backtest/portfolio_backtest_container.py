@@ -1,6 +1,11 @@
+import os
+
 from algo_royale.backtester.data_preparer.asset_matrix_preparer import (
     AssetMatrixPreparer,
 )
+from algo_royale.backtester.enums.asset_matrix_fill_policy import (
+    AssetMatrixFillPolicy,
+)
 from algo_royale.backtester.evaluator.backtest.portfolio_backtest_evaluator import (
     PortfolioBacktestEvaluator,
 )
@@ -31,6 +36,9 @@ from algo_royale.backtester.walkforward.walk_forward_coordinator import (
 from algo_royale.di.backtest.data_prep_coordinator_container import (
     DataPrepCoordinatorContainer,
 )
+from algo_royale.di.backtest.walk_forward_worker_builder import (
+    WalkForwardWorkerBuilder,
+)
 from algo_royale.di.backtest.signal_backtest_container import SignalBacktestContainer
 from algo_royale.di.factory_container import FactoryContainer
 from algo_royale.di.logger_container import LoggerContainer
@@ -93,6 +101,9 @@ class PortfolioBacktestContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.PORTFOLIO_ASSET_MATRIX_PREPARER
             ),
+            fill_policy=self.config["backtester_portfolio"].get(
+                "asset_matrix_fill_policy", AssetMatrixFillPolicy.NONE
+            ),
         )
 
     @property
@@ -116,8 +127,23 @@ class PortfolioBacktestContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.PORTFOLIO_MATRIX_LOADER
             ),
+            max_workers=self._portfolio_matrix_max_workers(),
         )
 
+    def _portfolio_matrix_max_workers(self) -> int:
+        """
+        Matrix processes per walk-forward window. Each parallel window starts
+        its own pool, so 0 splits the CPU count between the windows.
+        """
+        config = self.config["backtester_portfolio"]
+        max_workers = int(config.get("portfolio_matrix_max_workers", 1))
+        if max_workers > 0:
+            return max_workers
+        cpu_count = os.cpu_count() or 1
+        windows = int(config.get("walk_forward_max_workers", 1))
+        windows = windows if windows > 0 else cpu_count
+        return max(1, cpu_count // windows)
+
     @property
     def portfolio_optimization_stage_coordinator(
         self,
@@ -186,6 +212,15 @@ class PortfolioBacktestContainer:
             walk_forward_window_size=int(
                 self.config["backtester_portfolio"]["walk_forward_window_size"]
             ),
+            stage_profiler=self.stage_data_container.stage_profiler,
+            max_workers=int(
+                self.config["backtester_portfolio"].get("walk_forward_max_workers", 1)
+            ),
+            window_worker_builder=WalkForwardWorkerBuilder(
+                environment=self.logger_container.environment,
+                backtest_container="portfolio_backtest_container",
+                walk_forward_coordinator="portfolio_walk_forward_coordinator",
+            ),
         )
 
     @property
@@ -230,4 +265,7 @@ class PortfolioBacktestContainer:
             viability_threshold=float(
                 self.config["backtester_portfolio"]["strategy_viability_threshold"]
             ),
+            max_workers=int(
+                self.config["backtester_portfolio"].get("evaluation_max_workers", 1)
+            ),
         )
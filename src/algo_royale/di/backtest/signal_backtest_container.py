@@ -25,6 +25,9 @@ from algo_royale.backtester.walkforward.walk_forward_coordinator import (
 from algo_royale.di.backtest.data_prep_coordinator_container import (
     DataPrepCoordinatorContainer,
 )
+from algo_royale.di.backtest.walk_forward_worker_builder import (
+    WalkForwardWorkerBuilder,
+)
 from algo_royale.di.factory_container import FactoryContainer
 from algo_royale.di.logger_container import LoggerContainer
 from algo_royale.di.stage_data_container import StageDataContainer
@@ -130,6 +133,9 @@ class SignalBacktestContainer:
             evaluation_json_filename=self.config["backtester_signal_filenames"][
                 "signal_evaluation_json_filename"
             ],
+            max_workers=int(
+                self.config["backtester_signal"].get("evaluation_max_workers", 1)
+            ),
         )
 
     @property
@@ -173,4 +179,13 @@ class SignalBacktestContainer:
             walk_forward_window_size=int(
                 self.config["backtester_signal"]["walk_forward_window_size"]
             ),
+            stage_profiler=self.stage_data_container.stage_profiler,
+            max_workers=int(
+                self.config["backtester_signal"].get("walk_forward_max_workers", 1)
+            ),
+            window_worker_builder=WalkForwardWorkerBuilder(
+                environment=self.logger_container.environment,
+                backtest_container="signal_backtest_container",
+                walk_forward_coordinator="signal_strategy_walk_forward_coordinator",
+            ),
         )
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from algo_royale.backtester.walkforward.walk_forward_coordinator import (
+    WalkForwardCoordinator,
+)
+from algo_royale.logging.logger_env import ApplicationEnv
+
+
+@dataclass(frozen=True)
+class WalkForwardWorkerBuilder:
+    """
+    Builds a walk-forward coordinator in a window worker process from the
+    environment's config, with containers of its own. It is picklable, so it
+    is what crosses to the spawned worker instead of the coordinator.
+
+    Attributes:
+        environment: Application environment whose config the worker loads.
+        backtest_container: BacktestPipelineContainer property of the
+            pipeline's container, e.g. "signal_backtest_container".
+        walk_forward_coordinator: That container's walk-forward coordinator
+            property.
+    """
+
+    environment: ApplicationEnv
+    backtest_container: str
+    walk_forward_coordinator: str
+
+    def __call__(self) -> WalkForwardCoordinator:
+        # Imported here: the application container imports the backtest containers
+        from algo_royale.di.application_container import ApplicationContainer
+
+        pipeline_container = ApplicationContainer(
+            environment=self.environment
+        ).backtest_pipeline_container
+        return getattr(
+            getattr(pipeline_container, self.backtest_container),
+            self.walk_forward_coordinator,
+        )
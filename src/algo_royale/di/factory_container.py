@@ -51,6 +51,8 @@ class FactoryContainer:
 
     @property
     def signal_strategy_optimizer_factory(self) -> SignalStrategyOptimizerFactoryImpl:
+        signal_config = self.config["backtester_signal"]
+        seed = signal_config.get("optimization_seed", "")
         return SignalStrategyOptimizerFactoryImpl(
             logger=self.logger_container.logger(
                 logger_type=LoggerType.SIGNAL_STRATEGY_OPTIMIZER_FACTORY
@@ -58,6 +60,15 @@ class FactoryContainer:
             strategy_logger=self.logger_container.logger(
                 logger_type=LoggerType.SIGNAL_STRATEGY
             ),
+            pruner=signal_config.get("optimization_pruner", "none"),
+            fidelity_fractions=[
+                float(f)
+                for f in signal_config.get(
+                    "optimization_fidelity_fractions", "0.25,0.5"
+                ).split(",")
+                if f.strip()
+            ],
+            seed=int(seed) if seed else None,
         )
 
     @property
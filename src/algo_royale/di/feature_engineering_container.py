@@ -1,28 +1,62 @@
 from functools import partial
+from typing import Optional
 
 from algo_royale.backtester.column_names.feature_engineering_columns import (
     FeatureEngineeringColumns,
 )
+from algo_royale.backtester.enums.feature_selection import FeatureSelection
 from algo_royale.backtester.feature_engineering.backtest_feature_engineer import (
     BacktestFeatureEngineer,
 )
 from algo_royale.backtester.feature_engineering.feature_engineer import FeatureEngineer
 from algo_royale.backtester.feature_engineering.feature_engineering import (
     feature_engineering,
+    panel_feature_engineering,
 )
+from algo_royale.backtester.feature_engineering.feature_requirements import (
+    required_features,
+)
+from algo_royale.di.factory_container import FactoryContainer
 from algo_royale.di.logger_container import LoggerContainer
 from algo_royale.logging.logger_type import LoggerType
 
 
 class FeatureEngineeringContainer:
-    def __init__(self, config, logger_container: LoggerContainer):
+    def __init__(
+        self,
+        config,
+        logger_container: LoggerContainer,
+        factory_container: FactoryContainer,
+    ):
         self.config = config
         self.logger_container = logger_container
+        self.factory_container = factory_container
 
     @property
     def feature_engineering_func(self):
         return partial(feature_engineering)
 
+    @property
+    def panel_feature_engineering_func(self):
+        return partial(panel_feature_engineering)
+
+    @property
+    def backtest_features(self) -> Optional[set[str]]:
+        """Features the backtest feature stage computes; None for all."""
+        selection = FeatureSelection(
+            self.config["backtester_signal"].get(
+                "feature_selection", FeatureSelection.ALL
+            )
+        )
+        if selection == FeatureSelection.ALL:
+            return None
+        return required_features(
+            combinators=self.factory_container.signal_strategy_combinator_factory.all_combinators(),
+            logger=self.logger_container.logger(
+                logger_type=LoggerType.BACKTEST_FEATURE_ENGINEERING
+            ),
+        )
+
     @property
     def backtest_feature_engineer(self) -> BacktestFeatureEngineer:
         return BacktestFeatureEngineer(
@@ -31,6 +65,8 @@ class FeatureEngineeringContainer:
                 logger_type=LoggerType.BACKTEST_FEATURE_ENGINEERING
             ),
             max_lookback=FeatureEngineeringColumns.get_max_lookback_from_columns(),
+            features=self.backtest_features,
+            panel_feature_engineering_func=self.panel_feature_engineering_func,
         )
 
     @property
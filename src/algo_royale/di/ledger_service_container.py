@@ -28,6 +28,16 @@ class LedgerServiceContainer:
         self.logger_container = logger_container
         self.clock_service = clock_service
 
+    def dedicated(self) -> "LedgerServiceContainer":
+        """Services whose repositories use a new DB connection of their own."""
+        return LedgerServiceContainer(
+            config=self.config,
+            adapter_container=self.adapter_container,
+            repo_container=self.repo_container.dedicated(),
+            logger_container=self.logger_container,
+            clock_service=self.clock_service,
+        )
+
     @property
     def account_cash_service(self) -> AccountCashService:
         return AccountCashService(
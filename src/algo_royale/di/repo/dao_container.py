@@ -8,17 +8,28 @@ from algo_royale.logging.logger_type import LoggerType
 
 
 class DAOContainer:
-    """Data Access Object (DAO) Container"""
+    """Data Access Object (DAO) Container
+
+    DAOs use the shared DB connection unless the container is given a
+    connection of its own.
+    """
 
     def __init__(
-        self, config, db_container: DBContainer, logger_container: LoggerContainer
+        self,
+        config,
+        db_container: DBContainer,
+        logger_container: LoggerContainer,
+        connection=None,
     ):
         self.config = config
         self.db_container = db_container
         self.logger_container = logger_container
+        self.connection = connection
 
     @property
     def shared_connection(self):
+        if self.connection is not None:
+            return self.connection
         return self.db_container.db_connection
 
     @property
@@ -12,10 +12,13 @@ from algo_royale.repo.watchlist_repo import WatchlistRepo
 class RepoContainer:
     """Repository Container"""
 
-    def __init__(self, config, secrets, logger_container: LoggerContainer):
+    def __init__(
+        self, config, secrets, logger_container: LoggerContainer, connection=None
+    ):
         self.config = config
         self.secrets = secrets
         self.logger_container = logger_container
+        self.connection = connection
 
     # Instantiate DBContainer and DAOContainer as regular classes (anticipating their refactor)
     @property
@@ -32,6 +35,19 @@ class RepoContainer:
             config=self.config,
             db_container=self.db_container,
             logger_container=self.logger_container,
+            connection=self.connection,
+        )
+
+    def dedicated(self) -> "RepoContainer":
+        """
+        Repositories on a new DB connection of their own, for writers running
+        on another thread than the shared connection's users.
+        """
+        return RepoContainer(
+            config=self.config,
+            secrets=self.secrets,
+            logger_container=self.logger_container,
+            connection=self.db_container.database.connect(),
         )
 
     @property
@@ -80,4 +96,8 @@ class RepoContainer:
 
     def close(self):
         """Close resources like database connections."""
+        if self.connection is not None:
+            if not self.connection.closed:
+                self.connection.close()
+            return
         self.db_container.close()
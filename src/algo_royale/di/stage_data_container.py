@@ -1,4 +1,6 @@
 from algo_royale.backtester.data_preparer.stage_data_preparer import StageDataPreparer
+from algo_royale.backtester.enums.frame_precision import FramePrecision
+from algo_royale.backtester.profiling.stage_profiler import StageProfiler
 from algo_royale.backtester.stage_data.loader.stage_data_loader import StageDataLoader
 from algo_royale.backtester.stage_data.loader.symbol_strategy_data_loader import (
     SymbolStrategyDataLoader,
@@ -26,6 +28,18 @@ class StageDataContainer:
         self.repo_container = repo_container
 
         self.data_dir = get_project_root() / self.config["data_dir"]["root"]
+        # Shared so that every stage records into the same run report
+        self.stage_profiler = StageProfiler(
+            logger=self.logger_container.logger(
+                logger_type=LoggerType.PIPELINE_COORDINATOR
+            )
+        )
+
+    @property
+    def frame_precision(self) -> FramePrecision:
+        return FramePrecision(
+            self.config["data_dir"].get("frame_precision", FramePrecision.FULL)
+        )
 
     @property
     def stage_data_manager(self) -> StageDataManager:
@@ -53,6 +67,8 @@ class StageDataContainer:
             ),
             stage_data_manager=self.stage_data_manager,
             watchlist_repo=self.repo_container.watchlist_repo,
+            stage_profiler=self.stage_profiler,
+            precision=self.frame_precision,
         )
 
     @property
@@ -62,6 +78,8 @@ class StageDataContainer:
                 logger_type=LoggerType.STAGE_DATA_WRITER
             ),
             stage_data_manager=self.stage_data_manager,
+            stage_profiler=self.stage_profiler,
+            precision=self.frame_precision,
         )
 
     @property
@@ -95,4 +113,5 @@ class StageDataContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.SYMBOL_STRATEGY_DATA_WRITER
             ),
+            stage_profiler=self.stage_profiler,
         )
@@ -1,3 +1,4 @@
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 from algo_royale.di.ledger_service_container import LedgerServiceContainer
 from algo_royale.di.logger_container import LoggerContainer
 from algo_royale.di.trading.order_generator_service_container import (
@@ -7,21 +8,26 @@ from algo_royale.logging.logger_type import LoggerType
 from algo_royale.services.clock_service import ClockService
 from algo_royale.services.market_session_service import MarketSessionService
 from algo_royale.services.order_monitor_service import OrderMonitorService
+from algo_royale.services.order_monitor_writer import OrderMonitorWriter
 from algo_royale.services.orders_execution_service import OrderExecutionService
 
 
 class MarketSessionContainer:
     def __init__(
         self,
+        config,
         clock_service: ClockService,
         logger_container: LoggerContainer,
         ledger_service_container: LedgerServiceContainer,
         order_generator_service_container: OrderGeneratorServiceContainer,
+        latency_tracker: LatencyTracker | None = None,
     ):
+        self.config = config
         self.clock_service = clock_service
         self.logger_container = logger_container
         self.ledger_service_container = ledger_service_container
         self.order_generator_service_container = order_generator_service_container
+        self.latency_tracker = latency_tracker
 
     @property
     def order_execution_service(self) -> OrderExecutionService:
@@ -32,6 +38,19 @@ class MarketSessionContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.ORDER_EXECUTION_SERVICE
             ),
+            latency_tracker=self.latency_tracker,
+        )
+
+    @property
+    def order_monitor_writer(self) -> OrderMonitorWriter:
+        # The writer thread gets its own connection, shared by its order and trade DAOs
+        writer_services = self.ledger_service_container.dedicated()
+        return OrderMonitorWriter(
+            order_service=writer_services.order_service,
+            trades_service=writer_services.trades_service,
+            logger=self.logger_container.logger(
+                logger_type=LoggerType.ORDER_MONITOR_SERVICE
+            ),
         )
 
     @property
@@ -40,10 +59,20 @@ class MarketSessionContainer:
             ledger_service=self.ledger_service_container.ledger_service,
             order_event_service=self.order_generator_service_container.order_event_service,
             trades_service=self.ledger_service_container.trades_service,
+            writer=self.order_monitor_writer,
             clock_service=self.clock_service,
             logger=self.logger_container.logger(
                 logger_type=LoggerType.ORDER_MONITOR_SERVICE
             ),
+            trade_batch_size=int(
+                self.config["trading"].get("order_monitor_trade_batch_size", 100)
+            ),
+            trade_flush_interval_seconds=float(
+                self.config["trading"].get("order_monitor_flush_interval_seconds", 1.0)
+            ),
+            trade_max_flush_attempts=int(
+                self.config["trading"].get("order_monitor_max_flush_attempts", 3)
+            ),
         )
 
     @property
@@ -61,4 +90,8 @@ class MarketSessionContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.MARKET_SESSION_SERVICE
             ),
+            latency_tracker=self.latency_tracker,
+            premarket_step_timeout_seconds=float(
+                self.config["trading"].get("premarket_step_timeout_seconds", 120)
+            ),
         )
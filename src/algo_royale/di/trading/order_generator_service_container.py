@@ -1,3 +1,4 @@
+from algo_royale.adapters.market_data.stream_adapter import StreamAdapter
 from algo_royale.application.market_data.market_data_enriched_streamer import (
     MarketDataEnrichedStreamer,
 )
@@ -7,6 +8,7 @@ from algo_royale.application.market_data.market_data_raw_streamer import (
 from algo_royale.application.orders.order_generator import OrderGenerator
 from algo_royale.application.signals.signal_generator import SignalGenerator
 from algo_royale.application.symbols.symbol_hold_tracker import SymbolHoldTracker
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 from algo_royale.di.adapter.adapter_container import AdapterContainer
 from algo_royale.di.feature_engineering_container import FeatureEngineeringContainer
 from algo_royale.di.ledger_service_container import LedgerServiceContainer
@@ -32,6 +34,8 @@ class OrderGeneratorServiceContainer:
         registry_container: RegistryContainer,
         logger_container: LoggerContainer,
         clock_provider: ClockProvider,
+        latency_tracker: LatencyTracker | None = None,
+        stream_adapter: StreamAdapter | None = None,
     ):
         self.config = config
         self.adapter_container = adapter_container
@@ -41,16 +45,20 @@ class OrderGeneratorServiceContainer:
         self.registry_container = registry_container
         self.logger_container = logger_container
         self.clock_provider = clock_provider
+        self.latency_tracker = latency_tracker
+        # Overrides the Alpaca stream adapter (e.g. with a replay stream)
+        self.stream_adapter = stream_adapter
 
     @property
     def market_data_streamer(self) -> MarketDataRawStreamer:
         return MarketDataRawStreamer(
-            stream_adapter=self.adapter_container.stream_adapter,
+            stream_adapter=self.stream_adapter or self.adapter_container.stream_adapter,
             data_stream_session_repo=self.repo_container.data_stream_session_repo,
             logger=self.logger_container.logger(
                 logger_type=LoggerType.MARKET_DATA_RAW_STREAMER
             ),
             clock_provider=self.clock_provider,
+            latency_tracker=self.latency_tracker,
         )
 
     @property
@@ -61,6 +69,7 @@ class OrderGeneratorServiceContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.MARKET_DATA_ENRICHED_STREAMER
             ),
+            latency_tracker=self.latency_tracker,
         )
 
     @property
@@ -71,6 +80,7 @@ class OrderGeneratorServiceContainer:
             logger=self.logger_container.logger(
                 logger_type=LoggerType.SIGNAL_GENERATOR
             ),
+            latency_tracker=self.latency_tracker,
         )
 
     @property
@@ -79,6 +89,7 @@ class OrderGeneratorServiceContainer:
             signal_generator=self.signal_generator,
             portfolio_strategy_registry=self.registry_container.portfolio_strategy_registry,
             logger=self.logger_container.logger(logger_type=LoggerType.ORDER_GENERATOR),
+            latency_tracker=self.latency_tracker,
         )
 
     @property
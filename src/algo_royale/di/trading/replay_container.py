@@ -0,0 +1,111 @@
+from datetime import datetime
+
+from algo_royale.adapters.market_data.stream_adapter import StreamAdapter
+from algo_royale.application.replay.live_replay_harness import LiveReplayHarness
+from algo_royale.application.replay.replay_stub_broker import ReplayStubBroker
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+from algo_royale.clients.replay.replay_stream_client import ReplayStreamClient
+from algo_royale.di.adapter.adapter_container import AdapterContainer
+from algo_royale.di.feature_engineering_container import FeatureEngineeringContainer
+from algo_royale.di.ledger_service_container import LedgerServiceContainer
+from algo_royale.di.logger_container import LoggerContainer
+from algo_royale.di.repo.repo_container import RepoContainer
+from algo_royale.di.stage_data_container import StageDataContainer
+from algo_royale.di.trading.order_generator_service_container import (
+    OrderGeneratorServiceContainer,
+)
+from algo_royale.di.trading.registry_container import RegistryContainer
+from algo_royale.logging.logger_type import LoggerType
+from algo_royale.utils.clock_provider import ClockProvider
+from algo_royale.utils.path_utils import get_project_root
+
+
+class ReplayContainer:
+    """Wires the live order pipeline to a recorded-bar replay stream and a stub broker."""
+
+    def __init__(
+        self,
+        config,
+        adapter_container: AdapterContainer,
+        repo_container: RepoContainer,
+        feature_engineering_container: FeatureEngineeringContainer,
+        ledger_service_container: LedgerServiceContainer,
+        registry_container: RegistryContainer,
+        stage_data_container: StageDataContainer,
+        logger_container: LoggerContainer,
+        clock_provider: ClockProvider,
+    ):
+        self.config = config
+        self.adapter_container = adapter_container
+        self.repo_container = repo_container
+        self.feature_engineering_container = feature_engineering_container
+        self.ledger_service_container = ledger_service_container
+        self.registry_container = registry_container
+        self.stage_data_container = stage_data_container
+        self.logger_container = logger_container
+        self.clock_provider = clock_provider
+        # Shared by the pipeline, the stub broker and the harness
+        self.latency_tracker = LatencyTracker(
+            logger=self.logger_container.logger(logger_type=LoggerType.LATENCY_TRACKER)
+        )
+        self.replay_stream_client = ReplayStreamClient(
+            logger=self.logger_container.logger(
+                logger_type=LoggerType.REPLAY_STREAM_CLIENT
+            ),
+            speed=float(self.config["replay"]["speed"]),
+            emit_quotes=self.config["replay"]["emit_quotes"].lower() == "true",
+        )
+
+    @property
+    def stream_adapter(self) -> StreamAdapter:
+        return StreamAdapter(
+            stream_client=self.replay_stream_client,
+            logger=self.logger_container.logger(logger_type=LoggerType.STREAM_ADAPTER),
+        )
+
+    @property
+    def order_generator_service_container(self) -> OrderGeneratorServiceContainer:
+        return OrderGeneratorServiceContainer(
+            config=self.config,
+            adapter_container=self.adapter_container,
+            repo_container=self.repo_container,
+            feature_engineering_container=self.feature_engineering_container,
+            ledger_service_container=self.ledger_service_container,
+            registry_container=self.registry_container,
+            logger_container=self.logger_container,
+            clock_provider=self.clock_provider,
+            latency_tracker=self.latency_tracker,
+            stream_adapter=self.stream_adapter,
+        )
+
+    @property
+    def stub_broker(self) -> ReplayStubBroker:
+        return ReplayStubBroker(
+            logger=self.logger_container.logger(
+                logger_type=LoggerType.REPLAY_STUB_BROKER
+            ),
+            latency_tracker=self.latency_tracker,
+        )
+
+    @property
+    def live_replay_harness(self) -> LiveReplayHarness:
+        return LiveReplayHarness(
+            order_generator=self.order_generator_service_container.order_generator,
+            stream_client=self.replay_stream_client,
+            stage_data_loader=self.stage_data_container.stage_data_loader,
+            stub_broker=self.stub_broker,
+            latency_tracker=self.latency_tracker,
+            logger=self.logger_container.logger(
+                logger_type=LoggerType.LIVE_REPLAY_HARNESS
+            ),
+            drain_timeout_seconds=float(self.config["replay"]["drain_timeout_seconds"]),
+            report_path=get_project_root() / self.config["replay"]["report_root_path"],
+        )
+
+    @property
+    def replay_start_date(self) -> datetime:
+        return datetime.strptime(self.config["replay"]["start_date"], "%Y-%m-%d")
+
+    @property
+    def replay_end_date(self) -> datetime:
+        return datetime.strptime(self.config["replay"]["end_date"], "%Y-%m-%d")
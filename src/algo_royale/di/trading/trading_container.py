@@ -1,3 +1,4 @@
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 from algo_royale.di.adapter.adapter_container import AdapterContainer
 from algo_royale.di.factory_container import FactoryContainer
 from algo_royale.di.feature_engineering_container import FeatureEngineeringContainer
@@ -10,6 +11,7 @@ from algo_royale.di.trading.order_generator_service_container import (
     OrderGeneratorServiceContainer,
 )
 from algo_royale.di.trading.registry_container import RegistryContainer
+from algo_royale.di.trading.replay_container import ReplayContainer
 from algo_royale.logging.logger_type import LoggerType
 from algo_royale.services.clock_service import ClockService
 from algo_royale.services.trade_orchestrator import TradeOrchestrator
@@ -41,6 +43,10 @@ class TradingContainer:
         self.logger_container = logger_container
         self.clock_service = clock_service
         self.clock_provider = clock_provider
+        # Shared so every hop of the live path reports into the same tracker
+        self.latency_tracker = LatencyTracker(
+            logger=self.logger_container.logger(logger_type=LoggerType.LATENCY_TRACKER)
+        )
 
     @property
     def registry_container(self) -> RegistryContainer:
@@ -63,15 +69,32 @@ class TradingContainer:
             registry_container=self.registry_container,
             logger_container=self.logger_container,
             clock_provider=self.clock_provider,
+            latency_tracker=self.latency_tracker,
         )
 
     @property
     def market_session_container(self) -> MarketSessionContainer:
         return MarketSessionContainer(
+            config=self.config,
             clock_service=self.clock_service,
             logger_container=self.logger_container,
             ledger_service_container=self.ledger_service_container,
             order_generator_service_container=self.order_generator_service_container,
+            latency_tracker=self.latency_tracker,
+        )
+
+    @property
+    def replay_container(self) -> ReplayContainer:
+        return ReplayContainer(
+            config=self.config,
+            adapter_container=self.adapter_container,
+            repo_container=self.repo_container,
+            feature_engineering_container=self.feature_engineering_container,
+            ledger_service_container=self.ledger_service_container,
+            registry_container=self.registry_container,
+            stage_data_container=self.stage_data_container,
+            logger_container=self.logger_container,
+            clock_provider=self.clock_provider,
         )
 
     @property
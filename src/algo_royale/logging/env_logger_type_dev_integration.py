@@ -206,6 +206,7 @@ class EnvLoggerTypeDevIntegration(Enum):
     SYMBOL_HOLD_TRACKER = ("DEV_INTEGRATION_SYMBOL_HOLD_TRACKER", logging.DEBUG)
     SYMBOL_HOLD_SERVICE = ("DEV_INTEGRATION_SYMBOL_HOLD_SERVICE", logging.DEBUG)
     ORDER_GENERATOR_SERVICE = ("DEV_INTEGRATION_ORDER_GENERATOR_SERVICE", logging.DEBUG)
+    LATENCY_TRACKER = ("DEV_INTEGRATION_LATENCY_TRACKER", logging.DEBUG)
 
     # REGISTRY
     SIGNAL_STRATEGY_REGISTRY = (
@@ -223,6 +224,11 @@ class EnvLoggerTypeDevIntegration(Enum):
     ## TRADE ORCHESTRATOR
     TRADE_ORCHESTRATOR = ("DEV_INTEGRATION_TRADE_ORCHESTRATOR", logging.DEBUG)
 
+    ## LIVE REPLAY
+    REPLAY_STREAM_CLIENT = ("DEV_INTEGRATION_REPLAY_STREAM_CLIENT", logging.DEBUG)
+    REPLAY_STUB_BROKER = ("DEV_INTEGRATION_REPLAY_STUB_BROKER", logging.DEBUG)
+    LIVE_REPLAY_HARNESS = ("DEV_INTEGRATION_LIVE_REPLAY_HARNESS", logging.DEBUG)
+
     @property
     def name_str(self):
         return self.value[0]
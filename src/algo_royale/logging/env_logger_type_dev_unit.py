@@ -179,6 +179,7 @@ class EnvLoggerTypeDevUnit(Enum):
     SYMBOL_HOLD_TRACKER = ("DEV_UNIT_SYMBOL_HOLD_TRACKER", logging.ERROR)
     SYMBOL_HOLD_SERVICE = ("DEV_UNIT_SYMBOL_HOLD_SERVICE", logging.ERROR)
     ORDER_GENERATOR_SERVICE = ("DEV_UNIT_ORDER_GENERATOR_SERVICE", logging.ERROR)
+    LATENCY_TRACKER = ("DEV_UNIT_LATENCY_TRACKER", logging.ERROR)
 
     # REGISTRY
     SIGNAL_STRATEGY_REGISTRY = ("DEV_UNIT_SIGNAL_STRATEGY_REGISTRY", logging.ERROR)
@@ -193,6 +194,11 @@ class EnvLoggerTypeDevUnit(Enum):
     ## TRADE ORCHESTRATOR
     TRADE_ORCHESTRATOR = ("DEV_UNIT_TRADE_ORCHESTRATOR", logging.ERROR)
 
+    ## LIVE REPLAY
+    REPLAY_STREAM_CLIENT = ("DEV_UNIT_REPLAY_STREAM_CLIENT", logging.ERROR)
+    REPLAY_STUB_BROKER = ("DEV_UNIT_REPLAY_STUB_BROKER", logging.ERROR)
+    LIVE_REPLAY_HARNESS = ("DEV_UNIT_LIVE_REPLAY_HARNESS", logging.ERROR)
+
     @property
     def name_str(self):
         return self.value[0]
@@ -179,6 +179,7 @@ class EnvLoggerTypeProdLive(Enum):
     SYMBOL_HOLD_TRACKER = ("PROD_LIVE_SYMBOL_HOLD_TRACKER", logging.ERROR)
     SYMBOL_HOLD_SERVICE = ("PROD_LIVE_SYMBOL_HOLD_SERVICE", logging.ERROR)
     ORDER_GENERATOR_SERVICE = ("PROD_LIVE_ORDER_GENERATOR_SERVICE", logging.ERROR)
+    LATENCY_TRACKER = ("PROD_LIVE_LATENCY_TRACKER", logging.INFO)
 
     # REGISTRY
     SIGNAL_STRATEGY_REGISTRY = ("PROD_LIVE_SIGNAL_STRATEGY_REGISTRY", logging.ERROR)
@@ -193,6 +194,11 @@ class EnvLoggerTypeProdLive(Enum):
     ## TRADE ORCHESTRATOR
     TRADE_ORCHESTRATOR = ("PROD_LIVE_TRADE_ORCHESTRATOR", logging.ERROR)
 
+    ## LIVE REPLAY
+    REPLAY_STREAM_CLIENT = ("PROD_LIVE_REPLAY_STREAM_CLIENT", logging.ERROR)
+    REPLAY_STUB_BROKER = ("PROD_LIVE_REPLAY_STUB_BROKER", logging.ERROR)
+    LIVE_REPLAY_HARNESS = ("PROD_LIVE_LIVE_REPLAY_HARNESS", logging.INFO)
+
     @property
     def name_str(self):
         return self.value[0]
@@ -191,6 +191,7 @@ class EnvLoggerTypeProdPaper(Enum):
     SYMBOL_HOLD_TRACKER = ("PROD_PAPER_SYMBOL_HOLD_TRACKER", logging.ERROR)
     SYMBOL_HOLD_SERVICE = ("PROD_PAPER_SYMBOL_HOLD_SERVICE", logging.ERROR)
     ORDER_GENERATOR_SERVICE = ("PROD_PAPER_ORDER_GENERATOR_SERVICE", logging.ERROR)
+    LATENCY_TRACKER = ("PROD_PAPER_LATENCY_TRACKER", logging.INFO)
 
     # REGISTRY
     SIGNAL_STRATEGY_REGISTRY = ("PROD_PAPER_SIGNAL_STRATEGY_REGISTRY", logging.ERROR)
@@ -205,6 +206,11 @@ class EnvLoggerTypeProdPaper(Enum):
     ## TRADE ORCHESTRATOR
     TRADE_ORCHESTRATOR = ("PROD_PAPER_TRADE_ORCHESTRATOR", logging.ERROR)
 
+    ## LIVE REPLAY
+    REPLAY_STREAM_CLIENT = ("PROD_PAPER_REPLAY_STREAM_CLIENT", logging.ERROR)
+    REPLAY_STUB_BROKER = ("PROD_PAPER_REPLAY_STUB_BROKER", logging.ERROR)
+    LIVE_REPLAY_HARNESS = ("PROD_PAPER_LIVE_REPLAY_HARNESS", logging.INFO)
+
     @property
     def name_str(self):
         return self.value[0]
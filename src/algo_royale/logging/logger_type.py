@@ -128,6 +128,7 @@ class LoggerType(Enum):
     SYMBOL_HOLD_TRACKER = "SYMBOL_HOLD_TRACKER"
     SYMBOL_HOLD_SERVICE = "SYMBOL_HOLD_SERVICE"
     ORDER_GENERATOR_SERVICE = "ORDER_GENERATOR_SERVICE"
+    LATENCY_TRACKER = "LATENCY_TRACKER"
 
     # REGISTRY
     SIGNAL_STRATEGY_REGISTRY = "SIGNAL_STRATEGY_REGISTRY"
@@ -138,3 +139,8 @@ class LoggerType(Enum):
 
     ## TRADE ORCHESTRATOR
     TRADE_ORCHESTRATOR = "TRADE_ORCHESTRATOR"
+
+    ## LIVE REPLAY
+    REPLAY_STREAM_CLIENT = "REPLAY_STREAM_CLIENT"
+    REPLAY_STUB_BROKER = "REPLAY_STUB_BROKER"
+    LIVE_REPLAY_HARNESS = "LIVE_REPLAY_HARNESS"
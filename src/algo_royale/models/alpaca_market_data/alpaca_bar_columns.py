@@ -0,0 +1,135 @@
+from operator import itemgetter
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+# Alpaca bar keys and the column each one is decoded into, in Bar field order
+BAR_FIELDS = {
+    "t": "timestamp",
+    "o": "open_price",
+    "h": "high_price",
+    "l": "low_price",
+    "c": "close_price",
+    "v": "volume",
+    "n": "num_trades",
+    "vw": "volume_weighted_price",
+}
+PRICE_COLUMNS = ["open_price", "high_price", "low_price", "close_price"]
+COUNT_COLUMNS = ["volume", "num_trades"]
+FLOAT_COLUMNS = PRICE_COLUMNS + ["volume_weighted_price"]
+
+_bar_values = itemgetter(*BAR_FIELDS)
+
+
+def empty_bar_frame() -> pd.DataFrame:
+    """An empty frame with the decoded bar columns and dtypes."""
+    frame = pd.DataFrame(
+        {column: pd.Series(dtype=np.float64) for column in BAR_FIELDS.values()}
+    )
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True)
+    return frame.astype({column: np.int64 for column in COUNT_COLUMNS})
+
+
+def decode_bars(bars: list[dict]) -> pd.DataFrame:
+    """
+    Decode a list of raw Alpaca bars into one typed column per field, without
+    building a Bar per row. Missing or malformed prices decode to NaN and
+    missing counts to 0, as Bar.from_raw does; unparseable timestamps decode
+    to NaT. Rows are returned in ascending timestamp order.
+    """
+    if not bars:
+        return empty_bar_frame()
+    try:
+        # Fast path: every bar carries every key
+        columns = dict(zip(BAR_FIELDS.values(), zip(*map(_bar_values, bars))))
+        frame = pd.DataFrame(
+            {
+                column: np.asarray(columns[column], dtype=np.float64)
+                for column in FLOAT_COLUMNS
+            }
+        )
+        for column in COUNT_COLUMNS:
+            frame[column] = np.asarray(columns[column], dtype=np.int64)
+    except (KeyError, TypeError, ValueError):
+        columns = {
+            column: [bar.get(key) for bar in bars] for key, column in BAR_FIELDS.items()
+        }
+        frame = pd.DataFrame(
+            {
+                column: pd.to_numeric(
+                    pd.Series(columns[column], dtype=object), errors="coerce"
+                ).astype(np.float64)
+                for column in FLOAT_COLUMNS
+            }
+        )
+        for column in COUNT_COLUMNS:
+            frame[column] = (
+                pd.to_numeric(pd.Series(columns[column], dtype=object), errors="coerce")
+                .fillna(0)
+                .astype(np.int64)
+            )
+    frame.insert(
+        0,
+        "timestamp",
+        pd.to_datetime(pd.Series(columns["timestamp"]), utc=True, errors="coerce"),
+    )
+    frame = frame[list(BAR_FIELDS.values())]
+    if not frame["timestamp"].is_monotonic_increasing:
+        # Pages requested newest first (or mixed) still come back oldest first
+        frame = frame.sort_values("timestamp", kind="stable", ignore_index=True)
+    return frame
+
+
+def invalid_bar_mask(frame: pd.DataFrame) -> np.ndarray:
+    """
+    Flag bars that should not be staged, checking whole columns at once:
+    missing timestamps, repeated timestamps, non-positive or non-finite prices,
+    a high below the low and negative volume or trade counts.
+    """
+    prices = frame[PRICE_COLUMNS].to_numpy(dtype=np.float64)
+    counts = frame[COUNT_COLUMNS].to_numpy()
+    invalid = frame["timestamp"].isna().to_numpy()
+    invalid |= ~np.isfinite(prices).all(axis=1) | (prices <= 0).any(axis=1)
+    invalid |= frame["high_price"].to_numpy() < frame["low_price"].to_numpy()
+    invalid |= (counts < 0).any(axis=1)
+    # Of bars sharing a timestamp, keep the first one that is otherwise valid
+    valid = ~invalid
+    invalid[valid] = frame["timestamp"][valid].duplicated().to_numpy()
+    return invalid
+
+
+class BarColumnsResponse(BaseModel):
+    """
+    Historical bars for one or more stock symbols, decoded into columns.
+
+    Attributes:
+        symbol_frames (Dict[str, pd.DataFrame]): A mapping from stock symbol to a
+            frame with one row per bar, in ascending timestamp order.
+        next_page_token (Optional[str]): Token to fetch the next page of data, if available.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    symbol_frames: Dict[str, pd.DataFrame]
+    next_page_token: Optional[str] = None
+
+    @classmethod
+    def from_raw(cls, raw_data: dict) -> "BarColumnsResponse":
+        """
+        Creates a BarColumnsResponse instance from raw API response.
+
+        Args:
+            raw_data (dict): The raw dictionary response from the Alpaca API.
+
+        Returns:
+            BarColumnsResponse: The bars of each symbol decoded by decode_bars.
+        """
+        return cls(
+            symbol_frames={
+                symbol: decode_bars(bar_list)
+                for symbol, bar_list in (raw_data.get("bars") or {}).items()
+            },
+            next_page_token=raw_data.get("next_page_token"),
+        )
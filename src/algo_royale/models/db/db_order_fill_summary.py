@@ -0,0 +1,53 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DBOrderFillSummary(BaseModel):
+    """
+    Represents an order with the cumulative fills recorded against it.
+
+    Attributes:
+        order_id (UUID): Identifier of the order.
+        symbol (str): Trading symbol of the order.
+        action (str): Action of the order (e.g., 'buy', 'sell').
+        filled_qty (float): Total quantity of the recorded trades.
+        filled_notional (float): Total notional (price * quantity) of the recorded trades.
+    """
+
+    order_id: UUID
+    symbol: str
+    action: str
+    filled_qty: float
+    filled_notional: float
+
+    @classmethod
+    def columns(cls):
+        return [
+            "order_id",
+            "symbol",
+            "action",
+            "filled_qty",
+            "filled_notional",
+        ]
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "DBOrderFillSummary":
+        """
+        Create a DBOrderFillSummary instance from a tuple.
+        """
+        d = dict(zip(cls.columns(), data))
+        return cls.from_dict(d)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DBOrderFillSummary":
+        """
+        Create a DBOrderFillSummary instance from a dictionary.
+        """
+        return cls(
+            order_id=data["order_id"],
+            symbol=data["symbol"],
+            action=data["action"],
+            filled_qty=float(data["filled_qty"] or 0),
+            filled_notional=float(data["filled_notional"] or 0),
+        )
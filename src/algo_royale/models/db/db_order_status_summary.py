@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+
+
+class DBOrderStatusSummary(BaseModel):
+    """
+    Represents the grouped order state for a symbol and status.
+
+    Attributes:
+        symbol (str): The stock symbol of the orders.
+        status (str): The status shared by the grouped orders.
+        settled (bool): True if every grouped order is settled.
+        order_count (int): The number of orders in the group.
+    """
+
+    symbol: str
+    status: str
+    settled: bool
+    order_count: int
+
+    @classmethod
+    def columns(cls):
+        return [
+            "symbol",
+            "status",
+            "settled",
+            "order_count",
+        ]
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "DBOrderStatusSummary":
+        """
+        Create a DBOrderStatusSummary instance from a tuple.
+        """
+        d = dict(zip(cls.columns(), data))
+        return cls.from_dict(d)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DBOrderStatusSummary":
+        """
+        Create a DBOrderStatusSummary instance from a dictionary.
+        """
+        return cls(
+            symbol=data["symbol"],
+            status=data["status"],
+            settled=bool(data["settled"]),
+            order_count=data["order_count"],
+        )
@@ -0,0 +1,52 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class DBPageCursor(BaseModel):
+    """
+    Represents the last row of a page for keyset pagination. The next page
+    starts strictly after it, so deep pages are an index seek rather than a
+    scan over every skipped row.
+
+    Attributes:
+        key (datetime | None): Sort key of the last row (created_at for orders,
+            executed_at or settlement_date for trades).
+        id (UUID): ID of the last row, ordering rows with equal sort keys.
+    """
+
+    key: datetime | None = None
+    id: UUID
+
+    @classmethod
+    def after_order(cls, order) -> "DBPageCursor":
+        """
+        Cursor after an order, for pages ordered by creation time.
+        """
+        return cls(key=order.created_at, id=order.id)
+
+    @classmethod
+    def after_executed_trade(cls, trade) -> "DBPageCursor":
+        """
+        Cursor after a trade, for pages ordered by execution time.
+        """
+        return cls(key=trade.executed_at, id=trade.id)
+
+    @classmethod
+    def after_unsettled_trade(cls, trade) -> "DBPageCursor":
+        """
+        Cursor after a trade, for pages ordered by settlement date.
+        """
+        return cls(key=trade.settlement_date, id=trade.id)
+
+    @staticmethod
+    def params(after: "DBPageCursor | None", limit: int) -> dict:
+        """
+        Query parameters for a page of at most limit rows after the cursor.
+        """
+        return {
+            "limit": limit,
+            "after_key": after.key if after else None,
+            "after_id": str(after.id) if after else None,
+        }
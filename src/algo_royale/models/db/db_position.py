@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -7,14 +9,14 @@ class DBPosition(BaseModel):
 
     Attributes:
         symbol (str): The stock symbol of the position.
-        market (str): The market where the position is held (e.g., 'NYSE', 'NASDAQ').
+        market (Optional[str]): The market where the position is held (e.g., 'NYSE', 'NASDAQ'), if known.
         user_id (str): The ID of the user who owns the position.
         account_id (str): The ID of the account associated with the position.
         net_position (float): The net position of the stock in the account.
     """
 
     symbol: str
-    market: str
+    market: Optional[str] = None
     user_id: str
     account_id: str
     net_position: float
@@ -44,7 +46,8 @@ class DBPosition(BaseModel):
         """
         return cls(
             symbol=data["symbol"],
-            market=data["market"],
+            market=data.get("market"),
+            user_id=data["user_id"],
             account_id=data["account_id"],
             net_position=data["net_position"],
         )
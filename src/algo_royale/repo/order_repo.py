@@ -4,6 +4,9 @@ from uuid import UUID
 
 from algo_royale.clients.db.dao.order_dao import OrderDAO
 from algo_royale.models.db.db_order import DBOrder
+from algo_royale.models.db.db_order_fill_summary import DBOrderFillSummary
+from algo_royale.models.db.db_order_status_summary import DBOrderStatusSummary
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 
 
 class DBOrderStatus(ABC):
@@ -49,16 +52,19 @@ class OrderRepo:
         return self.dao.fetch_order_by_id(order_id, self.user_id, self.account_id)
 
     def fetch_orders_by_status(
-        self, status_list: list[DBOrderStatus], limit: int = 100, offset: int = 0
+        self,
+        status_list: list[DBOrderStatus],
+        limit: int = 100,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         """Fetch all orders for a specific status with pagination.
         :param status_list: List of statuses to filter orders by.
         :param limit: Maximum number of orders to fetch.
-        :param offset: Offset for pagination.
+        :param after: Cursor of the previous page's last order.
         :return: List of orders for the specified status.
         """
         return self.dao.fetch_orders_by_status(
-            status_list=status_list, limit=limit, offset=offset
+            status_list=status_list, limit=limit, after=after
         )
 
     def fetch_all_orders_by_symbol_and_status(
@@ -80,17 +86,45 @@ class OrderRepo:
         symbol: str,
         status_list: list[DBOrderStatus],
         limit: int = 100,
-        offset: int = 0,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         """Fetch orders by symbol and status with pagination.
         :param symbol: The stock symbol of the orders to fetch.
         :param status_list: List of statuses to filter orders by.
         :param limit: Maximum number of orders to fetch.
-        :param offset: Offset for pagination.
+        :param after: Cursor of the previous page's last order.
         :return: List of orders matching the specified symbol and status.
         """
         return self.dao.fetch_orders_by_symbol_and_status(
-            symbol=symbol, status_list=status_list, limit=limit, offset=offset
+            symbol=symbol, status_list=status_list, limit=limit, after=after
+        )
+
+    def fetch_order_status_summary_by_symbols(
+        self, symbols: list[str], status_list: list[DBOrderStatus]
+    ) -> list[DBOrderStatusSummary]:
+        """Fetch the grouped order state for a set of symbols.
+        :param symbols: The stock symbols to summarize.
+        :param status_list: List of statuses to filter orders by.
+        :return: One summary per symbol and status with matching orders.
+        """
+        return self.dao.fetch_order_status_summary_by_symbols(
+            symbols=symbols,
+            status_list=status_list,
+            user_id=self.user_id,
+            account_id=self.account_id,
+        )
+
+    def fetch_order_fill_summary_by_status(
+        self, status_list: list[DBOrderStatus]
+    ) -> list[DBOrderFillSummary]:
+        """Fetch orders by status with the cumulative fills of their trades.
+        :param status_list: List of statuses to filter orders by.
+        :return: One fill summary per matching order.
+        """
+        return self.dao.fetch_order_fill_summary_by_status(
+            status_list=status_list,
+            user_id=self.user_id,
+            account_id=self.account_id,
         )
 
     def fetch_unsettled_orders(self) -> list[DBOrder]:
@@ -1,10 +1,12 @@
 ## service\trade_service.py
 from abc import ABC
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
 from algo_royale.clients.db.dao.trade_dao import TradeDAO
 from algo_royale.logging.loggable import Loggable
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.models.db.db_position import DBPosition
 from algo_royale.models.db.db_trade import DBTrade
 
@@ -32,14 +34,14 @@ class TradeRepo:
         self.account_id = account_id
 
     def fetch_unsettled_trades(
-        self, limit: int = 100, offset: int = 0
+        self, limit: int = 100, after: DBPageCursor | None = None
     ) -> list[DBTrade]:
         """Fetch all unsettled trades with pagination.
         :param limit: Maximum number of trades to fetch.
-        :param offset: Offset for pagination.
+        :param after: Cursor of the previous page's last trade.
         :return: List of unsettled trades.
         """
-        return self.dao.fetch_unsettled_trades(limit, offset)
+        return self.dao.fetch_unsettled_trades(limit, after)
 
     def insert_trade(
         self,
@@ -86,30 +88,74 @@ class TradeRepo:
             account_id=self.account_id,
         )
 
+    def verify_positions(self) -> list[tuple[str, Decimal | None, Decimal | None]]:
+        """Compare the positions projection with a full aggregation of the trades.
+        :return: (symbol, expected, projected) for every symbol that differs.
+        """
+        return self.dao.verify_positions(
+            user_id=self.user_id,
+            account_id=self.account_id,
+        )
+
+    def rebuild_positions(self) -> int:
+        """Rebuild the positions projection from the full trade history.
+        :return: The number of open positions after the rebuild.
+        """
+        return self.dao.rebuild_positions(
+            user_id=self.user_id,
+            account_id=self.account_id,
+        )
+
     def fetch_trades_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
         limit: int = 100,
-        offset: int = 0,
+        after: DBPageCursor | None = None,
     ) -> list[DBTrade]:
         """Fetch trades within a specific date range.
         :param start_date: The start date of the range.
         :param end_date: The end date of the range.
         :param limit: The maximum number of trades to return.
-        :param offset: The number of trades to skip.
+        :param after: Cursor of the previous page's last trade.
         :return: A list of trades within the specified date range.
         """
-        return self.dao.fetch_trades_by_date_range(start_date, end_date, limit, offset)
+        return self.dao.fetch_trades_by_date_range(start_date, end_date, limit, after)
 
     def fetch_trades_by_order_id(self, order_id: UUID) -> list[DBTrade]:
         """Fetch trades by order ID."""
         return self.dao.fetch_trades_by_order_id(order_id)
 
+    def insert_trades(self, trades: list[DBTrade]) -> int:
+        """Insert a batch of trades.
+        :param trades: The trades to insert.
+        :return: The number of inserted trades.
+        """
+        return self.dao.insert_trades(
+            trades=trades, user_id=self.user_id, account_id=self.account_id
+        )
+
     def update_settled_trades(self, settlement_datetime: datetime) -> int:
         """Update all trades as settled."""
         return self.dao.update_settled_trades(settlement_datetime)
 
+    def reconcile_trades(
+        self, trades: list[DBTrade], start_date: datetime, end_date: datetime
+    ) -> tuple[int, int]:
+        """Reconcile local trades in a date range against broker fills.
+        :param trades: The broker fills for the date range.
+        :param start_date: The start date of the range.
+        :param end_date: The end date of the range.
+        :return: A tuple of (deleted count, inserted count).
+        """
+        return self.dao.reconcile_trades(
+            trades=trades,
+            start_date=start_date,
+            end_date=end_date,
+            user_id=self.user_id,
+            account_id=self.account_id,
+        )
+
     def delete_trade(self, trade_id: UUID) -> int:
         """Delete a trade record.
         :param trade_id: The ID of the trade to delete.
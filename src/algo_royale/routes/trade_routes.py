@@ -4,31 +4,63 @@ from datetime import datetime
 
 from flask import Blueprint, jsonify, request
 
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.services.trades_service import TradesService
 
 
+def _page_cursor() -> DBPageCursor | None:
+    """
+    Cursor from the after_key/after_id query arguments of a previous page.
+    :raises ValueError: If the cursor is malformed or an offset is given;
+        pages are keyset paged, so an offset would be silently ignored.
+    """
+    if "offset" in request.args:
+        raise ValueError(
+            "offset is not supported; page with the after_key and after_id "
+            "of the previous page's last trade"
+        )
+    after_id = request.args.get("after_id")
+    after_key = request.args.get("after_key")
+    if not after_id:
+        if after_key:
+            raise ValueError("after_key requires after_id")
+        return None
+    try:
+        return DBPageCursor(
+            key=datetime.fromisoformat(after_key) if after_key else None,
+            id=after_id,
+        )
+    except ValueError as e:
+        raise ValueError(f"Malformed page cursor: {e}") from e
+
+
+def _bad_request(error: ValueError):
+    return jsonify({"error": str(error)}), 400
+
+
 def create_trade_blueprint(service: TradesService) -> Blueprint:
     trade_bp = Blueprint("trade", __name__)
 
     @trade_bp.route("/unsettled", methods=["GET"])
     def fetch_unsettled_trades():
         limit = request.args.get("limit", default=10, type=int)
-        offset = request.args.get("offset", default=0, type=int)
-        trades = service.fetch_unsettled_trades(limit=limit, offset=offset)
+        try:
+            after = _page_cursor()
+        except ValueError as e:
+            return _bad_request(e)
+        trades = service.fetch_unsettled_trades(limit=limit, after=after)
         return jsonify(trades)
 
     @trade_bp.route("/date_range", methods=["GET"])
     def get_trades_by_date_range():
-        start_date = request.args.get("start_date")
-        end_date = request.args.get("end_date")
         limit = request.args.get("limit", default=10, type=int)
-        offset = request.args.get("offset", default=0, type=int)
-        trades = service.fetch_trades_by_date_range(
-            datetime.fromisoformat(start_date),
-            datetime.fromisoformat(end_date),
-            limit,
-            offset,
-        )
+        try:
+            start_date = datetime.fromisoformat(request.args.get("start_date", ""))
+            end_date = datetime.fromisoformat(request.args.get("end_date", ""))
+            after = _page_cursor()
+        except ValueError as e:
+            return _bad_request(e)
+        trades = service.fetch_trades_by_date_range(start_date, end_date, limit, after)
         return jsonify(trades)
 
     return trade_bp
@@ -3,6 +3,8 @@ from decimal import Decimal
 from algo_royale.application.orders.equity_order_types import EquityBaseOrder
 from algo_royale.logging.loggable import Loggable
 from algo_royale.models.db.db_order import DBOrder
+from algo_royale.models.db.db_order_fill_summary import DBOrderFillSummary
+from algo_royale.repo.order_repo import DBOrderStatus
 from algo_royale.services.account_cash_service import AccountCashService
 from algo_royale.services.enriched_data_service import EnrichedDataService
 from algo_royale.services.orders_service import OrderService
@@ -71,6 +73,16 @@ class LedgerService:
             self.logger.error(f"Error fetching order {order_id}: {e}")
             return None
 
+    def fetch_order_fill_summary_by_status(
+        self, status_list: list[DBOrderStatus]
+    ) -> list[DBOrderFillSummary]:
+        """Fetch orders by status with the cumulative fills of their trades."""
+        try:
+            return self.order_service.fetch_order_fill_summary_by_status(status_list)
+        except Exception as e:
+            self.logger.error(f"Error fetching order fill summaries: {e}")
+            return []
+
     def submit_equity_order(self, order: EquityBaseOrder, enriched_data: dict) -> None:
         """Submit a new order."""
         try:
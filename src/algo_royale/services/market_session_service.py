@@ -1,7 +1,11 @@
+import inspect
 from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
 
 from algo_royale.application.symbols.enums import SymbolHoldStatus
 from algo_royale.application.utils.async_pubsub import AsyncSubscriber
+from algo_royale.application.utils.async_step_graph import AsyncStep, AsyncStepGraph
+from algo_royale.application.utils.latency_tracker import LatencyTracker
 from algo_royale.logging.loggable import Loggable
 from algo_royale.services.clock_service import ClockService
 from algo_royale.services.ledger_service import LedgerService
@@ -29,6 +33,8 @@ class MarketSessionService:
         order_monitor_service: OrderMonitorService,
         clock_service: ClockService,
         logger: Loggable,
+        latency_tracker: LatencyTracker | None = None,
+        premarket_step_timeout_seconds: float | None = 120.0,
     ):
         ## SYMBOLS
         self.symbol_service = symbol_service
@@ -48,29 +54,112 @@ class MarketSessionService:
         self.ledger_service = ledger_service
         ## PROCESS
         self.premarket_completed = False
+        self.premarket_step_timeout_seconds = premarket_step_timeout_seconds
+        self.premarket_report: dict = {}
         ## CLOCK
         self.clock_service = clock_service
         ## LOGGER
         self.logger = logger
+        ## LATENCY
+        self.latency_tracker = latency_tracker
 
     async def async_start_premarket(self) -> None:
-        """Start the pre-market session."""
+        """
+        Start the pre-market session. The bootstrap steps run as a dependency
+        graph, so independent broker and DB work overlaps, and each step has a
+        time budget. The session is ready only if every step succeeded.
+        """
         try:
             self.logger.info("Starting pre-market session...")
-            self.trade_service.update_settled_trades()
-            self.order_service.update_settled_orders()
-            await self.symbol_hold_service.start()
-            await self._async_subscribe_to_symbol_holds()
-            await self._async_run_validations()
-            self._init_ledger_service()
-            await self.order_monitor_service.async_start()
-            await self._async_start_order_execution_subscription()
+            graph = AsyncStepGraph(
+                steps=self._premarket_steps(),
+                logger=self.logger,
+                default_timeout_seconds=self.premarket_step_timeout_seconds,
+            )
+            self.premarket_report = await graph.async_run()
+            self.logger.info(f"Pre-market bootstrap timings: {self.premarket_report}")
+            if not self.premarket_report["succeeded"]:
+                self.logger.error("Pre-market bootstrap did not complete.")
+                return
         except Exception as e:
             self.logger.error(f"Error starting pre-market session: {e}")
             return
         self.premarket_completed = True
         self.logger.info("Pre-market session started.")
 
+    def _premarket_steps(self) -> list[AsyncStep]:
+        """
+        The pre-market bootstrap steps and their dependencies. Settlement runs
+        first since hold resolution and reconciliation read settled state;
+        fill recovery in the order monitor waits for reconciled trades; order
+        execution starts last, once holds, cash, positions and the monitor are ready.
+        Each step returns True on success; any other result fails the step.
+        """
+        steps = [
+            AsyncStep("settle_trades", self.trade_service.update_settled_trades),
+            AsyncStep(
+                "settle_orders",
+                self.order_service.update_settled_orders,
+                depends_on=("settle_trades",),
+            ),
+            AsyncStep(
+                "symbol_holds",
+                self._async_start_symbol_holds,
+                depends_on=("settle_orders",),
+            ),
+            AsyncStep(
+                "validations",
+                self._async_run_validations,
+                depends_on=("settle_orders",),
+            ),
+            AsyncStep("ledger", self._init_ledger_service),
+            AsyncStep(
+                "order_monitor",
+                self.order_monitor_service.async_start,
+                depends_on=("validations",),
+            ),
+            AsyncStep(
+                "order_execution",
+                self._async_start_order_execution_subscription,
+                depends_on=("symbol_holds", "ledger", "order_monitor"),
+            ),
+        ]
+        for step in steps:
+            step.fn = self._require_success(step.name, step.fn)
+        return steps
+
+    @staticmethod
+    def _require_success(name: str, fn: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Wrap a step that handles its own errors so that a result other than
+        True raises, letting the step graph fail it and skip its dependents.
+        Coroutine functions stay coroutine functions and plain callables stay
+        plain, so the graph still runs the latter in a worker thread.
+        """
+
+        def check(result: Any) -> Any:
+            if result is not True:
+                raise RuntimeError(f"Pre-market step {name} reported failure")
+            return result
+
+        if inspect.iscoroutinefunction(fn):
+
+            async def async_step():
+                return check(await fn())
+
+            return async_step
+
+        def step():
+            return check(fn())
+
+        return step
+
+    async def _async_start_symbol_holds(self) -> bool:
+        """Start the symbol hold service and subscribe to its roster."""
+        if not await self.symbol_hold_service.start():
+            return False
+        return await self._async_subscribe_to_symbol_holds()
+
     async def async_start_market(self) -> dict[str, AsyncSubscriber] | None:
         """Start the market session."""
         try:
@@ -96,19 +185,27 @@ class MarketSessionService:
             await self.order_monitor_service.async_stop()
             await self._async_run_validations()
             self.premarket_completed = False
+            if self.latency_tracker:
+                self.latency_tracker.log_snapshot()
             self.logger.info("Market session stopped.")
         except Exception as e:
             self.logger.error(f"Error stopping market session: {e}")
 
-    def _init_ledger_service(self) -> None:
+    def get_latency_snapshot(self) -> dict:
+        """Return live path latency, queue-wait and drop statistics collected so far."""
+        return self.latency_tracker.snapshot() if self.latency_tracker else {}
+
+    def _init_ledger_service(self) -> bool:
         """Initialize the ledger service."""
         try:
             available_cash = self.ledger_service.get_available_cash()
             self.ledger_service.init_sod_cash(available_cash)
+            return True
         except Exception as e:
             self.logger.error(f"Error initializing ledger service: {e}")
+        return False
 
-    async def _async_start_order_execution_subscription(self) -> None:
+    async def _async_start_order_execution_subscription(self) -> bool:
         """Start the order execution services."""
         try:
             symbols = self.symbol_service.get_symbols()
@@ -116,7 +213,7 @@ class MarketSessionService:
             if symbol_subscribers:
                 for symbol, subscriber in symbol_subscribers.items():
                     self.symbol_subscribers[symbol] = subscriber
-                    return True
+                return True
             else:
                 self.logger.error("Failed to start order execution service.")
         except Exception as e:
@@ -136,7 +233,7 @@ class MarketSessionService:
         finally:
             self.symbol_subscribers.clear()
 
-    async def _async_run_validations(self) -> None:
+    async def _async_run_validations(self) -> bool:
         """Run all necessary validations."""
         try:
             today = self.clock_service.now().date()
@@ -154,11 +251,12 @@ class MarketSessionService:
             await self.trade_service.reconcile_trades(
                 start_date=start_of_last_week, end_date=now
             )
-            await self.positions_service.validate_positions()
+            return await self.positions_service.validate_positions()
         except Exception as e:
             self.logger.error(f"Error running validations: {e}")
+        return False
 
-    async def _async_subscribe_to_symbol_holds(self) -> None:
+    async def _async_subscribe_to_symbol_holds(self) -> bool:
         """Subscribe to symbol holds."""
         try:
             async_subscriber = (
@@ -1,45 +1,150 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from uuid import UUID
+
 from algo_royale.logging.loggable import Loggable
 from algo_royale.models.alpaca_trading.alpaca_order import Order
 from algo_royale.models.alpaca_trading.enums.order_stream_event import OrderStreamEvent
 from algo_royale.models.alpaca_trading.order_stream_data import OrderStreamData
-from algo_royale.models.db.db_order import DBOrder
+from algo_royale.models.db.db_trade import DBTrade
+from algo_royale.repo.order_repo import DBOrderStatus
 from algo_royale.services.clock_service import ClockService
 from algo_royale.services.ledger_service import LedgerService
 from algo_royale.services.order_event_service import OrderEventService
+from algo_royale.services.order_monitor_writer import OrderMonitorWriter
 from algo_royale.services.trades_service import TradesService
 
 
+@dataclass
+class OrderFillState:
+    """
+    Cumulative fills recorded for an open order.
+
+    Attributes:
+        order_id: The DB order ID (the Alpaca client order ID).
+        symbol: The stock symbol of the order.
+        action: The action of the order (e.g., 'buy', 'sell').
+        filled_qty: Quantity already recorded as trades.
+        filled_notional: Notional (price * quantity) already recorded as trades.
+    """
+
+    order_id: UUID
+    symbol: str
+    action: str
+    filled_qty: float = 0.0
+    filled_notional: float = 0.0
+
+
 class OrderMonitorService:
+    """
+    Applies order stream events to the ledger.
+
+    Open orders and their cumulative filled quantity and notional are kept in
+    memory, so a fill event is turned into a trade without any reads. Order
+    status updates and batches of queued trades are written by the writer, on
+    its own thread and DB connection, so fill bursts do not stall the event
+    loop. On start the in-memory view is rebuilt from the open orders and
+    trades in the DB.
+
+    Each fill is recorded under its own external ID (the broker order ID and
+    the cumulative filled quantity), and trades already stored are skipped,
+    so a batch can be retried safely. A batch that still fails after
+    trade_max_flush_attempts flushes is dropped to dead_letter_trades; trade
+    reconciliation restores those fills from the broker.
+
+    Parameters:
+        ledger_service: Service for managing the ledger.
+        order_event_service: Source of incoming order events.
+        trades_service: Service for managing trades.
+        writer: Writes order status updates and trades off the event loop.
+        clock_service: Clock used when a fill has no execution time.
+        logger: Loggable instance for logging information and errors.
+        trade_batch_size: Queued trades that trigger an immediate flush.
+        trade_flush_interval_seconds: Interval between background flushes.
+        trade_max_flush_attempts: Flushes a trade is attempted before it is dropped.
+    """
+
+    OPEN_ORDER_STATUSES = [
+        DBOrderStatus.NEW,
+        DBOrderStatus.PENDING_NEW,
+        DBOrderStatus.PARTIAL_FILL,
+        DBOrderStatus.PENDING_CANCEL,
+        DBOrderStatus.PENDING_REPLACE,
+        DBOrderStatus.STOPPED,
+        DBOrderStatus.CALCULATED,
+        DBOrderStatus.SUSPENDED,
+    ]
+    CLOSING_EVENTS = [
+        OrderStreamEvent.FILL,
+        OrderStreamEvent.CANCELED,
+        OrderStreamEvent.EXPIRED,
+        OrderStreamEvent.DONE_FOR_DAY,
+        OrderStreamEvent.REPLACED,
+        OrderStreamEvent.REJECTED,
+    ]
+
     def __init__(
         self,
         ledger_service: LedgerService,  ## Service for managing the ledger
         order_event_service: OrderEventService,  ## Incoming order events
         trades_service: TradesService,  ## Service for managing trades
+        writer: OrderMonitorWriter,  ## Writes to the DB off the event loop
         clock_service: ClockService,
         logger: Loggable,
+        trade_batch_size: int = 100,
+        trade_flush_interval_seconds: float = 1.0,
+        trade_max_flush_attempts: int = 3,
     ):
         self.ledger_service = ledger_service
         self.order_event_service = order_event_service
         self.trade_service = trades_service
+        self.writer = writer
         self.order_events_subscriber = None
         self.clock_service = clock_service
         self.logger = logger
+        self.trade_batch_size = max(1, int(trade_batch_size))
+        self.trade_flush_interval_seconds = trade_flush_interval_seconds
+        self.order_fills: dict[str, OrderFillState] = {}
+        self.trade_max_flush_attempts = max(1, int(trade_max_flush_attempts))
+        self.pending_trades: list[DBTrade] = []
+        self.dead_letter_trades: deque[DBTrade] = deque(maxlen=1000)
+        self._flush_attempts: dict[str, int] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._stop_flushing = asyncio.Event()
 
-    async def async_start(self):
-        """Start the order monitor service."""
+    async def async_start(self) -> bool:
+        """
+        Rebuild the fill state from the DB and start the order monitor service.
+        :return: True once the service is started.
+        """
         try:
             if self.order_events_subscriber is None:
+                self._recover_fill_state()
+                self.writer.start()
                 await self._async_subscribe_to_order_events()
+                self._stop_flushing.clear()
+                self._flush_task = asyncio.create_task(self._async_flush_loop())
                 self.logger.info("Order stream subscriber started.")
+            return True
         except Exception as e:
             self.logger.error(f"Error starting order monitor service: {e}")
+            return False
 
     async def async_stop(self):
-        """Stop the order monitor service."""
+        """Stop the order monitor service and persist any queued writes."""
         try:
             if self.order_events_subscriber:
                 await self._async_unsubscribe_from_order_events()
                 self.logger.info("Order stream subscriber stopped.")
+            if self._flush_task:
+                # Let an in-flight flush finish instead of losing its batch
+                self._stop_flushing.set()
+                await self._flush_task
+                self._flush_task = None
+            if self.writer.running:
+                await self._async_flush_trades()
+            await self.writer.async_stop()
         except Exception as e:
             self.logger.error(f"Error stopping order monitor service: {e}")
 
@@ -50,19 +155,25 @@ class OrderMonitorService:
                 self.logger.warning("Order stream subscriber already exists.")
                 return
             async_subscriber = await self.order_event_service.async_subscribe(
-                callback=self._handle_order_event
+                callback=self._async_handle_order_event
             )
             self.order_events_subscriber = async_subscriber
         except Exception as e:
             self.logger.error(f"Error subscribing to order stream: {e}")
 
-    def _handle_order_event(self, data: OrderStreamData):
+    async def _async_handle_order_event(self, data: OrderStreamData):
         """Handle incoming order events from the order stream."""
         try:
             self.logger.info(f"Handling order event: {data}")
-            self._update_order_status(data=data)
+            self._update_order_status(data)
             if data.event in [OrderStreamEvent.FILL, OrderStreamEvent.PARTIAL_FILL]:
-                self._handle_fill_event(data.order)
+                trade = self._handle_fill_event(data.order)
+                if trade is not None:
+                    self.pending_trades.append(trade)
+            if data.event in self.CLOSING_EVENTS:
+                self.order_fills.pop(data.order.client_order_id, None)
+            if len(self.pending_trades) >= self.trade_batch_size:
+                await self._async_flush_trades()
         except Exception as e:
             self.logger.error(f"Error handling order event: {e}")
 
@@ -79,74 +190,140 @@ class OrderMonitorService:
         except Exception as e:
             self.logger.error(f"Error unsubscribing from order stream: {e}")
 
-    def _handle_fill_event(self, order: Order):
-        """Handle fill events for an order."""
+    def _handle_fill_event(self, order: Order) -> DBTrade | None:
+        """
+        Turn a fill event into a trade for the quantity filled since the last event.
+        The order carries its cumulative filled quantity and average price, so the
+        fill delta is computed against the in-memory state without reading the DB.
+        :param order: The order from the fill event.
+        :return: The trade to record, or None if there is nothing new to record.
+        """
         try:
-            db_order = self._get_existing_order(order.id)
-            if not db_order:
-                self.logger.warning(f"No existing order found for fill event: {order}")
-                fill_qty = order.qty
-            else:
-                fill_qty = order.qty - db_order.quantity
+            state = self._get_fill_state(order)
+            if state is None:
+                return None
+            filled_qty = float(order.filled_qty or 0)
+            filled_notional = filled_qty * float(order.filled_avg_price or 0)
+            fill_qty = filled_qty - state.filled_qty
             if fill_qty <= 0:
                 self.logger.warning(
                     f"Fill quantity is zero or negative for order {order}. Ignoring."
                 )
-                return
-
-            db_trades = self.trade_service.fetch_trades_by_order_id(order.id)
-            db_trades_qty = sum(trade.quantity for trade in db_trades)
-            db_avg_price = (
-                sum(trade.price * trade.quantity for trade in db_trades) / db_trades_qty
-                if db_trades_qty > 0
-                else 0
-            )
-            filled_notional = (
-                order.filled_avg_price * fill_qty if order.filled_avg_price else 0
-            )
-            recorded_notional = db_avg_price * db_trades_qty if db_avg_price else 0
-            fill_event_notional = filled_notional - recorded_notional
-            fill_price = fill_event_notional / fill_qty if fill_qty > 0 else 0
-
-            now = self.clock_service.now()
+                return None
+            fill_price = (filled_notional - state.filled_notional) / fill_qty
+            state.filled_qty = filled_qty
+            state.filled_notional = filled_notional
 
-            self.trade_service.insert_trade(
-                external_id=order.id,
-                symbol=db_order.symbol,
-                action=db_order.action,
+            return self.trade_service.new_trade(
+                # One trade per fill: the order ID alone is not unique across fills
+                external_id=f"{order.id}:{filled_qty!r}",
+                symbol=state.symbol,
+                action=state.action,
                 price=fill_price,
                 quantity=fill_qty,
-                executed_at=order.filled_at or now,
-                order_id=db_order.id,
+                executed_at=order.filled_at or self.clock_service.now(),
+                order_id=state.order_id,
             )
-
         except Exception as e:
             self.logger.error(f"Error handling fill event for order {order}: {e}")
+            return None
 
-    def _get_existing_order(self, order_id: str) -> DBOrder:
+    def _get_fill_state(self, order: Order) -> OrderFillState | None:
+        """Get the fill state of an order, starting one for orders placed since start."""
+        state = self.order_fills.get(order.client_order_id)
+        if state is not None:
+            return state
         try:
-            order = self.ledger_service.fetch_order_by_id(order_id)
-            if not order:
-                self.logger.warning(f"No existing order found for ID: {order_id}")
-                return None
-            else:
-                self.logger.info(f"Found existing order: {order}")
-                return order
+            order_id = UUID(order.client_order_id)
+        except (TypeError, ValueError):
+            self.logger.warning(f"No existing order found for fill event: {order}")
+            return None
+        state = OrderFillState(
+            order_id=order_id,
+            symbol=order.symbol,
+            action=getattr(order.side, "value", order.side),
+        )
+        self.order_fills[order.client_order_id] = state
+        return state
+
+    def _recover_fill_state(self):
+        """Rebuild the in-memory fill state from the open orders and their trades."""
+        try:
+            summaries = self.ledger_service.fetch_order_fill_summary_by_status(
+                self.OPEN_ORDER_STATUSES
+            )
+            self.order_fills = {
+                str(summary.order_id): OrderFillState(
+                    order_id=summary.order_id,
+                    symbol=summary.symbol,
+                    action=summary.action,
+                    filled_qty=summary.filled_qty,
+                    filled_notional=summary.filled_notional,
+                )
+                for summary in summaries
+            }
+            self.logger.info(
+                f"Recovered fill state for {len(self.order_fills)} orders."
+            )
         except Exception as e:
-            self.logger.error(f"Error fetching existing order {order_id}: {e}")
+            self.logger.error(f"Error recovering order fill state: {e}")
+
+    async def _async_flush_loop(self):
+        """Flush queued trades on an interval until the service stops."""
+        while not self._stop_flushing.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stop_flushing.wait(),
+                    timeout=self.trade_flush_interval_seconds,
+                )
+            except asyncio.TimeoutError:
+                await self._async_flush_trades()
+
+    async def _async_flush_trades(self) -> int:
+        """
+        Persist the queued trades in one batch on the writer thread. A failed batch is put back at the
+        front of the queue and retried on the next flush; trades that have failed
+        trade_max_flush_attempts flushes are moved to dead_letter_trades instead.
+        :return: The number of trades written.
+        """
+        if not self.pending_trades:
+            return 0
+        batch, self.pending_trades = self.pending_trades, []
+        try:
+            inserted = await self.writer.async_insert_trades(batch)
+            self.logger.info(f"Persisted {len(batch)} trades ({inserted} inserted).")
+            for trade in batch:
+                self._flush_attempts.pop(trade.external_id, None)
+            return len(batch)
+        except Exception as e:
+            self.logger.error(f"Error persisting {len(batch)} trades: {e}")
+            retry = []
+            for trade in batch:
+                attempts = self._flush_attempts.get(trade.external_id, 0) + 1
+                if attempts < self.trade_max_flush_attempts:
+                    self._flush_attempts[trade.external_id] = attempts
+                    retry.append(trade)
+                    continue
+                self._flush_attempts.pop(trade.external_id, None)
+                self.dead_letter_trades.append(trade)
+                self.logger.error(
+                    f"Dropping trade {trade.external_id} after {attempts} failed flushes: {trade}"
+                )
+            self.pending_trades = retry + self.pending_trades
+            return 0
 
     def _update_order_status(self, data: OrderStreamData):
         """
-        Update the order status in the repository.
+        Queue the order status update on the writer; it is written in event order.
         """
         try:
-            status = data.db_status
-            self.ledger_service.update_order(
-                order_id=data.order.id,
-                status=status,
+            self.writer.update_order(
+                order_id=data.order.client_order_id,
+                status=data.db_status,
                 quantity=data.position_qty,
                 price=data.price,
             )
-            self.logger.info(f"Order {data.order.id} status updated to {status}.")
         except Exception as e:
-            self.logger.error(f"Error updating order status for {data.order.id}: {e}")
+            self.logger.error(
+                f"Error updating order status for {data.order.client_order_id}: {e}"
+            )
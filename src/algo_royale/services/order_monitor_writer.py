@@ -0,0 +1,121 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from algo_royale.logging.loggable import Loggable
+from algo_royale.models.db.db_trade import DBTrade
+from algo_royale.repo.order_repo import DBOrderStatus
+from algo_royale.services.orders_service import OrderService
+from algo_royale.services.trades_service import TradesService
+
+
+class OrderMonitorWriter:
+    """
+    Writes the order monitor's order status updates and trade batches on one
+    dedicated thread fed by a queue, so no DB round trip or commit runs on
+    the event loop. Writes run one at a time, in the order they were queued.
+
+    The services must be built on a DB connection of their own: a psycopg2
+    connection is not safe to use from the writer thread and the event loop
+    thread at once.
+
+    Parameters:
+        order_service: Order service on the writer's connection.
+        trades_service: Trades service on the writer's connection.
+        logger: Loggable instance for logging information and errors.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        order_service: OrderService,
+        trades_service: TradesService,
+        logger: Loggable,
+    ):
+        self.order_service = order_service
+        self.trades_service = trades_service
+        self.logger = logger
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the writer thread."""
+        if self.running:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="order-monitor-writer", daemon=True
+        )
+        self._thread.start()
+
+    async def async_stop(self):
+        """Stop the writer thread once every queued write has run."""
+        if not self.running:
+            return
+        self._queue.put(self._STOP)
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
+
+    def update_order(
+        self,
+        order_id: str,
+        status: DBOrderStatus,
+        quantity: float | None,
+        price: float | None,
+    ) -> Future:
+        """
+        Queue an order status update. Failures are logged on the writer thread.
+        :return: A future for the number of updated rows.
+        """
+        return self._submit(self._update_order, order_id, status, quantity, price)
+
+    async def async_insert_trades(self, trades: list[DBTrade]) -> int:
+        """
+        Insert a batch of trades on the writer thread.
+        :return: The number of inserted trades.
+        :raises Exception: If the insert failed.
+        """
+        return await asyncio.wrap_future(
+            self._submit(self.trades_service.insert_trades, trades)
+        )
+
+    def _submit(self, fn: Callable[..., Any], *args) -> Future:
+        if not self.running:
+            raise RuntimeError("Order monitor writer is not running.")
+        future = Future()
+        self._queue.put((future, fn, args))
+        return future
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is self._STOP:
+                return
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _update_order(
+        self,
+        order_id: str,
+        status: DBOrderStatus,
+        quantity: float | None,
+        price: float | None,
+    ) -> int:
+        try:
+            updated = self.order_service.update_order(order_id, status, quantity, price)
+            self.logger.info(f"Order {order_id} status updated to {status}.")
+            return updated
+        except Exception as e:
+            self.logger.error(f"Error updating order status for {order_id}: {e}")
+            return -1
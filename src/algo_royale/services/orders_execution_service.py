@@ -9,6 +9,8 @@ from algo_royale.application.symbols.queued_async_symbol_hold import (
     QueuedAsyncSymbolHold,
 )
 from algo_royale.application.utils.async_pubsub import AsyncSubscriber
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
 from algo_royale.logging.loggable import Loggable
 from algo_royale.services.ledger_service import LedgerService
 from algo_royale.services.order_generator_service import OrderGeneratorService
@@ -23,8 +25,10 @@ class OrderExecutionService:
         symbol_hold_service: SymbolHoldService,  ## Service for managing symbol holds
         order_generator_service: OrderGeneratorService,  ## Service for generating order payloads
         logger: Loggable,
+        latency_tracker: LatencyTracker | None = None,
     ):
         self.ledger_service = ledger_service
+        self.latency_tracker = latency_tracker
         self.symbol_hold_service = symbol_hold_service
         self.symbol_holds = QueuedAsyncSymbolHold(logger=logger)
         self.order_generator_service = order_generator_service
@@ -99,6 +103,7 @@ class OrderExecutionService:
 
     def _handle_order_generation(self, data: SignalOrderPayload):
         """Handle incoming order generation events from the order stream."""
+        submitted = False
         try:
             if self._executor_on is False:
                 return
@@ -110,7 +115,7 @@ class OrderExecutionService:
                     self.logger.info(f"Buy order for symbol {symbol}.")
                     if hold_status is SymbolHoldStatus.BUY_ONLY:
                         self.logger.info(f"Symbol {symbol} is buy-only. Proceeding.")
-                        self._submit_buy_order(data)
+                        submitted = self._submit_buy_order(data)
                     else:
                         self.logger.warning(
                             f"Cannot place buy order for symbol {symbol} as it is in SELL_ONLY hold status."
@@ -120,7 +125,7 @@ class OrderExecutionService:
                     self.logger.info(f"Sell order for symbol {symbol}.")
                     if hold_status is SymbolHoldStatus.SELL_ONLY:
                         self.logger.info(f"Symbol {symbol} is sell-only. Proceeding.")
-                        self._submit_sell_order(data)
+                        submitted = self._submit_sell_order(data)
                     else:
                         self.logger.warning(
                             f"Cannot place sell order for symbol {symbol} as it is in BUY_ONLY hold status."
@@ -133,9 +138,21 @@ class OrderExecutionService:
 
         except Exception as e:
             self.logger.error(f"Error handling order generation event: {e}")
+        finally:
+            # Only submitted orders count towards the end-to-end latency
+            if self.latency_tracker and data is not None:
+                timestamp = (data.price_data or {}).get(DataIngestColumns.TIMESTAMP)
+                if submitted:
+                    self.latency_tracker.stamp(
+                        data.symbol, timestamp, hop="order_execution", final=True
+                    )
+                else:
+                    self.latency_tracker.discard(
+                        data.symbol, timestamp, reason="order_execution"
+                    )
 
-    def _submit_buy_order(self, data: SignalOrderPayload):
-        """Submit a buy order."""
+    def _submit_buy_order(self, data: SignalOrderPayload) -> bool:
+        """Submit a buy order. Returns True if it was handed to the ledger."""
         try:
             self.logger.info(f"Submitting buy order: {data}")
             # Implement buy order submission logic here
@@ -149,11 +166,13 @@ class OrderExecutionService:
                     notional=weighted_notional,
                 )
             )
+            return True
         except Exception as e:
             self.logger.error(f"Error submitting buy order: {e}")
+            return False
 
-    def _submit_sell_order(self, data: SignalOrderPayload):
-        """Submit a sell order."""
+    def _submit_sell_order(self, data: SignalOrderPayload) -> bool:
+        """Submit a sell order. Returns True if it was handed to the ledger."""
         try:
             self.logger.info(f"Submitting sell order: {data}")
             # Implement sell order submission logic here
@@ -165,5 +184,7 @@ class OrderExecutionService:
                     quantity=current_position,
                 )
             )
+            return True
         except Exception as e:
             self.logger.error(f"Error submitting sell order: {e}")
+            return False
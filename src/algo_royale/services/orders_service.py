@@ -4,6 +4,9 @@ from algo_royale.logging.loggable import Loggable
 from algo_royale.models.alpaca_trading.alpaca_order import Order
 from algo_royale.models.alpaca_trading.enums.enums import OrderSide
 from algo_royale.models.db.db_order import DBOrder
+from algo_royale.models.db.db_order_fill_summary import DBOrderFillSummary
+from algo_royale.models.db.db_order_status_summary import DBOrderStatusSummary
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.repo.order_repo import DBOrderStatus, OrderAction, OrderRepo
 from algo_royale.repo.trade_repo import TradeRepo
 
@@ -26,7 +29,7 @@ class OrderService:
         symbol: str,
         status_list: list[DBOrderStatus],
         limit: int | None = None,
-        offset: int | None = None,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         try:
             if limit is None or limit <= 0:
@@ -34,11 +37,8 @@ class OrderService:
                     symbol=symbol, status_list=status_list
                 )
             else:
-                if offset is None or offset < 0:
-                    self.logger.warning("Invalid offset, defaulting to 0.")
-                    offset = 0
                 orders = self.order_repo.fetch_orders_by_symbol_and_status(
-                    symbol=symbol, status_list=status_list, limit=limit, offset=offset
+                    symbol=symbol, status_list=status_list, limit=limit, after=after
                 )
             self.logger.info(f"Fetched {len(orders)} orders with status {status_list}")
             return orders
@@ -46,6 +46,40 @@ class OrderService:
             self.logger.error(f"Error fetching orders by status {status_list}: {e}")
             return []
 
+    def fetch_order_status_summary_by_symbols(
+        self, symbols: list[str], status_list: list[DBOrderStatus]
+    ) -> list[DBOrderStatusSummary]:
+        try:
+            summaries = self.order_repo.fetch_order_status_summary_by_symbols(
+                symbols=symbols, status_list=status_list
+            )
+            self.logger.info(
+                f"Fetched {len(summaries)} order status summaries for {len(symbols)} symbols"
+            )
+            return summaries
+        except Exception as e:
+            self.logger.error(
+                f"Error fetching order status summaries by status {status_list}: {e}"
+            )
+            return []
+
+    def fetch_order_fill_summary_by_status(
+        self, status_list: list[DBOrderStatus]
+    ) -> list[DBOrderFillSummary]:
+        try:
+            summaries = self.order_repo.fetch_order_fill_summary_by_status(
+                status_list=status_list
+            )
+            self.logger.info(
+                f"Fetched {len(summaries)} order fill summaries with status {status_list}"
+            )
+            return summaries
+        except Exception as e:
+            self.logger.error(
+                f"Error fetching order fill summaries by status {status_list}: {e}"
+            )
+            return []
+
     def update_order(
         self,
         order_id: str,
@@ -129,7 +163,10 @@ class OrderService:
             )
             return None
 
-    def update_settled_orders(self):
+    def update_settled_orders(self) -> bool:
+        """Mark orders whose trades are all settled as settled.
+        :return: False if the unsettled orders could not be processed.
+        """
         try:
             unsettled_orders = self.order_repo.fetch_unsettled_orders()
             for order in unsettled_orders:
@@ -141,5 +178,7 @@ class OrderService:
                     self.logger.error(
                         f"Error updating order {order.id} as settled: {e}"
                     )
+            return True
         except Exception as e:
             self.logger.error(f"Error updating settled orders: {e}")
+            return False
@@ -21,6 +21,7 @@ class PositionsService:
         self.user_id = user_id
         self.account_id = account_id
         self.positions: list[Position] = []
+        self._projection_verified = False
 
     def get_positions(self) -> list[Position]:
         """
@@ -66,6 +67,8 @@ class PositionsService:
         Update the current positions with a new list.
         """
         try:
+            if not self._projection_verified:
+                self.verify_positions_projection()
             positionList = self._fetch_open_positions_from_repo()
             self.positions = positionList
             await self.validate_positions()
@@ -73,6 +76,29 @@ class PositionsService:
         except Exception as e:
             self.logger.error(f"Error updating positions: {e}")
 
+    def verify_positions_projection(self, rebuild: bool = True) -> int:
+        """
+        Check the positions projection against a full aggregation of the trade
+        history, once per service, and rebuild it if they differ.
+        Returns the number of mismatched symbols.
+        """
+        try:
+            mismatches = self.trade_repo.verify_positions()
+            self._projection_verified = True
+            for symbol, expected, projected in mismatches:
+                self.logger.warning(
+                    f"Positions projection mismatch for {symbol}: expected {expected}, projected {projected}"
+                )
+            if mismatches and rebuild:
+                open_positions = self.trade_repo.rebuild_positions()
+                self.logger.info(
+                    f"Rebuilt positions projection: {open_positions} open positions."
+                )
+            return len(mismatches)
+        except Exception as e:
+            self.logger.error(f"Error verifying positions projection: {e}")
+            return 0
+
     def _fetch_open_positions_from_repo(self) -> list[Position]:
         """
         Fetch open positions from the trade repository.
@@ -84,10 +110,11 @@ class PositionsService:
             self.logger.error(f"Error fetching positions from repo: {e}")
             return []
 
-    async def validate_positions(self) -> None:
+    async def validate_positions(self) -> bool:
         """
         Validate positions between Alpaca and local DB.
         Log missing, duplicate, or excess positions.
+        :return: True if the positions could be compared.
         """
         try:
             # Fetch positions from Alpaca and local DB
@@ -131,6 +158,7 @@ class PositionsService:
                     self.logger.warning(
                         f"Duplicate position in local DB: {key} (count={count})"
                     )
-
+            return True
         except Exception as e:
             self.logger.error(f"Error validating positions: {e}")
+            return False
@@ -8,6 +8,7 @@ from algo_royale.application.utils.async_pubsub import AsyncSubscriber
 from algo_royale.models.alpaca_trading.enums.enums import OrderSide
 from algo_royale.models.alpaca_trading.enums.order_stream_event import OrderStreamEvent
 from algo_royale.models.alpaca_trading.order_stream_data import OrderStreamData
+from algo_royale.models.db.db_order_status_summary import DBOrderStatusSummary
 from algo_royale.repo.order_repo import DBOrderStatus
 from algo_royale.services.order_event_service import OrderEventService
 from algo_royale.services.orders_service import OrderService
@@ -36,6 +37,26 @@ class SymbolHoldService:
         OrderStreamEvent.EXPIRED,
     }
 
+    # Order table statuses matching the events above, used for the startup load
+    HOLD_ALL_STATUSES = {
+        DBOrderStatus.NEW,
+        DBOrderStatus.ORDER_CANCEL_REJECTED,
+        DBOrderStatus.ORDER_REPLACE_REJECTED,
+        DBOrderStatus.PARTIAL_FILL,
+        DBOrderStatus.PENDING_NEW,
+        DBOrderStatus.PENDING_CANCEL,
+        DBOrderStatus.PENDING_REPLACE,
+        DBOrderStatus.REPLACED,
+        DBOrderStatus.STOPPED,
+        DBOrderStatus.SUSPENDED,
+    }
+
+    SELL_ONLY_OR_BUY_ONLY_STATUSES = {
+        DBOrderStatus.REJECTED,
+        DBOrderStatus.CANCELED,
+        DBOrderStatus.EXPIRED,
+    }
+
     def __init__(
         self,
         symbol_service: SymbolService,
@@ -57,11 +78,12 @@ class SymbolHoldService:
         self.logger = logger
         self.post_fill_delay_seconds = post_fill_delay_seconds
 
-    async def start(self):
+    async def start(self) -> bool:
+        """Load the symbol holds and follow order events; True once started."""
         try:
             if self._order_event_subscriber:
                 self.logger.warning("Order event subscriber already initialized.")
-                return
+                return True
             await self._async_initialize_symbol_holds()
             await self._async_set_symbol_holds_by_order_status()
             # Subscribe to order events to update symbol holds
@@ -69,8 +91,10 @@ class SymbolHoldService:
                 callback=self._async_update_symbol_hold, queue_size=0
             )
             self._order_event_subscriber = async_subscriber
+            return True
         except Exception as e:
             self.logger.error(f"Error starting symbol hold service: {e}")
+            return False
 
     async def stop(self):
         try:
@@ -89,60 +113,66 @@ class SymbolHoldService:
             self.logger.info("Initializing symbol holds...")
             # Fetch all symbols
             symbols = self.symbol_service.get_symbols()
-            for symbol in symbols:
-                await self._async_set_symbol_hold(symbol, SymbolHoldStatus.START)
+            await self.symbol_hold_tracker.async_set_holds(
+                {symbol: SymbolHoldStatus.START for symbol in symbols}
+            )
         except Exception as e:
             self.logger.error(f"Error initializing symbol holds: {e}")
 
     async def _async_set_symbol_holds_by_order_status(self):
-        """Set symbol holds based on order status."""
+        """
+        Set symbol holds based on order status.
+        The order state of every symbol is loaded with one grouped query and all
+        holds are set at once. Afterwards holds are kept current by order events.
+        """
         try:
             self.logger.info("Setting symbol holds by order status...")
-            # Fetch orders in hold status
-            for symbol in self.symbol_service.get_symbols():
-                # Fetch orders in hold status
-                orders = self.order_service.fetch_orders_by_symbol_and_status(
-                    symbol=symbol, status_list=self.HOLD_ALL_EVENTS
-                )
-                if len(orders) > 0:
-                    for order in orders:
-                        await self._async_set_symbol_hold(
-                            order.symbol, SymbolHoldStatus.HOLD_ALL
-                        )
-                        return
-
-                # Fetch orders in sell-only or buy-only status
-                orders = self.order_service.fetch_orders_by_symbol_and_status(
-                    symbol=symbol, status_list=list(self.SELL_ONLY_OR_BUY_ONLY_EVENTS)
-                )
-                if len(orders) > 0:
-                    for order in orders:
-                        if self.position_service.get_positions_by_symbol(order.symbol):
-                            await self._async_set_symbol_hold(
-                                order.symbol, SymbolHoldStatus.SELL_ONLY
-                            )
-                        else:
-                            await self._async_set_symbol_hold(
-                                order.symbol, SymbolHoldStatus.BUY_ONLY
-                            )
-                    return
-
-                # Fetch unsettled orders
-                filled_orders = self.order_service.fetch_orders_by_symbol_and_status(
-                    symbol=symbol, status_list=[DBOrderStatus.FILL]
-                )
-
-                if any(not order.settled for order in filled_orders):
-                    await self._async_set_symbol_hold(
-                        symbol, SymbolHoldStatus.PENDING_SETTLEMENT
-                    )
+            symbols = self.symbol_service.get_symbols()
+            if not symbols:
                 return
-
-                # If no orders found, set symbol hold to BUY_ONLY
-                await self._async_set_symbol_hold(symbol, SymbolHoldStatus.BUY_ONLY)
+            summaries = self.order_service.fetch_order_status_summary_by_symbols(
+                symbols=symbols,
+                status_list=list(
+                    self.HOLD_ALL_STATUSES
+                    | self.SELL_ONLY_OR_BUY_ONLY_STATUSES
+                    | {DBOrderStatus.FILL}
+                ),
+            )
+            summaries_by_symbol = {}
+            for summary in summaries:
+                summaries_by_symbol.setdefault(summary.symbol, []).append(summary)
+            held_symbols = {
+                position.symbol for position in self.position_service.get_positions()
+            }
+            holds = {
+                symbol: self._hold_status_from_summaries(
+                    summaries_by_symbol.get(symbol, []), symbol in held_symbols
+                )
+                for symbol in symbols
+            }
+            await self.symbol_hold_tracker.async_set_holds(holds)
         except Exception as e:
             self.logger.error(f"Error setting symbol holds by order status: {e}")
 
+    def _hold_status_from_summaries(
+        self, summaries: list[DBOrderStatusSummary], has_position: bool
+    ) -> SymbolHoldStatus:
+        """Resolve the hold status of a symbol from its grouped order state."""
+        statuses = {summary.status for summary in summaries}
+        if statuses & self.HOLD_ALL_STATUSES:
+            return SymbolHoldStatus.HOLD_ALL
+        if statuses & self.SELL_ONLY_OR_BUY_ONLY_STATUSES:
+            if has_position:
+                return SymbolHoldStatus.SELL_ONLY
+            return SymbolHoldStatus.BUY_ONLY
+        if any(
+            summary.status == DBOrderStatus.FILL and not summary.settled
+            for summary in summaries
+        ):
+            return SymbolHoldStatus.PENDING_SETTLEMENT
+        # If no orders found, set symbol hold to BUY_ONLY
+        return SymbolHoldStatus.BUY_ONLY
+
     async def _async_update_symbol_hold(self, symbol: str, data: OrderStreamData):
         """
         Update the hold status for a symbol based on the order event.
@@ -1,4 +1,5 @@
 ## service\trade_service.py
+import time
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 
@@ -6,6 +7,7 @@ from algo_royale.adapters.trading.account_adapter import AccountAdapter
 from algo_royale.logging.loggable import Loggable
 from algo_royale.models.alpaca_trading.alpaca_account import AccountActivity
 from algo_royale.models.alpaca_trading.enums.enums import ActivityType
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.models.db.db_trade import DBTrade
 from algo_royale.repo.trade_repo import TradeRepo
 from algo_royale.services.clock_service import ClockService
@@ -34,16 +36,20 @@ class TradesService:
         """Fetch trades by their associated order ID."""
         return self.repo.fetch_trades_by_order_id(order_id)
 
-    def fetch_unsettled_trades(self, limit: int = 100, offset: int = 0) -> list:
+    def fetch_unsettled_trades(
+        self, limit: int = 100, after: DBPageCursor | None = None
+    ) -> list:
         """Fetch all unsettled trades with pagination.
         :param limit: Maximum number of trades to fetch.
-        :param offset: Offset for pagination.
+        :param after: Cursor of the previous page's last trade.
         :return: List of unsettled trades.
         """
-        return self.repo.fetch_unsettled_trades(limit, offset)
+        return self.repo.fetch_unsettled_trades(limit, after)
 
-    def update_settled_trades(self):
-        """Update settlement status for all trades."""
+    def update_settled_trades(self) -> bool:
+        """Update settlement status for all trades.
+        :return: True if the update succeeded.
+        """
         try:
             self.logger.info("Updating settled trades...")
             settlement_datetime = self.clock_service.now()
@@ -52,10 +58,12 @@ class TradesService:
                 self.logger.error(
                     f"Failed to update settled trades | update count: {updated_count}"
                 )
-                return
+                return False
             self.logger.info(f"Updated {updated_count} settled trades.")
+            return True
         except Exception as e:
             self.logger.error(f"Error updating settled trades: {e}")
+            return False
 
     def insert_trade(
         self,
@@ -89,21 +97,67 @@ class TradesService:
             order_id=order_id,
         )
 
+    def new_trade(
+        self,
+        external_id: str,
+        symbol: str,
+        action: str,
+        price: float,
+        quantity: float,
+        executed_at: datetime,
+        order_id: UUID,
+    ) -> DBTrade:
+        """Build an unsaved trade record, ready for `insert_trades`.
+        :param external_id: The external ID of the trade from the trading platform.
+        :param symbol: The stock symbol of the trade.
+        :param action: The action of the trade (e.g., 'buy', 'sell').
+        :param price: The price at which the trade was executed.
+        :param quantity: The number of shares traded.
+        :param executed_at: The time when the trade was executed.
+        :param order_id: The ID of the associated order.
+        :return: The trade record.
+        """
+        now = self.clock_service.now()
+        return DBTrade(
+            id=uuid4(),
+            external_id=external_id,
+            symbol=symbol,
+            action=action,
+            settlement_date=self._get_settlement_date(executed_at),
+            price=price,
+            quantity=quantity,
+            executed_at=executed_at,
+            created_at=now,
+            updated_at=now,
+            order_id=order_id,
+            user_id=self.user_id,
+            account_id=self.account_id,
+        )
+
+    def insert_trades(self, trades: list[DBTrade]) -> int:
+        """Insert a batch of trade records in a single round trip.
+        :param trades: The trades to insert, e.g. built with `new_trade`.
+        :return: The number of inserted trade records.
+        """
+        if not trades:
+            return 0
+        return self.repo.insert_trades(trades)
+
     def fetch_trades_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
         limit: int = 100,
-        offset: int = 0,
+        after: DBPageCursor | None = None,
     ) -> list:
         """Fetch trades within a specific date range.
         :param start_date: The start date of the range.
         :param end_date: The end date of the range.
         :param limit: The maximum number of trades to return.
-        :param offset: The number of trades to skip.
+        :param after: Cursor of the previous page's last trade.
         :return: A list of trades within the specified date range.
         """
-        return self.repo.fetch_trades_by_date_range(start_date, end_date, limit, offset)
+        return self.repo.fetch_trades_by_date_range(start_date, end_date, limit, after)
 
     def delete_trade(self, trade_id: UUID) -> int:
         """Delete a trade record.
@@ -118,47 +172,16 @@ class TradesService:
         """
         return self.repo.delete_all_trades()
 
-    def _fetch_all_local_trades_by_date_range(
-        self, start_date: datetime, end_date: datetime
-    ) -> list[DBTrade]:
-        """Fetch all local trades from the repository."""
-        all_trades = []
-        limit = 100
-        fetch = True
-        offset = 0
-
-        while fetch:
-            trades = self.repo.fetch_trades_by_date_range(
-                start_date, end_date, limit, offset
-            )
-            all_trades.extend(trades)
-            if len(trades) < limit:
-                fetch = False
-            else:
-                offset += limit
-
-        return all_trades
-
-    def _trade_key(self, trade: DBTrade) -> tuple:
-        return (
-            trade.symbol,
-            trade.action,
-            trade.settled,
-            trade.settlement_date,
-            trade.price,
-            trade.quantity,
-            trade.executed_at,
-            trade.order_id,
-        )
-
-    async def reconcile_trades(
-        self, start_date: datetime, end_date: datetime, rerun: bool = True
-    ):
-        """Reconcile trades between the local database and the Alpaca API."""
+    async def reconcile_trades(self, start_date: datetime, end_date: datetime) -> dict:
+        """Reconcile trades between the local database and the Alpaca API.
+        Broker fills are applied in bulk in a single transaction, so the local
+        trades converge in one pass.
+        :param start_date: The start date of the reconciliation window.
+        :param end_date: The end date of the reconciliation window.
+        :return: A summary with the staged, deleted and inserted counts and run time.
+        """
+        start_time = time.time()
         try:
-            local_trades = self._fetch_all_local_trades_by_date_range(
-                start_date, end_date
-            )
             account_activities = (
                 await self.account_adapter.get_account_activities_by_activity_type(
                     activity_type=ActivityType.FILL, after=start_date, until=end_date
@@ -171,127 +194,25 @@ class TradesService:
             ]
             # Filter out None values
             account_trades = [t for t in account_trades if t is not None]
-            # Build dicts for O(1) lookup
-            local_trade_dict = {self._trade_key(trade): trade for trade in local_trades}
-            account_trade_dict = {
-                self._trade_key(trade): trade for trade in account_trades
+            deleted_count, inserted_count = self.repo.reconcile_trades(
+                trades=account_trades, start_date=start_date, end_date=end_date
+            )
+            summary = {
+                "staged": len(account_trades),
+                "deleted": deleted_count,
+                "inserted": inserted_count,
+                "run_time_sec": round(time.time() - start_time, 2),
             }
-
-            # Find duplicates in local trades
-            duplicate_trades = self._find_duplicate_local_trades(local_trades)
-            added_trades = []
-            removed_trades = []
-
-            for trade in duplicate_trades:
-                self.logger.info(f"Found duplicate trade: {trade.id}")
-                self._remove_trade(trade)
-                removed_trades.append(trade)
-
-            # Remove local trades not present in account trades
-            for key, trade in local_trade_dict.items():
-                if key not in account_trade_dict:
-                    self.logger.info(
-                        f"Trade {trade.id} is not present in account trades."
-                    )
-                    self._remove_trade(trade)
-                    removed_trades.append(trade)
-
-            # Add account trades not present in local trades
-            for key, trade in account_trade_dict.items():
-                if key not in local_trade_dict:
-                    self.logger.info(
-                        f"Trade {trade.id} is not present in local trades."
-                    )
-                    self._insert_trade(trade)
-                    added_trades.append(trade)
-
-            if rerun:
-                await self.reconcile_trades(start_date, end_date, rerun=False)
-            else:
-                is_same_length = self._validate_trade_list_length(
-                    account_trades, local_trades
-                )
-                if not is_same_length:
-                    self.logger.warning(
-                        "Trade lists are not of the same length after reconciliation."
-                    )
-                if added_trades:
-                    self.logger.warning(
-                        f"Post reconciliation added trades: {len(added_trades)}"
-                    )
-                if removed_trades:
-                    self.logger.warning(
-                        f"Post reconciliation removed trades: {len(removed_trades)}"
-                    )
+            self.logger.info(f"Trade reconciliation complete | {summary}")
+            return summary
         except Exception as e:
             self.logger.error(f"Error during trade reconciliation: {e}")
-
-    def _remove_trade(self, trade: DBTrade) -> int:
-        """Remove a trade from the local database."""
-        try:
-            removed_count = self.repo.delete_trade(trade.id)
-            if removed_count == -1:
-                self.logger.error(f"Failed to remove trade: {trade}")
-                return -1
-            self.logger.info(f"Removed trade with ID: {trade.id}")
-            return removed_count
-        except Exception as e:
-            self.logger.error(f"Error during trade removal: {e}")
-            return -1
-
-    def _insert_trade(self, trade: DBTrade) -> int:
-        """Insert a trade into the local database."""
-        try:
-            trade_id = self.repo.insert_trade(
-                external_id=trade.external_id,
-                symbol=trade.symbol,
-                action=trade.action,
-                settlement_date=trade.settlement_date,
-                price=trade.price,
-                quantity=trade.quantity,
-                executed_at=trade.executed_at,
-                order_id=trade.order_id,
-            )
-            if trade_id is None or trade_id == -1:
-                self.logger.error(f"Failed to insert trade: {trade}")
-                return -1
-            self.logger.info(f"Inserted trade with ID: {trade_id}")
-            return trade_id
-        except Exception as e:
-            self.logger.error(f"Error during trade insertion: {e}")
-            return -1
-
-    def _validate_trade_list_length(
-        self, account_list: list[DBTrade], local_list: list[DBTrade]
-    ) -> bool:
-        """Check if the trade lists are of equal length."""
-        try:
-            diff = len(account_list) - len(local_list)
-            if diff > 0:
-                self.logger.warning(f"Account trade list is longer by {diff} trades.")
-            if diff < 0:
-                self.logger.warning(f"Local trade list is longer by {-diff} trades.")
-            return diff == 0
-        except Exception as e:
-            self.logger.error(f"Error during trade list length validation: {e}")
-            return False
-
-    def _find_duplicate_local_trades(
-        self, local_trades: list[DBTrade]
-    ) -> list[DBTrade]:
-        try:
-            seen = set()
-            duplicates = []
-            for trade in local_trades:
-                key = self._trade_key(trade)
-                if key in seen:
-                    duplicates.append(trade)
-                else:
-                    seen.add(key)
-            return duplicates
-        except Exception as e:
-            self.logger.error(f"Error finding duplicate local trades: {e}")
-            return []
+            return {
+                "staged": 0,
+                "deleted": 0,
+                "inserted": 0,
+                "run_time_sec": round(time.time() - start_time, 2),
+            }
 
     def _get_settlement_date(self, execution_time: datetime) -> datetime | None:
         """Calculate the settlement date based on the execution time."""
@@ -0,0 +1,61 @@
+import fcntl
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+
+_registry_lock = threading.Lock()
+_path_locks: dict[str, "PathLock"] = {}
+
+
+class PathLock:
+    """
+    Re-entrant lock for a file path, held across the threads of this process
+    and across processes: a thread lock for the former and an exclusive flock
+    on a lock file in the temp directory for the latter.
+    """
+
+    def __init__(self, key: str):
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        self.lock_path = Path(tempfile.gettempdir()) / f"algo_royale_{digest}.lock"
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._handle = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._handle = open(self.lock_path, "a")
+                fcntl.flock(self._handle, fcntl.LOCK_EX)
+            except BaseException:
+                if self._handle is not None:
+                    self._handle.close()
+                    self._handle = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if self._depth == 0:
+            fcntl.flock(self._handle, fcntl.LOCK_UN)
+            self._handle.close()
+            self._handle = None
+        self._thread_lock.release()
+
+
+def path_lock(path: str | Path) -> PathLock:
+    """
+    Returns the lock for a file path. Hold it around a read-merge-write of a
+    file that several threads or walk-forward worker processes may update, so
+    no writer overwrites another's changes with a stale copy.
+    """
+    key = str(Path(path).resolve())
+    with _registry_lock:
+        lock = _path_locks.get(key)
+        if lock is None:
+            lock = PathLock(key)
+            _path_locks[key] = lock
+        return lock
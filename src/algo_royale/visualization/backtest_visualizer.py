@@ -4,6 +4,11 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
+from algo_royale.visualization.downsampling import (
+    DEFAULT_MAX_POINTS,
+    downsample_series,
+)
+
 
 class BacktestVisualizer:
     """
@@ -60,7 +65,14 @@ class BacktestVisualizer:
             self.data["cumulative_strategy"] - self.data["peak_strategy"]
         ) / self.data["peak_strategy"]
 
-    def plot_equity_curve(self, strategies=None, symbols=None, title="Equity Curve"):
+    def plot_equity_curve(
+        self,
+        strategies=None,
+        symbols=None,
+        title="Equity Curve",
+        max_points=DEFAULT_MAX_POINTS,
+        x_range=None,
+    ):
         """
         Plot cumulative returns for strategies/symbols
 
@@ -68,16 +80,13 @@ class BacktestVisualizer:
             strategies (list, optional): List of strategies to include. If None, all strategies.
             symbols (list, optional): List of symbols to include. If None, all symbols.
             title (str): Title for the plot
+            max_points (int, optional): Points per trace, LTTB-downsampled. None plots every point.
+            x_range (tuple, optional): (start, end) window to plot; narrow windows plot at full resolution.
 
         Returns:
             plotly.graph_objects.Figure
         """
-        # Filter data if needed
-        df = self.data.copy()
-        if strategies is not None:
-            df = df[df["strategy"].isin(strategies)]
-        if symbols is not None:
-            df = df[df["symbol"].isin(symbols)]
+        df = self._filter(strategies, symbols)
 
         # Group by strategy and symbol
         grouped = df.groupby(["strategy", "symbol"])
@@ -85,10 +94,13 @@ class BacktestVisualizer:
         fig = go.Figure()
 
         for (strategy, symbol), group in grouped:
+            equity = downsample_series(
+                group["cumulative_strategy"], max_points, x_range
+            )
             fig.add_trace(
                 go.Scatter(
-                    x=group.index,
-                    y=group["cumulative_strategy"],
+                    x=equity.index,
+                    y=equity.to_numpy(),
                     mode="lines",
                     name=f"{symbol} - {strategy}",
                     hovertemplate="<b>%{fullData.name}</b><br>"
@@ -101,10 +113,13 @@ class BacktestVisualizer:
         # Add market performance if only one symbol is selected
         if symbols is not None and len(symbols) == 1:
             market_data = df[df["symbol"] == symbols[0]]
+            market = downsample_series(
+                market_data["cumulative_market"], max_points, x_range
+            )
             fig.add_trace(
                 go.Scatter(
-                    x=market_data.index,
-                    y=market_data["cumulative_market"],
+                    x=market.index,
+                    y=market.to_numpy(),
                     mode="lines",
                     name=f"{symbols[0]} - Market",
                     line=dict(dash="dot"),
@@ -128,7 +143,14 @@ class BacktestVisualizer:
 
         return fig
 
-    def plot_drawdown(self, strategies=None, symbols=None, title="Drawdown"):
+    def plot_drawdown(
+        self,
+        strategies=None,
+        symbols=None,
+        title="Drawdown",
+        max_points=DEFAULT_MAX_POINTS,
+        x_range=None,
+    ):
         """
         Plot drawdown for strategies/symbols
 
@@ -136,16 +158,13 @@ class BacktestVisualizer:
             strategies (list, optional): List of strategies to include
             symbols (list, optional): List of symbols to include
             title (str): Title for the plot
+            max_points (int, optional): Points per trace, LTTB-downsampled. None plots every point.
+            x_range (tuple, optional): (start, end) window to plot; narrow windows plot at full resolution.
 
         Returns:
             plotly.graph_objects.Figure
         """
-        # Filter data if needed
-        df = self.data.copy()
-        if strategies is not None:
-            df = df[df["strategy"].isin(strategies)]
-        if symbols is not None:
-            df = df[df["symbol"].isin(symbols)]
+        df = self._filter(strategies, symbols)
 
         # Group by strategy and symbol
         grouped = df.groupby(["strategy", "symbol"])
@@ -153,10 +172,13 @@ class BacktestVisualizer:
         fig = go.Figure()
 
         for (strategy, symbol), group in grouped:
+            drawdown = downsample_series(
+                group["drawdown_strategy"], max_points, x_range
+            )
             fig.add_trace(
                 go.Scatter(
-                    x=group.index,
-                    y=group["drawdown_strategy"] * 100,  # as percentage
+                    x=drawdown.index,
+                    y=drawdown.to_numpy() * 100,  # as percentage
                     mode="lines",
                     name=f"{symbol} - {strategy}",
                     hovertemplate="<b>%{fullData.name}</b><br>"
@@ -179,6 +201,15 @@ class BacktestVisualizer:
 
         return fig
 
+    def _filter(self, strategies=None, symbols=None):
+        """Rows of the selected strategies/symbols, without copying when unfiltered"""
+        df = self.data
+        if strategies is not None:
+            df = df[df["strategy"].isin(strategies)]
+        if symbols is not None:
+            df = df[df["symbol"].isin(symbols)]
+        return df
+
     def plot_trades(self, symbol, strategy, days=1, title="Trade Signals"):
         """
         Plot price and trade signals for a specific symbol and strategy
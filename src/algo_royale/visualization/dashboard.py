@@ -1,9 +1,39 @@
 from pathlib import Path
 from algo_royale.config.config import Config
 from algo_royale.visualization.backtest_visualizer import BacktestVisualizer
+from algo_royale.visualization.downsampling import DEFAULT_MAX_POINTS
 import streamlit as st
 import pandas as pd
 
+# Session key of the loaded results file, so reruns keep showing it
+LOADED_FILE_KEY = "backtest_results_file"
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _index_result_files(results_dir: str) -> dict[str, dict[str, str]]:
+    """Index CSV results as strategy -> symbol -> file, re-scanned at most once a minute"""
+    index = {}
+    for csv_file in sorted(Path(results_dir).glob("*/*/*.csv")):
+        strategy, symbol = csv_file.parts[-3], csv_file.parts[-2]
+        index.setdefault(strategy, {})[symbol] = str(csv_file)
+    return index
+
+
+@st.cache_resource(max_entries=8, show_spinner="Loading results...")
+def _load_visualizer(file_path: str, mtime_ns: int) -> BacktestVisualizer:
+    """
+    Parse and preprocess a results file once; reruns reuse the visualizer.
+    The modification time is part of the cache key, so rewritten results reload.
+    """
+    path = Path(file_path)
+    df = pd.read_csv(path, parse_dates=["timestamp"])
+    if "strategy" not in df.columns:
+        df["strategy"] = path.parts[-3]
+    if "symbol" not in df.columns:
+        df["symbol"] = path.parts[-2]
+    return BacktestVisualizer(data=df)
+
+
 class BacktestDashboard:
     """
     BacktestDashboard is a Streamlit-based dashboard for visualizing backtest results.
@@ -31,14 +61,11 @@ class BacktestDashboard:
 
     def _find_result_files(self):
         """Find all CSV result files in strategy/symbol subdirectories"""
-        result_files = []
-
-        for strategy_dir in self.results_dir.glob("*"):
-            if strategy_dir.is_dir():
-                for symbol_dir in strategy_dir.glob("*"):
-                    if symbol_dir.is_dir():
-                        for csv_file in symbol_dir.glob("*.csv"):
-                            result_files.append(csv_file)
+        result_files = [
+            Path(f)
+            for symbols in _index_result_files(str(self.results_dir)).values()
+            for f in symbols.values()
+        ]
 
         if not result_files:
             print(f"No CSV files found in {self.results_dir}/*/*/")
@@ -51,22 +78,15 @@ class BacktestDashboard:
     def _load_selected_file(self, file_path):
         """Load file and extract strategy/symbol from path"""
         try:
-            parts = file_path.parts
-            strategy_name = parts[-3]
-            symbol_name = parts[-2]
-
-            df = pd.read_csv(file_path, parse_dates=["timestamp"])
-
-            if "strategy" not in df.columns:
-                df["strategy"] = strategy_name
-            if "symbol" not in df.columns:
-                df["symbol"] = symbol_name
-
-            self.visualizer = BacktestVisualizer(data=df)
+            self.visualizer = _load_visualizer(
+                str(file_path), file_path.stat().st_mtime_ns
+            )
+            st.session_state[LOADED_FILE_KEY] = str(file_path)
             return True
 
         except (FileNotFoundError, pd.errors.ParserError) as e:
             st.error(f"Error loading {file_path.name}: {str(e)}")
+            st.session_state.pop(LOADED_FILE_KEY, None)
             return False
 
     def run(self):
@@ -101,6 +121,11 @@ class BacktestDashboard:
                             st.success("Results loaded!")
                             self._update_selections_from_data()
 
+        # Widget clicks rerun the script; keep showing the loaded results
+        if self.visualizer is None and st.session_state.get(LOADED_FILE_KEY):
+            if self._load_selected_file(Path(st.session_state[LOADED_FILE_KEY])):
+                self._update_selections_from_data()
+
         # Main area - ONLY for visualizations/results
         if hasattr(self, "visualizer") and self.visualizer is not None:
             self._display_main_content()
@@ -124,15 +149,10 @@ class BacktestDashboard:
 
     def _build_file_hierarchy(self):
         """Organize files by strategy/symbol"""
-        self.file_groups = {}
-        for f in self.available_files:
-            parts = f.parts
-            strategy = parts[-3]
-            symbol = parts[-2]
-
-            if strategy not in self.file_groups:
-                self.file_groups[strategy] = {}
-            self.file_groups[strategy][symbol] = f
+        self.file_groups = {
+            strategy: {symbol: Path(f) for symbol, f in symbols.items()}
+            for strategy, symbols in _index_result_files(str(self.results_dir)).items()
+        }
 
     def _update_selections_from_data(self):
         """Update selections based on loaded data"""
@@ -180,18 +200,51 @@ class BacktestDashboard:
         st.header("Performance Analysis")
 
         if self.visualizer:
+            x_range = self._select_date_range()
             fig = self.visualizer.plot_equity_curve(
-                strategies=self.selected_strategies, symbols=self.selected_symbols
+                strategies=self.selected_strategies,
+                symbols=self.selected_symbols,
+                max_points=DEFAULT_MAX_POINTS,
+                x_range=x_range,
             )
             st.plotly_chart(fig, use_container_width=True)
 
             fig = self.visualizer.plot_drawdown(
-                strategies=self.selected_strategies, symbols=self.selected_symbols
+                strategies=self.selected_strategies,
+                symbols=self.selected_symbols,
+                max_points=DEFAULT_MAX_POINTS,
+                x_range=x_range,
             )
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.warning("No data loaded to display performance")
 
+    def _select_date_range(self):
+        """
+        Date window for the performance charts. Charts are downsampled to
+        DEFAULT_MAX_POINTS, so narrowing the window redraws it at higher
+        resolution, down to every bar once it fits.
+        """
+        index = self.visualizer.data.index
+        if index.empty:
+            return None
+        tz = index.tz
+        start = index.min().tz_localize(None).to_pydatetime()
+        end = index.max().tz_localize(None).to_pydatetime()
+        if start >= end:
+            return None
+        selected = st.slider(
+            "Date range",
+            min_value=start,
+            max_value=end,
+            value=(start, end),
+            format="YYYY-MM-DD HH:mm",
+            key="performance_date_range",
+        )
+        if selected == (start, end):
+            return None
+        return tuple(pd.Timestamp(v).tz_localize(tz) for v in selected)
+
     def _show_trade_analysis(self):
         st.header("Trade Analysis")
 
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+# Points per trace: about one per horizontal pixel of a wide chart
+DEFAULT_MAX_POINTS = 2000
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of `n_out - 2` equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket. Peaks and
+    troughs survive, unlike striding or bucket means.
+
+    Args:
+        x (np.ndarray): Increasing x values (e.g. epoch nanoseconds).
+        y (np.ndarray): Values, without NaN.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted positions of the kept points.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # n_out - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0] = 0
+    kept[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def downsample_series(
+    series: pd.Series,
+    max_points: int | None = DEFAULT_MAX_POINTS,
+    x_range: tuple | None = None,
+) -> pd.Series:
+    """
+    Shape-preserving downsampling of a datetime-indexed series for plotting.
+
+    Args:
+        series (pd.Series): Series indexed by timestamp.
+        max_points (int, optional): Points to keep; None keeps every point.
+        x_range (tuple, optional): (start, end) window to keep before
+            downsampling, so a zoomed-in window is drawn at full resolution
+            once it fits in `max_points`.
+
+    Returns:
+        pd.Series: The kept points, NaN values dropped.
+    """
+    if x_range is not None:
+        start, end = x_range
+        series = series.loc[start:end]
+    series = series.dropna()
+    if max_points is None or len(series) <= max_points:
+        return series
+    index = series.index
+    x = (
+        index.asi8
+        if isinstance(index, pd.DatetimeIndex)
+        else np.arange(len(series), dtype=np.float64)
+    )
+    kept = lttb_indices(x, series.to_numpy(), max_points)
+    return series.iloc[kept]
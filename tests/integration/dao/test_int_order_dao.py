@@ -8,6 +8,8 @@ SQL_FILES = [
     "fetch_all_orders_by_status.sql",
     "fetch_all_orders_by_symbol_and_status.sql",
     "fetch_order_by_id.sql",
+    "fetch_order_fill_summary_by_status.sql",
+    "fetch_order_status_summary_by_symbols.sql",
     "fetch_orders_by_status.sql",
     "fetch_orders_by_symbol_and_status.sql",
     "fetch_unsettled_orders.sql",
@@ -3,15 +3,22 @@ import pytest
 from algo_royale.di.application_container import ApplicationContainer
 
 SQL_FILES = [
+    "copy_trade_reconcile_stage.sql",
+    "create_trade_reconcile_stage.sql",
     "delete_all_trades.sql",
     "delete_trade.sql",
+    "delete_unreconciled_trades.sql",
     "fetch_open_positions.sql",
     "fetch_trades_by_date_range.sql",
     "fetch_trades_by_order_id.sql",
     "fetch_unsettled_trades.sql",
+    "insert_reconciled_trades.sql",
     "insert_trade.sql",
+    "insert_trades.sql",
+    "rebuild_positions.sql",
     "update_settled_trades.sql",
     "update_trade.sql",
+    "verify_positions.sql",
 ]
 
 
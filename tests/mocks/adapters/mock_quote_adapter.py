@@ -14,6 +14,10 @@ from algo_royale.models.alpaca_market_data.alpaca_bar import (
     BarsResponse,
     LatestBarsResponse,
 )
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import (
+    BarColumnsResponse,
+    decode_bars,
+)
 from algo_royale.models.alpaca_market_data.alpaca_condition_code import ConditionCodeMap
 from algo_royale.models.alpaca_market_data.alpaca_quote import QuotesResponse
 from algo_royale.models.alpaca_market_data.alpaca_snapshot import SnapshotsResponse
@@ -44,6 +48,16 @@ class MockQuoteAdapter(QuoteAdapter):
         # BarsResponse requires symbol_bars: Dict[str, list[Bar]]
         from algo_royale.models.alpaca_market_data.alpaca_bar import Bar
 
+        dummy_bar_raw = {
+            "t": "2024-01-02T14:30:00Z",
+            "o": 1.0,
+            "h": 1.0,
+            "l": 1.0,
+            "c": 1.0,
+            "v": 0,
+            "n": 0,
+            "vw": 1.0,
+        }
         dummy_bar = Bar(
             timestamp=datetime.utcnow(),
             open_price=0.0,
@@ -58,6 +72,11 @@ class MockQuoteAdapter(QuoteAdapter):
             symbol_bars={"MOCK": [dummy_bar]}, next_page_token=None
         )
         self.bars_response = self.base_bars_response
+        self.base_bar_columns_response = BarColumnsResponse(
+            symbol_frames={"MOCK": decode_bars([dummy_bar_raw])},
+            next_page_token=None,
+        )
+        self.bar_columns_response = self.base_bar_columns_response
         self.base_latest_bars_response = LatestBarsResponse(symbol_bars={})
         self.latest_bars_response = self.base_latest_bars_response
         self.base_snapshot_response = SnapshotsResponse(root={})
@@ -151,6 +170,25 @@ class MockQuoteAdapter(QuoteAdapter):
             return None
         return self.bars_response
 
+    async def fetch_historical_bar_columns(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        currency=SupportedCurrencies.USD,
+        feed: DataFeed = DataFeed.IEX,
+        timeframe: TimeFrame = TimeFrame(1, TimeFrameUnit.Minute),
+        adjustment: Adjustment = Adjustment.RAW,
+        sort_order: Sort = Sort.ASC,
+        page_limit: int = 10000,
+        page_token: Optional[str] = None,
+    ) -> Optional[BarColumnsResponse]:
+        if self.should_raise:
+            raise ValueError("API error")
+        if self.should_return_none:
+            return None
+        return self.bar_columns_response
+
     async def fetch_latest_bars(
         self,
         symbols: list[str],
@@ -35,3 +35,10 @@ class MockAssetMatrixPreparer(AssetMatrixPreparer):
         if self.return_none:
             return None
         return self.df
+
+    def build(self, frames, **kwargs):
+        if self.raise_exception:
+            raise ValueError("Mocked exception")
+        if self.return_none:
+            return None
+        return self.df
@@ -38,3 +38,8 @@ class MockSignalBacktestEvaluator(SignalBacktestEvaluator):
         if self.return_none:
             return None
         return self.result
+
+    def stream(self, strategy):
+        if self.raise_exception:
+            raise Exception("Mocked exception in evaluate")
+        return super().stream(strategy)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List, Optional
 
 from algo_royale.backtester.evaluator.portfolio.portfolio_cross_window_evaluator import (
     PortfolioCrossWindowEvaluator,
@@ -19,7 +20,7 @@ class MockPortfolioCrossWindowEvaluator(PortfolioCrossWindowEvaluator):
     def set_raise_exception(self, value: bool):
         self.raise_exception = value
 
-    def run(self, strategy_dir: Path):
+    def run(self, strategy_dir: Path, window_files: Optional[List[Path]] = None):
         self.run_called = True
         if self.raise_exception:
             raise RuntimeError("Mocked exception in run")
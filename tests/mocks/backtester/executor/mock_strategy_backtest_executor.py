@@ -1,4 +1,4 @@
-from typing import AsyncIterator, Callable, Dict
+from typing import AsyncIterator, Callable, Dict, Tuple
 
 import pandas as pd
 
@@ -49,3 +49,16 @@ class MockStrategyBacktestExecutor(StrategyBacktestExecutor):
         if self.raise_exception:
             raise Exception("Mocked exception in run_backtest")
         return self.backtest_result
+
+    async def async_stream_backtest(
+        self,
+        strategies: list[BaseSignalStrategy],
+        data: Dict[str, Callable[[], AsyncIterator[pd.DataFrame]]],
+    ) -> AsyncIterator[Tuple[str, BaseSignalStrategy, pd.DataFrame]]:
+        if self.raise_exception:
+            raise Exception("Mocked exception in run_backtest")
+        for symbol, dfs in self.backtest_result.items():
+            if not isinstance(dfs, list):
+                continue
+            for df in dfs:
+                yield symbol, strategies[0] if strategies else None, df
@@ -5,6 +5,10 @@ from algo_royale.backtester.feature_engineering.backtest_feature_engineer import
 
 class MockBacktestFeatureEngineer(BacktestFeatureEngineer):
     def __init__(self):
+        self.features = None
+        self.feature_engineering_func = lambda df: df
+        self.max_lookback = 0
+        self.start_report()
         self.should_raise = False
         self.should_return_none = False
         self.return_value = {"mock": True}
@@ -24,3 +28,12 @@ class MockBacktestFeatureEngineer(BacktestFeatureEngineer):
         if self.should_return_none:
             return None
         return self.return_value
+
+    async def engineer_panel_features(self, df_iters):
+        if self.should_raise:
+            raise RuntimeError("Mocked exception in engineer_panel_features")
+        self.panel_calls = getattr(self, "panel_calls", []) + [list(df_iters)]
+        pages = {}
+        for symbol, df_iter in df_iters.items():
+            pages[symbol] = [df async for df in df_iter]
+        return pages
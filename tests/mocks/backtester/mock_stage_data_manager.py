@@ -78,6 +78,8 @@ class MockStageDataManager(StageDataManager):
         strategy_name=None,
         start_date=None,
         end_date=None,
+        fingerprint=None,
+        duration_sec=None,
     ):
         return None
 
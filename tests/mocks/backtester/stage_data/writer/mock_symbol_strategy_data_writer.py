@@ -1,10 +1,14 @@
 from algo_royale.backtester.stage_data.writer.symbol_strategy_data_writer import (
     SymbolStrategyDataWriter,
 )
+from tests.mocks.backtester.stage_data.writer.mock_stage_data_writer import (
+    MockStageDataWriter,
+)
 
 
 class MockSymbolStrategyDataWriter(SymbolStrategyDataWriter):
     def __init__(self):
+        self.data_writer = MockStageDataWriter()
         self.should_raise = False
         self.should_return_none = False
         self.return_value = True
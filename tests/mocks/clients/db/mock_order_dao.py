@@ -3,6 +3,9 @@ from uuid import UUID
 
 from algo_royale.clients.db.dao.order_dao import OrderDAO
 from algo_royale.models.db.db_order import DBOrder
+from algo_royale.models.db.db_order_fill_summary import DBOrderFillSummary
+from algo_royale.models.db.db_order_status_summary import DBOrderStatusSummary
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 
 
 class MockOrderDAO(OrderDAO):
@@ -40,7 +43,10 @@ class MockOrderDAO(OrderDAO):
         return [self.test_order]
 
     def fetch_orders_by_status(
-        self, status_list: list[str], limit: int = 100, offset: int = 0
+        self,
+        status_list: list[str],
+        limit: int = 100,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         return [self.test_order]
 
@@ -50,10 +56,40 @@ class MockOrderDAO(OrderDAO):
         return [self.test_order]
 
     def fetch_orders_by_symbol_and_status(
-        self, symbol: str, status_list: list[str], limit: int = 100, offset: int = 0
+        self,
+        symbol: str,
+        status_list: list[str],
+        limit: int = 100,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         return [self.test_order]
 
+    def fetch_order_status_summary_by_symbols(
+        self, symbols: list[str], status_list: list[str], user_id: str, account_id: str
+    ) -> list[DBOrderStatusSummary]:
+        return [
+            DBOrderStatusSummary(
+                symbol=symbol,
+                status=self.test_order.status,
+                settled=self.test_order.settled,
+                order_count=1,
+            )
+            for symbol in symbols
+        ]
+
+    def fetch_order_fill_summary_by_status(
+        self, status_list: list[str], user_id: str, account_id: str
+    ) -> list[DBOrderFillSummary]:
+        return [
+            DBOrderFillSummary(
+                order_id=self.test_order.id,
+                symbol=self.test_order.symbol,
+                action=self.test_order.action,
+                filled_qty=0.0,
+                filled_notional=0.0,
+            )
+        ]
+
     def fetch_unsettled_orders(self) -> list[DBOrder]:
         return [self.test_order]
 
@@ -3,6 +3,7 @@ from decimal import Decimal
 from uuid import UUID
 
 from algo_royale.clients.db.dao.trade_dao import TradeDAO
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.models.db.db_position import DBPosition
 from algo_royale.models.db.db_trade import DBTrade
 
@@ -46,7 +47,7 @@ class MockTradeDAO(TradeDAO):
         self.reset_open_position()
 
     def fetch_unsettled_trades(
-        self, limit: int = 100, offset: int = 0
+        self, limit: int = 100, after: DBPageCursor | None = None
     ) -> list[DBTrade]:
         return [self.test_trade.model_copy(update={"id": 1, "settled": False})]
 
@@ -57,12 +58,20 @@ class MockTradeDAO(TradeDAO):
             )
         ]
 
+    def verify_positions(
+        self, user_id: str, account_id: str
+    ) -> list[tuple[str, Decimal | None, Decimal | None]]:
+        return []
+
+    def rebuild_positions(self, user_id: str, account_id: str) -> int:
+        return 1
+
     def fetch_trades_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
         limit: int = 100,
-        offset: int = 0,
+        after: DBPageCursor | None = None,
     ) -> list[DBTrade]:
         return [
             self.test_trade.model_copy(
@@ -95,9 +104,24 @@ class MockTradeDAO(TradeDAO):
     ) -> UUID | None:
         return self.test_trade.id
 
+    def insert_trades(
+        self, trades: list[DBTrade], user_id: str, account_id: str
+    ) -> int:
+        return len(trades)
+
     def update_settled_trades(self, settlement_datetime: datetime) -> int:
         return 1
 
+    def reconcile_trades(
+        self,
+        trades: list[DBTrade],
+        start_date: datetime,
+        end_date: datetime,
+        user_id: str,
+        account_id: str,
+    ) -> tuple[int, int]:
+        return 0, len(trades)
+
     def delete_trade(self, trade_id: UUID) -> int:
         return 1
 
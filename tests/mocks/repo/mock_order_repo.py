@@ -1,6 +1,9 @@
 from uuid import UUID
 
 from algo_royale.models.db.db_order import DBOrder
+from algo_royale.models.db.db_order_fill_summary import DBOrderFillSummary
+from algo_royale.models.db.db_order_status_summary import DBOrderStatusSummary
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.repo.order_repo import DBOrderStatus, OrderAction, OrderRepo, OrderType
 from tests.mocks.clients.db.mock_order_dao import MockOrderDAO
 from tests.mocks.mock_loggable import MockLoggable
@@ -44,13 +47,16 @@ class MockOrderRepo(OrderRepo):
         return self.dao.fetch_order_by_id(order_id, self.user_id, self.account_id)
 
     def fetch_orders_by_status(
-        self, status_list: list[DBOrderStatus], limit: int = 100, offset: int = 0
+        self,
+        status_list: list[DBOrderStatus],
+        limit: int = 100,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         if self._raise_exception:
             raise ValueError("Database error")
         if self._return_empty:
             return []
-        return self.dao.fetch_orders_by_status(status_list, limit, offset)
+        return self.dao.fetch_orders_by_status(status_list, limit, after)
 
     def fetch_all_orders_by_symbol_and_status(
         self, symbol: str, status_list: list[DBOrderStatus]
@@ -66,14 +72,36 @@ class MockOrderRepo(OrderRepo):
         symbol: str,
         status_list: list[DBOrderStatus],
         limit: int = 100,
-        offset: int = 0,
+        after: DBPageCursor | None = None,
     ) -> list[DBOrder]:
         if self._raise_exception:
             raise ValueError("Database error")
         if self._return_empty:
             return []
         return self.dao.fetch_orders_by_symbol_and_status(
-            symbol, status_list, limit, offset
+            symbol, status_list, limit, after
+        )
+
+    def fetch_order_status_summary_by_symbols(
+        self, symbols: list[str], status_list: list[DBOrderStatus]
+    ) -> list[DBOrderStatusSummary]:
+        if self._raise_exception:
+            raise ValueError("Database error")
+        if self._return_empty:
+            return []
+        return self.dao.fetch_order_status_summary_by_symbols(
+            symbols, status_list, self.user_id, self.account_id
+        )
+
+    def fetch_order_fill_summary_by_status(
+        self, status_list: list[DBOrderStatus]
+    ) -> list[DBOrderFillSummary]:
+        if self._raise_exception:
+            raise ValueError("Database error")
+        if self._return_empty:
+            return []
+        return self.dao.fetch_order_fill_summary_by_status(
+            status_list, self.user_id, self.account_id
         )
 
     def fetch_unsettled_orders(self) -> list[DBOrder]:
@@ -1,6 +1,8 @@
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
+from algo_royale.models.db.db_page_cursor import DBPageCursor
 from algo_royale.models.db.db_position import DBPosition
 from algo_royale.models.db.db_trade import DBTrade
 from algo_royale.repo.trade_repo import TradeRepo
@@ -39,13 +41,13 @@ class MockTradeRepo(TradeRepo):
         self.reset_dao()
 
     def fetch_unsettled_trades(
-        self, limit: int = 100, offset: int = 0
+        self, limit: int = 100, after: DBPageCursor | None = None
     ) -> list[DBTrade]:
         if self._raise_exception:
             raise ValueError("Database error")
         if self._return_empty:
             return []
-        return self.dao.fetch_unsettled_trades(limit, offset)
+        return self.dao.fetch_unsettled_trades(limit, after)
 
     def insert_trade(
         self,
@@ -80,12 +82,22 @@ class MockTradeRepo(TradeRepo):
             return []
         return self.dao.fetch_open_positions(self.user_id, self.account_id)
 
+    def verify_positions(self) -> list[tuple[str, Decimal | None, Decimal | None]]:
+        if self._raise_exception:
+            raise ValueError("Database error")
+        return self.dao.verify_positions(self.user_id, self.account_id)
+
+    def rebuild_positions(self) -> int:
+        if self._raise_exception:
+            raise ValueError("Database error")
+        return self.dao.rebuild_positions(self.user_id, self.account_id)
+
     def fetch_trades_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime,
         limit: int = 100,
-        offset: int = 0,
+        after: DBPageCursor | None = None,
     ) -> list[DBTrade]:
         if self._raise_exception:
             raise ValueError("Database error")
@@ -95,7 +107,7 @@ class MockTradeRepo(TradeRepo):
             start_date=start_date,
             end_date=end_date,
             limit=limit,
-            offset=offset,
+            after=after,
         )
 
     def fetch_trades_by_order_id(self, order_id: UUID) -> list[DBTrade]:
@@ -105,11 +117,31 @@ class MockTradeRepo(TradeRepo):
             return []
         return self.dao.fetch_trades_by_order_id(order_id=order_id)
 
+    def insert_trades(self, trades: list[DBTrade]) -> int:
+        if self._raise_exception:
+            raise ValueError("Database error")
+        return self.dao.insert_trades(
+            trades=trades, user_id=self.user_id, account_id=self.account_id
+        )
+
     def update_settled_trades(self, settlement_datetime: datetime) -> int:
         if self._raise_exception:
             raise ValueError("Database error")
         return self.dao.update_settled_trades(settlement_datetime)
 
+    def reconcile_trades(
+        self, trades: list[DBTrade], start_date: datetime, end_date: datetime
+    ) -> tuple[int, int]:
+        if self._raise_exception:
+            raise ValueError("Database error")
+        return self.dao.reconcile_trades(
+            trades=trades,
+            start_date=start_date,
+            end_date=end_date,
+            user_id=self.user_id,
+            account_id=self.account_id,
+        )
+
     def delete_trade(self, trade_id: UUID) -> int:
         if self._raise_exception:
             raise ValueError("Database error")
@@ -3,15 +3,35 @@ from tests.mocks.mock_loggable import MockLoggable
 from tests.mocks.services.mock_clock_service import MockClockService
 from tests.mocks.services.mock_ledger_service import MockLedgerService
 from tests.mocks.services.mock_order_event_service import MockOrderEventService
+from tests.mocks.services.mock_order_monitor_writer import MockOrderMonitorWriter
 from tests.mocks.services.mock_trades_service import MockTradesService
 
 
 class MockOrderMonitorService(OrderMonitorService):
     def __init__(self):
+        trades_service = MockTradesService()
         super().__init__(
-            trades_service=MockTradesService(),
+            trades_service=trades_service,
+            writer=MockOrderMonitorWriter(trades_service=trades_service),
             ledger_service=MockLedgerService(),
             order_event_service=MockOrderEventService(),
             clock_service=MockClockService(),
             logger=MockLoggable(),
         )
+        self.raise_exception = False
+
+    def set_raise_exception(self, value: bool):
+        self.raise_exception = value
+
+    def reset_raise_exception(self):
+        self.raise_exception = False
+
+    def reset(self):
+        self.reset_raise_exception()
+        self.order_fills = {}
+        self.pending_trades = []
+
+    async def async_start(self):
+        if self.raise_exception:
+            raise Exception("Mocked exception in async_start")
+        return await super().async_start()
@@ -0,0 +1,13 @@
+from algo_royale.services.order_monitor_writer import OrderMonitorWriter
+from tests.mocks.mock_loggable import MockLoggable
+from tests.mocks.services.mock_order_service import MockOrderService
+from tests.mocks.services.mock_trades_service import MockTradesService
+
+
+class MockOrderMonitorWriter(OrderMonitorWriter):
+    def __init__(self, trades_service: MockTradesService | None = None):
+        super().__init__(
+            order_service=MockOrderService(),
+            trades_service=trades_service or MockTradesService(),
+            logger=MockLoggable(),
+        )
@@ -111,4 +111,4 @@ class MockPositionsService(PositionsService):
         return None
 
     async def validate_positions(self):
-        return None
+        return True
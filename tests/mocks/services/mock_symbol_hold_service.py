@@ -43,7 +43,9 @@ class MockSymbolHoldService(SymbolHoldService):
     async def start(self):
         if self.raise_exception:
             self.logger.error("Mocked exception on start")
+            return False
         self.logger.info("MockSymbolHoldService started")
+        return True
 
     async def stop(self):
         if self.raise_exception:
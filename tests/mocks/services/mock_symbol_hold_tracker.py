@@ -27,6 +27,11 @@ class MockSymbolHoldTracker(SymbolHoldTracker):
         self.logger.info(f"Mock set hold for {symbol} to {status}")
         self.symbol_holds[symbol] = status
 
+    async def async_set_holds(self, holds: dict[str, SymbolHoldStatus]):
+        # Mock implementation: just log the action
+        self.logger.info(f"Mock set holds for {list(holds)}")
+        self.symbol_holds.update(holds)
+
     async def async_subscribe_to_symbol_holds(
         self,
         callback,
@@ -68,7 +68,7 @@ class MockTradesService(TradesService):
             trade.model_copy(update={"order_id": order_id}) for trade in self.trades
         ]
 
-    def fetch_unsettled_trades(self, limit=100, offset=0):
+    def fetch_unsettled_trades(self, limit=100, after=None):
         if self.raise_exception:
             raise ValueError("Database error")
         if self.return_empty:
@@ -78,7 +78,7 @@ class MockTradesService(TradesService):
     def update_settled_trades(self):
         if self.raise_exception:
             raise Exception("Mocked exception in update_settled_trades")
-        return
+        return True
 
     def insert_trade(
         self,
@@ -112,7 +112,16 @@ class MockTradesService(TradesService):
         self.trades.append(new_trade)
         return UUID(str(new_trade.id))
 
-    def fetch_trades_by_date_range(self, start_date, end_date, limit=100, offset=0):
+    def insert_trades(self, trades: list[DBTrade]) -> int:
+        if self.raise_exception:
+            raise ValueError("Database error")
+        # external_id is unique; existing trades are skipped like ON CONFLICT DO NOTHING
+        existing = {trade.external_id for trade in self.trades}
+        new_trades = [trade for trade in trades if trade.external_id not in existing]
+        self.trades.extend(new_trades)
+        return len(new_trades)
+
+    def fetch_trades_by_date_range(self, start_date, end_date, limit=100, after=None):
         if self.raise_exception:
             raise ValueError("Database error")
         if self.return_empty:
@@ -144,5 +153,7 @@ class MockTradesService(TradesService):
         self.trades = []
         return count
 
-    def reconcile_trades(self, start_date, end_date, rerun=True):
-        return
+    async def reconcile_trades(self, start_date, end_date) -> dict:
+        if self.raise_exception:
+            raise ValueError("Database error")
+        return {"staged": 0, "deleted": 0, "inserted": 0, "run_time_sec": 0.0}
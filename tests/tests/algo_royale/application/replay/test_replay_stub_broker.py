@@ -0,0 +1,27 @@
+import asyncio
+
+from algo_royale.application.orders.equity_order_enums import EquityOrderSide
+from algo_royale.application.orders.signal_order_payload import SignalOrderPayload
+from algo_royale.application.replay.replay_stub_broker import ReplayStubBroker
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+from tests.mocks.mock_loggable import MockLoggable
+
+
+def test_fill_records_order_and_closes_trace():
+    tracker = LatencyTracker()
+    broker = ReplayStubBroker(logger=MockLoggable(), latency_tracker=tracker)
+    tracker.start_trace("AAPL", 1)
+    payload = SignalOrderPayload(
+        symbol="AAPL",
+        side=EquityOrderSide.BUY,
+        weight=0.5,
+        price_data={"timestamp": 1, "close_price": 101.0},
+    )
+
+    asyncio.run(broker.async_submit_order(payload))
+
+    assert broker.fills[0]["price"] == 101.0
+    assert broker.get_summary()["by_symbol"] == {"AAPL": 1}
+    snapshot = tracker.snapshot()
+    assert snapshot["hop_latency"]["end_to_end"]["count"] == 1
+    assert snapshot["open_traces"] == 0
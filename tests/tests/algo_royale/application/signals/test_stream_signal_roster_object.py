@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from algo_royale.application.signals.signal_roster import SignalRoster
+from algo_royale.application.signals.signals_data_payload import SignalDataPayload
+from algo_royale.application.signals.stream_signal_roster_object import (
+    StreamSignalRosterObject,
+)
+from tests.mocks.mock_loggable import MockLoggable
+
+
+def _payload(entry: str) -> SignalDataPayload:
+    return SignalDataPayload(
+        signals={"entry_signal": entry}, price_data={"close_price": 1.0}
+    )
+
+
+@pytest.mark.asyncio
+class TestStreamSignalRosterObject:
+    async def test_publishes_roster_of_set_symbols(self):
+        roster_object = StreamSignalRosterObject(
+            initial_symbols=["AAPL", "MSFT", "GOOG"], logger=MockLoggable()
+        )
+        received = []
+
+        async def callback(roster):
+            received.append(roster)
+
+        roster_object.subscribe(callback)
+        aapl = _payload("buy")
+        await roster_object.async_set_signal_data_payload("AAPL", aapl)
+        await asyncio.sleep(0.01)
+
+        roster = received[-1]
+        assert isinstance(roster, SignalRoster)
+        assert list(roster) == ["AAPL"]
+        assert len(roster) == 1
+        assert roster["AAPL"] is aapl
+        assert "MSFT" not in roster
+        with pytest.raises(KeyError):
+            roster["MSFT"]
+        await roster_object.async_shutdown()
+
+    async def test_snapshots_are_not_affected_by_later_updates(self):
+        roster_object = StreamSignalRosterObject(
+            initial_symbols=["AAPL"], logger=MockLoggable()
+        )
+        first = _payload("buy")
+        await roster_object.async_set_signal_data_payload("AAPL", first)
+        snapshot = roster_object.get_signal_data_roster()
+
+        second = _payload("hold")
+        await roster_object.async_set_signal_data_payload("AAPL", second)
+        await roster_object.async_set_signal_data_payload("TSLA", _payload("buy"))
+
+        assert dict(snapshot.items()) == {"AAPL": first}
+        latest = roster_object.get_signal_data_roster()
+        assert [symbol for symbol, _ in latest.items()] == ["AAPL", "TSLA"]
+        assert latest["AAPL"] is second
+        assert roster_object.get_signal_data_payload("TSLA") == _payload("buy")
+        assert roster_object.get_signal_data_payload("NVDA") is None
@@ -0,0 +1,83 @@
+import json
+
+from algo_royale.application.strategies.strategy_registry_snapshot import (
+    StrategyRegistrySnapshot,
+)
+from tests.mocks.mock_loggable import MockLoggable
+
+
+class TestStrategyRegistrySnapshot:
+    def test_put_appends_and_reloads(self, tmp_path):
+        path = tmp_path / "viable.json"
+        snapshot = StrategyRegistrySnapshot(path=path, logger=MockLoggable())
+        snapshot.load()
+        snapshot.put("AAPL", {"A": {"viability_score": 1.0, "params": {}}})
+        snapshot.put("MSFT", {"B": {"viability_score": 0.5, "params": {}}})
+
+        lines = path.read_text().splitlines()
+        assert json.loads(lines[0]) == {"version": StrategyRegistrySnapshot.VERSION}
+        assert len(lines) == 3
+
+        reloaded = StrategyRegistrySnapshot(path=path, logger=MockLoggable()).load()
+        assert set(reloaded) == {"AAPL", "MSFT"}
+        assert reloaded["MSFT"]["B"]["viability_score"] == 0.5
+
+    def test_latest_record_wins_and_compacts(self, tmp_path):
+        path = tmp_path / "viable.json"
+        snapshot = StrategyRegistrySnapshot(path=path, logger=MockLoggable())
+        snapshot.load()
+        for score in range(5):
+            snapshot.put("AAPL", {"score": score})
+
+        assert len(path.read_text().splitlines()) <= 3
+        reloaded = StrategyRegistrySnapshot(path=path, logger=MockLoggable()).load()
+        assert reloaded == {"AAPL": {"score": 4}}
+
+    def test_migrates_legacy_json(self, tmp_path):
+        path = tmp_path / "viable.json"
+        path.write_text(json.dumps({"AAPL": {"name": "S", "params": {}}}, indent=2))
+        loaded = StrategyRegistrySnapshot(path=path, logger=MockLoggable()).load()
+        assert loaded == {"AAPL": {"name": "S", "params": {}}}
+        assert json.loads(path.read_text().splitlines()[0]) == {
+            "version": StrategyRegistrySnapshot.VERSION
+        }
+
+    def test_skips_torn_record(self, tmp_path):
+        path = tmp_path / "viable.json"
+        snapshot = StrategyRegistrySnapshot(path=path, logger=MockLoggable())
+        snapshot.load()
+        snapshot.put("AAPL", {"score": 1})
+        with open(path, "a") as f:
+            f.write('{"k":"MSFT","v":')
+        loaded = StrategyRegistrySnapshot(path=path, logger=MockLoggable()).load()
+        assert loaded == {"AAPL": {"score": 1}}
+
+    def test_put_after_torn_record_is_kept(self, tmp_path):
+        path = tmp_path / "viable.json"
+        snapshot = StrategyRegistrySnapshot(path=path, logger=MockLoggable())
+        snapshot.load()
+        snapshot.put("AAPL", {"score": 1})
+        with open(path, "a") as f:
+            f.write('{"k":"MSFT","v":')
+
+        snapshot = StrategyRegistrySnapshot(path=path, logger=MockLoggable())
+        snapshot.load()
+        snapshot.put("NVDA", {"score": 2})
+
+        reloaded = StrategyRegistrySnapshot(path=path, logger=MockLoggable()).load()
+        assert reloaded == {"AAPL": {"score": 1}, "NVDA": {"score": 2}}
+
+    def test_put_rewrites_other_version(self, tmp_path):
+        path = tmp_path / "viable.json"
+        path.write_text('{"version":0}\n{"k":"AAPL","v":{"score":1}}\n')
+        snapshot = StrategyRegistrySnapshot(path=path, logger=MockLoggable())
+        assert snapshot.load() == {}
+        # The mismatched file is left alone until there is something to write
+        assert json.loads(path.read_text().splitlines()[0]) == {"version": 0}
+
+        snapshot.put("MSFT", {"score": 2})
+
+        lines = path.read_text().splitlines()
+        assert json.loads(lines[0]) == {"version": StrategyRegistrySnapshot.VERSION}
+        reloaded = StrategyRegistrySnapshot(path=path, logger=MockLoggable()).load()
+        assert reloaded == {"MSFT": {"score": 2}}
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -29,6 +29,19 @@ class TestSymbolHoldTracker:
         await self.tracker.async_set_hold("AAPL", SymbolHoldStatus.HOLD_ALL)
         # Should not raise, error is logged
 
+    @pytest.mark.asyncio
+    async def test_async_set_holds_publishes_single_roster_update(self):
+        self.tracker._symbol_hold_pubsub.async_publish = AsyncMock()
+        self.tracker._roster_hold_pubsub.async_publish = AsyncMock()
+        holds = {
+            "AAPL": SymbolHoldStatus.HOLD_ALL,
+            "MSFT": SymbolHoldStatus.BUY_ONLY,
+        }
+        await self.tracker.async_set_holds(holds)
+        assert self.tracker.symbol_holds == holds
+        assert self.tracker._symbol_hold_pubsub.async_publish.await_count == 2
+        assert self.tracker._roster_hold_pubsub.async_publish.await_count == 1
+
     @pytest.mark.asyncio
     async def test_async_subscribe_to_symbol_holds_and_unsubscribe(self):
         async def callback(data):
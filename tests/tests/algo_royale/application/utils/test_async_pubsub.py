@@ -3,6 +3,7 @@ import asyncio
 import pytest
 
 from src.algo_royale.application.utils.async_pubsub import AsyncPubSub
+from src.algo_royale.application.utils.latency_tracker import LatencyTracker
 
 
 @pytest.mark.asyncio
@@ -59,3 +60,24 @@ class TestAsyncPubSub:
         subscriber = self.pubsub.subscribe("test", sub)
         self.pubsub.unsubscribe(subscriber)
         assert subscriber not in self.pubsub.subscribers.get("test", [])
+
+    @pytest.mark.asyncio
+    async def test_latency_tracker_records_queue_wait_and_drops(self):
+        tracker = LatencyTracker()
+        pubsub = AsyncPubSub(stage="test_stage", latency_tracker=tracker)
+        received = []
+
+        async def sub(msg):
+            received.append(msg)
+
+        pubsub.subscribe("test", sub, queue_size=1)
+        # Publishing twice before the consumer runs drops the oldest item
+        await pubsub.async_publish("test", "first")
+        await pubsub.async_publish("test", "second")
+        await asyncio.sleep(0.01)
+
+        snapshot = tracker.snapshot()
+        assert received == ["second"]
+        assert snapshot["dropped"] == {"test_stage": 1}
+        assert snapshot["queue_wait"]["test_stage"]["count"] == 1
+        await pubsub.async_shutdown()
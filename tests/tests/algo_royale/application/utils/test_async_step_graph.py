@@ -0,0 +1,78 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from algo_royale.application.utils.async_step_graph import AsyncStep, AsyncStepGraph
+from tests.mocks.mock_loggable import MockLoggable
+
+
+@pytest.mark.asyncio
+class TestAsyncStepGraph:
+    async def test_independent_steps_run_concurrently(self):
+        order = []
+
+        async def slow(name):
+            order.append(f"{name}_start")
+            await asyncio.sleep(0.05)
+            order.append(f"{name}_end")
+
+        graph = AsyncStepGraph(
+            steps=[
+                AsyncStep("a", partial(slow, "a")),
+                AsyncStep("b", partial(slow, "b")),
+                AsyncStep("c", lambda: order.append("c"), depends_on=("a", "b")),
+            ],
+            logger=MockLoggable(),
+        )
+        report = await graph.async_run()
+
+        assert report["succeeded"] is True
+        assert order[:2] == ["a_start", "b_start"]
+        assert order[-1] == "c"
+        assert report["wall_time_sec"] < report["step_time_sec"]
+
+    async def test_failure_and_timeout_skip_dependents(self):
+        def fail():
+            raise ValueError("boom")
+
+        async def hang():
+            await asyncio.sleep(1)
+
+        async def noop():
+            return None
+
+        graph = AsyncStepGraph(
+            steps=[
+                AsyncStep("fail", fail),
+                AsyncStep("hang", hang, timeout_seconds=0.01),
+                AsyncStep("after_fail", noop, depends_on=("fail",)),
+                AsyncStep("after_hang", noop, depends_on=("hang",)),
+                AsyncStep("independent", noop),
+            ],
+            logger=MockLoggable(),
+        )
+        report = await graph.async_run()
+        steps = report["steps"]
+
+        assert report["succeeded"] is False
+        assert steps["fail"]["status"] == AsyncStepGraph.FAILED
+        assert steps["hang"]["status"] == AsyncStepGraph.TIMEOUT
+        assert steps["after_fail"]["status"] == AsyncStepGraph.SKIPPED
+        assert steps["after_hang"]["status"] == AsyncStepGraph.SKIPPED
+        assert steps["independent"]["status"] == AsyncStepGraph.OK
+
+    async def test_rejects_cycles_and_unknown_dependencies(self):
+        with pytest.raises(ValueError):
+            AsyncStepGraph(
+                steps=[
+                    AsyncStep("a", lambda: None, depends_on=("b",)),
+                    AsyncStep("b", lambda: None, depends_on=("a",)),
+                ],
+                logger=MockLoggable(),
+            )
+        with pytest.raises(ValueError):
+            AsyncStepGraph(
+                steps=[AsyncStep("a", lambda: None, depends_on=("missing",))],
+                logger=MockLoggable(),
+            )
@@ -0,0 +1,55 @@
+from src.algo_royale.application.utils.latency_tracker import LatencyTracker
+
+
+class TestLatencyTracker:
+    def setup_method(self):
+        self.tracker = LatencyTracker(max_open_traces=2)
+
+    def test_trace_records_hops_and_end_to_end(self):
+        self.tracker.start_trace("AAPL", 1)
+        self.tracker.stamp("AAPL", 1, hop="enrichment", next_timestamp="t1")
+        self.tracker.stamp("AAPL", "t1", hop="signal")
+        self.tracker.stamp("AAPL", "t1", hop="order_execution", final=True)
+
+        snapshot = self.tracker.snapshot()
+        assert set(snapshot["hop_latency"]) == {
+            "enrichment",
+            "signal",
+            "order_execution",
+            LatencyTracker.END_TO_END,
+        }
+        assert snapshot["hop_latency"]["signal"]["count"] == 1
+        assert snapshot["hop_latency"]["signal"]["p99_ms"] is not None
+        assert snapshot["open_traces"] == 0
+
+    def test_stamp_without_open_trace_is_ignored(self):
+        self.tracker.stamp("AAPL", 1, hop="signal")
+        assert self.tracker.snapshot()["hop_latency"] == {}
+
+    def test_discard_closes_trace_without_latency(self):
+        self.tracker.start_trace("AAPL", 1)
+        self.tracker.stamp("AAPL", 1, hop="signal")
+        self.tracker.discard("AAPL", 1, reason="order_execution")
+        self.tracker.discard("AAPL", 2, reason="order_execution")
+
+        snapshot = self.tracker.snapshot()
+        assert LatencyTracker.END_TO_END not in snapshot["hop_latency"]
+        assert snapshot["discarded"] == {"order_execution": 1}
+        assert snapshot["open_traces"] == 0
+
+    def test_oldest_traces_are_evicted(self):
+        for ts in range(3):
+            self.tracker.start_trace("AAPL", ts)
+        self.tracker.stamp("AAPL", 0, hop="signal")
+        snapshot = self.tracker.snapshot()
+        assert snapshot["open_traces"] == 2
+        assert snapshot["hop_latency"] == {}
+
+    def test_percentiles(self):
+        for ms in range(1, 101):
+            self.tracker.record_latency("signal", ms / 1000)
+        summary = self.tracker.snapshot()["hop_latency"]["signal"]
+        assert summary["count"] == 100
+        assert summary["max_ms"] == 100.0
+        assert 49 <= summary["p50_ms"] <= 51
+        assert summary["p99_ms"] >= 99
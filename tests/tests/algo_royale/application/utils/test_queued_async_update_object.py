@@ -64,3 +64,42 @@ class TestQueuedAsyncUpdateObject:
         assert self.obj.value == 0
         asyncio.run(self.q.async_update(1))
         assert self.obj.value == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_updates_are_suppressed(self):
+        applied = []
+
+        async def record(v):
+            applied.append(v)
+
+        self.obj.update = record
+        for v in [1, 1, 2, 2, 1]:
+            await self.q.async_update(v)
+        assert applied == [1, 2, 1]
+        assert self.q.get_update_counters() == {
+            "applied": 3,
+            "coalesced": 0,
+            "suppressed": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_updates_queued_while_applying_are_coalesced(self):
+        applied = []
+        release = asyncio.Event()
+
+        async def slow_record(v):
+            applied.append(v)
+            if v == "first":
+                await release.wait()
+
+        self.obj.update = slow_record
+        first = asyncio.create_task(self.q.async_update("first"))
+        await asyncio.sleep(0)
+        # Arrive while "first" is being applied; only the latest str survives
+        await self.q.async_update("second")
+        await self.q.async_update("third")
+        await self.q.async_update(3.0)
+        release.set()
+        await first
+        assert applied == ["first", "third", 3.0]
+        assert self.q.get_update_counters()["coalesced"] == 1
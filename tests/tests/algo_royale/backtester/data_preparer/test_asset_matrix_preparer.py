@@ -1,9 +1,15 @@
+from math import nan
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from algo_royale.backtester.data_preparer.asset_matrix_preparer import (
     AssetMatrixPreparer,
 )
+from algo_royale.backtester.enums.asset_matrix_fill_policy import (
+    AssetMatrixFillPolicy,
+)
 from tests.mocks.mock_loggable import MockLoggable
 
 
@@ -100,3 +106,61 @@ class TestAssetMatrixPreparer:
         assert isinstance(result, pd.DataFrame)
         assert list(result.columns) == ["close"]
         assert result.shape == (3, 1)
+
+    def test_build_matches_prepare(self, asset_matrix_preparer: AssetMatrixPreparer):
+        frames = [
+            pd.DataFrame(
+                {
+                    "timestamp": [1, 2, 3],
+                    "symbol": "B",
+                    "close_price": [20.0, 21.0, 22.0],
+                    "open_price": [19.0, 20.0, 21.0],
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "timestamp": [2, 4],
+                    "symbol": "A",
+                    "close_price": [11.0, 13.0],
+                    "open_price": [10.0, 12.0],
+                }
+            ),
+        ]
+        expected = asset_matrix_preparer.prepare(
+            pd.concat(frames, ignore_index=True),
+            symbol_col="symbol",
+            timestamp_col="timestamp",
+        )
+        result = asset_matrix_preparer.build(
+            frames, symbol_col="symbol", timestamp_col="timestamp"
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "fill_policy, expected",
+        [
+            (AssetMatrixFillPolicy.NONE, [nan, 1.0, nan, 3.0, nan]),
+            (AssetMatrixFillPolicy.FFILL, [nan, 1.0, 1.0, 3.0, 3.0]),
+            (AssetMatrixFillPolicy.FFILL_BFILL, [1.0, 1.0, 1.0, 3.0, 3.0]),
+            (AssetMatrixFillPolicy.ZERO, [0.0, 1.0, 0.0, 3.0, 0.0]),
+        ],
+    )
+    def test_build_fill_policies(
+        self, asset_matrix_preparer: AssetMatrixPreparer, fill_policy, expected
+    ):
+        frames = [
+            pd.DataFrame({"timestamp": [1, 2, 3, 4, 5], "symbol": "A", "x": 0.0}),
+            pd.DataFrame({"timestamp": [2, 4], "symbol": "B", "x": [1.0, 3.0]}),
+        ]
+        result = asset_matrix_preparer.build(
+            frames, value_col="x", fill_policy=fill_policy
+        )
+        np.testing.assert_array_equal(result["B"].to_numpy(), expected)
+        assert result["A"].tolist() == [0.0] * 5
+
+    def test_build_rejects_duplicate_timestamps(
+        self, asset_matrix_preparer: AssetMatrixPreparer
+    ):
+        frames = [pd.DataFrame({"timestamp": [1, 1], "symbol": "A", "x": [1.0, 2.0]})]
+        with pytest.raises(ValueError):
+            asset_matrix_preparer.build(frames, value_col="x")
@@ -94,3 +94,45 @@ def test_max_drawdown(evaluator):
     result = evaluator._max_drawdown(cum_returns)
     assert isinstance(result, float)
     assert result >= 0
+
+
+def test_stream_matches_evaluation_of_concatenated_pages(evaluator):
+    rng = np.random.default_rng(0)
+    n = 500
+    signals = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-07-09", periods=n, freq="min"),
+            "close_price": 100 + rng.normal(0, 1, n).cumsum(),
+            "entry_signal": rng.choice(["buy", "hold"], n, p=[0.1, 0.9]),
+            "exit_signal": rng.choice(["sell", "hold"], n, p=[0.1, 0.9]),
+        }
+    )
+
+    expected = evaluator._evaluate_signals(signals)
+    stream = evaluator.stream(strategy=None)
+    # Uneven pages, so open trades carry over page boundaries
+    for start, end in [(0, 7), (7, 180), (180, 181), (181, n)]:
+        stream.add_signals(signals.iloc[start:end])
+
+    assert expected["total_return"] != 0.0
+    assert stream.metrics() == pytest.approx(expected)
+
+
+def test_stream_without_trades_reports_zero_metrics(evaluator):
+    stream = evaluator.stream(strategy=None)
+    stream.add_signals(valid_signals_df().assign(entry_signal="hold"))
+    assert stream.pages == 1
+    assert stream.metrics() == {
+        "total_return": 0.0,
+        "sharpe_ratio": 0.0,
+        "win_rate": 0.0,
+        "max_drawdown": 0.0,
+    }
+
+
+def test_stream_rejects_invalid_page(evaluator):
+    stream = evaluator.stream(strategy=None)
+    with pytest.raises(ValueError):
+        stream.add_signals(
+            pd.DataFrame({"timestamp": ["2025-07-09"], "close_price": [100]})
+        )
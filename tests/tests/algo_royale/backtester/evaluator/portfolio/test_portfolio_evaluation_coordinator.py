@@ -55,3 +55,25 @@ def test_run_handles_cross_strategy_exception(coordinator):
     cross_strategy.set_raise_exception(True)
     with pytest.raises(RuntimeError):
         coordinator_obj.run()
+
+
+def test_run_skips_unchanged_strategies(coordinator):
+    coordinator_obj, cross_window, cross_strategy, symbol_dir, strat_dir = coordinator
+    window_dir = strat_dir / "20200101_20201231"
+    window_dir.mkdir()
+    (window_dir / cross_window.window_json_filename).write_text("{}")
+    (strat_dir / cross_window.output_filename).write_text("{}")
+    (symbol_dir / cross_strategy.output_filename).write_text("{}")
+
+    stats = coordinator_obj.run()
+    assert cross_window.run_called
+    assert stats.strategies_evaluated == 1
+    assert stats.files_read == 1
+
+    cross_window.run_called = False
+    cross_strategy.run_called = False
+    stats = coordinator_obj.run()
+    assert not cross_window.run_called
+    assert not cross_strategy.run_called
+    assert stats.strategies_skipped == 1
+    assert stats.files_skipped == 1
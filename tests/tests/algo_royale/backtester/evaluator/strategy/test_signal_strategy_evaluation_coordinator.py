@@ -112,6 +112,68 @@ def test_run_success(temp_optimization_dir):
     assert report["is_viable"] in [True, False]
 
 
+def test_run_skips_unchanged_strategy_dirs(temp_optimization_dir):
+    tmp_path, symbol_dir, strat_dir = temp_optimization_dir
+    metrics = {
+        "total_return": 0.1,
+        "sharpe_ratio": 1.0,
+        "win_rate": 0.8,
+        "max_drawdown": 0.2,
+    }
+    opt_content = {
+        "window1": {
+            "window": {"start_date": "2020-01-01", "end_date": "2020-06-30"},
+            "optimization": {
+                "strategy": "TestStrategy",
+                "best_value": 1.23,
+                "best_params": {"entry_conditions": [{"cond": 1}]},
+                "meta": {
+                    "run_time_sec": 1.0,
+                    "n_trials": 10,
+                    "symbol": "SYM1",
+                    "direction": "long",
+                },
+                "metrics": metrics,
+            },
+            "test": {},
+        }
+    }
+    for window in ("w1", "w2"):
+        (strat_dir / window).mkdir()
+        make_opt_json(strat_dir / window, "opt.json", opt_content)
+    other_dir = symbol_dir / "STRAT2"
+    other_dir.mkdir()
+    make_opt_json(other_dir, "opt.json", opt_content)
+    coordinator = SignalStrategyEvaluationCoordinator(
+        logger=MockLoggable(),
+        optimization_root=str(tmp_path),
+        evaluation_type=StrategyEvaluationType.OPTIMIZATION,
+        optimization_json_filename="opt.json",
+        evaluation_json_filename="eval.json",
+        max_workers=2,
+    )
+
+    stats = coordinator.run()
+    assert stats.files_indexed == 3
+    assert stats.files_read == 3
+    assert stats.strategies_evaluated == 2
+    with open(strat_dir / "eval.json") as f:
+        assert json.load(f)["n_windows"] == 2
+
+    stats = coordinator.run()
+    assert stats.files_read == 0
+    assert stats.files_skipped == 3
+    assert stats.strategies_skipped == 2
+
+    metrics["total_return"] = 0.3
+    make_opt_json(other_dir, "opt.json", opt_content)
+    stats = coordinator.run()
+    assert stats.strategies_evaluated == 1
+    assert stats.files_read == 1
+    with open(other_dir / "eval.json") as f:
+        assert json.load(f)["summary"]["total_return"]["mean"] == 0.3
+
+
 def test_run_handles_missing_dir(tmp_path):
     logger = MockLoggable()
     coordinator = SignalStrategyEvaluationCoordinator(
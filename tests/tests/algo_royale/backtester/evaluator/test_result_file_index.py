@@ -0,0 +1,41 @@
+from algo_royale.backtester.evaluator.result_file_index import ResultFileIndex
+
+
+def _write(path, text="{}"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_scan_groups_files_by_strategy_dir(tmp_path):
+    _write(tmp_path / "AAPL" / "Momentum" / "w2" / "result.json")
+    _write(tmp_path / "AAPL" / "Momentum" / "w1" / "result.json")
+    _write(tmp_path / "AAPL" / "Momentum" / "w1" / "other.json")
+    _write(tmp_path / "AAPL" / "Empty" / "w1" / "other.json")
+    _write(tmp_path / "result.json")
+    index = ResultFileIndex(tmp_path, "result.json").scan()
+    strategy_dir = tmp_path / "AAPL" / "Momentum"
+    assert set(index) == {strategy_dir, tmp_path / "AAPL" / "Empty"}
+    assert [f.path.parent.name for f in index[strategy_dir]] == ["w1", "w2"]
+    assert index[tmp_path / "AAPL" / "Empty"] == []
+
+
+def test_signature_tracks_content_and_params(tmp_path):
+    path = _write(tmp_path / "AAPL" / "Momentum" / "w1" / "result.json")
+    index = ResultFileIndex(tmp_path, "result.json")
+    files = index.scan()[tmp_path / "AAPL" / "Momentum"]
+    signature = index.signature(files, "both")
+    assert index.signature(files, "both") == signature
+    assert index.signature(files, "test") != signature
+    _write(path, '{"changed": true}')
+    files = index.scan()[tmp_path / "AAPL" / "Momentum"]
+    assert index.signature(files, "both") != signature
+
+
+def test_state_round_trip(tmp_path):
+    index = ResultFileIndex(tmp_path, "result.json")
+    assert index.load_state() == {}
+    index.save_state({"AAPL/Momentum": "abc"})
+    assert index.load_state() == {"AAPL/Momentum": "abc"}
+    index.state_path.write_text("not json")
+    assert index.load_state() == {}
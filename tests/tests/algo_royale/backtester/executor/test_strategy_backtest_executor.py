@@ -189,3 +189,45 @@ async def test_run_backtest_invalid_prices(mock_stage_data_manager, mock_logger)
     executor = StrategyBacktestExecutor(mock_stage_data_manager, mock_logger)
     results = await executor.async_run_backtest([], data)
     assert results == {"AAPL": []}  # Expect no results for invalid prices
+
+
+@pytest.mark.asyncio
+async def test_stream_backtest_yields_pages_and_filters_once(
+    mock_stage_data_manager, mock_logger, mock_strategy
+):
+    other_strategy = MagicMock()
+    other_strategy.get_hash_id.return_value = "OtherStrategy"
+    other_strategy.generate_signals.side_effect = (
+        mock_strategy.generate_signals.side_effect
+    )
+
+    async def df_iter():
+        for i in range(3):
+            yield pd.DataFrame(
+                {
+                    "a": [i, i],
+                    SignalStrategyExecutorColumns.CLOSE_PRICE: [100, 1e7],
+                    SignalStrategyExecutorColumns.TIMESTAMP: pd.to_datetime(
+                        ["2020-01-01", "2020-01-02"]
+                    ),
+                }
+            )
+
+    executor = StrategyBacktestExecutor(mock_stage_data_manager, mock_logger)
+    filter_extreme_values = executor.filter_extreme_values
+    executor.filter_extreme_values = MagicMock(side_effect=filter_extreme_values)
+
+    pages = [
+        (symbol, strategy.get_hash_id(), df)
+        async for symbol, strategy, df in executor.async_stream_backtest(
+            [mock_strategy, other_strategy], {"AAPL": lambda: df_iter()}
+        )
+    ]
+
+    assert [(symbol, name) for symbol, name, _ in pages] == [
+        ("AAPL", "MockStrategy"),
+        ("AAPL", "OtherStrategy"),
+    ] * 3
+    # The extreme row is dropped, once per page rather than once per strategy
+    assert all(len(df) == 1 for _, _, df in pages)
+    assert executor.filter_extreme_values.call_count == 3
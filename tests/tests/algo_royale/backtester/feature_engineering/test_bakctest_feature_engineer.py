@@ -1,11 +1,16 @@
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from algo_royale.backtester.feature_engineering.backtest_feature_engineer import (
     BacktestFeatureEngineer,
 )
+from algo_royale.backtester.feature_engineering.feature_engineering import (
+    feature_engineering,
+    panel_feature_engineering,
+)
 
 
 @pytest.fixture
@@ -165,3 +170,88 @@ async def test_engineer_features_handles_exception(mock_logger):
     # Should yield nothing, but print error
     assert results == []
     mock_logger.error.assert_any_call("Feature engineering failed for AAPL: bad data")
+
+
+@pytest.mark.asyncio
+async def test_engineer_features_computes_selected_features(mock_logger):
+    async def df_iter():
+        yield pd.DataFrame(
+            {
+                "close_price": [1.0, 2.0],
+                "high_price": [2.0, 3.0],
+                "low_price": [0.5, 1.5],
+                "num_trades": [4, 5],
+                "open_price": [1.0, 1.5],
+                "symbol": ["AAPL", "AAPL"],
+                "timestamp": pd.to_datetime(["2025-07-07 14:30", "2025-07-07 14:45"]),
+                "volume": [100.0, 200.0],
+                "volume_weighted_price": [1.0, 2.0],
+            }
+        )
+
+    fe = BacktestFeatureEngineer(
+        feature_engineering_func=feature_engineering,
+        logger=mock_logger,
+        max_lookback=0,
+        features={"macd_signal", "close_price"},
+    )
+    report = fe.start_report()
+    results = [df async for df in fe.engineer_features(df_iter(), "AAPL")]
+
+    assert len(results) == 1
+    assert {"macd", "macd_signal"} <= set(results[0].columns)
+    assert "vwap_200" not in results[0].columns
+    assert report.computed == ["macd", "macd_signal"]
+    assert report.rows == 2
+    assert report.skipped_bytes == 2 * len(report.skipped) * 8
+
+
+@pytest.mark.asyncio
+async def test_engineer_panel_features_matches_per_symbol_pages(mock_logger):
+    def pages(seed: int, sizes: list[int]) -> list[pd.DataFrame]:
+        rng = np.random.default_rng(seed)
+        n = sum(sizes)
+        close = 100 + rng.normal(0, 1, n).cumsum()
+        bars = pd.DataFrame(
+            {
+                "close_price": close,
+                "high_price": close + 1,
+                "low_price": close - 1,
+                "num_trades": rng.integers(1, 100, n),
+                "open_price": close + rng.normal(0, 0.2, n),
+                "symbol": f"SYM{seed}",
+                "timestamp": pd.date_range("2025-07-07 14:30", periods=n, freq="min"),
+                "volume": rng.integers(1, 1_000, n).astype(float),
+                "volume_weighted_price": close,
+            }
+        )
+        bounds = np.cumsum([0] + sizes)
+        return [
+            bars.iloc[a:b].reset_index(drop=True) for a, b in zip(bounds, bounds[1:])
+        ]
+
+    async def df_iter(frames):
+        for df in frames:
+            yield df.copy()
+
+    symbol_pages = {"AAPL": pages(0, [60, 50, 40]), "MSFT": pages(1, [70, 30])}
+
+    def engineer():
+        return BacktestFeatureEngineer(
+            feature_engineering_func=feature_engineering,
+            logger=mock_logger,
+            max_lookback=20,
+            features={"sma_20", "macd_signal", "atr_14"},
+            panel_feature_engineering_func=panel_feature_engineering,
+        )
+
+    panel = await engineer().engineer_panel_features(
+        {symbol: df_iter(frames) for symbol, frames in symbol_pages.items()}
+    )
+    for symbol, frames in symbol_pages.items():
+        expected = [
+            df async for df in engineer().engineer_features(df_iter(frames), symbol)
+        ]
+        assert len(panel[symbol]) == len(expected) == len(frames)
+        for got, want in zip(panel[symbol], expected):
+            pd.testing.assert_frame_equal(got, want, check_exact=True)
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.feature_engineering.feature_engineering import (
+    FEATURE_SPECS,
+    feature_engineering,
+    panel_feature_engineering,
+    resolve_features,
+)
+from algo_royale.backtester.feature_engineering.feature_requirements import (
+    required_features,
+)
+from algo_royale.backtester.strategy_combinator.signal.moving_average_strategy_combinator import (
+    MovingAverageStrategyCombinator,
+)
+from algo_royale.backtester.strategy_combinator.signal.rsi_strategy_combinator import (
+    RSIStrategyCombinator,
+)
+from tests.mocks.mock_loggable import MockLoggable
+
+
+def _bars(n: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "timestamp": pd.date_range("2024-01-02 14:30", periods=n, freq="15min"),
+            "open_price": close + rng.normal(0, 0.2, n),
+            "high_price": close + 1,
+            "low_price": close - 1,
+            "close_price": close,
+            "volume": rng.integers(1, 1_000, n).astype(float),
+            "num_trades": rng.integers(1, 100, n),
+            "volume_weighted_price": close,
+        }
+    )
+
+
+def test_resolve_features_adds_dependencies_in_computation_order():
+    assert resolve_features(["bollinger_width", "close_price", "macd_signal"]) == [
+        "macd",
+        "macd_signal",
+        "bollinger_upper",
+        "bollinger_lower",
+        "bollinger_width",
+    ]
+    assert resolve_features(["volatility_20"]) == ["pct_return", "volatility_20"]
+    assert resolve_features(None) == list(FEATURE_SPECS)
+
+
+def test_selected_features_match_full_computation():
+    full = feature_engineering(_bars(), MockLoggable())
+    timings = {}
+    selected = feature_engineering(
+        _bars(), MockLoggable(), features=["stochastic_d", "vwap_50"], timings=timings
+    )
+
+    engineered = [col for col in selected.columns if col not in _bars().columns]
+    assert engineered == ["vwap_50", "stochastic_k", "stochastic_d"]
+    assert sorted(timings) == sorted(engineered)
+    pd.testing.assert_frame_equal(selected, full[selected.columns])
+
+
+def test_panel_matches_per_symbol_path():
+    # Unequal lengths pad the panel; a missing close must not leak across symbols
+    frames = {f"SYM{i}": _bars(250 + 40 * i, seed=i) for i in range(4)}
+    frames["SYM1"].loc[20, "close_price"] = np.nan
+
+    panel = panel_feature_engineering(
+        {symbol: df.copy() for symbol, df in frames.items()}, MockLoggable()
+    )
+
+    assert list(panel) == list(frames)
+    for symbol, df in frames.items():
+        expected = feature_engineering(df.copy(), MockLoggable())
+        pd.testing.assert_frame_equal(panel[symbol], expected, check_exact=True)
+
+
+def test_required_features_from_combinators():
+    logger = MockLoggable()
+    # RSI conditions derive RSI from the close price themselves
+    columns = required_features([RSIStrategyCombinator()], logger)
+    assert columns == {"close_price", "open_price"}
+    assert resolve_features(columns) == []
+
+    # A condition type whose grid cannot be enumerated makes the columns unknown
+    assert required_features([MovingAverageStrategyCombinator()], logger) is None
@@ -154,3 +154,101 @@ def test_signal_strategy_optimizer_impl(monkeypatch):
     )
     result = optimizer.optimize("SYM1", df, None, None, n_trials=1)
     assert result["metrics"] is None
+
+
+def test_signal_strategy_optimizer_pruning_keeps_best_params():
+    class ThresholdCond:
+        @staticmethod
+        def optuna_suggest(logger, trial, prefix=""):
+            return trial.suggest_float(f"{prefix}threshold", 0.0, 1.0)
+
+    class ThresholdStrategy:
+        def __init__(self, logger, entry_conditions=None):
+            self.threshold = entry_conditions[0]
+
+    df = pd.DataFrame({"close_price": range(100)})
+
+    async def backtest_fn(strategy, df_):
+        # Score grows with both the parameter and the slice of the window seen
+        score = strategy.threshold * len(df_) / len(df)
+        return {
+            "total_return": score,
+            "sharpe_ratio": score,
+            "win_rate": 0.5,
+            "max_drawdown": 0.1,
+        }
+
+    def run(pruner):
+        optimizer = SignalStrategyOptimizerImpl(
+            strategy_class=ThresholdStrategy,
+            condition_types={"entry": [ThresholdCond]},
+            backtest_fn=backtest_fn,
+            logger=MockLoggable(),
+            strategy_logger=MockLoggable(),
+            pruner=pruner,
+            seed=7,
+        )
+        return optimizer.optimize("SYM1", df, None, None, n_trials=10)
+
+    baseline = run(None)
+    pruned = run("median")
+    assert pruned["best_params"] == baseline["best_params"]
+    assert pruned["best_value"] == baseline["best_value"]
+    assert baseline["meta"]["n_pruned"] == 0
+    assert pruned["meta"]["n_pruned"] > 0
+    assert pruned["meta"]["n_complete"] + pruned["meta"]["n_pruned"] == 10
+    assert pruned["meta"]["fidelity_fractions"] == [0.25, 0.5, 1.0]
+    assert "wall_time_saved_sec" in pruned["meta"]
+
+
+def test_signal_strategy_optimizer_short_study_skips_rungs():
+    class ThresholdCond:
+        @staticmethod
+        def optuna_suggest(logger, trial, prefix=""):
+            return trial.suggest_float(f"{prefix}threshold", 0.0, 1.0)
+
+    class ThresholdStrategy:
+        def __init__(self, logger, entry_conditions=None):
+            self.threshold = entry_conditions[0]
+
+    df = pd.DataFrame({"close_price": range(100)})
+    window_lengths = []
+
+    async def backtest_fn(strategy, df_):
+        window_lengths.append(len(df_))
+        return {
+            "total_return": strategy.threshold,
+            "sharpe_ratio": 1.0,
+            "win_rate": 0.5,
+            "max_drawdown": 0.1,
+        }
+
+    optimizer = SignalStrategyOptimizerImpl(
+        strategy_class=ThresholdStrategy,
+        condition_types={"entry": [ThresholdCond]},
+        backtest_fn=backtest_fn,
+        logger=MockLoggable(),
+        strategy_logger=MockLoggable(),
+        pruner="median",
+        seed=7,
+    )
+    n_trials = SignalStrategyOptimizerImpl.PRUNER_STARTUP_TRIALS
+    result = optimizer.optimize("SYM1", df, None, None, n_trials=n_trials)
+
+    # Too few trials for the pruner to act: only the full window is backtested
+    assert window_lengths == [len(df)] * n_trials
+    assert result["meta"]["pruner"] is None
+    assert result["meta"]["fidelity_fractions"] == [1.0]
+
+
+def test_signal_strategy_optimizer_unknown_pruner():
+    optimizer = SignalStrategyOptimizerImpl(
+        strategy_class=object,
+        condition_types={},
+        backtest_fn=None,
+        logger=MockLoggable(),
+        strategy_logger=MockLoggable(),
+        pruner="bogus",
+    )
+    with pytest.raises(ValueError):
+        optimizer.optimize("SYM1", pd.DataFrame(), None, None, n_trials=1)
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import time
+
+import numpy as np
+import pytest
+
+from algo_royale.backtester.profiling.stage_profiler import StageProfiler
+from tests.mocks.mock_loggable import MockLoggable
+
+
+@pytest.fixture
+def profiler():
+    return StageProfiler(logger=MockLoggable())
+
+
+def test_span_records_timings_and_rolls_up_counters(profiler):
+    with profiler.span("stage", stage="DATA_INGEST", window="20200101_20210101"):
+        with profiler.span("write_symbol", symbol="AAPL"):
+            profiler.add_files_written(2, rows=100)
+            profiler.add_rows(100)
+        profiler.add_files_read(1, rows=10)
+
+    symbol_span, stage_span = profiler.spans
+    assert symbol_span.stage == "DATA_INGEST"
+    assert symbol_span.window == "20200101_20210101"
+    assert symbol_span.parent == stage_span.label
+    assert symbol_span.files_written == 2
+    assert stage_span.files_written == 2
+    assert stage_span.rows_written == 100
+    assert stage_span.rows == 100
+    assert stage_span.files_read == 1
+    assert stage_span.wall_time_sec >= 0
+    assert stage_span.peak_rss_bytes > 0
+
+
+def test_span_marks_error_status(profiler):
+    with pytest.raises(ValueError):
+        with profiler.span("stage", stage="FEATURE_ENGINEERING"):
+            raise ValueError("boom")
+    assert profiler.spans[0].status == "error"
+    assert profiler.summary()["stage/FEATURE_ENGINEERING"]["errors"] == 1
+
+
+def test_concurrent_tasks_keep_separate_spans(profiler):
+    async def work(symbol, rows):
+        with profiler.span("write_symbol", symbol=symbol):
+            await asyncio.sleep(0)
+            profiler.add_rows(rows)
+
+    async def run():
+        await asyncio.gather(work("AAPL", 1), work("MSFT", 2))
+
+    asyncio.run(run())
+    rows = {span.symbol: span.rows for span in profiler.spans}
+    assert rows == {"AAPL": 1, "MSFT": 2}
+
+
+def test_peak_rss_is_sampled_per_span(profiler):
+    with profiler.span("allocate"):
+        block = np.ones(80 * 1024 * 1024 // 8)
+        time.sleep(0.3)
+        del block
+    with profiler.span("after"):
+        time.sleep(0.2)
+
+    allocate, after = profiler.spans
+    assert allocate.peak_rss_bytes >= allocate.rss_start_bytes + 60 * 1024 * 1024
+    # A later span does not inherit the earlier high-water mark
+    assert after.peak_rss_bytes < allocate.peak_rss_bytes
+    assert after.peak_rss_bytes >= after.rss_start_bytes
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    profiler = StageProfiler(enabled=False)
+    with profiler.span("stage") as span:
+        profiler.add_rows(5)
+    assert span is None
+    assert profiler.spans == []
+    assert profiler.write_report(tmp_path) is None
+
+
+def test_write_report_to_directory(profiler, tmp_path):
+    with profiler.span("pipeline"):
+        pass
+    path = profiler.write_report(tmp_path)
+    report = json.loads(path.read_text())
+    assert path.parent == tmp_path
+    assert report["summary"]["pipeline"]["count"] == 1
+    assert report["spans"][0]["name"] == "pipeline"
@@ -1,11 +1,16 @@
-import types
 from datetime import datetime
 
+import pandas as pd
 import pytest
 
+from algo_royale.backtester.enums.frame_precision import FramePrecision
 from algo_royale.backtester.stage_coordinator.data_staging.data_ingest_stage_coordinator import (
     DataIngestStageCoordinator,
 )
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import (
+    BarColumnsResponse,
+)
 from tests.mocks.adapters.mock_quote_adapter import MockQuoteAdapter
 from tests.mocks.backtester.mock_stage_data_manager import MockStageDataManager
 from tests.mocks.backtester.stage_data.loader.mock_stage_data_loader import (
@@ -84,6 +89,38 @@ def test_init_missing_watchlist_path(
         )
 
 
+def test_plan_rebuild_flags_precision_change(
+    mock_loader, mock_writer, mock_logger, mock_quote_service, monkeypatch
+):
+    data_manager = MockStageDataManager()
+    coordinator = DataIngestStageCoordinator(
+        data_loader=mock_loader,
+        data_writer=mock_writer,
+        data_manager=data_manager,
+        logger=mock_logger,
+        quote_adapter=mock_quote_service,
+        watchlist_repo=MockWatchlistRepo(),
+    )
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+    mock_writer.data_writer.precision = FramePrecision.COMPACT
+    stored = {
+        symbol: coordinator.stage_fingerprint(symbol, start, end)
+        for symbol in ["AAPL", "GOOGL", "MSFT"]
+    }
+    monkeypatch.setattr(
+        data_manager,
+        "read_symbol_stage_marker",
+        lambda stage, symbol, start_date, end_date: {"fingerprint": stored[symbol]},
+    )
+
+    plan = coordinator.plan_rebuild(start, end, RebuildPlan())
+    assert {item.reason for item in plan.items} == {RebuildPlan.REUSE}
+
+    mock_writer.data_writer.precision = FramePrecision.FULL
+    plan = coordinator.plan_rebuild(start, end, RebuildPlan())
+    assert [item.reason for item in plan.items] == [RebuildPlan.CHANGED] * 3
+
+
 @pytest.mark.asyncio
 async def test_init_empty_watchlist(
     mock_loader, mock_writer, mock_logger, mock_quote_service
@@ -140,52 +177,36 @@ async def test_process_returns_factories(
     assert result is True
 
 
-@pytest.mark.asyncio
-async def test_fetch_symbol_data_success(
-    mock_loader,
-    mock_writer,
-    mock_logger,
-    mock_quote_service,
-    monkeypatch,
-):
-    """Test that fetching symbol data yields the correct number of DataFrames."""
-    import algo_royale.backtester.stage_coordinator.data_staging.data_ingest_stage_coordinator as dic_mod
-
-    monkeypatch.setattr(
-        dic_mod, "SupportedCurrencies", types.SimpleNamespace(USD="USD")
-    )
-    monkeypatch.setattr(dic_mod, "DataFeed", types.SimpleNamespace(IEX="IEX"))
-    monkeypatch.setattr(
-        dic_mod,
-        "DataIngestColumns",
-        types.SimpleNamespace(SYMBOL="symbol", OPEN="open", CLOSE="close"),
-    )
+def _raw_bar(minute: int, **overrides) -> dict:
+    bar = {
+        "t": f"2024-01-02T14:{minute:02d}:00Z",
+        "o": 100.0 + minute,
+        "h": 101.0 + minute,
+        "l": 99.0 + minute,
+        "c": 100.5 + minute,
+        "v": 1000,
+        "n": 10,
+        "vw": 100.2 + minute,
+    }
+    bar.update(overrides)
+    return bar
 
-    class DummyBar:
-        def model_dump(self):
-            return {"open": 1, "close": 2}
-
-    class DummyResponse:
-        def __init__(self, bars, next_page_token=None):
-            self.symbol_bars = {"AAPL": bars}
-            self.next_page_token = next_page_token
 
+def _coordinator_with_pages(
+    mock_loader, mock_writer, mock_logger, mock_quote_service, pages
+):
     responses = [
-        DummyResponse([DummyBar(), DummyBar()], next_page_token="token2"),
-        DummyResponse([DummyBar()], next_page_token=None),
+        BarColumnsResponse.from_raw({"bars": {"AAPL": bars}, "next_page_token": token})
+        for bars, token in pages
     ]
 
-    def fetch_historical_bars_side_effect(*args, **kwargs):
+    async def fetch_historical_bar_columns_async(*args, **kwargs):
         return responses.pop(0) if responses else None
 
-    async def fetch_historical_bars_async(*args, **kwargs):
-        return fetch_historical_bars_side_effect(*args, **kwargs)
-
-    mock_quote_service.fetch_historical_bars = fetch_historical_bars_async
-
+    mock_quote_service.fetch_historical_bar_columns = fetch_historical_bar_columns_async
     repo = MockWatchlistRepo()
     repo.test_watchlist = ["AAPL"]
-    coordinator = dic_mod.DataIngestStageCoordinator(
+    coordinator = DataIngestStageCoordinator(
         data_loader=mock_loader,
         data_writer=mock_writer,
         data_manager=MockStageDataManager(),
@@ -201,10 +222,32 @@ async def test_fetch_symbol_data_success(
     coordinator.quote_adapter.client = DummyClient()
     coordinator.start_date = datetime(2024, 1, 1)
     coordinator.end_date = datetime(2024, 1, 31)
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_fetch_symbol_data_success(
+    mock_loader,
+    mock_writer,
+    mock_logger,
+    mock_quote_service,
+):
+    """Test that fetching symbol data yields one DataFrame per page, in time order."""
+    coordinator = _coordinator_with_pages(
+        mock_loader,
+        mock_writer,
+        mock_logger,
+        mock_quote_service,
+        pages=[([_raw_bar(0), _raw_bar(1)], "token2"), ([_raw_bar(2)], None)],
+    )
     results = []
     async for df in coordinator._fetch_symbol_data("AAPL"):
         results.append(df)
     assert len(results) == 2
+    staged = pd.concat(results, ignore_index=True)
+    assert staged["timestamp"].is_monotonic_increasing
+    assert (staged["symbol"] == "AAPL").all()
+    assert set(coordinator.stage.output_columns) <= set(staged.columns)
 
 
 @pytest.mark.asyncio
@@ -222,7 +265,7 @@ async def test_fetch_symbol_data_no_data_warns(
     async def fetch_historical_bars_async(*args, **kwargs):
         return None
 
-    mock_quote_service.fetch_historical_bars = fetch_historical_bars_async
+    mock_quote_service.fetch_historical_bar_columns = fetch_historical_bars_async
     repo = MockWatchlistRepo()
     repo.test_watchlist = ["AAPL"]
     coordinator = DataIngestStageCoordinator(
@@ -257,7 +300,7 @@ async def test_fetch_symbol_data_exception_logs_error(
     async def fetch_historical_bars_async(*args, **kwargs):
         raise Exception("fail!")
 
-    mock_quote_service.fetch_historical_bars = fetch_historical_bars_async
+    mock_quote_service.fetch_historical_bar_columns = fetch_historical_bars_async
     repo = MockWatchlistRepo()
     repo.test_watchlist = ["AAPL"]
     coordinator = DataIngestStageCoordinator(
@@ -288,67 +331,32 @@ async def test_fetch_symbol_data_validation(
     mock_writer,
     mock_logger,
     mock_quote_service,
-    monkeypatch,
 ):
-    """Test that validation of symbol data is applied correctly."""
-    import algo_royale.backtester.stage_coordinator.data_staging.data_ingest_stage_coordinator as dic_mod
-
-    monkeypatch.setattr(
-        dic_mod, "SupportedCurrencies", types.SimpleNamespace(USD="USD")
-    )
-    monkeypatch.setattr(dic_mod, "DataFeed", types.SimpleNamespace(IEX="IEX"))
-    monkeypatch.setattr(
-        dic_mod,
-        "DataIngestColumns",
-        types.SimpleNamespace(SYMBOL="symbol", OPEN="open", CLOSE="close"),
-    )
-
-    class DummyBar:
-        def model_dump(self):
-            return {"open": 1, "close": 2}
-
-    class InvalidBar:
-        def model_dump(self):
-            return {"invalid_column": 1}
-
-    class DummyResponse:
-        def __init__(self, bars, next_page_token=None):
-            self.symbol_bars = {"AAPL": bars}
-            self.next_page_token = next_page_token
-
-    responses = [
-        DummyResponse([DummyBar(), InvalidBar()], next_page_token="token2"),
-        DummyResponse([DummyBar()], next_page_token=None),
-    ]
-
-    def fetch_historical_bars_side_effect(*args, **kwargs):
-        return responses.pop(0) if responses else None
-
-    async def fetch_historical_bars_async2(*args, **kwargs):
-        return fetch_historical_bars_side_effect(*args, **kwargs)
-
-    mock_quote_service.fetch_historical_bars = fetch_historical_bars_async2
-
-    repo = MockWatchlistRepo()
-    repo.test_watchlist = ["AAPL"]
-    coordinator = dic_mod.DataIngestStageCoordinator(
-        data_loader=mock_loader,
-        data_writer=mock_writer,
-        data_manager=MockStageDataManager(),
-        logger=mock_logger,
-        quote_adapter=mock_quote_service,
-        watchlist_repo=repo,
+    """Test that invalid bars are dropped from a page before it is yielded."""
+    coordinator = _coordinator_with_pages(
+        mock_loader,
+        mock_writer,
+        mock_logger,
+        mock_quote_service,
+        pages=[
+            (
+                [
+                    _raw_bar(0),
+                    _raw_bar(1, h=90.0),  # high below low
+                    _raw_bar(2, o=None),
+                    _raw_bar(2),
+                    _raw_bar(2),  # repeated timestamp
+                    _raw_bar(3, v=-1),
+                ],
+                "token2",
+            ),
+            ([_raw_bar(4)], None),
+        ],
     )
-
-    class DummyClient:
-        async def aclose(self):
-            pass
-
-    coordinator.quote_adapter.client = DummyClient()
-    coordinator.start_date = datetime(2024, 1, 1)
-    coordinator.end_date = datetime(2024, 1, 31)
     results = []
     async for df in coordinator._fetch_symbol_data("AAPL"):
         results.append(df)
     assert len(results) == 2
-    assert "invalid_column" not in results[0].columns
+    assert list(results[0]["timestamp"].dt.minute) == [0, 2]
+    assert results[0]["open_price"].notna().all()
+    assert list(results[1]["timestamp"].dt.minute) == [4]
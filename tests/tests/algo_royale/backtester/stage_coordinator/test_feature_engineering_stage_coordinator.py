@@ -1,9 +1,14 @@
+from datetime import datetime
+
 import pandas as pd
 import pytest
 
+from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.enums.frame_precision import FramePrecision
 from algo_royale.backtester.stage_coordinator.data_staging.feature_engineering_stage_coordinator import (
     FeatureEngineeringStageCoordinator,
 )
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
 from tests.mocks.backtester.feature_engineering.mock_backtest_feature_engineer import (
     MockBacktestFeatureEngineer,
 )
@@ -126,6 +131,84 @@ async def test_engineer_returns_factories(
     assert isinstance(out[0], pd.DataFrame)
 
 
+@pytest.mark.asyncio
+async def test_engineer_panels_engineers_batches_on_demand(
+    coordinator, mock_feature_engineer
+):
+    def factory_for(value):
+        async def async_gen():
+            yield pd.DataFrame({"a": [value]})
+
+        return async_gen
+
+    coordinator.panel_symbols = 2
+    ingest_data = {s: factory_for(i) for i, s in enumerate(["AAPL", "MSFT", "TSLA"])}
+    engineered = await coordinator._engineer(ingest_data)
+    assert list(engineered) == ["AAPL", "MSFT", "TSLA"]
+
+    aapl = [df async for df in engineered["AAPL"]()]
+    assert mock_feature_engineer.panel_calls == [["AAPL", "MSFT"]]
+    msft = [df async for df in engineered["MSFT"]()]
+    tsla = [df async for df in engineered["TSLA"]()]
+    assert mock_feature_engineer.panel_calls == [["AAPL", "MSFT"], ["TSLA"]]
+    assert [df["a"].iloc[0] for df in aapl + msft + tsla] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_engineer_panels_drops_pages_of_skipped_symbols(
+    coordinator, mock_feature_engineer
+):
+    def factory_for(value):
+        async def async_gen():
+            yield pd.DataFrame({"a": [value]})
+
+        return async_gen
+
+    coordinator.panel_symbols = 3
+    ingest_data = {
+        s: factory_for(i) for i, s in enumerate(["AAPL", "MSFT", "TSLA", "NVDA"])
+    }
+    engineered = await coordinator._engineer(ingest_data)
+
+    # The writer skips AAPL and TSLA as already done
+    msft = [df async for df in engineered["MSFT"]()]
+    assert [df["a"].iloc[0] for df in msft] == [1]
+    [df async for df in engineered["NVDA"]()]
+
+    # Nothing of the first batch is left behind once the next one is engineered
+    assert [df async for df in engineered["AAPL"]()] == []
+    assert [df async for df in engineered["TSLA"]()] == []
+
+
+def test_plan_rebuild_flags_precision_change(
+    coordinator, mock_data_writer, mock_stage_data_manager, monkeypatch
+):
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+    monkeypatch.setattr(
+        mock_stage_data_manager, "hash_stage_data", lambda **kwargs: "ingest-hash"
+    )
+    mock_data_writer.data_writer.precision = FramePrecision.COMPACT
+    stored = coordinator.stage_fingerprint("AAPL", start, end)
+    monkeypatch.setattr(
+        mock_stage_data_manager,
+        "read_symbol_stage_marker",
+        lambda **kwargs: {"fingerprint": stored},
+    )
+
+    plan = coordinator.plan_rebuild(["AAPL"], start, end, RebuildPlan())
+    assert plan.items[0].reason == RebuildPlan.REUSE
+
+    mock_data_writer.data_writer.precision = FramePrecision.FULL
+    plan = coordinator.plan_rebuild(["AAPL"], start, end, RebuildPlan())
+    assert plan.items[0].reason == RebuildPlan.CHANGED
+
+    # Ingest rebuilt for the new precision rebuilds the features after it
+    plan = RebuildPlan()
+    plan.add(BacktestStage.DATA_INGEST, "mocked_window_id", "AAPL", "new", "old")
+    coordinator.plan_rebuild(["AAPL"], start, end, plan)
+    assert plan.items[-1].reason == RebuildPlan.UPSTREAM
+
+
 # Error/exception handling tests
 @pytest.mark.asyncio
 async def test_engineer_features_raises_exception(coordinator, mock_feature_engineer):
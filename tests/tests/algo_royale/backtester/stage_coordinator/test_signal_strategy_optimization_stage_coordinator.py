@@ -1,11 +1,24 @@
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from algo_royale.backtester.evaluator.backtest.signal_backtest_evaluator import (
+    SignalBacktestEvaluator,
+)
 from algo_royale.backtester.stage_coordinator.optimization.signal_strategy_optimization_stage_coordinator import (
     SignalStrategyOptimizationStageCoordinator,
 )
+from algo_royale.backtester.strategy.signal.base_signal_strategy import (
+    BaseSignalStrategy,
+)
+from algo_royale.backtester.strategy.signal.conditions.momentum_entry import (
+    MomentumEntryCondition,
+)
+from algo_royale.backtester.strategy.signal.conditions.momentum_exit import (
+    MomentumExitCondition,
+)
 from tests.mocks.backtester.evaluator.backtest.mock_signal_backtest_evaluator import (
     MockSignalBacktestEvaluator,
 )
@@ -53,6 +66,24 @@ def signal_strategy_optimization_coordinator(tmp_path):
     yield coordinator
 
 
+def _momentum_strategy(logger, lookback: int) -> BaseSignalStrategy:
+    return BaseSignalStrategy(
+        logger=logger,
+        entry_conditions=[MomentumEntryCondition(lookback=lookback)],
+        exit_conditions=[MomentumExitCondition(lookback=lookback)],
+    )
+
+
+def _price_frame(rows: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "close_price": 100 + rng.normal(0, 1, rows).cumsum(),
+        }
+    )
+
+
 def set_raise_exception(coordinator, value: bool):
     coordinator.executor.set_raise_exception(value)
     coordinator.evaluator.set_raise_exception(value)
@@ -154,6 +185,36 @@ class TestSignalStrategyOptimizationStageCoordinator:
         assert False, "Exception was not raised as expected"
         reset_raise_exception(signal_strategy_optimization_coordinator)
 
+    @pytest.mark.asyncio
+    async def test_backtest_and_evaluate_from_signal_matrix(
+        self, signal_strategy_optimization_coordinator
+    ):
+        coordinator = signal_strategy_optimization_coordinator
+        df = _price_frame()
+        signal_matrices = {}
+
+        for lookback in (3, 5, 3):
+            strategy = _momentum_strategy(coordinator.logger, lookback)
+            metrics = await coordinator._backtest_and_evaluate(
+                "AAPL", strategy, df, signal_matrices
+            )
+            expected = SignalBacktestEvaluator(logger=coordinator.logger).evaluate(
+                strategy, df
+            )
+            assert metrics == pytest.approx(expected, nan_ok=True)
+
+        # One matrix for the frame; the repeated trial applied no conditions
+        assert list(signal_matrices) == [len(df)]
+        matrix = signal_matrices[len(df)]
+        assert len(matrix) == 2
+        assert matrix.conditions_applied == 4
+
+        # A rung prefix of the frame gets a matrix of its own
+        await coordinator._backtest_and_evaluate(
+            "AAPL", strategy, df.iloc[:100], signal_matrices
+        )
+        assert sorted(signal_matrices) == [100, len(df)]
+
     def test_validate_optimization_results_normal(
         self, signal_strategy_optimization_coordinator
     ):
@@ -222,3 +283,40 @@ class TestSignalStrategyOptimizationStageCoordinator:
         except Exception:
             result = None
         assert result is None or isinstance(result, dict)
+
+    def test_has_optimization_run_matches_fingerprint(
+        self, signal_strategy_optimization_coordinator
+    ):
+        coordinator = signal_strategy_optimization_coordinator
+        start_date = datetime(2022, 1, 1)
+        end_date = datetime(2022, 12, 31)
+        coordinator.stage_data_manager.file_path = str(coordinator.optimization_root)
+        coordinator.window_id = "20220101_20221231"
+        metrics = {
+            "total_return": 0.1,
+            "sharpe_ratio": 1.0,
+            "win_rate": 0.5,
+            "max_drawdown": -0.1,
+        }
+        coordinator._write_results(
+            "AAPL",
+            start_date,
+            end_date,
+            "DummyStrategy",
+            {
+                "best_params": {"entry_conditions": []},
+                "best_value": 2.0,
+                "metrics": metrics,
+            },
+            {},
+            fingerprint="abc",
+        )
+
+        def has_run(fingerprint=None):
+            return coordinator._has_optimization_run(
+                "AAPL", "DummyStrategy", start_date, end_date, fingerprint=fingerprint
+            )
+
+        assert has_run()
+        assert has_run("abc")
+        assert not has_run("def")
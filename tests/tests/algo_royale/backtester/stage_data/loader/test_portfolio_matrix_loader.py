@@ -0,0 +1,170 @@
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.enums.frame_precision import FramePrecision
+from algo_royale.backtester.executor.strategy_backtest_executor import (
+    StrategyBacktestExecutor,
+)
+from algo_royale.backtester.stage_data.frame_dtypes import to_stored_frame
+from algo_royale.backtester.stage_data.loader.portfolio_matrix_loader import (
+    PortfolioMatrixLoader,
+)
+from algo_royale.backtester.stage_data.loader.signal_backtest_worker import (
+    SymbolSignalArrays,
+    select_signal_columns,
+)
+from algo_royale.backtester.stage_data.loader.stage_data_loader import StageDataLoader
+from algo_royale.backtester.stage_data.stage_data_manager import StageDataManager
+from algo_royale.backtester.strategy.signal.momentum_strategy import MomentumStrategy
+from tests.mocks.backtester.data_preparer.mock_asset_matrix_preparer import (
+    MockAssetMatrixPreparer,
+)
+from tests.mocks.backtester.strategy_factory.signal.mock_signal_strategy_factory import (
+    MockSignalStrategyFactory,
+)
+from tests.mocks.mock_loggable import MockLoggable
+from tests.mocks.repo.mock_watchlist_repo import MockWatchlistRepo
+
+START = datetime(2023, 1, 1)
+END = datetime(2024, 1, 1)
+SYMBOLS = ["AAPL", "MSFT", "GOOG"]
+
+
+def write_feature_pages(
+    manager: StageDataManager,
+    symbol: str,
+    seed: int,
+    precision: FramePrecision = FramePrecision.FULL,
+):
+    rng = np.random.default_rng(seed)
+    symbol_dir = manager.get_directory_path(
+        stage=BacktestStage.FEATURE_ENGINEERING,
+        symbol=symbol,
+        start_date=START,
+        end_date=END,
+    )
+    symbol_dir.mkdir(parents=True, exist_ok=True)
+    timestamps = pd.date_range("2023-01-02 14:30", periods=120, freq="min", tz="UTC")
+    close = 100 + rng.normal(0, 1, len(timestamps)).cumsum()
+    df = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open_price": close,
+            "high_price": close + 0.5,
+            "low_price": close - 0.5,
+            "close_price": close,
+            "volume": 1000,
+            "momentum": rng.normal(0, 1, len(timestamps)),
+        }
+    )
+    if precision == FramePrecision.COMPACT:
+        df = to_stored_frame(df)
+    df.iloc[:60].to_csv(symbol_dir / f"None_{symbol}_page1.csv", index=False)
+    df.iloc[60:].to_csv(symbol_dir / f"None_{symbol}_page2.csv", index=False)
+
+
+def make_loader(
+    tmp_path, max_workers: int, precision: FramePrecision = FramePrecision.FULL
+) -> PortfolioMatrixLoader:
+    manager = StageDataManager(data_dir=tmp_path / "data", logger=MockLoggable())
+    for seed, symbol in enumerate(SYMBOLS):
+        write_feature_pages(manager, symbol, seed, precision)
+    loader = PortfolioMatrixLoader(
+        strategy_backtest_executor=StrategyBacktestExecutor(
+            stage_data_manager=manager, logger=MockLoggable()
+        ),
+        asset_matrix_preparer=MockAssetMatrixPreparer(),
+        stage_data_manager=manager,
+        stage_data_loader=StageDataLoader(
+            logger=MockLoggable(),
+            stage_data_manager=manager,
+            watchlist_repo=MockWatchlistRepo(),
+            precision=precision,
+        ),
+        strategy_factory=MockSignalStrategyFactory(),
+        data_dir=tmp_path / "signals",
+        optimization_root=tmp_path / "optimization",
+        signal_summary_json_filename="summary_result.json",
+        symbol_signals_filename="symbol_signals.parquet",
+        logger=MockLoggable(),
+        max_workers=max_workers,
+    )
+    loader._get_optimized_strategy = lambda symbol: MomentumStrategy(
+        logger=MockLoggable()
+    )
+    return loader
+
+
+def run_backtests(loader: PortfolioMatrixLoader) -> dict[str, pd.DataFrame]:
+    saved = {}
+    loader._save_symbol_signals = lambda symbol, df, start_date, end_date: (
+        saved.__setitem__(symbol, df)
+    )
+    asyncio.run(loader._run_backtest_and_save_signals(SYMBOLS, START, END))
+    return saved
+
+
+def test_process_pool_matches_in_process_backtests(tmp_path):
+    in_process = run_backtests(make_loader(tmp_path / "serial", max_workers=1))
+    pooled_loader = make_loader(tmp_path / "pooled", max_workers=2)
+    pooled = run_backtests(pooled_loader)
+
+    assert not any("Worker backtest failed" in m for m in pooled_loader.logger.messages)
+
+    assert set(in_process) == set(SYMBOLS)
+    for symbol in SYMBOLS:
+        assert not in_process[symbol].empty
+        pd.testing.assert_frame_equal(
+            select_signal_columns(in_process[symbol]), pooled[symbol]
+        )
+
+
+def test_process_pool_reads_compact_pages(tmp_path):
+    compact = FramePrecision.COMPACT
+    in_process = run_backtests(
+        make_loader(tmp_path / "serial", max_workers=1, precision=compact)
+    )
+    pooled_loader = make_loader(tmp_path / "pooled", max_workers=2, precision=compact)
+    pooled = run_backtests(pooled_loader)
+
+    assert not any("Worker backtest failed" in m for m in pooled_loader.logger.messages)
+    for symbol in SYMBOLS:
+        assert isinstance(pooled[symbol]["timestamp"].dtype, pd.DatetimeTZDtype)
+        pd.testing.assert_frame_equal(
+            select_signal_columns(in_process[symbol]), pooled[symbol]
+        )
+
+
+def test_failed_worker_falls_back_to_in_process(tmp_path):
+    loader = make_loader(tmp_path, max_workers=2)
+    unpicklable = MomentumStrategy(logger=MockLoggable())
+    unpicklable.callback = lambda: None
+    loader._get_optimized_strategy = lambda symbol: unpicklable
+
+    results = run_backtests(loader)
+
+    assert any("Worker backtest failed" in m for m in loader.logger.messages)
+
+    assert set(results) == set(SYMBOLS)
+    assert all(not df.empty for df in results.values())
+
+
+def test_symbol_signal_arrays_round_trip():
+    df = pd.DataFrame(
+        {
+            "entry_signal": [1, 0],
+            "symbol": ["AAPL", "AAPL"],
+            "timestamp": pd.date_range("2024-01-02", periods=2, tz="America/New_York"),
+            "close_price": [1.0, 2.0],
+        }
+    )
+
+    arrays = SymbolSignalArrays.from_frame("AAPL", df)
+
+    assert "symbol" not in arrays.columns
+    assert arrays.columns["timestamp"].dtype.kind == "M"
+    pd.testing.assert_frame_equal(arrays.to_frame(), df)
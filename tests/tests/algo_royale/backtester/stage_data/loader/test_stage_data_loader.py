@@ -1,8 +1,10 @@
 from unittest.mock import AsyncMock, MagicMock
 
+import pandas as pd
 import pytest
 
 from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.enums.frame_precision import FramePrecision
 from algo_royale.backtester.stage_data.loader.stage_data_loader import StageDataLoader
 from tests.mocks.backtester.mock_stage_data_manager import MockStageDataManager
 from tests.mocks.mock_loggable import MockLoggable
@@ -145,3 +147,20 @@ class TestStageDataLoader:
         # Should return False if path exists but is empty
         fake_path.iterdir.return_value = []
         assert not stage_data_loader._has_existing_data(fake_path)
+
+
+@pytest.mark.parametrize("precision", list(FramePrecision))
+def test_read_page_loads_compact_pages(tmp_path, precision):
+    path = tmp_path / "page.csv"
+    path.write_text("timestamp,symbol,rsi\n1704153600,AAPL,0.33333334\n")
+    loader = StageDataLoader(
+        logger=MockLoggable(),
+        stage_data_manager=MockStageDataManager(),
+        watchlist_repo=MockWatchlistRepo(),
+        precision=precision,
+    )
+
+    df = loader._read_page(path)
+    assert df["timestamp"].iloc[0] == pd.Timestamp("2024-01-02", tz="UTC")
+    expected = "category" if precision == FramePrecision.COMPACT else object
+    assert df["symbol"].dtype == expected
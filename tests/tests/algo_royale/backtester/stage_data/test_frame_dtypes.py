@@ -0,0 +1,93 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from algo_royale.backtester.feature_engineering.feature_engineering import (
+    feature_engineering,
+)
+from algo_royale.backtester.stage_data.frame_dtypes import (
+    FULL_PRECISION_COLUMNS,
+    compact_frame,
+    from_stored_frame,
+    memory_per_symbol_year,
+    restore_timestamps,
+    to_stored_frame,
+)
+from tests.mocks.mock_loggable import MockLoggable
+
+
+def _bars(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 0.1, rows).cumsum()
+    return pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "timestamp": pd.date_range(
+                "2021-01-04 14:30", periods=rows, freq="min", tz="UTC"
+            ),
+            "open_price": close + rng.normal(0, 0.02, rows),
+            "high_price": close + 0.05,
+            "low_price": close - 0.05,
+            "close_price": close,
+            "volume": rng.integers(100, 10_000, rows).astype(float),
+            "num_trades": rng.integers(1, 100, rows),
+            "volume_weighted_price": close,
+        }
+    )
+
+
+def _features(rows: int = 2_000) -> pd.DataFrame:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return feature_engineering(_bars(rows), MockLoggable())
+
+
+def test_compact_features_within_float32_tolerance():
+    full = _features()
+    compact = compact_frame(full)
+
+    assert compact["symbol"].dtype == "category"
+    assert compact["close_price"].dtype == np.float64
+    assert compact["num_trades"].dtype == full["num_trades"].dtype
+    for column in full.columns:
+        if full[column].dtype != np.float64 or column in FULL_PRECISION_COLUMNS:
+            continue
+        assert compact[column].dtype == np.float32, column
+        np.testing.assert_allclose(
+            compact[column].to_numpy(np.float64),
+            full[column].to_numpy(),
+            rtol=1e-6,
+            atol=1e-6,
+            equal_nan=True,
+            err_msg=column,
+        )
+
+
+def test_stored_frame_round_trips_through_csv(tmp_path):
+    full = _features(500).assign(strategy="Bollinger")
+    path = tmp_path / "page.csv"
+    to_stored_frame(full).to_csv(path, index=False)
+
+    assert path.read_text().splitlines()[1].split(",")[1] == "1609770600"
+    restored = from_stored_frame(
+        pd.read_csv(path, dtype={"symbol": "category", "strategy": "category"})
+    )
+    pd.testing.assert_frame_equal(restored, compact_frame(full))
+
+
+def test_restore_timestamps_reads_compact_pages_with_parse_dates(tmp_path):
+    path = tmp_path / "page.csv"
+    to_stored_frame(_bars(10)).to_csv(path, index=False)
+
+    df = restore_timestamps(pd.read_csv(path, parse_dates=["timestamp"]))
+    pd.testing.assert_series_equal(df["timestamp"], _bars(10)["timestamp"])
+
+
+def test_memory_per_symbol_year_shrinks_when_compact():
+    full = _features()
+    full_bytes = memory_per_symbol_year(full)
+    compact_bytes = memory_per_symbol_year(compact_frame(full))
+
+    assert full_bytes > 0
+    assert compact_bytes < 0.6 * full_bytes
@@ -0,0 +1,47 @@
+import pytest
+
+from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.stage_data.rebuild_plan import RebuildPlan
+
+
+def test_add_classifies_outputs():
+    plan = RebuildPlan()
+    ingest = BacktestStage.DATA_INGEST
+    assert plan.add(ingest, "w", "AAPL", "abc", "abc").reason == RebuildPlan.REUSE
+    assert plan.add(ingest, "w", "MSFT", "abc", None).reason == RebuildPlan.MISSING
+    assert plan.add(ingest, "w", "TSLA", "abc", "").reason == RebuildPlan.CHANGED
+    assert plan.add(ingest, "w", "NVDA", None, "abc").reason == RebuildPlan.UPSTREAM
+    assert [item.symbol for item in plan.rebuilds] == ["MSFT", "TSLA", "NVDA"]
+
+
+def test_will_rebuild_by_strategy():
+    plan = RebuildPlan()
+    stage = BacktestStage.STRATEGY_OPTIMIZATION
+    plan.add(stage, "w", "AAPL", "abc", "abc", strategy="Momentum")
+    plan.add(stage, "w", "AAPL", "abc", "old", strategy="MeanReversion")
+    assert plan.will_rebuild(stage, "w", "AAPL")
+    assert plan.will_rebuild(stage, "w", "AAPL", "MeanReversion")
+    assert not plan.will_rebuild(stage, "w", "AAPL", "Momentum")
+    assert not plan.will_rebuild(stage, "other", "AAPL")
+    assert not plan.will_rebuild(BacktestStage.DATA_INGEST, "w", "AAPL")
+
+
+def test_estimate_falls_back_to_stage_mean():
+    plan = RebuildPlan()
+    ingest = BacktestStage.DATA_INGEST
+    plan.add(ingest, "w", "AAPL", "abc", "abc", last_duration_sec=2.0)
+    plan.add(ingest, "w", "MSFT", "abc", "old", last_duration_sec=4.0)
+    plan.add(ingest, "w", "TSLA", "abc", None)
+    plan.add(BacktestStage.FEATURE_ENGINEERING, "w", "TSLA", None, None)
+    assert plan.estimate() == pytest.approx(7.0)
+    rows = plan.to_rows()
+    assert [row["estimated_sec"] for row in rows] == [None, 4.0, 3.0, None]
+    assert [row["rebuild"] for row in rows] == [False, True, True, True]
+    assert plan.summary().startswith("3 of 4 stage outputs to rebuild (estimated ~7s)")
+
+
+def test_estimate_without_durations():
+    plan = RebuildPlan()
+    plan.add(BacktestStage.DATA_INGEST, "w", "AAPL", "abc", None)
+    assert plan.estimate() is None
+    assert "estimated unknown" in plan.summary()
@@ -117,6 +117,52 @@ def test_is_symbol_stage_done(stage_data_manager):
     assert mgr.is_symbol_stage_done(BacktestStage.DATA_INGEST, None, "AAPL")
 
 
+def test_symbol_stage_done_with_fingerprint(stage_data_manager):
+    mgr = stage_data_manager
+    mgr.mark_symbol_stage(
+        BacktestStage.DATA_INGEST,
+        "AAPL",
+        DataExtension.DONE,
+        fingerprint="abc",
+        duration_sec=1.5,
+    )
+    assert mgr.is_symbol_stage_done(
+        BacktestStage.DATA_INGEST, None, "AAPL", fingerprint="abc"
+    )
+    assert not mgr.is_symbol_stage_done(
+        BacktestStage.DATA_INGEST, None, "AAPL", fingerprint="def"
+    )
+    assert mgr.read_symbol_stage_marker(BacktestStage.DATA_INGEST, "AAPL") == {
+        "fingerprint": "abc",
+        "duration_sec": 1.5,
+    }
+
+
+def test_legacy_marker_does_not_match_fingerprint(stage_data_manager):
+    mgr = stage_data_manager
+    mgr.mark_symbol_stage(BacktestStage.DATA_INGEST, "AAPL", DataExtension.DONE)
+    assert not mgr.is_symbol_stage_done(
+        BacktestStage.DATA_INGEST, None, "AAPL", fingerprint="abc"
+    )
+    assert mgr.read_symbol_stage_marker(BacktestStage.DATA_INGEST, "AAPL") == {}
+    assert mgr.read_symbol_stage_marker(BacktestStage.DATA_INGEST, "MSFT") is None
+
+
+def test_hash_stage_data_ignores_markers(stage_data_manager):
+    mgr = stage_data_manager
+    assert mgr.hash_stage_data(BacktestStage.DATA_INGEST, "AAPL") is None
+    dir_path = mgr.get_directory_path(stage=BacktestStage.DATA_INGEST, symbol="AAPL")
+    dir_path.mkdir(parents=True, exist_ok=True)
+    (dir_path / "None_AAPL_page1.csv").write_text("a,b\n1,2\n")
+    before = mgr.hash_stage_data(BacktestStage.DATA_INGEST, "AAPL")
+    mgr.mark_symbol_stage(
+        BacktestStage.DATA_INGEST, "AAPL", DataExtension.DONE, fingerprint="abc"
+    )
+    assert mgr.hash_stage_data(BacktestStage.DATA_INGEST, "AAPL") == before
+    (dir_path / "None_AAPL_page1.csv").write_text("a,b\n1,3\n")
+    assert mgr.hash_stage_data(BacktestStage.DATA_INGEST, "AAPL") != before
+
+
 def test_mark_symbol_stage_removes_old_markers(stage_data_manager):
     mgr = stage_data_manager
     mgr.mark_symbol_stage(BacktestStage.DATA_INGEST, "AAPL", DataExtension.ERROR)
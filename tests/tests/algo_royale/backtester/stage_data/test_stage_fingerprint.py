@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from algo_royale.backtester.enums.backtest_stage import BacktestStage
+from algo_royale.backtester.stage_data.stage_fingerprint import (
+    FINGERPRINT_LENGTH,
+    code_version,
+    fingerprint,
+    hash_files,
+)
+from algo_royale.backtester.strategy.signal.base_signal_strategy import (
+    BaseSignalStrategy,
+)
+
+
+def test_fingerprint_is_canonical():
+    a = fingerprint("stage", {"b": 2, "a": 1}, datetime(2024, 1, 1))
+    b = fingerprint("stage", {"a": 1, "b": 2}, datetime(2024, 1, 1))
+    assert a == b
+    assert len(a) == FINGERPRINT_LENGTH
+    assert fingerprint("stage", {"a": 1, "b": 3}, datetime(2024, 1, 1)) != a
+
+
+def test_fingerprint_hashes_enums_by_value():
+    assert fingerprint(BacktestStage.DATA_INGEST) == fingerprint(
+        str(BacktestStage.DATA_INGEST)
+    )
+
+
+def test_hash_files_ignores_order_and_tracks_content(tmp_path):
+    first = tmp_path / "page1.csv"
+    second = tmp_path / "page2.csv"
+    first.write_text("a\n1\n")
+    second.write_text("a\n2\n")
+    digest = hash_files([first, second])
+    assert hash_files([second, first]) == digest
+    second.write_text("a\n3\n")
+    assert hash_files([first, second]) != digest
+
+
+def test_code_version_covers_base_classes():
+    class Strategy(BaseSignalStrategy):
+        pass
+
+    version = code_version(Strategy)
+    assert version == code_version(Strategy)
+    assert version != code_version(BaseSignalStrategy, fingerprint)
+    assert code_version(None) == code_version()
@@ -85,3 +85,27 @@ def test_save_stage_data_wrong_type_raises(writer):
         writer.save_stage_data(
             BacktestStage.DATA_INGEST, "strat", "AAPL", [1, 2, 3], 1
         )  # <-- add page_idx
+
+
+def test_save_stage_data_compact_precision(mock_logger, mock_stage_data_manager):
+    from algo_royale.backtester.enums.frame_precision import FramePrecision
+    from algo_royale.backtester.stage_data.writer.stage_data_writer import (
+        StageDataWriter,
+    )
+
+    writer = StageDataWriter(
+        logger=mock_logger,
+        stage_data_manager=mock_stage_data_manager,
+        precision=FramePrecision.COMPACT,
+    )
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-02", periods=2, freq="min", tz="UTC"),
+            "rsi": [1 / 3, 2 / 3],
+        }
+    )
+    filepaths = writer.save_stage_data(
+        BacktestStage.FEATURE_ENGINEERING, "strat", "AAPL", df, 1
+    )
+    lines = Path(filepaths[0]).read_text().splitlines()
+    assert lines[1].startswith("1704153600,0.33333334,")
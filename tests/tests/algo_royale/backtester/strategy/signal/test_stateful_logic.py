@@ -1,8 +1,19 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from algo_royale.backtester.strategy.signal.stateful_logic.base_stateful_logic import (
     StatefulLogic,
 )
+from algo_royale.backtester.strategy.signal.stateful_logic.macd_trailing_stateful_logic import (
+    MACDTrailingStatefulLogic,
+)
+from algo_royale.backtester.strategy.signal.stateful_logic.mean_reversion_stateful_logic import (
+    MeanReversionStatefulLogic,
+)
+from algo_royale.backtester.strategy.signal.stateful_logic.trailing_stop_stateful_logic import (
+    TrailingStopStatefulLogic,
+)
 
 
 class DummyLogicNoParams(StatefulLogic):
@@ -55,3 +66,51 @@ def test_get_id_includes_class_and_params():
     assert "DummyLogicWithParams" in id_str
     assert "alpha=0.5" in id_str
     assert "beta=3" in id_str
+
+
+def _price_frame(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {"close_price": 100 + rng.normal(0, 1, rows).cumsum()},
+        index=pd.RangeIndex(rows),
+    )
+
+
+@pytest.mark.parametrize(
+    "logic",
+    [
+        TrailingStopStatefulLogic(stop_pct=0.01),
+        MeanReversionStatefulLogic(window=5, threshold=0.005, reentry_cooldown=2),
+        MACDTrailingStatefulLogic(fast=3, slow=8, signal=4, stop_pct=0.01),
+    ],
+)
+def test_apply_batch_matches_row_by_row(logic):
+    df = _price_frame()
+    rng = np.random.default_rng(1)
+    shape = (5, len(df))
+    entry = rng.choice(np.array(["buy", "hold"], dtype=object), shape)
+    exit_ = rng.choice(np.array(["sell", "hold"], dtype=object), shape)
+    trend = rng.random(shape) < 0.7
+    trend[3] = trend[0]  # a repeated mask is simulated once
+    filter_ = rng.random(shape) < 0.8
+
+    expected = StatefulLogic.apply_batch(logic, df, entry, exit_, trend, filter_)
+    entry_out, exit_out = logic.apply_batch(df, entry, exit_, trend, filter_)
+
+    np.testing.assert_array_equal(entry_out, expected[0])
+    np.testing.assert_array_equal(exit_out, expected[1])
+    assert (entry_out != entry).any() or (exit_out != exit_).any()
+
+
+def test_apply_batch_without_required_columns_keeps_signals():
+    df = pd.DataFrame({"open_price": [1.0, 2.0]})
+    entry = np.array([["hold", "hold"]], dtype=object)
+    exit_ = np.array([["hold", "hold"]], dtype=object)
+    masks = np.ones((1, 2), dtype=bool)
+
+    entry_out, exit_out = TrailingStopStatefulLogic().apply_batch(
+        df, entry, exit_, masks, masks
+    )
+
+    np.testing.assert_array_equal(entry_out, entry)
+    np.testing.assert_array_equal(exit_out, exit_)
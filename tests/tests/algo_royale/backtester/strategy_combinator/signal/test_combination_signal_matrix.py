@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo_royale.backtester.evaluator.backtest.signal_backtest_evaluator import (
+    SignalBacktestEvaluator,
+)
+from algo_royale.backtester.strategy.signal.base_signal_strategy import (
+    BaseSignalStrategy,
+)
+from algo_royale.backtester.strategy.signal.conditions.momentum_entry import (
+    MomentumEntryCondition,
+)
+from algo_royale.backtester.strategy.signal.conditions.momentum_exit import (
+    MomentumExitCondition,
+)
+from algo_royale.backtester.strategy.signal.stateful_logic.trailing_stop_stateful_logic import (
+    TrailingStopStatefulLogic,
+)
+from algo_royale.backtester.strategy_combinator.signal.base_signal_strategy_combinator import (
+    SignalStrategyCombinator,
+)
+from algo_royale.backtester.strategy_combinator.signal.combination_signal_matrix import (
+    CombinationSignalMatrix,
+    ConditionCombination,
+)
+from algo_royale.logging.logger_factory import mockLogger
+
+
+@pytest.fixture
+def logger():
+    return mockLogger()
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    close = 100 + rng.normal(0, 1, 300).cumsum()
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=len(close), freq="min"),
+            "close_price": close,
+        }
+    )
+
+
+@pytest.fixture
+def combinator():
+    return SignalStrategyCombinator(
+        strategy_class=BaseSignalStrategy,
+        filter_condition_types=[],
+        entry_condition_types=[MomentumEntryCondition],
+        trend_condition_types=[],
+        exit_condition_types=[MomentumExitCondition],
+        stateful_logic_types=[TrailingStopStatefulLogic],
+    )
+
+
+class FailingCondition(MomentumEntryCondition):
+    def _apply(self, df):
+        raise RuntimeError("boom")
+
+
+def test_condition_combinations_cross_product(combinator, logger):
+    combinations = list(
+        combinator.condition_combinations(
+            logger, max_entry=3, max_exit=2, max_stateful_logic=2
+        )
+    )
+
+    assert len(combinations) == 3 * 2 * 2
+    assert all(not c.filter_conditions and not c.trend_conditions for c in combinations)
+    assert len({c.get_id() for c in combinations}) == len(combinations)
+
+
+def _strategy(combination, logger):
+    return BaseSignalStrategy(
+        logger=logger,
+        entry_conditions=list(combination.entry_conditions),
+        exit_conditions=list(combination.exit_conditions),
+        stateful_logic=combination.stateful_logic,
+    )
+
+
+def test_matrix_matches_generate_signals(combinator, df, logger):
+    matrix = combinator.combination_signals(
+        df, logger, max_entry=3, max_exit=3, max_stateful_logic=2
+    )
+
+    assert len(matrix) == 18
+    # Each distinct condition is applied once, not once per combination
+    assert matrix.conditions_applied == 6
+    assert matrix.valid.all()
+    for k, combination in enumerate(matrix.combinations):
+        expected = _strategy(combination, logger).generate_signals(df)
+        entry, exit_ = matrix.signals(k)
+        assert list(entry) == list(expected["entry_signal"])
+        assert list(exit_) == list(expected["exit_signal"])
+
+
+def test_failed_condition_leaves_combination_hold(df, logger):
+    combinations = [
+        ConditionCombination(entry_conditions=(MomentumEntryCondition(lookback=3),)),
+        ConditionCombination(entry_conditions=(FailingCondition(lookback=3),)),
+    ]
+
+    matrix = CombinationSignalMatrix(df, combinations, logger=logger)
+
+    assert list(matrix.valid) == [True, False]
+    assert (matrix.entry_signals[1] == 0).all()
+    assert (matrix.entry_signals[0] != 0).any()
+
+
+def test_missing_column_leaves_combination_hold(df, logger):
+    combinations = [
+        ConditionCombination(
+            entry_conditions=(MomentumEntryCondition(close_col="missing"),)
+        )
+    ]
+
+    matrix = CombinationSignalMatrix(df, combinations, logger=logger)
+
+    assert not matrix.valid[0]
+    assert matrix.conditions_applied == 0
+
+
+def test_evaluate_returns_metrics_per_combination(combinator, df, logger):
+    matrix = combinator.combination_signals(
+        df, logger, max_entry=2, max_exit=2, max_stateful_logic=1
+    )
+    evaluator = SignalBacktestEvaluator(logger=logger)
+
+    metrics = matrix.evaluate(evaluator)
+
+    assert len(metrics) == len(matrix)
+    for combination, result in zip(matrix.combinations, metrics):
+        expected = evaluator.evaluate(_strategy(combination, logger), df)
+        assert result == pytest.approx(expected, nan_ok=True)
+
+
+def test_row_adds_combinations_incrementally(combinator, df, logger):
+    combinations = list(
+        combinator.condition_combinations(
+            logger, max_entry=2, max_exit=2, max_stateful_logic=2
+        )
+    )
+    matrix = CombinationSignalMatrix(df, logger=logger)
+
+    rows = [matrix.row(combination) for combination in combinations]
+    applied = matrix.conditions_applied
+
+    assert rows == list(range(len(combinations)))
+    # A combination already in the matrix keeps its row and applies nothing
+    assert matrix.row(combinations[1]) == 1
+    assert matrix.conditions_applied == applied == 4
+    for k, combination in enumerate(combinations):
+        expected = _strategy(combination, logger).generate_signals(df)
+        entry, exit_ = matrix.signals(k)
+        assert list(entry) == list(expected["entry_signal"])
+        assert list(exit_) == list(expected["exit_signal"])
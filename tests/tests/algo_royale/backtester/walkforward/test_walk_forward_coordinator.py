@@ -0,0 +1,167 @@
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from unittest.mock import MagicMock
+
+import pytest
+
+from algo_royale.backtester.walkforward.walk_forward_coordinator import (
+    WalkForwardCoordinator,
+)
+from tests.mocks.mock_loggable import MockLoggable
+from tests.mocks.services.mock_clock_service import MockClockService
+
+
+class FakeStagingCoordinator:
+    def __init__(self):
+        self.ranges = []
+
+    async def run(self, start_date, end_date):
+        self.ranges.append((start_date, end_date))
+        return True
+
+
+class FakeOptimizationCoordinator:
+    """Keeps the window on the instance like the real stage coordinators."""
+
+    def __init__(self, fail_years=(), delay=0.0, parent_pid=None):
+        self.fail_years = fail_years
+        self.delay = delay
+        self.parent_pid = parent_pid
+        self.start_date = None
+        self.threads = set()
+
+    async def run(self, start_date, end_date):
+        self.start_date = start_date
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        await asyncio.sleep(0)
+        if start_date.year in self.fail_years:
+            raise RuntimeError(f"boom {start_date.year}")
+        if os.getpid() == self.parent_pid:
+            return False
+        # Another window overwriting this instance's state would be caught here
+        return self.start_date == start_date
+
+
+class FakeTestingCoordinator:
+    async def run(
+        self, train_start_date, train_end_date, test_start_date, test_end_date
+    ):
+        return {"ok": True}
+
+
+def make_coordinator(optimization, max_workers, window_worker_builder=None):
+    coordinator = WalkForwardCoordinator(
+        stage_data_manager=MagicMock(),
+        stage_data_loader=MagicMock(),
+        data_ingest_stage_coordinator=FakeStagingCoordinator(),
+        feature_engineering_stage_coordinator=FakeStagingCoordinator(),
+        optimization_stage_coordinator=optimization,
+        testing_stage_coordinator=FakeTestingCoordinator(),
+        clock_service=MockClockService(),
+        logger=MockLoggable(),
+        max_workers=max_workers,
+        window_worker_builder=window_worker_builder,
+    )
+    coordinator.has_ingested_data = lambda start_date, end_date: True
+    return coordinator
+
+
+def build_worker_coordinator(fail_years=(), parent_pid=None):
+    """Window worker builder; fails windows run in the parent process."""
+    return make_coordinator(
+        FakeOptimizationCoordinator(fail_years=fail_years, parent_pid=parent_pid),
+        max_workers=1,
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_windows_run_isolated_and_in_order(max_workers):
+    optimization = FakeOptimizationCoordinator(fail_years=(2019,), delay=0.01)
+    coordinator = make_coordinator(
+        optimization,
+        max_workers,
+        partial(build_worker_coordinator, fail_years=(2019,)),
+    )
+
+    result = asyncio.run(
+        coordinator.run_walk_forward(
+            n_trials=4, window_size=1, end_date=datetime(2024, 6, 1)
+        )
+    )
+
+    assert result is True
+    train_years = [r["train_start"].year for r in coordinator.window_results]
+    assert train_years == [2019, 2020, 2021, 2022]
+    statuses = [r["status"] for r in coordinator.window_results]
+    assert statuses == ["error", "ok", "ok", "ok"]
+    assert "boom 2019" in coordinator.window_results[0]["error"]
+    # The shared coordinator is copied per window, never run directly
+    assert optimization.start_date is None
+
+
+def test_shared_ranges_are_staged_once():
+    coordinator = make_coordinator(FakeOptimizationCoordinator(), max_workers=2)
+
+    asyncio.run(
+        coordinator.run_walk_forward(
+            n_trials=3, window_size=1, end_date=datetime(2024, 6, 1)
+        )
+    )
+
+    ingested = coordinator.data_ingest_stage_coordinator.ranges
+    # 3 windows cover 4 consecutive yearly ranges
+    assert len(ingested) == 4
+    assert len(set(ingested)) == 4
+    assert coordinator.feature_engineering_stage_coordinator.ranges == ingested
+
+
+def test_windows_run_in_worker_processes():
+    optimization = FakeOptimizationCoordinator()
+    coordinator = make_coordinator(
+        optimization,
+        max_workers=3,
+        window_worker_builder=partial(build_worker_coordinator, parent_pid=os.getpid()),
+    )
+
+    asyncio.run(
+        coordinator.run_walk_forward(
+            n_trials=3, window_size=1, end_date=datetime(2024, 6, 1)
+        )
+    )
+
+    # The fake fails any window optimized in this process
+    assert all(r["status"] == "ok" for r in coordinator.window_results)
+    assert not optimization.threads
+    # The workers' profile spans are merged into this process's profiler
+    windows = [
+        span.window
+        for span in coordinator.stage_profiler.spans
+        if span.name == "walk_forward_window"
+    ]
+    assert sorted(windows) == [r["window_id"] for r in coordinator.window_results]
+
+
+def test_windows_run_in_process_without_worker_builder():
+    optimization = FakeOptimizationCoordinator()
+    coordinator = make_coordinator(optimization, max_workers=3)
+
+    asyncio.run(
+        coordinator.run_walk_forward(
+            n_trials=3, window_size=1, end_date=datetime(2024, 6, 1)
+        )
+    )
+
+    assert all(r["status"] == "ok" for r in coordinator.window_results)
+    assert optimization.threads == {threading.get_ident()}
+
+
+def test_max_workers_defaults_to_cpu_count():
+    coordinator = make_coordinator(FakeOptimizationCoordinator(), max_workers=0)
+    assert coordinator.max_workers == (os.cpu_count() or 1)
+    coordinator = make_coordinator(FakeOptimizationCoordinator(), max_workers=6)
+    assert coordinator.max_workers == 6
@@ -13,6 +13,11 @@ from algo_royale.models.alpaca_market_data.alpaca_bar import (
     BarsResponse,
     LatestBarsResponse,
 )
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import (
+    BAR_FIELDS,
+    BarColumnsResponse,
+    invalid_bar_mask,
+)
 from algo_royale.models.alpaca_market_data.alpaca_condition_code import ConditionCodeMap
 from algo_royale.models.alpaca_market_data.alpaca_quote import Quote, QuotesResponse
 from algo_royale.models.alpaca_market_data.alpaca_snapshot import SnapshotsResponse
@@ -164,6 +169,22 @@ class TestAlpacaStockClient:
                 assert bar.volume >= 0
                 assert bar.num_trades >= 0
 
+    async def test_fetch_historical_bar_columns(self, alpaca_client):
+        """Test fetching historical bars decoded into columns."""
+        result = await alpaca_client.fetch_historical_bar_columns(
+            symbols=["AAPL"],
+            start_date=datetime(2022, 1, 3, tzinfo=timezone.utc),
+            end_date=datetime(2022, 1, 4, tzinfo=timezone.utc),
+        )
+
+        assert isinstance(result, BarColumnsResponse)
+        frame = result.symbol_frames["AAPL"]
+        assert list(frame.columns) == list(BAR_FIELDS.values())
+        assert str(frame["timestamp"].dt.tz) == "UTC"
+        assert frame["volume"].dtype == "int64"
+        assert frame["timestamp"].is_monotonic_increasing
+        assert not invalid_bar_mask(frame).any()
+
     async def test_fetch_latest_bars(self, alpaca_client):
         """Test fetching latest bars for a symbol."""
         symbols = ["AAPL"]
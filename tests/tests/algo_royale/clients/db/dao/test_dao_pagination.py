@@ -0,0 +1,54 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from algo_royale.clients.db.dao.order_dao import OrderDAO
+from algo_royale.clients.db.dao.trade_dao import TradeDAO
+from algo_royale.models.db.db_page_cursor import DBPageCursor
+from tests.mocks.mock_loggable import MockLoggable
+
+SQL_DIR = "src/algo_royale/clients/db/sql"
+ORDER_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+def _dao(dao_class, sql_dir):
+    connection = MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = []
+    return dao_class(connection, sql_dir, MockLoggable()), cursor
+
+
+def test_first_page_has_no_cursor():
+    dao, cursor = _dao(OrderDAO, f"{SQL_DIR}/orders")
+    dao.fetch_orders_by_status(["new"], limit=50)
+
+    query, params = cursor.execute.call_args.args
+    assert "OFFSET" not in query
+    assert params == {
+        "status_list": ["new"],
+        "limit": 50,
+        "after_key": None,
+        "after_id": None,
+    }
+
+
+def test_next_page_starts_after_last_row():
+    dao, cursor = _dao(OrderDAO, f"{SQL_DIR}/orders")
+    last = MagicMock(created_at=datetime(2024, 1, 2, 15, 30), id=ORDER_ID)
+    dao.fetch_orders_by_symbol_and_status(
+        "AAPL", ["new"], limit=10, after=DBPageCursor.after_order(last)
+    )
+
+    _, params = cursor.execute.call_args.args
+    assert params["symbol"] == "AAPL"
+    assert params["after_key"] == datetime(2024, 1, 2, 15, 30)
+    assert params["after_id"] == str(ORDER_ID)
+
+
+def test_unsettled_trade_cursor_allows_missing_settlement_date():
+    dao, cursor = _dao(TradeDAO, f"{SQL_DIR}/trades")
+    last = MagicMock(settlement_date=None, id=ORDER_ID)
+    dao.fetch_unsettled_trades(limit=10, after=DBPageCursor.after_unsettled_trade(last))
+
+    _, params = cursor.execute.call_args.args
+    assert params == {"limit": 10, "after_key": None, "after_id": str(ORDER_ID)}
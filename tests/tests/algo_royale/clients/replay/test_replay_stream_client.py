@@ -0,0 +1,98 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from algo_royale.clients.replay.replay_stream_client import ReplayStreamClient
+from algo_royale.models.alpaca_market_data.alpaca_stream_bar import StreamBar
+from algo_royale.models.alpaca_market_data.alpaca_stream_quote import StreamQuote
+from tests.mocks.mock_loggable import MockLoggable
+
+
+def _source(timestamps, close=100.0):
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(timestamps),
+            "open_price": close,
+            "high_price": close + 1,
+            "low_price": close - 1,
+            "close_price": close,
+            "volume": 1000,
+            "num_trades": 10,
+            "volume_weighted_price": close,
+        }
+    )
+
+    async def gen():
+        yield df
+
+    return lambda: gen()
+
+
+@pytest.fixture
+def client():
+    client = ReplayStreamClient(logger=MockLoggable(), speed=0)
+    client.set_data_sources(
+        {
+            "AAPL": _source(["2024-01-02 09:30", "2024-01-02 09:32"], close=100.0),
+            "MSFT": _source(["2024-01-02 09:31"], close=200.0),
+        }
+    )
+    return client
+
+
+def test_replays_bars_in_timestamp_order_across_symbols(client):
+    received = []
+
+    async def on_bar(raw):
+        received.append(StreamBar.from_raw(raw))
+
+    async def run():
+        await client.stream(symbols=["AAPL", "MSFT"], on_bar=on_bar)
+        return await client.async_replay()
+
+    stats = asyncio.run(run())
+    assert [bar.symbol for bar in received] == ["AAPL", "MSFT", "AAPL"]
+    assert [bar.closing_epoch for bar in received] == sorted(
+        bar.closing_epoch for bar in received
+    )
+    assert received[1].close_price == 200.0
+    assert stats["bars"] == 3
+    assert stats["events"] == 3
+    assert stats["events_per_sec"] > 0
+
+
+def test_only_streamed_symbols_are_replayed_and_quotes_synthesized(client):
+    client.emit_quotes = True
+    bars, quotes = [], []
+
+    async def on_bar(raw):
+        bars.append(raw)
+
+    async def on_quote(raw):
+        quotes.append(StreamQuote.from_raw(raw))
+
+    async def run():
+        await client.stream(symbols=["AAPL", "MSFT"], on_quote=on_quote, on_bar=on_bar)
+        await client.remove_symbols(quotes=["MSFT"], bars=["MSFT"])
+        return await client.async_replay()
+
+    stats = asyncio.run(run())
+    assert {raw["T"] for raw in bars} == {"AAPL"}
+    assert [quote.bid_price for quote in quotes] == [100.0, 100.0]
+    assert stats["events"] == 4
+
+
+def test_paced_replay_follows_speed_multiple(client):
+    # Two recorded minutes at 1200x real time take about 0.1 seconds
+    client.speed = 1200
+
+    async def on_bar(raw):
+        pass
+
+    async def run():
+        await client.stream(symbols=["AAPL", "MSFT"], on_bar=on_bar)
+        return await client.async_replay()
+
+    stats = asyncio.run(run())
+    assert stats["wall_time_sec"] >= 0.09
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from algo_royale.models.alpaca_market_data.alpaca_bar import BarsResponse
+from algo_royale.models.alpaca_market_data.alpaca_bar_columns import (
+    BarColumnsResponse,
+    decode_bars,
+    empty_bar_frame,
+    invalid_bar_mask,
+)
+
+
+def _raw_bars(n: int) -> list[dict]:
+    return [
+        {
+            "t": f"2024-01-02T{14 + minute // 60:02d}:{minute % 60:02d}:00Z",
+            "o": 100.0 + minute,
+            "h": 101.0 + minute,
+            "l": 99.0 + minute,
+            "c": 100.5 + minute,
+            "v": 1000 + minute,
+            "n": 10,
+            "vw": 100.2 + minute,
+        }
+        for minute in range(n)
+    ]
+
+
+def test_decode_bars_matches_bar_models_in_ascending_order():
+    raw = {"bars": {"AAPL": _raw_bars(120)[::-1]}, "next_page_token": "next"}
+
+    response = BarColumnsResponse.from_raw(raw)
+
+    expected = pd.DataFrame(
+        [bar.model_dump() for bar in BarsResponse.from_raw(raw).symbol_bars["AAPL"]]
+    ).iloc[::-1]
+    expected["timestamp"] = expected["timestamp"].dt.tz_convert("UTC")
+    assert response.next_page_token == "next"
+    pd.testing.assert_frame_equal(
+        response.symbol_frames["AAPL"], expected.reset_index(drop=True)
+    )
+
+
+def test_decode_bars_fills_missing_fields_like_bar_models():
+    bars = _raw_bars(2)
+    del bars[0]["vw"]
+    bars[1]["v"] = None
+    bars[1]["t"] = "not a timestamp"
+
+    frame = decode_bars(bars)
+
+    assert np.isnan(frame["volume_weighted_price"].iloc[0])
+    assert frame["volume"].dtype == np.int64
+    assert frame["volume"].iloc[0] == 1000
+    # Unparseable timestamps sort last and are flagged invalid
+    assert frame["timestamp"].isna().tolist() == [False, True]
+    assert invalid_bar_mask(frame).tolist() == [False, True]
+
+
+def test_invalid_bar_mask_flags_bad_rows():
+    bars = _raw_bars(5)
+    bars[1]["h"] = 50.0  # high below low
+    bars[2]["c"] = 0.0
+    bars[3]["n"] = -1
+    bars[4]["t"] = bars[0]["t"]  # repeated timestamp
+
+    frame = decode_bars(bars)
+
+    assert invalid_bar_mask(frame).sum() == 4
+    assert not invalid_bar_mask(decode_bars(_raw_bars(5))).any()
+
+
+def test_empty_pages_keep_their_dtypes():
+    frame = BarColumnsResponse.from_raw({"bars": {"AAPL": []}}).symbol_frames["AAPL"]
+
+    pd.testing.assert_series_equal(frame.dtypes, empty_bar_frame().dtypes)
+    assert frame.empty
+    assert len(invalid_bar_mask(frame)) == 0
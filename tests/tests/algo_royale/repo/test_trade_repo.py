@@ -98,6 +98,18 @@ class TestTradeRepo:
             trade_repo.fetch_open_positions()
         assert "Database error" in str(excinfo.value)
 
+    async def test_verify_positions_normal(self, trade_repo: TradeRepo):
+        assert trade_repo.verify_positions() == []
+
+    async def test_rebuild_positions_normal(self, trade_repo: TradeRepo):
+        assert trade_repo.rebuild_positions() == 1
+
+    async def test_rebuild_positions_exception(self, trade_repo: TradeRepo):
+        trade_repo._raise_exception = True
+        with pytest.raises(ValueError) as excinfo:
+            trade_repo.rebuild_positions()
+        assert "Database error" in str(excinfo.value)
+
     async def test_fetch_trades_by_date_range_normal(self, trade_repo: TradeRepo):
         from datetime import datetime, timedelta
 
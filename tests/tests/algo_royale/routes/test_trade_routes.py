@@ -0,0 +1,48 @@
+import pytest
+from flask import Flask
+
+from algo_royale.routes.trade_routes import create_trade_blueprint
+from tests.mocks.services.mock_trades_service import MockTradesService
+
+
+@pytest.fixture
+def service():
+    service = MockTradesService()
+    service.return_empty = True
+    return service
+
+
+@pytest.fixture
+def client(service):
+    app = Flask(__name__)
+    app.register_blueprint(create_trade_blueprint(service), url_prefix="/trades")
+    return app.test_client()
+
+
+def test_unsettled_with_cursor(client):
+    response = client.get(
+        "/trades/unsettled?after_id=7f1c1f5e-2b52-4c8e-9a3c-0d2b1a7f6e10"
+        "&after_key=2024-01-02T14:30:00%2B00:00"
+    )
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "after_id=not-a-uuid",
+        "after_id=7f1c1f5e-2b52-4c8e-9a3c-0d2b1a7f6e10&after_key=yesterday",
+        "after_key=2024-01-02T14:30:00",
+        "offset=20",
+    ],
+)
+def test_unsettled_rejects_bad_paging(client, query):
+    response = client.get(f"/trades/unsettled?{query}")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_date_range_rejects_bad_dates(client):
+    response = client.get("/trades/date_range?start_date=2024-01-01&end_date=soon")
+    assert response.status_code == 400
@@ -84,6 +84,19 @@ class TestMarketSessionService:
         await market_session_service.async_start_premarket()
         assert market_session_service.premarket_completed is True
 
+    @pytest.mark.asyncio
+    async def test_async_start_premarket_reports_step_timings(
+        self, market_session_service
+    ):
+        await market_session_service.async_start_premarket()
+        steps = market_session_service.premarket_report["steps"]
+        assert all(step["status"] == "ok" for step in steps.values())
+        # Start and duration are each rounded to 0.1 ms
+        assert steps["order_execution"]["start_sec"] + 0.0002 >= max(
+            steps[name]["start_sec"] + steps[name]["duration_sec"]
+            for name in ("symbol_holds", "ledger", "order_monitor")
+        )
+
     @pytest.mark.asyncio
     async def test_async_start_premarket_exception(self, market_session_service):
         raise_trade_service_exception(market_session_service)
@@ -123,6 +136,19 @@ class TestMarketSessionService:
         # order_execution_service exceptions are always caught, so this test is not needed
         await market_session_service.async_stop_market()
 
+    @pytest.mark.asyncio
+    async def test_async_start_premarket_reported_failure_skips_dependents(
+        self, market_session_service
+    ):
+        # The symbol hold service logs its error and reports failure instead of raising
+        raise_symbol_hold_service_exception(market_session_service)
+        await market_session_service.async_start_premarket()
+        steps = market_session_service.premarket_report["steps"]
+        assert steps["symbol_holds"]["status"] == "failed"
+        assert steps["order_execution"]["status"] == "skipped"
+        assert steps["ledger"]["status"] == "ok"
+        assert market_session_service.premarket_completed is False
+
     def test__init_ledger_service_success(self, market_session_service):
         market_session_service._init_ledger_service()
         # Should not raise
@@ -1,5 +1,12 @@
+from types import SimpleNamespace
+
 import pytest
 
+from algo_royale.application.orders.equity_order_enums import EquityOrderSide
+from algo_royale.application.orders.signal_order_payload import SignalOrderPayload
+from algo_royale.application.symbols.enums import SymbolHoldStatus
+from algo_royale.application.utils.latency_tracker import LatencyTracker
+from algo_royale.backtester.column_names.data_ingest_columns import DataIngestColumns
 from algo_royale.services.orders_execution_service import OrderExecutionService
 from tests.mocks.mock_loggable import MockLoggable
 from tests.mocks.services.mock_ledger_service import MockLedgerService
@@ -102,7 +109,9 @@ class TestOrderExecutionService:
         def broken_unsubscribe_from_symbol_orders(*args, **kwargs):
             raise Exception("Mocked exception in unsubscribe_from_symbol_orders")
 
-        order_execution_service.order_generator_service.unsubscribe_from_symbol_orders = broken_unsubscribe_from_symbol_orders
+        order_execution_service.order_generator_service.unsubscribe_from_symbol_orders = (
+            broken_unsubscribe_from_symbol_orders
+        )
         symbol_subscribers = {"AAPL": [object()]}
         result = await order_execution_service.stop(symbol_subscribers)
         assert result is False
@@ -118,3 +127,44 @@ class TestOrderExecutionService:
     ):
         order_execution_service.update_executor_status(False)
         assert order_execution_service._executor_on is False
+
+    def _traced_order(self, service: OrderExecutionService) -> SignalOrderPayload:
+        service.latency_tracker = LatencyTracker()
+        service.latency_tracker.start_trace("AAPL", 1)
+        return SignalOrderPayload(
+            symbol="AAPL",
+            side=EquityOrderSide.BUY,
+            weight=1.0,
+            price_data={DataIngestColumns.TIMESTAMP: 1},
+        )
+
+    def test_order_not_placed_discards_trace(
+        self, order_execution_service: OrderExecutionService
+    ):
+        data = self._traced_order(order_execution_service)
+        order_execution_service.update_executor_status(False)
+
+        order_execution_service._handle_order_generation(data)
+
+        snapshot = order_execution_service.latency_tracker.snapshot()
+        assert LatencyTracker.END_TO_END not in snapshot["hop_latency"]
+        assert snapshot["discarded"] == {"order_execution": 1}
+        assert snapshot["open_traces"] == 0
+
+    def test_submitted_order_closes_trace(
+        self, order_execution_service: OrderExecutionService, monkeypatch
+    ):
+        data = self._traced_order(order_execution_service)
+        order_execution_service.update_executor_status(True)
+        order_execution_service.symbol_holds = SimpleNamespace(
+            status={"AAPL": SymbolHoldStatus.BUY_ONLY}
+        )
+        monkeypatch.setattr(
+            order_execution_service, "_submit_buy_order", lambda data: True
+        )
+
+        order_execution_service._handle_order_generation(data)
+
+        snapshot = order_execution_service.latency_tracker.snapshot()
+        assert snapshot["hop_latency"][LatencyTracker.END_TO_END]["count"] == 1
+        assert snapshot["discarded"] == {}
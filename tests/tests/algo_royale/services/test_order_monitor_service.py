@@ -1,27 +1,189 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+
 import pytest
 
+from algo_royale.models.alpaca_trading.alpaca_order import Order
+from algo_royale.models.alpaca_trading.enums.order_stream_event import OrderStreamEvent
+from algo_royale.models.alpaca_trading.order_stream_data import OrderStreamData
 from algo_royale.services.order_monitor_service import OrderMonitorService
 from tests.mocks.mock_loggable import MockLoggable
 from tests.mocks.services.mock_clock_service import MockClockService
 from tests.mocks.services.mock_ledger_service import MockLedgerService
 from tests.mocks.services.mock_order_event_service import MockOrderEventService
+from tests.mocks.services.mock_order_monitor_writer import MockOrderMonitorWriter
 from tests.mocks.services.mock_trades_service import MockTradesService
 
+CLIENT_ORDER_ID = "123e4567-e89b-12d3-a456-426614174001"
+
 
 @pytest.fixture
 def order_monitor_service():
+    trades_service = MockTradesService()
     service = OrderMonitorService(
         ledger_service=MockLedgerService(),
         order_event_service=MockOrderEventService(),
-        trades_service=MockTradesService(),
+        trades_service=trades_service,
+        writer=MockOrderMonitorWriter(trades_service=trades_service),
         clock_service=MockClockService(),
         logger=MockLoggable(),
+        trade_batch_size=2,
+        trade_flush_interval_seconds=60,
     )
     yield service
 
 
+def make_fill_event(
+    event: OrderStreamEvent, filled_qty: float, filled_avg_price: float
+) -> OrderStreamData:
+    order = Order(
+        id="broker_order_id",
+        client_order_id=CLIENT_ORDER_ID,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        submitted_at=datetime.now(),
+        filled_at=datetime.now(),
+        asset_id="asset_id",
+        symbol="AAPL",
+        asset_class="us_equity",
+        qty=10,
+        filled_qty=filled_qty,
+        filled_avg_price=filled_avg_price,
+        order_class=None,
+        order_type="market",
+        type="market",
+        side="buy",
+        time_in_force="day",
+        status="partially_filled",
+        extended_hours=False,
+    )
+    return OrderStreamData(
+        event=event,
+        price=filled_avg_price,
+        timestamp=datetime.now(),
+        position_qty=int(filled_qty),
+        order=order,
+    )
+
+
 @pytest.mark.asyncio
 class TestOrderMonitorService:
     async def test_async_start_and_stop(self, order_monitor_service):
         await order_monitor_service.async_start()
         await order_monitor_service.async_stop()
+
+    async def test_start_recovers_open_order_fills(self, order_monitor_service):
+        await order_monitor_service.async_start()
+        assert CLIENT_ORDER_ID in order_monitor_service.order_fills
+        await order_monitor_service.async_stop()
+
+    async def test_fill_deltas_are_batched(self, order_monitor_service):
+        trades_service = order_monitor_service.trade_service
+        existing = len(trades_service.trades)
+        await order_monitor_service.async_start()
+
+        await order_monitor_service._async_handle_order_event(
+            make_fill_event(OrderStreamEvent.PARTIAL_FILL, 4, 100.0)
+        )
+        assert len(order_monitor_service.pending_trades) == 1
+        assert len(trades_service.trades) == existing
+
+        await order_monitor_service._async_handle_order_event(
+            make_fill_event(OrderStreamEvent.FILL, 10, 103.0)
+        )
+        assert order_monitor_service.pending_trades == []
+        first, second = trades_service.trades[existing:]
+        assert first.quantity == pytest.approx(4)
+        assert first.price == pytest.approx(100.0)
+        assert second.quantity == pytest.approx(6)
+        assert second.price == pytest.approx((10 * 103.0 - 4 * 100.0) / 6)
+        assert str(second.order_id) == CLIENT_ORDER_ID
+        assert CLIENT_ORDER_ID not in order_monitor_service.order_fills
+        await order_monitor_service.async_stop()
+
+    async def test_stop_flushes_pending_trades(self, order_monitor_service):
+        trades_service = order_monitor_service.trade_service
+        existing = len(trades_service.trades)
+        await order_monitor_service.async_start()
+        await order_monitor_service._async_handle_order_event(
+            make_fill_event(OrderStreamEvent.PARTIAL_FILL, 4, 100.0)
+        )
+        await order_monitor_service.async_stop()
+        assert len(trades_service.trades) == existing + 1
+
+    async def test_each_fill_gets_its_own_external_id(self, order_monitor_service):
+        trades_service = order_monitor_service.trade_service
+        existing = len(trades_service.trades)
+        await order_monitor_service.async_start()
+        for filled_qty in (2, 5):
+            await order_monitor_service._async_handle_order_event(
+                make_fill_event(OrderStreamEvent.PARTIAL_FILL, filled_qty, 100.0)
+            )
+
+        first, second = trades_service.trades[existing:]
+        assert first.external_id != second.external_id
+        # Re-inserting the same fills does not duplicate them
+        assert trades_service.insert_trades([first, second]) == 0
+        await order_monitor_service.async_stop()
+
+    async def test_failing_batch_is_dead_lettered(self, order_monitor_service):
+        trades_service = order_monitor_service.trade_service
+        order_monitor_service.trade_max_flush_attempts = 2
+        await order_monitor_service.async_start()
+        trades_service.raise_exception = True
+        await order_monitor_service._async_handle_order_event(
+            make_fill_event(OrderStreamEvent.PARTIAL_FILL, 4, 100.0)
+        )
+
+        assert await order_monitor_service._async_flush_trades() == 0
+        assert len(order_monitor_service.pending_trades) == 1
+        assert await order_monitor_service._async_flush_trades() == 0
+        assert order_monitor_service.pending_trades == []
+        assert len(order_monitor_service.dead_letter_trades) == 1
+
+        # Later trades are written once the DB recovers
+        trades_service.raise_exception = False
+        existing = len(trades_service.trades)
+        await order_monitor_service._async_handle_order_event(
+            make_fill_event(OrderStreamEvent.PARTIAL_FILL, 6, 100.0)
+        )
+        assert await order_monitor_service._async_flush_trades() == 1
+        assert len(trades_service.trades) == existing + 1
+        await order_monitor_service.async_stop()
+
+    async def test_loop_stays_responsive_while_flush_is_blocked(
+        self, order_monitor_service
+    ):
+        trades_service = order_monitor_service.trade_service
+        release = threading.Event()
+        insert_trades = trades_service.insert_trades
+
+        def blocking_insert_trades(trades):
+            release.wait(timeout=5)
+            return insert_trades(trades)
+
+        trades_service.insert_trades = blocking_insert_trades
+        existing = len(trades_service.trades)
+        await order_monitor_service.async_start()
+        await order_monitor_service._async_handle_order_event(
+            make_fill_event(OrderStreamEvent.PARTIAL_FILL, 4, 100.0)
+        )
+        flush = asyncio.create_task(order_monitor_service._async_flush_trades())
+
+        # The loop keeps ticking and events keep being handled during the insert
+        started = time.perf_counter()
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        await order_monitor_service._async_handle_order_event(
+            make_fill_event(OrderStreamEvent.PARTIAL_FILL, 6, 100.0)
+        )
+        assert time.perf_counter() - started < 1
+        assert not flush.done()
+
+        release.set()
+        assert await flush == 1
+        await order_monitor_service.async_stop()
+        assert len(trades_service.trades) == existing + 2
+        assert not order_monitor_service.writer.running
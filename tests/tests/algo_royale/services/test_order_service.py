@@ -85,6 +85,23 @@ class TestOrderService:
         )
         assert result == []
 
+    async def test_fetch_order_status_summary_by_symbols(
+        self, order_service: OrderService
+    ):
+        summaries = order_service.fetch_order_status_summary_by_symbols(
+            symbols=["AAPL", "MSFT"], status_list=["new", "fill"]
+        )
+        assert {summary.symbol for summary in summaries} == {"AAPL", "MSFT"}
+
+    async def test_fetch_order_status_summary_by_symbols_exception(
+        self, order_service: OrderService
+    ):
+        set_order_service_raise_exception(order_service, True)
+        summaries = order_service.fetch_order_status_summary_by_symbols(
+            symbols=["AAPL"], status_list=["new"]
+        )
+        assert summaries == []
+
     async def test_update_order(self, order_service: OrderService):
         order_id = order_service.order_repo.dao.test_order.id
         update_count = order_service.update_order(
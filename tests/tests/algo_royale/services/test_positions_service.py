@@ -128,3 +128,19 @@ class TestPositionsService:
     async def test_validate_positions(self, positions_service: MockPositionsService):
         await positions_service.validate_positions()
         assert True
+
+
+@pytest.mark.asyncio
+async def test_verify_positions_projection_rebuilds_on_mismatch(
+    positions_service: PositionsService,
+):
+    dao = positions_service.trade_repo.dao
+    dao.verify_positions = lambda user_id, account_id: [("AAPL", 3, None)]
+    rebuilds = []
+    dao.rebuild_positions = lambda user_id, account_id: rebuilds.append(
+        (user_id, account_id)
+    )
+
+    await positions_service.sync_positions()
+    await positions_service.sync_positions()
+    assert rebuilds == [("user_1", "account_1")]
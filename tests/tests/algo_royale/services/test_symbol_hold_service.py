@@ -1,5 +1,10 @@
+from types import SimpleNamespace
+
 import pytest
 
+from algo_royale.application.symbols.enums import SymbolHoldStatus
+from algo_royale.models.db.db_order_status_summary import DBOrderStatusSummary
+from algo_royale.repo.order_repo import DBOrderStatus
 from algo_royale.services.symbol_hold_service import SymbolHoldService
 from tests.mocks.mock_loggable import MockLoggable
 from tests.mocks.services.mock_order_event_service import MockOrderEventService
@@ -54,11 +59,11 @@ def set_raise_exception_order_event_service(service: SymbolHoldService):
 
 
 def set_return_empty_positions_service(service: SymbolHoldService):
-    service.positions_service.set_return_empty(True)
+    service.position_service.set_return_empty(True)
 
 
 def set_raise_exception_positions_service(service: SymbolHoldService):
-    service.positions_service.set_raise_exception(True)
+    service.position_service.set_raise_exception(True)
 
 
 def set_return_empty_trades_service(service: SymbolHoldService):
@@ -74,7 +79,7 @@ def reset_services(service: SymbolHoldService):
     service.symbol_hold_tracker.reset()
     service.order_service.reset()
     service.order_event_service.reset()
-    service.positions_service.reset()
+    service.position_service.reset()
     service.trades_service.reset()
 
 
@@ -135,6 +140,83 @@ class TestSymbolHoldService:
         set_raise_exception_symbol_service(symbol_hold_service)
         await symbol_hold_service._async_set_symbol_holds_by_order_status()
 
+    @pytest.mark.asyncio
+    async def test_async_set_symbol_holds_by_order_status_grouped(
+        self, symbol_hold_service, monkeypatch
+    ):
+        def summary(symbol, status, settled=True):
+            return DBOrderStatusSummary(
+                symbol=symbol, status=status, settled=settled, order_count=1
+            )
+
+        summaries = [
+            # An open order outranks a rejected one on the same symbol
+            summary("AAPL", DBOrderStatus.REJECTED),
+            summary("AAPL", DBOrderStatus.NEW),
+            summary("MSFT", DBOrderStatus.FILL, settled=True),
+            summary("MSFT", DBOrderStatus.CANCELED),
+            summary("TSLA", DBOrderStatus.FILL, settled=True),
+            summary("TSLA", DBOrderStatus.FILL, settled=False),
+        ]
+        monkeypatch.setattr(
+            symbol_hold_service.symbol_service,
+            "get_symbols",
+            lambda: ["AAPL", "MSFT", "TSLA", "NVDA"],
+        )
+        monkeypatch.setattr(
+            symbol_hold_service.order_service,
+            "fetch_order_status_summary_by_symbols",
+            lambda symbols, status_list: summaries,
+        )
+        monkeypatch.setattr(
+            symbol_hold_service.position_service,
+            "get_positions",
+            lambda: [SimpleNamespace(symbol="MSFT")],
+        )
+
+        await symbol_hold_service._async_set_symbol_holds_by_order_status()
+
+        assert symbol_hold_service.symbol_hold_tracker.symbol_holds == {
+            "AAPL": SymbolHoldStatus.HOLD_ALL,
+            "MSFT": SymbolHoldStatus.SELL_ONLY,
+            "TSLA": SymbolHoldStatus.PENDING_SETTLEMENT,
+            # A symbol without orders can be bought
+            "NVDA": SymbolHoldStatus.BUY_ONLY,
+        }
+
+    def test_hold_status_from_summaries(self, symbol_hold_service):
+        def summary(status, settled=True):
+            return DBOrderStatusSummary(
+                symbol="AAPL", status=status, settled=settled, order_count=2
+            )
+
+        resolve = symbol_hold_service._hold_status_from_summaries
+        assert resolve([], False) == SymbolHoldStatus.BUY_ONLY
+        assert resolve([], True) == SymbolHoldStatus.BUY_ONLY
+        assert (
+            resolve([summary(DBOrderStatus.EXPIRED)], False)
+            == SymbolHoldStatus.BUY_ONLY
+        )
+        assert (
+            resolve([summary(DBOrderStatus.EXPIRED)], True)
+            == SymbolHoldStatus.SELL_ONLY
+        )
+        assert (
+            resolve(
+                [summary(DBOrderStatus.CANCELED), summary(DBOrderStatus.PENDING_NEW)],
+                True,
+            )
+            == SymbolHoldStatus.HOLD_ALL
+        )
+        assert (
+            resolve([summary(DBOrderStatus.FILL, settled=False)], True)
+            == SymbolHoldStatus.PENDING_SETTLEMENT
+        )
+        assert (
+            resolve([summary(DBOrderStatus.FILL, settled=True)], False)
+            == SymbolHoldStatus.BUY_ONLY
+        )
+
     @pytest.mark.asyncio
     async def test_async_update_symbol_hold_all_events(self, symbol_hold_service):
         class DummyOrder:
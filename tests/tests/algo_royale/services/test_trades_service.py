@@ -211,21 +211,27 @@ class TestTradesService:
         assert "Database error" in str(excinfo.value)
         reset_trades_service_raise_exception(trades_service)
 
-    async def reconcile_trades_normal(self, trades_service: TradesService):
+    async def test_reconcile_trades_normal(self, trades_service: TradesService):
         from datetime import datetime, timedelta
 
         start_date = datetime.now() - timedelta(days=10)
         end_date = datetime.now()
-        trades_service.reconcile_trades(start_date=start_date, end_date=end_date)
-        assert True  # If no exception is raised, the test passes
+        summary = await trades_service.reconcile_trades(
+            start_date=start_date, end_date=end_date
+        )
+        assert summary["deleted"] == 0
+        assert summary["inserted"] == summary["staged"]
+        assert summary["run_time_sec"] >= 0
 
-    async def reconcile_trades_exception(self, trades_service: TradesService):
+    async def test_reconcile_trades_exception(self, trades_service: TradesService):
         from datetime import datetime, timedelta
 
-        set_trades_service_raise_exception(trades_service, True)
+        trades_service.repo.set_raise_exception(True)
         start_date = datetime.now() - timedelta(days=10)
         end_date = datetime.now()
-        with pytest.raises(ValueError) as excinfo:
-            trades_service.reconcile_trades(start_date=start_date, end_date=end_date)
-        assert "Database error" in str(excinfo.value)
-        reset_trades_service_raise_exception(trades_service)
+        summary = await trades_service.reconcile_trades(
+            start_date=start_date, end_date=end_date
+        )
+        assert summary["deleted"] == 0
+        assert summary["inserted"] == 0
+        trades_service.repo.reset_raise_exception()
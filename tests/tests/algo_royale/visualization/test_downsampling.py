@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from algo_royale.visualization.downsampling import downsample_series, lttb_indices
+
+
+def _minute_series(n: int, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-03 14:30", periods=n, freq="min", tz="UTC")
+    return pd.Series(1 + rng.normal(0, 0.001, n).cumsum(), index=index)
+
+
+def test_lttb_keeps_endpoints_and_shape():
+    series = _minute_series(50_000)
+    kept = lttb_indices(series.index.asi8, series.to_numpy(), 500)
+
+    assert len(kept) == 500
+    assert kept[0] == 0 and kept[-1] == len(series) - 1
+    assert np.all(np.diff(kept) > 0)
+    # Peaks and troughs survive to within a sliver of the series' range
+    kept_values = series.iloc[kept]
+    value_range = series.max() - series.min()
+    assert series.max() - kept_values.max() < 0.001 * value_range
+    assert kept_values.min() - series.min() < 0.001 * value_range
+
+
+def test_lttb_returns_every_point_when_already_small():
+    x = np.arange(10)
+    assert np.array_equal(lttb_indices(x, x * 2.0, 20), x)
+
+
+def test_downsample_series_window_is_full_resolution_when_it_fits():
+    series = _minute_series(10_000)
+    series.iloc[0] = np.nan
+
+    whole = downsample_series(series, max_points=1_000)
+    assert len(whole) == 1_000
+    assert whole.notna().all()
+
+    start, end = series.index[5_000], series.index[5_499]
+    window = downsample_series(series, max_points=1_000, x_range=(start, end))
+    pd.testing.assert_series_equal(window, series.loc[start:end])